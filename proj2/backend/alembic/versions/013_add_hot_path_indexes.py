@@ -0,0 +1,66 @@
+"""Add composite indexes for hot access paths
+
+Indexes recommended by scripts/index_advisor.py:
+- wellness logs filtered by user_id and ordered by occurred_at_utc
+- meals filtered by user_id and ordered by meal_time
+- goals filtered by user_id (and status) and ordered by created_at
+- menu_items.restaurant_id and restaurants.is_active lookups
+
+Revision ID: 013_add_hot_path_indexes
+Revises: 012_add_menu_item_allergens_association
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_add_hot_path_indexes"
+down_revision: Union[str, Sequence[str], None] = (
+    "012_add_menu_item_allergens_association"
+)
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table name, columns)
+INDEXES = [
+    (
+        "ix_mood_logs_user_id_occurred_at_utc",
+        "mood_logs",
+        ["user_id", "occurred_at_utc"],
+    ),
+    (
+        "ix_stress_logs_user_id_occurred_at_utc",
+        "stress_logs",
+        ["user_id", "occurred_at_utc"],
+    ),
+    (
+        "ix_sleep_logs_user_id_occurred_at_utc",
+        "sleep_logs",
+        ["user_id", "occurred_at_utc"],
+    ),
+    ("ix_meals_user_id_meal_time", "meals", ["user_id", "meal_time"]),
+    ("ix_goals_user_id_created_at", "goals", ["user_id", "created_at"]),
+    (
+        "ix_goals_user_id_status_created_at",
+        "goals",
+        ["user_id", "status", "created_at"],
+    ),
+    ("ix_menu_items_restaurant_id", "menu_items", ["restaurant_id"]),
+    ("ix_restaurants_is_active", "restaurants", ["is_active"]),
+]
+
+
+def upgrade() -> None:
+    """Create composite and foreign key indexes for hot queries."""
+    for index_name, table_name, columns in INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop the hot path indexes."""
+    for index_name, table_name, _ in reversed(INDEXES):
+        op.drop_index(index_name, table_name=table_name)
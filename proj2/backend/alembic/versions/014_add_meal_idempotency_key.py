@@ -0,0 +1,44 @@
+"""Add idempotency key to meals for batch logging retries
+
+Revision ID: 014_add_meal_idempotency_key
+Revises: 013_add_hot_path_indexes
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_add_meal_idempotency_key"
+down_revision: Union[str, Sequence[str], None] = "013_add_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("meals", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("idempotency_key", sa.String(length=100), nullable=True)
+        )
+
+    # One meal per (user, key); NULL keys are not constrained
+    op.create_index(
+        "ix_meals_user_id_idempotency_key",
+        "meals",
+        ["user_id", "idempotency_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_meals_user_id_idempotency_key", table_name="meals")
+
+    with op.batch_alter_table("meals", schema=None) as batch_op:
+        batch_op.drop_column("idempotency_key")
@@ -0,0 +1,46 @@
+"""Add daily_nutrition rollup table
+
+Revision ID: 015_add_daily_nutrition_table
+Revises: 014_add_meal_idempotency_key
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_add_daily_nutrition_table"
+down_revision: Union[str, Sequence[str], None] = "014_add_meal_idempotency_key"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing meals are not rolled up here; run
+    ``scripts/rebuild_daily_nutrition.py`` after upgrading.
+    """
+    op.create_table(
+        "daily_nutrition",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        sa.Column("meal_count", sa.Integer(), nullable=False),
+        sa.Column("total_calories", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("total_protein_g", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("total_carbs_g", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("total_fat_g", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "local_date"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_nutrition")
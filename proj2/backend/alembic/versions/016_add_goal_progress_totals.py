@@ -0,0 +1,47 @@
+"""Add running progress totals to goals
+
+Revision ID: 016_add_goal_progress_totals
+Revises: 015_add_daily_nutrition_table
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016_add_goal_progress_totals"
+down_revision: Union[str, Sequence[str], None] = "015_add_daily_nutrition_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Totals start at zero; run ``scripts/reconcile_goal_progress.py`` after
+    upgrading to compute them for existing goals.
+    """
+    with op.batch_alter_table("goals", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "progress_sum",
+                sa.Numeric(precision=12, scale=2),
+                nullable=False,
+                server_default="0",
+            )
+        )
+        batch_op.add_column(
+            sa.Column("progress_days", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("goals", schema=None) as batch_op:
+        batch_op.drop_column("progress_days")
+        batch_op.drop_column("progress_sum")
@@ -0,0 +1,30 @@
+"""Add (status, end_date) index for the goal status worker
+
+Revision ID: 017_add_goal_status_end_date_index
+Revises: 016_add_goal_progress_totals
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017_add_goal_status_end_date_index"
+down_revision: Union[str, Sequence[str], None] = "016_add_goal_progress_totals"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index active goals by end date."""
+    op.create_index(
+        "ix_goals_status_end_date", "goals", ["status", "end_date"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the index."""
+    op.drop_index("ix_goals_status_end_date", table_name="goals")
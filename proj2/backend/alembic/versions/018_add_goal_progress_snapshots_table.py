@@ -0,0 +1,45 @@
+"""Add goal_progress_snapshots table
+
+Revision ID: 018_add_goal_progress_snapshots_table
+Revises: 017_add_goal_status_end_date_index
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018_add_goal_progress_snapshots_table"
+down_revision: Union[str, Sequence[str], None] = "017_add_goal_status_end_date_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    History starts with the first snapshot the goal status worker records
+    after upgrading; earlier progress was never stored.
+    """
+    op.create_table(
+        "goal_progress_snapshots",
+        sa.Column("goal_id", sa.String(), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("period_days", sa.Integer(), nullable=False),
+        sa.Column("value", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("min_value", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("max_value", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["goal_id"], ["goals.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("goal_id", "snapshot_date", "period_days"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("goal_progress_snapshots")
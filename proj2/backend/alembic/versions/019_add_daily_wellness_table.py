@@ -0,0 +1,52 @@
+"""Add daily_wellness rollup table
+
+Revision ID: 019_add_daily_wellness_table
+Revises: 018_add_goal_progress_snapshots_table
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "019_add_daily_wellness_table"
+down_revision: Union[str, Sequence[str], None] = "018_add_goal_progress_snapshots_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+METRICS = ("mood_score", "stress_level", "sleep_hours", "sleep_quality")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing wellness logs are not rolled up here; run
+    ``scripts/rebuild_daily_wellness.py`` after upgrading.
+    """
+    metric_columns = []
+    for metric in METRICS:
+        metric_columns += [
+            sa.Column(
+                f"{metric}_sum", sa.Numeric(precision=10, scale=2), nullable=False
+            ),
+            sa.Column(f"{metric}_count", sa.Integer(), nullable=False),
+        ]
+    op.create_table(
+        "daily_wellness",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        *metric_columns,
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "local_date"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_wellness")
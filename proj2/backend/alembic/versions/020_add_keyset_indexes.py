@@ -0,0 +1,100 @@
+"""Add composite indexes in keyset pagination order
+
+The list endpoints page on (sort column, id). Extend the hot path indexes
+from 013_add_hot_path_indexes with the id tie-breaker so SQLite no longer
+sorts the right part of the ORDER BY, and index the audit logs the same way:
+- wellness logs filtered by user_id and ordered by (occurred_at_utc, id)
+- meals filtered by user_id and ordered by (meal_time, id)
+- goals filtered by user_id (and status) and ordered by (created_at, id)
+- audit logs (optionally filtered by target user) ordered by (created_at, id)
+
+Revision ID: 020_add_keyset_indexes
+Revises: 019_add_daily_wellness_table
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "020_add_keyset_indexes"
+down_revision: Union[str, Sequence[str], None] = "019_add_daily_wellness_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table name, columns, replaced 013 index or None)
+INDEXES = [
+    (
+        "ix_mood_logs_user_id_occurred_at_utc_id",
+        "mood_logs",
+        ["user_id", "occurred_at_utc", "id"],
+        "ix_mood_logs_user_id_occurred_at_utc",
+    ),
+    (
+        "ix_stress_logs_user_id_occurred_at_utc_id",
+        "stress_logs",
+        ["user_id", "occurred_at_utc", "id"],
+        "ix_stress_logs_user_id_occurred_at_utc",
+    ),
+    (
+        "ix_sleep_logs_user_id_occurred_at_utc_id",
+        "sleep_logs",
+        ["user_id", "occurred_at_utc", "id"],
+        "ix_sleep_logs_user_id_occurred_at_utc",
+    ),
+    (
+        "ix_meals_user_id_meal_time_id",
+        "meals",
+        ["user_id", "meal_time", "id"],
+        "ix_meals_user_id_meal_time",
+    ),
+    (
+        "ix_goals_user_id_created_at_id",
+        "goals",
+        ["user_id", "created_at", "id"],
+        "ix_goals_user_id_created_at",
+    ),
+    (
+        "ix_goals_user_id_status_created_at_id",
+        "goals",
+        ["user_id", "status", "created_at", "id"],
+        "ix_goals_user_id_status_created_at",
+    ),
+    (
+        "ix_allergen_audit_logs_created_at_id",
+        "allergen_audit_logs",
+        ["created_at", "id"],
+        None,
+    ),
+    (
+        "ix_user_audit_logs_created_at_id",
+        "user_audit_logs",
+        ["created_at", "id"],
+        None,
+    ),
+    (
+        "ix_user_audit_logs_target_user_id_created_at_id",
+        "user_audit_logs",
+        ["target_user_id", "created_at", "id"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create the keyset indexes, replacing their 013 prefixes."""
+    for index_name, table_name, columns, replaced in INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+        if replaced:
+            op.drop_index(replaced, table_name=table_name)
+
+
+def downgrade() -> None:
+    """Restore the 013 indexes and drop the keyset indexes."""
+    for index_name, table_name, columns, replaced in reversed(INDEXES):
+        if replaced:
+            op.create_index(replaced, table_name, columns[:-1], unique=False)
+        op.drop_index(index_name, table_name=table_name)
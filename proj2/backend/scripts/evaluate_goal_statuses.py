@@ -0,0 +1,50 @@
+"""Complete or expire active goals whose end date has passed.
+
+Schedule this script from cron (e.g. hourly, once per deployment) or run it
+to catch up after downtime. The API only runs it in the background when
+GOAL_STATUS_INTERVAL_SECONDS is set.
+
+Usage:
+    uv run python scripts/evaluate_goal_statuses.py
+    uv run python scripts/evaluate_goal_statuses.py --batch-size 5000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from eatsential.db import SessionLocal
+from eatsential.services.goal_status_service import (
+    GOAL_STATUS_BATCH_SIZE,
+    GoalStatusService,
+)
+
+
+def main() -> None:
+    """Parse arguments, evaluate ended goals and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=GOAL_STATUS_BATCH_SIZE,
+        help="Goals per transaction",
+    )
+    args = parser.parse_args()
+
+    print("Evaluating ended goals...")
+    print("=" * 50)
+    stats = GoalStatusService.run_once(SessionLocal, batch_size=args.batch_size)
+    print(f"  completed: {stats.completed}")
+    print(f"  expired:   {stats.expired}")
+    print(f"  batches:   {stats.batches}")
+    print(
+        f"\n✓ Evaluated {stats.evaluated} goals in {stats.elapsed_seconds:.2f}s "
+        f"({stats.goals_per_second:.0f} goals/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
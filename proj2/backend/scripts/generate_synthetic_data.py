@@ -0,0 +1,136 @@
+r"""Generate a large deterministic synthetic dataset for load tests and benchmarks.
+
+Creates users (synth<N>@example.com, all with the same password), health
+profiles, goals, meals with food items, daily mood, stress and sleep logs
+and a restaurant catalog, then builds the daily rollups and goal progress.
+The same --seed and --end-date always produce the same rows. Partitions are
+generated and bulk inserted by --workers processes; on SQLite their writes
+take turns, on PostgreSQL they run in parallel.
+
+Usage:
+    # Apply migrations to an empty database first
+    DATABASE_URL=sqlite:///./bench.db uv run alembic upgrade head
+    DATABASE_URL=sqlite:///./bench.db \
+        uv run python scripts/generate_synthetic_data.py --users 10000
+
+    # 1M users, 100M meals, two years of wellness logs, 1M menu items
+    uv run python scripts/generate_synthetic_data.py --users 1000000 \
+        --meals-per-user 100 --days 730 --menu-items 1000000 --workers 16
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from eatsential.db.database import DATABASE_URL
+from eatsential.scripts.synthetic_data import (
+    DEFAULT_PASSWORD,
+    SyntheticDataConfig,
+    generate,
+    user_email,
+)
+from eatsential.utils.auth_util import get_password_hash
+
+
+def main() -> None:
+    """Parse arguments and generate the dataset."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=DATABASE_URL,
+        help="Migrated, empty database to fill (default: DATABASE_URL)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--users", type=int, default=1000, help="Users")
+    parser.add_argument(
+        "--meals-per-user", type=int, default=100, help="Meals per user"
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="Days of meal and wellness history"
+    )
+    parser.add_argument(
+        "--log-rate",
+        type=float,
+        default=0.8,
+        help="Chance a user logs each wellness type on a day",
+    )
+    parser.add_argument("--menu-items", type=int, default=10000, help="Menu items")
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Day after the last day of history (default: today, which is left "
+        "free for new logs)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(os.cpu_count() or 1, 8),
+        help="Processes generating and loading partitions",
+    )
+    parser.add_argument(
+        "--password", default=DEFAULT_PASSWORD, help="Password of every user"
+    )
+    parser.add_argument(
+        "--skip-rollups",
+        action="store_true",
+        help="Do not build daily rollups and goal progress",
+    )
+    args = parser.parse_args()
+    if args.days < 1 or not 0 <= args.log_rate <= 1:
+        parser.error("--days must be positive and --log-rate between 0 and 1")
+
+    config = SyntheticDataConfig(
+        seed=args.seed,
+        users=args.users,
+        meals_per_user=args.meals_per_user,
+        days=args.days,
+        log_rate=args.log_rate,
+        menu_items=args.menu_items,
+        end_date=args.end_date,
+    )
+    partitions = config.user_partitions + config.menu_partitions
+    print(
+        f"Generating {config.users} users and {config.menu_items} menu items "
+        f"in {partitions} partitions with {args.workers} workers..."
+    )
+    print("=" * 50)
+    start = time.perf_counter()
+    done = 0
+
+    def progress(totals: dict[str, int]) -> None:
+        nonlocal done
+        done += 1
+        rows = sum(totals.values())
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {done}/{partitions} partitions, {rows} rows "
+            f"({elapsed:.1f}s, {rows / elapsed:.0f} rows/s)"
+        )
+
+    try:
+        totals = generate(
+            args.database_url,
+            config,
+            get_password_hash(args.password),
+            workers=args.workers,
+            rollups=not args.skip_rollups,
+            on_progress=progress,
+        )
+    except ValueError as e:
+        sys.exit(f"✗ {e}")
+
+    print(f"\n✓ Generated {sum(totals.values())} rows")
+    for table, count in sorted(totals.items()):
+        print(f"  {table}: {count}")
+    print(f"  Log in as {user_email(0)} with password {args.password!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+r"""Import a user's mood, stress and sleep history from a CSV or NDJSON file.
+
+CSV files need a header row with log_type (mood, stress or sleep) and
+occurred_at (ISO8601 with timezone) plus the scores of each log type:
+mood_score; stress_level; duration_hours and quality_score. notes and
+triggers are optional. NDJSON files hold one object with the same keys per
+line. Rejected records are written to an NDJSON error file.
+
+Usage:
+    uv run python scripts/import_wellness_logs.py --user-id <id> export.csv
+
+    # NDJSON, 5000 records per transaction, errors to a chosen file
+    uv run python scripts/import_wellness_logs.py --user-id <id> \
+        --chunk-size 5000 --errors rejected.ndjson export.ndjson
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from eatsential.db import SessionLocal
+from eatsential.models import UserDB
+from eatsential.schemas.schemas import WellnessImportResponse
+from eatsential.services.wellness_import_service import (
+    WELLNESS_IMPORT_CHUNK_SIZE,
+    WellnessImportService,
+)
+
+
+def main() -> None:
+    """Parse arguments and import the file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="CSV or NDJSON file to import")
+    parser.add_argument("--user-id", required=True, help="User to import for")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "ndjson"),
+        help="File format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=WELLNESS_IMPORT_CHUNK_SIZE,
+        help="Records per transaction",
+    )
+    parser.add_argument(
+        "--errors",
+        type=Path,
+        help="Where to write rejected records (default: <path>.errors.ndjson)",
+    )
+    args = parser.parse_args()
+
+    import_format = args.format or (
+        "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    )
+    errors_path = args.errors or args.path.with_name(f"{args.path.name}.errors.ndjson")
+
+    db = SessionLocal()
+    try:
+        user = db.get(UserDB, args.user_id)
+        if user is None:
+            sys.exit(f"User {args.user_id} not found")
+
+        print(f"Importing {args.path} ({import_format})...")
+        print("=" * 50)
+        start = time.perf_counter()
+
+        def progress(report: WellnessImportResponse) -> None:
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {report.processed} records, {report.imported} imported, "
+                f"{report.failed} rejected ({elapsed:.1f}s, "
+                f"{report.processed / elapsed:.0f} records/s)"
+            )
+
+        with (
+            args.path.open(encoding="utf-8-sig", newline="") as lines,
+            open(errors_path, "w", encoding="utf-8") as errors_file,
+        ):
+            report = WellnessImportService.import_logs(
+                db,
+                user,
+                lines,
+                import_format,
+                chunk_size=args.chunk_size,
+                on_error=lambda error: errors_file.write(
+                    error.model_dump_json() + "\n"
+                ),
+                on_progress=progress,
+            )
+    finally:
+        db.close()
+
+    print(f"\n✓ Imported {report.imported} logs")
+    for log_type, count in report.imported_by_type.items():
+        print(f"  {log_type}: {count}")
+    if report.failed:
+        print(f"✗ Rejected {report.failed} records, see {errors_path}")
+
+
+if __name__ == "__main__":
+    main()
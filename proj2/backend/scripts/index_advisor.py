@@ -0,0 +1,543 @@
+"""Query-plan based index advisor for the service query shapes.
+
+Runs ``EXPLAIN QUERY PLAN`` (SQLite) or ``EXPLAIN`` (PostgreSQL) for every
+query shape used by the services and flags full table scans and temporary
+B-tree sorts, which usually mean a missing composite index.
+
+Usage:
+    # Analyse the database configured by DATABASE_URL
+    uv run python scripts/index_advisor.py
+
+    # Seed a large throwaway SQLite database and benchmark the hot queries
+    # without and with the indexes recommended by the migrations
+    uv run python scripts/index_advisor.py --benchmark --users 200 --rows 500
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import Engine, create_engine, func, insert, select, text
+from sqlalchemy.sql import Select
+
+from eatsential.db.database import DATABASE_URL, Base
+from eatsential.models import (
+    AllergenDB,
+    DailyNutritionDB,
+    GoalDB,
+    MealDB,
+    MealFoodItemDB,
+    MenuItem,
+    MoodLogDB,
+    Restaurant,
+    SleepLogDB,
+    StressLogDB,
+    UserAuditLogDB,
+    UserDB,
+)
+from eatsential.models.models import AllergenAuditLogDB
+
+# Indexes added by migrations 013_add_hot_path_indexes,
+# 017_add_goal_status_end_date_index and 020_add_keyset_indexes
+RECOMMENDED_INDEXES = [
+    "ix_mood_logs_user_id_occurred_at_utc_id",
+    "ix_stress_logs_user_id_occurred_at_utc_id",
+    "ix_sleep_logs_user_id_occurred_at_utc_id",
+    "ix_meals_user_id_meal_time_id",
+    "ix_goals_user_id_created_at_id",
+    "ix_goals_user_id_status_created_at_id",
+    "ix_goals_status_end_date",
+    "ix_menu_items_restaurant_id",
+    "ix_restaurants_is_active",
+    "ix_allergen_audit_logs_created_at_id",
+    "ix_user_audit_logs_created_at_id",
+    "ix_user_audit_logs_target_user_id_created_at_id",
+]
+
+_SQLITE_FULL_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)\b(?! USING)")
+_SQLITE_INDEX_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+) USING (?:COVERING )?INDEX")
+_PG_SEQ_SCAN_RE = re.compile(r"Seq Scan on (\w+)")
+_PG_SORT_RE = re.compile(r"(?:^|->\s*)(?:Incremental )?Sort\s+\(")
+
+
+def query_shapes(user_id: str, restaurant_id: str, meal_id: str) -> dict[str, Select]:
+    """Build the query shapes issued by the services.
+
+    Args:
+        user_id: User ID to filter by
+        restaurant_id: Restaurant ID to filter menu items by
+        meal_id: Meal ID to filter food items by
+
+    Returns:
+        Mapping of shape name to SQLAlchemy select statement
+
+    """
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    week_ago = now - timedelta(days=7)
+
+    def wellness_list(model):
+        return (
+            select(model)
+            .where(model.user_id == user_id)
+            .where(model.occurred_at_utc >= week_ago)
+            .where(model.occurred_at_utc <= now)
+            .order_by(model.occurred_at_utc.desc(), model.id.desc())
+        )
+
+    return {
+        "meals.list": (
+            select(MealDB)
+            .where(MealDB.user_id == user_id)
+            .order_by(MealDB.meal_time.desc(), MealDB.id.desc())
+            .limit(20)
+            .offset(0)
+        ),
+        "meals.list_by_range": (
+            select(MealDB)
+            .where(MealDB.user_id == user_id)
+            .where(MealDB.meal_time >= week_ago)
+            .where(MealDB.meal_time <= now)
+            .order_by(MealDB.meal_time.desc(), MealDB.id.desc())
+            .limit(20)
+        ),
+        "meals.count": (
+            select(func.count()).select_from(MealDB).where(MealDB.user_id == user_id)
+        ),
+        "meal_food_items.by_meal": (
+            select(MealFoodItemDB).where(MealFoodItemDB.meal_id == meal_id)
+        ),
+        "meals.type_breakdown": (
+            select(MealDB.meal_type, func.count(), func.sum(MealDB.total_calories))
+            .where(MealDB.user_id == user_id)
+            .where(MealDB.meal_time >= week_ago)
+            .where(MealDB.meal_time < now)
+            .group_by(MealDB.meal_type)
+        ),
+        "daily_nutrition.range": (
+            select(DailyNutritionDB)
+            .where(DailyNutritionDB.user_id == user_id)
+            .where(DailyNutritionDB.local_date >= week_ago.date())
+            .where(DailyNutritionDB.local_date <= now.date())
+            .where(DailyNutritionDB.meal_count > 0)
+            .order_by(DailyNutritionDB.local_date)
+        ),
+        "goals.list": (
+            select(GoalDB)
+            .where(GoalDB.user_id == user_id)
+            .order_by(GoalDB.created_at.desc(), GoalDB.id.desc())
+            .limit(20)
+            .offset(0)
+        ),
+        "goals.list_by_status": (
+            select(GoalDB)
+            .where(GoalDB.user_id == user_id)
+            .where(GoalDB.status == "active")
+            .order_by(GoalDB.created_at.desc(), GoalDB.id.desc())
+            .limit(20)
+        ),
+        "goals.ended_active": (
+            select(GoalDB.id, GoalDB.user_id)
+            .where(GoalDB.status == "active")
+            .where(GoalDB.end_date < now.date())
+            .order_by(GoalDB.end_date)
+            .limit(1000)
+        ),
+        "mood_logs.list": wellness_list(MoodLogDB),
+        "stress_logs.list": wellness_list(StressLogDB),
+        "sleep_logs.list": wellness_list(SleepLogDB),
+        "menu_items.active_candidates": (
+            select(MenuItem).join(Restaurant).where(Restaurant.is_active.is_(True))
+        ),
+        "menu_items.by_restaurant": (
+            select(MenuItem).where(MenuItem.restaurant_id == restaurant_id)
+        ),
+        "restaurants.active": select(Restaurant).where(Restaurant.is_active.is_(True)),
+        "allergens.search": (
+            select(AllergenDB)
+            .where(AllergenDB.name.ilike("%nut%"))
+            .order_by(AllergenDB.name)
+            .limit(100)
+        ),
+        "allergen_audit_logs.recent": (
+            select(AllergenAuditLogDB)
+            .order_by(
+                AllergenAuditLogDB.created_at.desc(), AllergenAuditLogDB.id.desc()
+            )
+            .limit(100)
+        ),
+        "user_audit_logs.recent": (
+            select(UserAuditLogDB)
+            .order_by(UserAuditLogDB.created_at.desc(), UserAuditLogDB.id.desc())
+            .limit(100)
+        ),
+        "user_audit_logs.by_user": (
+            select(UserAuditLogDB)
+            .where(UserAuditLogDB.target_user_id == user_id)
+            .order_by(UserAuditLogDB.created_at.desc(), UserAuditLogDB.id.desc())
+            .limit(100)
+        ),
+    }
+
+
+def explain(engine: Engine, stmt: Select) -> list[str]:
+    """Return the query plan for a statement as a list of lines.
+
+    Args:
+        engine: Database engine
+        stmt: Statement to explain
+
+    Returns:
+        Plan lines (SQLite detail column or PostgreSQL EXPLAIN output)
+
+    """
+    # Compile with named parameters so the SQL can be wrapped in text()
+    dialect = type(engine.dialect)(paramstyle="named")
+    compiled = stmt.compile(dialect=dialect)
+
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            rows = conn.execute(
+                text(f"EXPLAIN QUERY PLAN {compiled}"), compiled.params
+            ).all()
+            return [row[-1] for row in rows]
+        rows = conn.execute(text(f"EXPLAIN {compiled}"), compiled.params).all()
+        return [row[0] for row in rows]
+
+
+def find_plan_issues(dialect_name: str, plan: list[str]) -> list[str]:
+    """Flag full scans and temporary sorts in a query plan.
+
+    Args:
+        dialect_name: Database dialect name ("sqlite" or "postgresql")
+        plan: Plan lines from explain()
+
+    Returns:
+        Human-readable issue descriptions
+
+    """
+    issues = []
+    for line in plan:
+        detail = line.strip()
+        if dialect_name == "sqlite":
+            # "SCAN t USING INDEX" is also a full scan, just of an index
+            if match := _SQLITE_INDEX_SCAN_RE.match(detail):
+                issues.append(f"full index scan on {match.group(1)}")
+            elif match := _SQLITE_FULL_SCAN_RE.match(detail):
+                issues.append(f"full table scan on {match.group(1)}")
+            if "USE TEMP B-TREE" in detail:
+                issues.append(f"temp B-tree sort ({detail})")
+        else:
+            if match := _PG_SEQ_SCAN_RE.search(detail):
+                issues.append(f"sequential scan on {match.group(1)}")
+            if _PG_SORT_RE.search(detail):
+                issues.append("explicit sort")
+    return issues
+
+
+def _sample_ids(engine: Engine) -> tuple[str, str, str]:
+    """Pick existing user, restaurant and meal IDs to build realistic shapes"""
+    with engine.connect() as conn:
+        user_id = conn.execute(
+            select(MealDB.user_id).group_by(MealDB.user_id).limit(1)
+        ).scalar()
+        restaurant_id = conn.execute(select(Restaurant.id).limit(1)).scalar()
+        meal_id = conn.execute(select(MealDB.id).limit(1)).scalar()
+    return user_id or "user", restaurant_id or "restaurant", meal_id or "meal"
+
+
+def advise(engine: Engine) -> dict[str, list[str]]:
+    """Explain every query shape and print the flagged plans.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Mapping of shape name to list of issues (empty when the plan is fine)
+
+    """
+    shapes = query_shapes(*_sample_ids(engine))
+    results = {}
+
+    print(f"{'QUERY SHAPE':<32} RESULT")
+    print("-" * 70)
+    for name, stmt in shapes.items():
+        plan = explain(engine, stmt)
+        issues = find_plan_issues(engine.dialect.name, plan)
+        results[name] = issues
+        if issues:
+            print(f"{name:<32} ⚠️  {'; '.join(issues)}")
+        else:
+            print(f"{name:<32} ✓ indexed")
+
+    return results
+
+
+def benchmark(engine: Engine, repeat: int = 20) -> dict[str, float]:
+    """Measure the median latency of every query shape in milliseconds.
+
+    Args:
+        engine: Database engine
+        repeat: Number of executions per shape
+
+    Returns:
+        Mapping of shape name to median latency (ms)
+
+    """
+    shapes = query_shapes(*_sample_ids(engine))
+    timings = {}
+
+    with engine.connect() as conn:
+        for name, stmt in shapes.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(stmt).all()
+                samples.append((time.perf_counter() - start) * 1000)
+            timings[name] = statistics.median(samples)
+
+    return timings
+
+
+def seed_benchmark_database(engine: Engine, users: int, rows: int) -> None:
+    """Bulk insert a large deterministic dataset for benchmarking.
+
+    Args:
+        engine: Database engine (schema must already exist)
+        users: Number of users
+        rows: Number of meals and of each wellness log type per user
+
+    """
+    rng = random.Random(42)  # noqa: S311 - deterministic benchmark data
+    base_time = datetime(2025, 6, 1, 12, 0, 0)
+    created = datetime(2025, 1, 1)
+
+    with engine.begin() as conn:
+        user_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(users)]
+        conn.execute(
+            insert(UserDB),
+            [
+                {
+                    "id": user_id,
+                    "email": f"bench{i}@example.com",
+                    "username": f"bench{i}",
+                    "password_hash": "x",
+                    "account_status": "verified",
+                    "email_verified": True,
+                    "role": "user",
+                    "timezone": "UTC",
+                    "created_at": created,
+                    "updated_at": created,
+                }
+                for i, user_id in enumerate(user_ids)
+            ],
+        )
+
+        restaurant_ids = [str(uuid.uuid4()) for _ in range(max(users, 50))]
+        conn.execute(
+            insert(Restaurant),
+            [
+                {
+                    "id": restaurant_id,
+                    "name": f"Restaurant {i}",
+                    "is_active": rng.random() > 0.2,
+                    "created_at": created,
+                }
+                for i, restaurant_id in enumerate(restaurant_ids)
+            ],
+        )
+        conn.execute(
+            insert(MenuItem),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "restaurant_id": restaurant_id,
+                    "name": f"Item {j}",
+                    "calories": rng.randint(100, 1200),
+                    "price": round(rng.uniform(5, 40), 2),
+                    "created_at": created,
+                }
+                for restaurant_id in restaurant_ids
+                for j in range(20)
+            ],
+        )
+
+        for user_id in user_ids:
+            meals = []
+            food_items = []
+            for i in range(rows):
+                meal_id = str(uuid.uuid4())
+                meal_time = base_time - timedelta(hours=8 * i)
+                meals.append(
+                    {
+                        "id": meal_id,
+                        "user_id": user_id,
+                        "meal_type": rng.choice(["breakfast", "lunch", "dinner"]),
+                        "meal_time": meal_time,
+                        "total_calories": 500,
+                        "created_at": meal_time,
+                        "updated_at": meal_time,
+                    }
+                )
+                food_items.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "meal_id": meal_id,
+                        "food_name": "Food",
+                        "portion_size": 1,
+                        "portion_unit": "serving",
+                        "calories": 500,
+                        "created_at": meal_time,
+                    }
+                )
+            conn.execute(insert(MealDB), meals)
+            conn.execute(insert(MealFoodItemDB), food_items)
+
+            conn.execute(
+                insert(GoalDB),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "user_id": user_id,
+                        "goal_type": "nutrition",
+                        "target_type": "daily_calories",
+                        "target_value": 2000,
+                        "current_value": 0,
+                        "start_date": date(2025, 1, 1),
+                        "end_date": date(2025, 12, 31),
+                        "status": rng.choice(["active", "completed", "cancelled"]),
+                        "created_at": created + timedelta(days=i),
+                        "updated_at": created,
+                    }
+                    for i in range(max(rows // 25, 1))
+                ],
+            )
+
+            for model, extra in (
+                (MoodLogDB, {"mood_score": 7}),
+                (StressLogDB, {"stress_level": 4}),
+                (SleepLogDB, {"duration_hours": 7.5, "quality_score": 8}),
+            ):
+                conn.execute(
+                    insert(model),
+                    [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "user_id": user_id,
+                            "occurred_at_utc": base_time - timedelta(days=i),
+                            "created_at": base_time - timedelta(days=i),
+                            "updated_at": base_time - timedelta(days=i),
+                            **extra,
+                        }
+                        for i in range(rows)
+                    ],
+                )
+
+
+def _drop_recommended_indexes(engine: Engine) -> None:
+    """Drop the recommended indexes to reproduce the pre-migration schema"""
+    with engine.begin() as conn:
+        for index_name in RECOMMENDED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+def _create_recommended_indexes(engine: Engine) -> None:
+    """Create the recommended indexes from the model metadata"""
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in RECOMMENDED_INDEXES:
+                    index.create(conn, checkfirst=True)
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+
+
+def run_benchmark(users: int, rows: int, repeat: int) -> None:
+    """Seed a throwaway SQLite database and compare latency before/after.
+
+    Args:
+        users: Number of users to seed
+        rows: Meals and wellness logs per user
+        repeat: Executions per query shape
+
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "index_benchmark.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        _drop_recommended_indexes(engine)
+
+        print(f"Seeding {users} users x {rows} rows per table...")
+        seed_benchmark_database(engine, users, rows)
+
+        print("\n=== BEFORE (without recommended indexes) ===")
+        advise(engine)
+        before = benchmark(engine, repeat)
+
+        _create_recommended_indexes(engine)
+
+        print("\n=== AFTER (with recommended indexes) ===")
+        advise(engine)
+        after = benchmark(engine, repeat)
+
+        header = f"{'BEFORE ms':>10} {'AFTER ms':>10} {'SPEEDUP':>8}"
+        print(f"\n{'QUERY SHAPE':<32} {header}")
+        print("-" * 64)
+        for name in before:
+            speedup = before[name] / after[name] if after[name] else float("inf")
+            print(
+                f"{name:<32} {before[name]:>10.3f} {after[name]:>10.3f} "
+                f"{speedup:>7.1f}x"
+            )
+
+        engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the advisor or the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=DATABASE_URL,
+        help="Database to analyse (default: DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Seed a temporary SQLite database and compare before/after latency",
+    )
+    parser.add_argument("--users", type=int, default=200, help="Users to seed")
+    parser.add_argument(
+        "--rows", type=int, default=500, help="Meals and wellness logs per user"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Executions per query shape"
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.users, args.rows, args.repeat)
+        return
+
+    engine = create_engine(args.database_url)
+    try:
+        results = advise(engine)
+    finally:
+        engine.dispose()
+
+    flagged = [name for name, issues in results.items() if issues]
+    print(f"\n{len(flagged)} of {len(results)} query shapes flagged")
+
+
+if __name__ == "__main__":
+    main()
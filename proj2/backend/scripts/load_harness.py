@@ -0,0 +1,168 @@
+r"""Drive realistic user sessions against a running API and report latencies.
+
+Virtual users log in as synthetic users (scripts/generate_synthetic_data.py),
+log mood, stress and sleep, then repeatedly list meals, log a meal, check
+goal progress and ask for meal recommendations. Prints throughput and
+p50/p95/p99 per endpoint and writes them as JSON with the commit under
+test, so runs of two commits can be compared with --compare.
+
+Usage:
+    # Seeded database, stand-in LLM answering after 300 ms
+    DATABASE_URL=sqlite:///./bench.db LLM_STAND_IN_LATENCY_MS=300 \
+        uv run uvicorn src.eatsential.index:app --workers 4
+
+    uv run python scripts/load_harness.py --users 50 --duration 60 \
+        --output before.json
+    # ...check out another commit, restart the server...
+    uv run python scripts/load_harness.py --users 50 --duration 60 \
+        --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from eatsential.scripts.load_harness import compare_reports, run_load_test
+from eatsential.scripts.synthetic_data import DEFAULT_PASSWORD
+
+
+def _git_commit() -> Optional[str]:
+    """Return the commit of the working tree, if it is a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_report(report: dict) -> None:
+    """Print the per endpoint table of a report"""
+    header = f"{'REQS':>7} {'ERR':>5} {'RPS':>8} {'P50 ms':>9} {'P95 ms':>9}"
+    print(f"\n{'ENDPOINT':<32} {header} {'P99 ms':>9}")
+    print("-" * 84)
+    rows = [*report["endpoints"].items(), ("total", report["total"])]
+    for endpoint, summary in rows:
+        print(
+            f"{endpoint:<32} {summary['requests']:>7} {summary['errors']:>5} "
+            f"{summary['throughput_rps']:>8.1f} {summary.get('p50_ms', 0):>9.1f} "
+            f"{summary.get('p95_ms', 0):>9.1f} {summary.get('p99_ms', 0):>9.1f}"
+        )
+
+
+def _print_comparison(baseline: dict, report: dict) -> None:
+    """Print how each endpoint's metrics changed against a baseline"""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    print(f"{'ENDPOINT':<32} {'METRIC':<15} {'BEFORE':>9} {'AFTER':>9} CHANGE")
+    print("-" * 84)
+    for row in compare_reports(baseline, report):
+        mark = "✓" if row["improved"] else "✗" if row["change_pct"] else " "
+        print(
+            f"{row['endpoint']:<32} {row['metric']:<15} {row['baseline']:>9.1f} "
+            f"{row['current']:>9.1f} {row['change_pct']:>+6.1f}% {mark}"
+        )
+
+
+def main() -> None:
+    """Parse arguments, run the load test and write the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--base-url", default="http://127.0.0.1:8000", help="Running API"
+    )
+    parser.add_argument("--users", type=int, default=20, help="Concurrent users")
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Seconds to run sessions for"
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0,
+        help="Mean seconds a user waits between requests",
+    )
+    parser.add_argument(
+        "--first-user", type=int, default=0, help="Index of the first synth user"
+    )
+    parser.add_argument(
+        "--password", default=DEFAULT_PASSWORD, help="Password of the synth users"
+    )
+    parser.add_argument(
+        "--recommendation-mode",
+        choices=("llm", "baseline"),
+        default="llm",
+        help="Ranking requested from /api/recommend/meal",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed of user choices")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Where to write the JSON report (default: load_test_<commit>.json)",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Earlier JSON report to compare against"
+    )
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    print(
+        f"Running {args.users} users against {args.base_url} "
+        f"for {args.duration:.0f}s..."
+    )
+    print("=" * 50)
+    started_at = datetime.now(timezone.utc)
+    report = asyncio.run(
+        run_load_test(
+            args.base_url,
+            args.users,
+            args.duration,
+            password=args.password,
+            first_user=args.first_user,
+            think_time=args.think_time,
+            recommendation_mode=args.recommendation_mode,
+            seed=args.seed,
+        )
+    )
+    report = {
+        "commit": commit,
+        "started_at": started_at.isoformat(),
+        "config": {
+            key: getattr(args, key)
+            for key in (
+                "base_url",
+                "users",
+                "duration",
+                "think_time",
+                "first_user",
+                "recommendation_mode",
+                "seed",
+            )
+        },
+        **report,
+    }
+
+    _print_report(report)
+    output = args.output or Path(f"load_test_{commit or 'unknown'}.json")
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\n✓ {report['sessions']} sessions, report written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        _print_comparison(baseline, report)
+
+    if report["total"]["errors"]:
+        print(f"✗ {report['total']['errors']} requests failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Rebuild the daily_nutrition rollup from raw meals.
+
+Run after applying migration 015_add_daily_nutrition_table, after changing a
+user's timezone, or whenever the rollup is suspected to have drifted. Users
+are processed in batches, each rebuilt and committed in its own transaction.
+
+Usage:
+    # Rebuild every user
+    uv run python scripts/rebuild_daily_nutrition.py
+
+    # Rebuild specific users
+    uv run python scripts/rebuild_daily_nutrition.py --user-id <id> --user-id <id>
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import select
+
+from eatsential.db import SessionLocal
+from eatsential.models import UserDB
+from eatsential.services.daily_nutrition_service import DailyNutritionService
+
+
+def rebuild_daily_nutrition(
+    user_ids: list[str], batch_size: int = 200, yield_per: int = 5000
+) -> int:
+    """Rebuild rollups for the given users, or all users if none are given.
+
+    Args:
+        user_ids: Users to rebuild; empty for all users
+        batch_size: Users rebuilt per transaction
+        yield_per: Meal rows fetched per round trip
+
+    Returns:
+        Number of rollup rows written
+
+    """
+    db = SessionLocal()
+    rows_written = 0
+    users_done = 0
+    start = time.perf_counter()
+    try:
+        last_id = ""
+        while True:
+            if user_ids:
+                batch = user_ids[users_done : users_done + batch_size]
+            else:
+                # Keyset over user IDs so each batch query stays cheap
+                batch = list(
+                    db.scalars(
+                        select(UserDB.id)
+                        .where(UserDB.id > last_id)
+                        .order_by(UserDB.id)
+                        .limit(batch_size)
+                    )
+                )
+            if not batch:
+                break
+
+            rows_written += DailyNutritionService.rebuild(db, batch, yield_per)
+            users_done += len(batch)
+            last_id = batch[-1]
+            print(
+                f"  {users_done} users, {rows_written} days "
+                f"({time.perf_counter() - start:.1f}s)"
+            )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return rows_written
+
+
+def main() -> None:
+    """Parse arguments and rebuild the rollup."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        action="append",
+        default=[],
+        help="Rebuild only this user (repeatable)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="Users per transaction"
+    )
+    parser.add_argument(
+        "--yield-per", type=int, default=5000, help="Meal rows per fetch"
+    )
+    args = parser.parse_args()
+
+    print("Rebuilding daily nutrition rollup...")
+    print("=" * 50)
+    rows_written = rebuild_daily_nutrition(
+        args.user_id, args.batch_size, args.yield_per
+    )
+    print(f"\n✓ Wrote {rows_written} daily nutrition rows")
+
+
+if __name__ == "__main__":
+    main()
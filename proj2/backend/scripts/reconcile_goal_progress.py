@@ -0,0 +1,77 @@
+"""Recompute log-driven goal progress from the raw meal and wellness data.
+
+Run after applying migration 016_add_goal_progress_totals, after rebuilding
+the daily_nutrition rollup, or whenever goal progress is suspected to have
+drifted from the logs. Active goals are processed in batches, each written
+and committed in its own transaction.
+
+Usage:
+    # Reconcile every active tracked goal
+    uv run python scripts/reconcile_goal_progress.py
+
+    # Reconcile the goals of specific users
+    uv run python scripts/reconcile_goal_progress.py --user-id <id> --user-id <id>
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from eatsential.db import SessionLocal
+from eatsential.services.goal_progress_service import GoalProgressService
+
+
+def reconcile_goal_progress(user_ids: list[str], batch_size: int = 500) -> int:
+    """Reconcile goals of the given users, or of all users if none are given.
+
+    Args:
+        user_ids: Users whose goals to reconcile; empty for all users
+        batch_size: Goals per transaction
+
+    Returns:
+        Number of goals reconciled
+
+    """
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        reconciled = GoalProgressService.reconcile(
+            db, user_ids or None, batch_size=batch_size
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"  {reconciled} goals ({elapsed:.1f}s)")
+    return reconciled
+
+
+def main() -> None:
+    """Parse arguments and reconcile goal progress."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        action="append",
+        default=[],
+        help="Reconcile only this user's goals (repeatable)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Goals per transaction"
+    )
+    args = parser.parse_args()
+
+    print("Reconciling goal progress...")
+    print("=" * 50)
+    reconciled = reconcile_goal_progress(args.user_id, args.batch_size)
+    print(f"\n✓ Reconciled {reconciled} goals")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,27 @@
 """Database connection and session management."""
 
 from .database import (
+    DATABASE_READ_URL,
     DATABASE_URL,
     Base,
+    ReadSessionLocal,
     SessionLocal,
     engine,
     get_database_path,
     get_db,
+    get_read_db,
+    read_engine,
 )
 
 __all__ = [
+    "DATABASE_READ_URL",
     "DATABASE_URL",
     "Base",
+    "ReadSessionLocal",
     "SessionLocal",
     "engine",
     "get_database_path",
     "get_db",
+    "get_read_db",
+    "read_engine",
 ]
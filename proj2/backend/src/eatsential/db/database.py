@@ -1,10 +1,15 @@
 """Database connection and session management."""
 
 import os
+import time
+from typing import Optional
 
 import dotenv
+from fastapi import Depends, Request
 from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 
 class Base(DeclarativeBase):
@@ -22,18 +27,79 @@ DATABASE_URL = os.getenv(
     "sqlite:///./eatsential.db",  # Default to SQLite database in current directory
 )
 
+# Optional read replica used by read-only endpoints (see get_read_db)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL") or None
+
+# Seconds after a user's write during which their reads stay on the primary
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+
+def _connect_args(url: str) -> dict:
+    """Return driver connect args for a database URL.
+
+    Note: check_same_thread=False is needed for SQLite
+    """
+    return {"check_same_thread": False} if url.startswith("sqlite") else {}
+
+
 # Create SQLAlchemy engine
-# Note: check_same_thread=False is needed for SQLite
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-    if DATABASE_URL.startswith("sqlite")
-    else {},
-)
+engine = create_engine(DATABASE_URL, connect_args=_connect_args(DATABASE_URL))
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read replica engine and session factory (None when no replica is configured)
+read_engine: Optional[Engine] = None
+ReadSessionLocal: Optional[sessionmaker] = None
+
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL,
+        connect_args=_connect_args(DATABASE_READ_URL),
+        pool_pre_ping=True,
+    )
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# user_id -> monotonic timestamp of the user's last successful write. Only
+# covers this process; ReadYourWritesMiddleware also sets a signed cookie
+# so other worker processes pin the user's reads too
+_recent_writes: dict[str, float] = {}
+
+
+def record_user_write(user_id: str, now: Optional[float] = None) -> None:
+    """Remember that a user has just written to the primary database.
+
+    Args:
+        user_id: ID of the user who performed the write
+        now: Optional monotonic timestamp (defaults to time.monotonic())
+
+    """
+    now = time.monotonic() if now is None else now
+    _recent_writes[user_id] = now
+
+    # Drop entries whose read-your-writes window has elapsed
+    cutoff = now - READ_YOUR_WRITES_SECONDS
+    for key in [k for k, ts in _recent_writes.items() if ts <= cutoff]:
+        del _recent_writes[key]
+
+
+def has_recent_write(user_id: str, now: Optional[float] = None) -> bool:
+    """Check whether a user is inside their read-your-writes window.
+
+    Args:
+        user_id: User ID to check
+        now: Optional monotonic timestamp (defaults to time.monotonic())
+
+    Returns:
+        True if the user wrote within the last READ_YOUR_WRITES_SECONDS
+
+    """
+    last_write = _recent_writes.get(user_id)
+    if last_write is None:
+        return False
+    now = time.monotonic() if now is None else now
+    return now - last_write < READ_YOUR_WRITES_SECONDS
+
 
 def get_db():  # type: ignore
     """Get database session
@@ -49,6 +115,44 @@ def get_db():  # type: ignore
         db.close()
 
 
+def get_read_db(request: Request, db: Session = Depends(get_db)):  # type: ignore
+    """Get a database session for read-only request handlers.
+
+    Uses the read replica when DATABASE_READ_URL is configured. Falls back to
+    the primary session when no replica is configured, when the replica is
+    unreachable, or when the request is inside the user's read-your-writes
+    window (flagged by ReadYourWritesMiddleware).
+
+    Args:
+        request: Incoming HTTP request
+        db: Primary database session (only connects if it is used)
+
+    Yields:
+        Database session
+
+    """
+    if ReadSessionLocal is None or getattr(request.state, "read_from_primary", False):
+        yield db
+        return
+
+    read_db = ReadSessionLocal()
+    try:
+        # Check out a connection up front so an unreachable replica falls back
+        read_db.connection()
+    except OperationalError:
+        read_db.close()
+        read_db = None
+
+    if read_db is None:
+        yield db
+        return
+
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
 def get_database_path() -> str:
     """Get the full path to the database file.
 
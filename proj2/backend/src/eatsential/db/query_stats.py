@@ -0,0 +1,196 @@
+"""Per-request SQL statement counting and repeated-statement (N+1) detection.
+
+SQLAlchemy cursor events are registered on every Engine. Statements are only
+recorded while a QueryStats collector is active for the current context,
+which QueryCounterMiddleware does per request and ``track_queries`` does for
+service-level tests.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Strict mode: "off" (default), "log" to warn, "raise" to fail the request
+SQL_STRICT_MODE = os.getenv("SQL_STRICT_MODE", "off").lower()
+
+# Number of times one statement shape may run in a request before strict mode
+# reports it
+SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "5"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"IN \((?:[^()]*)\)", re.IGNORECASE)
+_START_TIME_KEY = "eatsential_query_start"
+
+
+class RepeatedQueryError(Exception):
+    """Raised in strict mode when a statement shape repeats too often."""
+
+    pass
+
+
+@dataclass
+class QueryStats:
+    """Statement count, DB time and statement shapes for one request."""
+
+    count: int = 0
+    total_time: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    reported_shapes: set = field(default_factory=set)
+
+    @property
+    def total_time_ms(self) -> float:
+        """Total time spent executing statements, in milliseconds"""
+        return self.total_time * 1000
+
+    def repeated_shapes(self, threshold: int) -> dict[str, int]:
+        """Return statement shapes that ran more than ``threshold`` times"""
+        return {
+            shape: count for shape, count in self.shapes.items() if count > threshold
+        }
+
+
+@dataclass
+class EndpointQueryMetrics:
+    """Aggregated query metrics for one endpoint."""
+
+    requests: int = 0
+    queries: int = 0
+    total_time: float = 0.0
+    max_queries: int = 0
+
+    @property
+    def avg_queries(self) -> float:
+        """Average number of statements per request"""
+        return self.queries / self.requests if self.requests else 0.0
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "eatsential_query_stats", default=None
+)
+
+# "METHOD /route/path" -> aggregated metrics
+endpoint_metrics: dict[str, EndpointQueryMetrics] = {}
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions compare equal.
+
+    Statements are already parameterized; this collapses whitespace and
+    expanded ``IN (...)`` lists so varying list sizes share one shape.
+    """
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    return _IN_LIST_RE.sub("IN (...)", shape)
+
+
+def start_request_stats() -> tuple[QueryStats, object]:
+    """Activate a new QueryStats collector for the current context.
+
+    Returns:
+        Tuple of (stats, token) where token is passed to stop_request_stats
+
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    return stats, token
+
+
+def stop_request_stats(token: object) -> None:
+    """Deactivate the collector started by start_request_stats"""
+    _current_stats.reset(token)  # type: ignore[arg-type]
+
+
+def get_current_stats() -> Optional[QueryStats]:
+    """Return the active QueryStats collector, if any"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed in the current context.
+
+    Example:
+        >>> with track_queries() as stats:
+        ...     MealService.get_user_meals(db, user_id)
+        >>> assert stats.count <= 2
+
+    """
+    stats, token = start_request_stats()
+    try:
+        yield stats
+    finally:
+        stop_request_stats(token)
+
+
+def record_endpoint_metrics(endpoint: str, stats: QueryStats) -> None:
+    """Fold one request's statistics into the per-endpoint metrics"""
+    metrics = endpoint_metrics.setdefault(endpoint, EndpointQueryMetrics())
+    metrics.requests += 1
+    metrics.queries += stats.count
+    metrics.total_time += stats.total_time
+    metrics.max_queries = max(metrics.max_queries, stats.count)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+    """Record the statement start time and shape for the active request"""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+
+    # Pushed first, so handle_error can pop it even if strict mode raises
+    conn.info.setdefault(_START_TIME_KEY, []).append(time.perf_counter())
+
+    shape = statement_shape(statement)
+    stats.count += 1
+    stats.shapes[shape] += 1
+
+    if (
+        SQL_STRICT_MODE in ("log", "raise")
+        and stats.shapes[shape] > SQL_REPEAT_THRESHOLD
+        and shape not in stats.reported_shapes
+    ):
+        stats.reported_shapes.add(shape)
+        message = (
+            f"Statement executed {stats.shapes[shape]} times in one request "
+            f"(threshold {SQL_REPEAT_THRESHOLD}): {shape}"
+        )
+        if SQL_STRICT_MODE == "raise":
+            raise RepeatedQueryError(message)
+        logger.warning(message)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+    """Add the statement's execution time to the active request"""
+    stats = _current_stats.get()
+    start_times = conn.info.get(_START_TIME_KEY)
+    if stats is None or not start_times:
+        return
+
+    stats.total_time += time.perf_counter() - start_times.pop()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):  # type: ignore
+    """Pop the start time of a statement that raised instead of completing"""
+    conn = exception_context.connection
+    start_times = conn.info.get(_START_TIME_KEY) if conn is not None else None
+    if not start_times:
+        return
+
+    start = start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.total_time += time.perf_counter() - start
@@ -0,0 +1,35 @@
+"""Custom column types."""
+
+from typing import Optional
+
+from sqlalchemy import Text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from ..utils.security import EncryptedValue
+
+
+class EncryptedText(TypeDecorator):
+    """Text column holding a value encrypted with encrypt_sensitive_data.
+
+    Values are written as given (already encrypted) and read back as
+    EncryptedValue, so loading a row costs no decryption; the plaintext is
+    decrypted when first read through ``value.plaintext`` or
+    decrypt_sensitive_data. Queries that never need the plaintext should
+    leave the column out of the SELECT (e.g. with ``load_only``).
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[str], dialect: Dialect
+    ) -> Optional[str]:
+        """Store the ciphertext as plain text"""
+        return None if value is None else str(value)
+
+    def process_result_value(
+        self, value: Optional[str], dialect: Dialect
+    ) -> Optional[EncryptedValue]:
+        """Wrap the loaded ciphertext without decrypting it"""
+        return None if value is None else EncryptedValue(value)
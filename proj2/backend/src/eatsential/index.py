@@ -1,11 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 
+from .db.database import SessionLocal
 from .middleware.jwt_auth import JWTAuthMiddleware
+from .middleware.query_counter import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryCounterMiddleware,
+)
 from .middleware.rate_limit import RateLimitMiddleware
+from .middleware.read_your_writes import ReadYourWritesMiddleware
 from .routers import auth, goals, health, meals, recommend, users, wellness
+from .services.goal_status_service import (
+    GOAL_STATUS_INTERVAL_SECONDS,
+    run_goal_status_worker,
+)
+from .services.photo_service import PhotoService
+from .services.photo_storage import PHOTO_MEDIA_URL, PHOTO_STORAGE_DIR
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .utils.security import shutdown_decrypt_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers, and stop them when the app shuts down"""
+    goal_status_task = None
+    if GOAL_STATUS_INTERVAL_SECONDS > 0:
+        goal_status_task = asyncio.create_task(
+            run_goal_status_worker(SessionLocal, GOAL_STATUS_INTERVAL_SECONDS)
+        )
+    yield
+    if goal_status_task is not None:
+        goal_status_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await goal_status_task
+    PhotoService.shutdown_process_pool()
+    shutdown_decrypt_pool()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # Configure Rate Limiting
 app.add_middleware(RateLimitMiddleware)
@@ -13,6 +51,12 @@ app.add_middleware(RateLimitMiddleware)
 # Configure JWT Authentication
 app.add_middleware(JWTAuthMiddleware)
 
+# Keep a user's reads on the primary database right after they write
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Count SQL statements and DB time per request
+app.add_middleware(QueryCounterMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -23,6 +67,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[QUERY_COUNT_HEADER, QUERY_TIME_HEADER, NEXT_CURSOR_HEADER],
 )
 
 # Register routers
@@ -34,6 +79,13 @@ app.include_router(goals.router, prefix="/api")
 app.include_router(recommend.router, prefix="/api")
 app.include_router(wellness.router, prefix="/api")
 
+# Processed meal photos (originals are stored outside this directory)
+app.mount(
+    PHOTO_MEDIA_URL,
+    StaticFiles(directory=Path(PHOTO_STORAGE_DIR) / "public", check_dir=False),
+    name="media",
+)
+
 
 @app.get("/api")
 def read_root():
@@ -1,6 +1,13 @@
 """Middleware package"""
 
 from .jwt_auth import JWTAuthMiddleware
+from .query_counter import QueryCounterMiddleware
 from .rate_limit import RateLimitMiddleware
+from .read_your_writes import ReadYourWritesMiddleware
 
-__all__ = ["JWTAuthMiddleware", "RateLimitMiddleware"]
+__all__ = [
+    "JWTAuthMiddleware",
+    "QueryCounterMiddleware",
+    "RateLimitMiddleware",
+    "ReadYourWritesMiddleware",
+]
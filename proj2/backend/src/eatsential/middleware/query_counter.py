@@ -0,0 +1,73 @@
+"""SQL statement counting middleware.
+
+Counts the SQL statements each request issues and the time spent in the
+database, exposes them as response headers and folds them into
+per-endpoint metrics (see db/query_stats.py and
+GET /api/users/admin/query-metrics).
+
+Headers are sent before a streamed body (e.g. /api/meals/export) is
+produced, so they only count the statements issued up to that point; the
+endpoint metrics are recorded once the body has been sent and include them.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ..db.query_stats import (
+    record_endpoint_metrics,
+    start_request_stats,
+    stop_request_stats,
+)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+# Metrics key path of requests no route matched (404s, scanners), so their
+# raw URLs cannot grow the metrics without bound
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """Middleware to count SQL statements and DB time per request"""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Collect query statistics while the request is handled
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/route handler
+
+        Returns:
+            HTTP response with query count and DB time headers
+
+        """
+        stats, token = start_request_stats()
+        try:
+            response = await call_next(request)
+        finally:
+            stop_request_stats(token)
+
+        response.headers[QUERY_COUNT_HEADER] = str(stats.count)
+        response.headers[QUERY_TIME_HEADER] = f"{stats.total_time_ms:.2f}"
+
+        # Group metrics by route template (e.g. /api/meals/{meal_id})
+        route = request.scope.get("route")
+        endpoint = f"{request.method} {getattr(route, 'path', UNMATCHED_ROUTE)}"
+
+        # call_next returns before a streamed body runs its queries; record
+        # the metrics after the last chunk so they include them
+        body = response.body_iterator  # type: ignore[attr-defined]
+
+        async def record_after_body() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                record_endpoint_metrics(endpoint, stats)
+
+        response.body_iterator = record_after_body()  # type: ignore[attr-defined]
+        return response
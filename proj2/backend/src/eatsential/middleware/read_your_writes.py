@@ -0,0 +1,141 @@
+"""Read-your-writes middleware for read replica routing.
+
+After a user performs a write, their reads are pinned to the primary
+database for a short window so they never observe replica lag on their
+own data. The decision is stored on ``request.state.read_from_primary``
+and honoured by the ``get_read_db`` dependency.
+
+Writes are remembered in two ways: in this process (see
+``database.record_user_write``) and in a signed cookie holding the time of
+the write. The cookie lets every worker process pin the user's reads, so
+the window holds with several uvicorn workers as long as the client sends
+cookies back; clients that do not only get it from the process that
+handled their write.
+"""
+
+import hashlib
+import hmac
+import math
+import time
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ..db import database
+from ..utils.auth_util import SECRET_KEY, verify_token
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Cookie with the signed time (UNIX milliseconds) of the user's last write
+READ_PRIMARY_COOKIE = "read_primary_since"
+
+
+def _write_signature(user_id: str, written_ms: int) -> str:
+    """Sign the time of a user's write, so the cookie cannot be forged"""
+    message = f"read_primary:{user_id}:{written_ms}".encode()
+    return hmac.new(SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+
+def write_cookie_value(user_id: str, written_ms: int) -> str:
+    """Build the read-your-writes cookie value of a write.
+
+    Args:
+        user_id: ID of the user who performed the write
+        written_ms: UNIX time of the write in milliseconds
+
+    Returns:
+        Cookie value of the form ``<written_ms>.<signature>``
+
+    """
+    return f"{written_ms}.{_write_signature(user_id, written_ms)}"
+
+
+def cookie_has_recent_write(
+    cookie: Optional[str], user_id: str, now: Optional[float] = None
+) -> bool:
+    """Check whether a cookie proves a write inside the user's window.
+
+    Args:
+        cookie: Read-your-writes cookie value, if the request had one
+        user_id: User the request is authenticated as
+        now: Optional UNIX timestamp (defaults to time.time())
+
+    Returns:
+        True if the cookie is signed for this user and its write happened
+        within the last READ_YOUR_WRITES_SECONDS
+
+    """
+    written, _, signature = (cookie or "").partition(".")
+    if not written.isdigit():
+        return False
+    if not hmac.compare_digest(signature, _write_signature(user_id, int(written))):
+        return False
+    now = time.time() if now is None else now
+    return now - int(written) / 1000 < database.READ_YOUR_WRITES_SECONDS
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pin a user's reads to the primary database right after they write
+
+    Only active when a read replica is configured (DATABASE_READ_URL).
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Flag reads inside the window and record successful writes
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/route handler
+
+        Returns:
+            HTTP response
+
+        """
+        if database.ReadSessionLocal is None:
+            return await call_next(request)
+
+        user_id = self._get_user_id(request)
+        if user_id and (
+            database.has_recent_write(user_id)
+            or cookie_has_recent_write(
+                request.cookies.get(READ_PRIMARY_COOKIE), user_id
+            )
+        ):
+            request.state.read_from_primary = True
+
+        response = await call_next(request)
+
+        if (
+            user_id
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            database.record_user_write(user_id)
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                write_cookie_value(user_id, int(time.time() * 1000)),
+                max_age=math.ceil(database.READ_YOUR_WRITES_SECONDS),
+                httponly=True,
+                samesite="lax",
+            )
+
+        return response
+
+    def _get_user_id(self, request: Request) -> Optional[str]:
+        """Extract the user ID from the request's bearer token, if valid"""
+        authorization = request.headers.get("Authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        try:
+            payload = verify_token(token)
+        except HTTPException:
+            return None
+
+        user_id = payload.get("sub")
+        return user_id if isinstance(user_id, str) else None
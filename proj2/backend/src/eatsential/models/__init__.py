@@ -6,8 +6,11 @@ from .models import (
     AllergenDB,
     AllergySeverity,
     AuditAction,
+    DailyNutritionDB,
+    DailyWellnessDB,
     DietaryPreferenceDB,
     GoalDB,
+    GoalProgressSnapshotDB,
     HealthProfileDB,
     MealDB,
     MealFoodItemDB,
@@ -30,8 +33,11 @@ __all__ = [
     "AllergenDB",
     "AllergySeverity",
     "AuditAction",
+    "DailyNutritionDB",
+    "DailyWellnessDB",
     "DietaryPreferenceDB",
     "GoalDB",
+    "GoalProgressSnapshotDB",
     "HealthProfileDB",
     "MealDB",
     "MealFoodItemDB",
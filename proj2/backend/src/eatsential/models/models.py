@@ -10,6 +10,8 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     Numeric,
     String,
     Table,
@@ -18,6 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.database import Base
+from ..db.types import EncryptedText
 
 
 def utcnow():
@@ -94,6 +97,9 @@ class UserDB(Base):
     sleep_logs: Mapped[list["SleepLogDB"]] = relationship(
         "SleepLogDB", back_populates="user", cascade="all, delete-orphan"
     )
+    daily_nutrition: Mapped[list["DailyNutritionDB"]] = relationship(
+        "DailyNutritionDB", cascade="all, delete-orphan"
+    )
 
 
 class ActivityLevel(str, Enum):
@@ -288,6 +294,15 @@ class MealDB(Base):
     """SQLAlchemy model for meal logs table"""
 
     __tablename__ = "meals"
+    __table_args__ = (
+        Index("ix_meals_user_id_meal_time_id", "user_id", "meal_time", "id"),
+        Index(
+            "ix_meals_user_id_idempotency_key",
+            "user_id",
+            "idempotency_key",
+            unique=True,
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -300,6 +315,9 @@ class MealDB(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     photo_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+    # Client-supplied key so retried batch uploads do not create duplicates
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
     # Nutritional Summary (calculated from food items)
     total_calories: Mapped[Optional[float]] = mapped_column(
         Numeric(10, 2), nullable=True
@@ -357,6 +375,39 @@ class MealFoodItemDB(Base):
     meal: Mapped["MealDB"] = relationship("MealDB", back_populates="food_items")
 
 
+class DailyNutritionDB(Base):
+    """SQLAlchemy model for per-day nutrition totals of a user.
+
+    One row per (user, local date) in the user's timezone, maintained in the
+    same transaction as meal writes by DailyNutritionService.
+    """
+
+    __tablename__ = "daily_nutrition"
+
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    local_date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    meal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_calories: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    total_protein_g: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    total_carbs_g: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    total_fat_g: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
 class GoalType(str, Enum):
     """Enumeration of goal types"""
 
@@ -370,12 +421,25 @@ class GoalStatus(str, Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+    EXPIRED = "expired"
 
 
 class GoalDB(Base):
     """SQLAlchemy model for health goals"""
 
     __tablename__ = "goals"
+    __table_args__ = (
+        Index("ix_goals_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_goals_user_id_status_created_at_id",
+            "user_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        # Ended active goals, for the goal status worker
+        Index("ix_goals_status_end_date", "status", "end_date"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -392,6 +456,15 @@ class GoalDB(Base):
         Numeric(10, 2), nullable=False, default=0
     )
 
+    # Running totals for goals tracked from logs (see goal_progress_service):
+    # current_value = progress_sum / progress_days, the average per logged day
+    progress_sum: Mapped[float] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0, server_default="0"
+    )
+    progress_days: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Date Range
     start_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -414,6 +487,33 @@ class GoalDB(Base):
 
     # Relationships
     user: Mapped["UserDB"] = relationship("UserDB", back_populates="goals")
+    progress_snapshots: Mapped[list["GoalProgressSnapshotDB"]] = relationship(
+        "GoalProgressSnapshotDB", cascade="all, delete-orphan"
+    )
+
+
+class GoalProgressSnapshotDB(Base):
+    """SQLAlchemy model for the progress history of a goal.
+
+    Append-only: one row per goal and local day (``period_days`` 1) holding
+    the goal's progress at the end of that day, written by
+    GoalHistoryService. Daily rows past the retention window are compacted
+    into one row per ISO week (``period_days`` 7, ``snapshot_date`` the
+    Monday) whose ``value`` is the mean of the days.
+    """
+
+    __tablename__ = "goal_progress_snapshots"
+
+    goal_id: Mapped[str] = mapped_column(
+        String, ForeignKey("goals.id", ondelete="CASCADE"), primary_key=True
+    )
+    snapshot_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    period_days: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+
+    value: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    min_value: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    max_value: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
 
 # ============================================================================
@@ -433,6 +533,14 @@ class MoodLogDB(Base):
     """SQLAlchemy model for mood logging"""
 
     __tablename__ = "mood_logs"
+    __table_args__ = (
+        Index(
+            "ix_mood_logs_user_id_occurred_at_utc_id",
+            "user_id",
+            "occurred_at_utc",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -446,7 +554,7 @@ class MoodLogDB(Base):
     mood_score: Mapped[int] = mapped_column(Numeric(2, 0), nullable=False)  # 1-10 scale
 
     # Encrypted sensitive data (optional notes)
-    encrypted_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    encrypted_notes: Mapped[Optional[str]] = mapped_column(EncryptedText, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -464,6 +572,14 @@ class StressLogDB(Base):
     """SQLAlchemy model for stress logging"""
 
     __tablename__ = "stress_logs"
+    __table_args__ = (
+        Index(
+            "ix_stress_logs_user_id_occurred_at_utc_id",
+            "user_id",
+            "occurred_at_utc",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -479,8 +595,10 @@ class StressLogDB(Base):
     )  # 1-10 scale
 
     # Encrypted sensitive data (triggers and notes)
-    encrypted_triggers: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    encrypted_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    encrypted_triggers: Mapped[Optional[str]] = mapped_column(
+        EncryptedText, nullable=True
+    )
+    encrypted_notes: Mapped[Optional[str]] = mapped_column(EncryptedText, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -498,6 +616,14 @@ class SleepLogDB(Base):
     """SQLAlchemy model for sleep logging"""
 
     __tablename__ = "sleep_logs"
+    __table_args__ = (
+        Index(
+            "ix_sleep_logs_user_id_occurred_at_utc_id",
+            "user_id",
+            "occurred_at_utc",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -514,7 +640,7 @@ class SleepLogDB(Base):
     )  # 1-10 scale
 
     # Encrypted sensitive data (optional notes)
-    encrypted_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    encrypted_notes: Mapped[Optional[str]] = mapped_column(EncryptedText, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -528,6 +654,43 @@ class SleepLogDB(Base):
     user: Mapped["UserDB"] = relationship("UserDB", back_populates="sleep_logs")
 
 
+class DailyWellnessDB(Base):
+    """SQLAlchemy model for per-day wellness totals of a user.
+
+    One row per (user, local date) in the user's timezone with the sum and
+    number of logged values of each metric, maintained in the same
+    transaction as wellness log writes by daily_wellness_service.
+    """
+
+    __tablename__ = "daily_wellness"
+
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    local_date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    mood_score_sum: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    mood_score_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    stress_level_sum: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    stress_level_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sleep_hours_sum: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    sleep_hours_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sleep_quality_sum: Mapped[float] = mapped_column(
+        Numeric(10, 2), nullable=False, default=0
+    )
+    sleep_quality_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+
 # ============================================================================
 # Restaurant Models
 # ============================================================================
@@ -542,7 +705,9 @@ class Restaurant(Base):
     name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     address: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
     cuisine: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, default=True, nullable=False, index=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -567,7 +732,10 @@ class MenuItem(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     restaurant_id: Mapped[str] = mapped_column(
-        String, ForeignKey("restaurants.id", ondelete="CASCADE"), nullable=False
+        String,
+        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -611,6 +779,10 @@ class AllergenAuditLogDB(Base):
     """SQLAlchemy model for allergen audit log table"""
 
     __tablename__ = "allergen_audit_logs"
+    __table_args__ = (
+        # Keyset pagination orders by (created_at, id)
+        Index("ix_allergen_audit_logs_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
 
@@ -647,6 +819,16 @@ class UserAuditLogDB(Base):
     """
 
     __tablename__ = "user_audit_logs"
+    __table_args__ = (
+        # Keyset pagination orders by (created_at, id), optionally per target user
+        Index("ix_user_audit_logs_created_at_id", "created_at", "id"),
+        Index(
+            "ix_user_audit_logs_target_user_id_created_at_id",
+            "target_user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
 
@@ -1,25 +1,66 @@
 """API routes for goal tracking."""
 
 from datetime import date
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from ..db.database import get_db
+from ..db.database import get_db, get_read_db
+from ..models.models import GoalDB, utcnow
 from ..schemas.schemas import (
     GoalCreate,
+    GoalHistoryResponse,
     GoalListResponse,
+    GoalProgressPoint,
     GoalProgressResponse,
     GoalResponse,
+    GoalSparseListResponse,
     GoalUpdate,
     UserResponse,
+    goal_completion_percentage,
+    goal_is_active,
 )
 from ..services.auth_service import get_current_user
+from ..services.goal_history_service import (
+    DEFAULT_HISTORY_POINTS,
+    MAX_HISTORY_POINTS,
+    GoalHistoryService,
+)
 from ..services.goal_service import GoalService
+from ..utils.pagination import InvalidCursorError, next_cursor
+from ..utils.sparse_fields import InvalidFieldsError, parse_fields, required_columns
+from ..utils.timezones import get_local_date
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
+# Goal fields always returned with fields=, since the cursor is built from them
+GOAL_ALWAYS_FIELDS = ("id", "created_at")
+
+# Computed GoalResponse fields and the columns they are derived from
+GOAL_DERIVED_FIELDS = {
+    "completion_percentage": ("current_value", "target_value"),
+    "is_active": ("status", "start_date", "end_date"),
+}
+
+
+def _sparse_goal(goal: GoalDB, fields: list[str]) -> dict:
+    """Serialize only the requested fields of a goal"""
+    item = {
+        field: getattr(goal, field)
+        for field in fields
+        if field not in GOAL_DERIVED_FIELDS
+    }
+    if "completion_percentage" in fields:
+        item["completion_percentage"] = goal_completion_percentage(
+            float(goal.current_value), float(goal.target_value)
+        )
+    if "is_active" in fields:
+        item["is_active"] = goal_is_active(goal.status, goal.start_date, goal.end_date)
+    return jsonable_encoder(item)
+
 
 @router.post("", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
 def create_goal(
@@ -51,16 +92,29 @@ def create_goal(
         )
 
 
-@router.get("", response_model=GoalListResponse)
+@router.get("", response_model=Union[GoalListResponse, GoalSparseListResponse])
 def get_goals(
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     goal_type: Optional[str] = Query(None, description="Filter by goal type"),
     status: Optional[str] = Query(None, description="Filter by status"),
     start_date: Optional[date] = Query(None, description="Filter by start date"),
     end_date: Optional[date] = Query(None, description="Filter by end date"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        False, description="Count all matching goals (extra query)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated goal fields to return, e.g. id,target_type,"
+            "completion_percentage"
+        ),
+    ),
 ):
     """Get user's goals with optional filters.
 
@@ -73,37 +127,75 @@ def get_goals(
         status: Optional status filter
         start_date: Optional start date filter
         end_date: Optional end date filter
+        cursor: Optional next_cursor from a previous page
+        include_total: Whether to include the total number of matching goals
+        fields: Optional sparse fieldset for each goal
 
     Returns:
-        Paginated list of goals
+        Paginated list of goals (partial goals when fields= is given)
+
+    Raises:
+        HTTPException: If the cursor or fields are invalid
 
     """
     skip = (page - 1) * page_size
 
-    goals, total = GoalService.get_user_goals(
-        db,
-        current_user.id,
-        skip=skip,
-        limit=page_size,
-        goal_type=goal_type,
-        status=status,
-        start_date=start_date,
-        end_date=end_date,
+    try:
+        selected = parse_fields(
+            fields,
+            [*GoalResponse.model_fields, *GoalResponse.model_computed_fields],
+            GOAL_ALWAYS_FIELDS,
+        )
+        goals, total, has_more = GoalService.get_user_goals_page(
+            db,
+            current_user.id,
+            skip=skip,
+            limit=page_size,
+            goal_type=goal_type,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            include_total=include_total,
+            columns=(
+                None
+                if selected is None
+                else required_columns(selected, GOAL_DERIVED_FIELDS)
+            ),
+        )
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = GoalListResponse(
+        goals=[],
+        total=total,
+        page=page,
+        page_size=page_size,
+        has_more=has_more,
+        next_cursor=next_cursor(goals, has_more, "created_at"),
     )
+    if selected is None:
+        response.goals = [GoalResponse.model_validate(goal) for goal in goals]
+        return response
 
-    return GoalListResponse(goals=goals, total=total, page=page, page_size=page_size)
+    # Partial items do not match GoalResponse, so bypass response validation
+    content = response.model_dump(mode="json")
+    content["goals"] = [_sparse_goal(goal, selected) for goal in goals]
+    return JSONResponse(content=content)
 
 
 @router.get("/progress", response_model=list[GoalProgressResponse])
 def get_goals_progress(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     goal_type: Optional[str] = Query(None, description="Filter by goal type"),
     status: Optional[str] = Query(None, description="Filter by status"),
 ):
     """Get progress statistics for user's goals.
 
     Args:
+        request: Incoming request, flagged by ReadYourWritesMiddleware
         current_user: Authenticated user
         db: Database session
         goal_type: Optional goal type filter
@@ -113,8 +205,14 @@ def get_goals_progress(
         List of goal progress statistics
 
     """
+    # Right after a write the snapshot cache of this process may predate it
+    # (the write was handled by another worker), so read the primary directly
     progress_list = GoalService.get_goals_progress(
-        db, current_user.id, goal_type=goal_type, status=status
+        db,
+        current_user.id,
+        goal_type=goal_type,
+        status=status,
+        use_cache=not getattr(request.state, "read_from_primary", False),
     )
 
     return progress_list
@@ -124,7 +222,7 @@ def get_goals_progress(
 def get_goal(
     goal_id: str,
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get a specific goal by ID.
 
@@ -150,6 +248,72 @@ def get_goal(
     return goal
 
 
+@router.get("/{goal_id}/history", response_model=GoalHistoryResponse)
+def get_goal_history(
+    goal_id: str,
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    start_date: Optional[date] = Query(
+        None, description="First date (defaults to the goal's start date)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last date (defaults to the goal's end date)"
+    ),
+    max_points: int = Query(
+        DEFAULT_HISTORY_POINTS,
+        ge=2,
+        le=MAX_HISTORY_POINTS,
+        description="Maximum number of points; longer ranges are downsampled",
+    ),
+):
+    """Get a goal's progress over time for a chart.
+
+    Args:
+        goal_id: Goal ID
+        current_user: Authenticated user
+        db: Database session
+        start_date: Optional first date
+        end_date: Optional last date
+        max_points: Maximum number of points returned
+
+    Returns:
+        Progress points ordered by date
+
+    Raises:
+        HTTPException: If goal not found or the range is invalid
+
+    """
+    goal = GoalService.get_goal_by_id(db, current_user.id, goal_id)
+
+    if not goal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found"
+        )
+
+    start_date = start_date or goal.start_date
+    end_date = end_date or goal.end_date
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must be on or before end_date",
+        )
+
+    points = GoalHistoryService.get_history(
+        db,
+        goal,
+        start_date,
+        end_date,
+        max_points=max_points,
+        today=get_local_date(utcnow(), current_user.timezone),
+    )
+    return GoalHistoryResponse(
+        goal_id=goal.id,
+        start_date=start_date,
+        end_date=end_date,
+        points=[GoalProgressPoint.model_validate(point) for point in points],
+    )
+
+
 @router.put("/{goal_id}", response_model=GoalResponse)
 def update_goal(
     goal_id: str,
@@ -169,7 +333,8 @@ def update_goal(
         Updated goal
 
     Raises:
-        HTTPException: If goal not found or update fails
+        HTTPException: If goal not found, current_value is set on a tracked
+            goal or update fails
 
     """
     try:
@@ -183,6 +348,8 @@ def update_goal(
         return goal
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
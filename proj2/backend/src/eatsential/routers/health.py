@@ -4,11 +4,11 @@ import csv
 import io
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from ..db.database import get_db
+from ..db.database import get_db, get_read_db
 from ..models.models import UserDB
 from ..schemas.schemas import (
     AllergenAuditLogResponse,
@@ -30,6 +30,7 @@ from ..schemas.schemas import (
 )
 from ..services.auth_service import get_current_admin_user, get_current_user
 from ..services.health_service import HealthProfileService
+from ..utils.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, next_cursor
 
 router = APIRouter(
     prefix="/health",
@@ -37,6 +38,7 @@ router = APIRouter(
 )
 
 SessionDep = Annotated[Session, Depends(get_db)]
+ReadSessionDep = Annotated[Session, Depends(get_read_db)]
 CurrentUserDep = Annotated[UserDB, Depends(get_current_user)]
 AdminUserDep = Annotated[UserDB, Depends(get_current_admin_user)]
 
@@ -443,7 +445,7 @@ async def delete_dietary_preference(
 
 @router.get("/allergens", response_model=list[AllergenResponse])
 async def list_allergens(
-    db: SessionDep,
+    db: ReadSessionDep,
 ):
     """List all available allergens in the database.
 
@@ -472,7 +474,7 @@ async def list_allergens(
 @router.get("/allergens/{allergen_id}", response_model=AllergenResponse)
 async def get_allergen(
     allergen_id: str,
-    db: SessionDep,
+    db: ReadSessionDep,
 ):
     """Get a specific allergen by ID.
 
@@ -696,7 +698,7 @@ async def bulk_import_allergens(
 
 @router.get("/admin/allergens/search", response_model=dict)
 async def search_allergens(
-    db: SessionDep,
+    db: ReadSessionDep,
     current_user: AdminUserDep,
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -705,6 +707,12 @@ async def search_allergens(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page (overrides skip)"
+    ),
+    include_total: bool = Query(
+        False, description="Count all matching allergens (extra query)"
+    ),
 ):
     """Search and filter allergens with pagination (admin only).
 
@@ -716,6 +724,8 @@ async def search_allergens(
         is_major_allergen: Optional major allergen filter
         skip: Pagination offset
         limit: Pagination limit
+        cursor: Optional next_cursor from a previous page
+        include_total: Whether to include the total number of matches
 
     Returns:
         Paginated allergen list with metadata
@@ -723,12 +733,14 @@ async def search_allergens(
     """
     try:
         service = HealthProfileService(db)
-        allergens, total_count = service.search_allergens(
+        allergens, total_count, has_more = service.search_allergens_page(
             name=name,
             category=category,
             is_major_allergen=is_major_allergen,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         return {
@@ -736,7 +748,13 @@ async def search_allergens(
             "total": total_count,
             "skip": skip,
             "limit": limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor(allergens, has_more, "name"),
         }
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except Exception as e:
         print(f"Error searching allergens: {e!s}")
         raise HTTPException(
@@ -747,7 +765,7 @@ async def search_allergens(
 
 @router.get("/admin/allergens/export")
 async def export_allergens(
-    db: SessionDep,
+    db: ReadSessionDep,
     current_user: AdminUserDep,
     format: str = Query("json", pattern="^(json|csv)$", description="Export format"),
 ):
@@ -814,18 +832,24 @@ async def export_allergens(
     response_model=list[AllergenAuditLogResponse],
 )
 async def get_allergen_audit_logs(
-    db: SessionDep,
+    db: ReadSessionDep,
     current_user: AdminUserDep,
+    response: Response,
     allergen_id: Optional[str] = Query(None, description="Filter by allergen ID"),
     limit: int = Query(100, ge=1, le=500, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
 ):
     """Get audit logs for allergen operations (admin only).
 
+    The cursor for the next page is returned in the X-Next-Cursor header.
+
     Args:
         db: Database session
         current_user: Current authenticated admin user
+        response: Response used to set the next cursor header
         allergen_id: Optional allergen ID filter
         limit: Maximum number of logs to return
+        cursor: Optional cursor from a previous page's X-Next-Cursor header
 
     Returns:
         List of audit log entries
@@ -833,8 +857,17 @@ async def get_allergen_audit_logs(
     """
     try:
         service = HealthProfileService(db)
-        logs = service.get_audit_logs(allergen_id=allergen_id, limit=limit)
+        logs = service.get_audit_logs(
+            allergen_id=allergen_id, limit=limit, cursor=cursor
+        )
+        cursor_value = next_cursor(logs, len(logs) == limit, "created_at")
+        if cursor_value:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
         return [AllergenAuditLogResponse.model_validate(log) for log in logs]
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
     except Exception as e:
         print(f"Error fetching audit logs: {e!s}")
         raise HTTPException(
@@ -1,29 +1,82 @@
 """API routes for meal logging."""
 
-from datetime import datetime
-from typing import Annotated, Optional
+from datetime import date, datetime, timedelta
+from typing import Annotated, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from ..db.database import get_db
+from ..db.database import get_db, get_read_db
+from ..models.models import MealDB, UserDB, utcnow
 from ..schemas.schemas import (
+    MAX_NUTRITION_SUMMARY_DAYS,
+    MAX_NUTRITION_TRENDS_DAYS,
+    DailyNutritionResponse,
+    MealBatchCreate,
+    MealBatchItem,
+    MealBatchItemResult,
+    MealBatchResponse,
     MealCreate,
+    MealFoodItemResponse,
     MealListResponse,
+    MealPhotoResponse,
     MealResponse,
+    MealSparseListResponse,
     MealUpdate,
-    UserResponse,
+    NutritionSummaryResponse,
+    NutritionTrendsResponse,
 )
 from ..services.auth_service import get_current_user
+from ..services.daily_nutrition_service import DailyNutritionService
+from ..services.meal_export_service import MealExportService
 from ..services.meal_service import MealService
+from ..services.nutrition_trends_service import NutritionTrendsService
+from ..services.photo_service import PhotoService
+from ..services.photo_storage import (
+    PHOTO_MAX_BYTES,
+    PhotoStorage,
+    PhotoTooLargeError,
+    UnsupportedImageError,
+    get_photo_storage,
+)
+from ..utils.pagination import InvalidCursorError, next_cursor
+from ..utils.sparse_fields import InvalidFieldsError, parse_fields
+from ..utils.timezones import get_local_date
 
 router = APIRouter(prefix="/meals", tags=["meals"])
 
+# Meal fields always returned with fields=, since the cursor is built from them
+MEAL_ALWAYS_FIELDS = ("id", "meal_time")
+
+# Photo uploads are sent as the raw request body
+PHOTO_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        content_type: {"schema": {"type": "string", "format": "binary"}}
+        for content_type in ("image/jpeg", "image/png", "image/webp")
+    },
+}
+
+
+def _sparse_meal(meal: MealDB, fields: list[str]) -> dict:
+    """Serialize only the requested fields of a meal"""
+    item = {field: getattr(meal, field) for field in fields if field != "food_items"}
+    if "food_items" in fields:
+        item["food_items"] = [
+            MealFoodItemResponse.model_validate(food_item)
+            for food_item in meal.food_items
+        ]
+    return jsonable_encoder(item)
+
 
 @router.post("", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
 def create_meal(
     meal_data: MealCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Create a new meal log.
@@ -41,7 +94,9 @@ def create_meal(
 
     """
     try:
-        meal = MealService.create_meal(db, current_user.id, meal_data)
+        meal = MealService.create_meal(
+            db, current_user.id, meal_data, current_user.timezone
+        )
         return meal
     except Exception as e:
         raise HTTPException(
@@ -50,15 +105,102 @@ def create_meal(
         )
 
 
-@router.get("", response_model=MealListResponse)
-def get_meals(
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+@router.post("/batch", response_model=MealBatchResponse)
+def create_meals_batch(
+    batch: MealBatchCreate,
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
+):
+    """Log many meals in one request (offline sync and imports).
+
+    Each meal is validated on its own; invalid meals are reported with status
+    "error" while the valid ones are inserted together in one transaction.
+    Meals carrying an idempotency_key that was already used, even by a
+    concurrent request, are returned with status "duplicate" instead of being
+    logged twice, so retries are safe.
+
+    Args:
+        batch: Meals to create
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Per-meal results and counts
+
+    Raises:
+        HTTPException: If creation fails
+
+    """
+    results: list[Optional[MealBatchItemResult]] = [None] * len(batch.meals)
+    valid: list[tuple[int, MealBatchItem]] = []
+
+    for index, raw_meal in enumerate(batch.meals):
+        try:
+            valid.append((index, MealBatchItem.model_validate(raw_meal)))
+        except ValidationError as e:
+            key = raw_meal.get("idempotency_key")
+            results[index] = MealBatchItemResult(
+                index=index,
+                status="error",
+                idempotency_key=key if isinstance(key, str) else None,
+                errors=[
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ],
+            )
+
+    if valid:
+        try:
+            outcomes = MealService.create_meals_batch(
+                db,
+                current_user.id,
+                [meal_data for _, meal_data in valid],
+                current_user.timezone,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create meals: {e!s}",
+            )
+
+        for (index, meal_data), (outcome, meal) in zip(valid, outcomes):
+            results[index] = MealBatchItemResult(
+                index=index,
+                status=outcome,
+                idempotency_key=meal_data.idempotency_key,
+                meal=MealResponse.model_validate(meal),
+            )
+
+    return MealBatchResponse(
+        results=results,
+        created=sum(1 for r in results if r.status == "created"),
+        duplicates=sum(1 for r in results if r.status == "duplicate"),
+        failed=sum(1 for r in results if r.status == "error"),
+    )
+
+
+@router.get("", response_model=Union[MealListResponse, MealSparseListResponse])
+def get_meals(
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     meal_type: Optional[str] = Query(None, description="Filter by meal type"),
     start_date: Optional[datetime] = Query(None, description="Filter start date"),
     end_date: Optional[datetime] = Query(None, description="Filter end date"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        False, description="Count all matching meals (extra query)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated meal fields to return, e.g. id,meal_time,"
+            "total_calories (food items are only loaded if listed)"
+        ),
+    ),
 ):
     """Get user's meal logs with optional filters.
 
@@ -70,36 +212,244 @@ def get_meals(
         meal_type: Optional meal type filter
         start_date: Optional start date filter
         end_date: Optional end date filter
+        cursor: Optional next_cursor from a previous page
+        include_total: Whether to include the total number of matching meals
+        fields: Optional sparse fieldset for each meal
 
     Returns:
-        Paginated list of meals
+        Paginated list of meals (partial meals when fields= is given)
+
+    Raises:
+        HTTPException: If the cursor or fields are invalid
 
     """
     skip = (page - 1) * page_size
 
-    meals, total = MealService.get_user_meals(
-        db=db,
-        user_id=current_user.id,
-        skip=skip,
-        limit=page_size,
-        meal_type=meal_type,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    try:
+        selected = parse_fields(fields, MealResponse.model_fields, MEAL_ALWAYS_FIELDS)
+        meals, total, has_more = MealService.get_user_meals_page(
+            db=db,
+            user_id=current_user.id,
+            skip=skip,
+            limit=page_size,
+            meal_type=meal_type,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            include_total=include_total,
+            columns=selected,
+        )
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return MealListResponse(
-        meals=[MealResponse.model_validate(meal) for meal in meals],
+    response = MealListResponse(
+        meals=[],
         total=total,
         page=page,
         page_size=page_size,
+        has_more=has_more,
+        next_cursor=next_cursor(meals, has_more, "meal_time"),
+    )
+    if selected is None:
+        response.meals = [MealResponse.model_validate(meal) for meal in meals]
+        return response
+
+    # Partial items do not match MealResponse, so bypass response validation
+    content = response.model_dump(mode="json")
+    content["meals"] = [_sparse_meal(meal, selected) for meal in meals]
+    return JSONResponse(content=content)
+
+
+@router.get("/summary", response_model=NutritionSummaryResponse)
+def get_nutrition_summary(
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    start_date: Optional[date] = Query(
+        None, description="First local date (defaults to 6 days before end_date)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last local date (defaults to today in your timezone)"
+    ),
+):
+    """Get daily and total nutrition for a date range.
+
+    Served from the daily_nutrition rollup, so the cost does not depend on
+    how many meals or food items were logged. Dates are local dates in the
+    user's timezone.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+        start_date: First local date (inclusive)
+        end_date: Last local date (inclusive)
+
+    Returns:
+        Per-day totals for days with meals and totals over the range
+
+    Raises:
+        HTTPException: If the range is invalid or too long
+
+    """
+    if end_date is None:
+        end_date = get_local_date(utcnow(), current_user.timezone)
+    if start_date is None:
+        start_date = end_date - timedelta(days=6)
+
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+    if (end_date - start_date).days >= MAX_NUTRITION_SUMMARY_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must not exceed {MAX_NUTRITION_SUMMARY_DAYS} days",
+        )
+
+    days = DailyNutritionService.get_daily_totals(
+        db, current_user.id, start_date, end_date
+    )
+
+    return NutritionSummaryResponse(
+        start_date=start_date,
+        end_date=end_date,
+        timezone=current_user.timezone,
+        days=[DailyNutritionResponse.model_validate(day) for day in days],
+        **DailyNutritionService.summarize(days),
+    )
+
+
+@router.get("/trends", response_model=NutritionTrendsResponse)
+def get_nutrition_trends(
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    period: Literal["week", "month"] = Query("week", description="Bucket size"),
+    start_date: Optional[date] = Query(
+        None, description="First local date (defaults to one year before end_date)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last local date (defaults to today in your timezone)"
+    ),
+    window: int = Query(
+        4, ge=1, le=52, description="Periods in the calorie moving average"
+    ),
+):
+    """Get weekly or monthly nutrition trends.
+
+    Returns per-period totals, macro distribution and a moving average of
+    average daily calories, plus totals per meal type. Aggregation runs in
+    the database; meals are never loaded.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+        period: "week" (starting Monday) or "month"
+        start_date: First local date (inclusive)
+        end_date: Last local date (inclusive)
+        window: Number of periods in the moving average
+
+    Returns:
+        Trend buckets and meal type breakdown
+
+    Raises:
+        HTTPException: If the range is invalid or too long, or aggregation fails
+
+    """
+    if end_date is None:
+        end_date = get_local_date(utcnow(), current_user.timezone)
+    if start_date is None:
+        start_date = end_date - timedelta(days=364)
+
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+    if (end_date - start_date).days >= MAX_NUTRITION_TRENDS_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must not exceed {MAX_NUTRITION_TRENDS_DAYS} days",
+        )
+
+    try:
+        trends = NutritionTrendsService.get_trends(
+            db,
+            current_user.id,
+            current_user.timezone,
+            start_date,
+            end_date,
+            period,
+            window,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compute nutrition trends: {e!s}",
+        )
+
+    return NutritionTrendsResponse(
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        timezone=current_user.timezone,
+        moving_average_window=window,
+        **trends,
+    )
+
+
+# Media type of each export format
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@router.get("/export")
+def export_meals(
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    export_format: Literal["csv", "ndjson"] = Query(
+        "csv", alias="format", description="csv (one line per food item) or ndjson"
+    ),
+    use_gzip: bool = Query(False, alias="gzip", description="Gzip the file"),
+    start_date: Optional[datetime] = Query(None, description="Filter start date"),
+    end_date: Optional[datetime] = Query(None, description="Filter end date"),
+):
+    """Download the full meal history as a streamed file.
+
+    Rows are streamed from the database in fixed-size batches and written to
+    the response as they are serialized, so memory use does not grow with
+    the length of the history.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session (kept open until the stream completes)
+        export_format: "csv" or "ndjson"
+        use_gzip: Whether to gzip the file
+        start_date: Optional earliest meal_time
+        end_date: Optional latest meal_time
+
+    Returns:
+        Streaming file download
+
+    """
+    filename = f"meals-{utcnow():%Y%m%d}.{export_format}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if use_gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        MealExportService.stream(
+            db, current_user.id, export_format, use_gzip, start_date, end_date
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
 @router.get("/{meal_id}", response_model=MealResponse)
 def get_meal(
     meal_id: str,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
 ):
     """Get a specific meal log by ID.
 
@@ -126,11 +476,82 @@ def get_meal(
     return meal
 
 
+@router.post(
+    "/{meal_id}/photo",
+    response_model=MealPhotoResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={"requestBody": PHOTO_REQUEST_BODY},
+)
+async def upload_meal_photo(
+    meal_id: str,
+    request: Request,
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_db),
+    storage: PhotoStorage = Depends(get_photo_storage),
+):
+    """Upload a meal's photo as the raw request body.
+
+    The body is streamed to storage and hashed without being buffered, and
+    is rejected as soon as it exceeds the size limit. The metadata-free
+    photo and thumbnail are generated in the background, so their URLs may
+    404 briefly while ``processing`` is true.
+
+    Args:
+        meal_id: Meal ID
+        request: Incoming request, whose body is the image
+        current_user: Current authenticated user
+        db: Database session
+        storage: Photo storage backend
+
+    Returns:
+        Stored photo details and URLs
+
+    Raises:
+        HTTPException: If the meal is not found, the photo is too large or
+            not a supported image, or storing it fails
+
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > PHOTO_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Photo exceeds the {PHOTO_MAX_BYTES} byte limit",
+        )
+
+    meal = await run_in_threadpool(PhotoService.get_meal, db, current_user.id, meal_id)
+    if not meal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meal not found",
+        )
+
+    try:
+        photo = await storage.save_original(request.stream(), PHOTO_MAX_BYTES)
+    except PhotoTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(e)
+        )
+    except UnsupportedImageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        )
+
+    try:
+        return await run_in_threadpool(
+            PhotoService.attach_photo, db, meal, storage, photo
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save meal photo: {e!s}",
+        )
+
+
 @router.put("/{meal_id}", response_model=MealResponse)
 def update_meal(
     meal_id: str,
     meal_data: MealUpdate,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Update an existing meal log.
@@ -145,10 +566,15 @@ def update_meal(
         Updated meal
 
     Raises:
-        HTTPException: If meal not found or update fails
+        HTTPException: If meal not found or a food item id is not in the meal
 
     """
-    meal = MealService.update_meal(db, current_user.id, meal_id, meal_data)
+    try:
+        meal = MealService.update_meal(
+            db, current_user.id, meal_id, meal_data, current_user.timezone
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not meal:
         raise HTTPException(
@@ -162,7 +588,7 @@ def update_meal(
 @router.delete("/{meal_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_meal(
     meal_id: str,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Delete a meal log.
@@ -176,7 +602,9 @@ def delete_meal(
         HTTPException: If meal not found
 
     """
-    success = MealService.delete_meal(db, current_user.id, meal_id)
+    success = MealService.delete_meal(
+        db, current_user.id, meal_id, current_user.timezone
+    )
 
     if not success:
         raise HTTPException(
@@ -7,7 +7,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from ..db.database import get_db
+from ..db.database import get_read_db
 from ..models.models import UserDB
 from ..schemas.recommendation_schemas import (
     RecommendationRequest,
@@ -18,7 +18,7 @@ from ..services.engine import RecommendationService
 
 router = APIRouter(prefix="/recommend", tags=["recommendations"])
 
-SessionDep = Annotated[Session, Depends(get_db)]
+ReadSessionDep = Annotated[Session, Depends(get_read_db)]
 CurrentUserDep = Annotated[UserDB, Depends(get_current_user)]
 
 
@@ -35,7 +35,7 @@ def _build_service(db: Session) -> RecommendationService:
 def recommend_meal(
     request: RecommendationRequest,
     current_user: CurrentUserDep,
-    db: SessionDep,
+    db: ReadSessionDep,
 ) -> RecommendationResponse:
     """Return personalized meal recommendations using the LLM-enabled engine."""
     service = _build_service(db)
@@ -50,7 +50,7 @@ def recommend_meal(
 def recommend_restaurant(
     request: RecommendationRequest,
     current_user: CurrentUserDep,
-    db: SessionDep,
+    db: ReadSessionDep,
 ) -> RecommendationResponse:
     """Return restaurant recommendations using the LLM-enabled engine."""
     service = _build_service(db)
@@ -4,14 +4,16 @@ This router handles user-specific CRUD operations.
 For authentication-related endpoints (register, login, etc.), see auth.py
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
+from ..db import query_stats
 from ..db.database import get_db
 from ..models import UserDB
 from ..schemas import (
+    EndpointQueryMetricsResponse,
     UserAuditLogResponse,
     UserDetailResponse,
     UserListResponse,
@@ -23,6 +25,7 @@ from ..services.user_service import (
     get_user_audit_logs,
     update_user_profile_with_audit,
 )
+from ..utils.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, next_cursor
 
 router = APIRouter(
     prefix="/users",
@@ -167,7 +170,9 @@ async def get_user_audit_history(
     user_id: str,
     db: SessionDep,
     current_user: AdminUserDep,
+    response: Response,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ):
     """Get audit log history for a specific user (Admin only)
 
@@ -179,12 +184,15 @@ async def get_user_audit_history(
         user_id: The ID of the user to get audit logs for
         db: Database session
         current_user: Current authenticated admin user
+        response: Response used to set the X-Next-Cursor header
         limit: Maximum number of audit logs to return (default: 100)
+        cursor: Optional cursor from a previous page's X-Next-Cursor header
 
     Returns:
         List of audit log entries for the user
 
     Raises:
+        HTTPException: 400 if the cursor is invalid
         HTTPException: 403 if user is not an admin
         HTTPException: 404 if user is not found
 
@@ -198,16 +206,16 @@ async def get_user_audit_history(
         )
 
     # Get audit logs
-    audit_logs = get_user_audit_logs(db=db, target_user_id=user_id, limit=limit)
-
-    return audit_logs
+    return _audit_logs_page(response, db, user_id, limit, cursor)
 
 
 @router.get("/admin/audit-logs", response_model=list[UserAuditLogResponse])
 async def get_all_user_audit_history(
     db: SessionDep,
     current_user: AdminUserDep,
+    response: Response,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ):
     """Get all user audit log history (Admin only)
 
@@ -218,17 +226,76 @@ async def get_all_user_audit_history(
     Args:
         db: Database session
         current_user: Current authenticated admin user
+        response: Response used to set the X-Next-Cursor header
         limit: Maximum number of audit logs to return (default: 100)
+        cursor: Optional cursor from a previous page's X-Next-Cursor header
 
     Returns:
         List of all audit log entries
 
     Raises:
+        HTTPException: 400 if the cursor is invalid
         HTTPException: 403 if user is not an admin
 
     """
     # Get all audit logs (no user_id filter)
-    audit_logs = get_user_audit_logs(db=db, target_user_id=None, limit=limit)
+    return _audit_logs_page(response, db, None, limit, cursor)
+
+
+@router.get("/admin/query-metrics", response_model=list[EndpointQueryMetricsResponse])
+async def get_query_metrics(current_user: AdminUserDep):
+    """Get per-endpoint SQL statement metrics of this process (Admin only)
+
+    Metrics are aggregated since the worker process started, grouped by
+    route template, busiest endpoints first. With several workers each
+    process reports its own requests.
+
+    Args:
+        current_user: Current authenticated admin user
+
+    Returns:
+        Request count, statements per request and DB time per endpoint
+
+    Raises:
+        HTTPException: 403 if user is not an admin
+
+    """
+    return sorted(
+        (
+            EndpointQueryMetricsResponse(
+                endpoint=endpoint,
+                requests=metrics.requests,
+                avg_queries=metrics.avg_queries,
+                max_queries=metrics.max_queries,
+                total_time_ms=metrics.total_time * 1000,
+            )
+            for endpoint, metrics in list(query_stats.endpoint_metrics.items())
+        ),
+        key=lambda metrics: metrics.requests,
+        reverse=True,
+    )
+
+
+def _audit_logs_page(
+    response: Response,
+    db: Session,
+    target_user_id: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+) -> list:
+    """Fetch one page of user audit logs and set the next cursor header"""
+    try:
+        audit_logs = get_user_audit_logs(
+            db=db, target_user_id=target_user_id, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    cursor_value = next_cursor(audit_logs, len(audit_logs) == limit, "created_at")
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
 
     return audit_logs
 
@@ -1,14 +1,18 @@
 """API routes for mental wellness logging (mood, stress, sleep)."""
 
-from datetime import datetime
-from typing import Annotated, Optional
+import io
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import Annotated, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from ..db.database import get_db
-from ..models.models import LogType, UserDB
+from ..db.database import get_db, get_read_db
+from ..models.models import LogType, UserDB, utcnow
 from ..schemas.schemas import (
+    MAX_WELLNESS_INSIGHTS_DAYS,
     MoodLogCreate,
     MoodLogResponse,
     MoodLogUpdate,
@@ -19,20 +23,39 @@ from ..schemas.schemas import (
     StressLogResponse,
     StressLogUpdate,
     UserResponse,
+    WellnessImportResponse,
+    WellnessInsightsResponse,
     WellnessLogsResponse,
+    WellnessTimelineResponse,
 )
 from ..services.auth_service import get_current_user
 from ..services.mental_wellness_service import MentalWellnessService
+from ..services.wellness_import_service import (
+    WELLNESS_IMPORT_MAX_BYTES,
+    WellnessImportService,
+)
+from ..services.wellness_insights_service import WellnessInsightsService
+from ..utils.pagination import InvalidCursorError, next_cursor
+from ..utils.timezones import get_local_date
 
 router = APIRouter(prefix="/wellness", tags=["wellness"])
 
+# Imports are sent as the raw request body
+IMPORT_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        content_type: {"schema": {"type": "string", "format": "binary"}}
+        for content_type in ("text/csv", "application/x-ndjson")
+    },
+}
+
 
 @router.post(
     "/mood-logs", response_model=MoodLogResponse, status_code=status.HTTP_201_CREATED
 )
 def create_mood_log(
     mood_data: MoodLogCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Create a new mood log entry.
@@ -53,14 +76,10 @@ def create_mood_log(
 
     """
     try:
-        # Get full user object from database for timezone info
-        user_db = db.query(UserDB).filter(UserDB.id == current_user.id).first()
-        if not user_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
-        db_log = MentalWellnessService.log_mood(db, current_user.id, mood_data, user_db)
+        # current_user is the UserDB loaded by get_current_user (has timezone)
+        db_log = MentalWellnessService.log_mood(
+            db, current_user.id, mood_data, current_user
+        )
 
         # Convert to response with decrypted notes
         from ..utils.security import decrypt_sensitive_data
@@ -93,7 +112,7 @@ def create_mood_log(
 )
 def create_stress_log(
     stress_data: StressLogCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Create a new stress log entry.
@@ -114,15 +133,9 @@ def create_stress_log(
 
     """
     try:
-        # Get full user object from database for timezone info
-        user_db = db.query(UserDB).filter(UserDB.id == current_user.id).first()
-        if not user_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
+        # current_user is the UserDB loaded by get_current_user (has timezone)
         db_log = MentalWellnessService.log_stress(
-            db, current_user.id, stress_data, user_db
+            db, current_user.id, stress_data, current_user
         )
 
         # Convert to response with decrypted data
@@ -155,7 +168,7 @@ def create_stress_log(
 )
 def create_sleep_log(
     sleep_data: SleepLogCreate,
-    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    current_user: Annotated[UserDB, Depends(get_current_user)],
     db: Session = Depends(get_db),
 ):
     """Create a new sleep log entry.
@@ -176,15 +189,9 @@ def create_sleep_log(
 
     """
     try:
-        # Get full user object from database for timezone info
-        user_db = db.query(UserDB).filter(UserDB.id == current_user.id).first()
-        if not user_db:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-
+        # current_user is the UserDB loaded by get_current_user (has timezone)
         db_log = MentalWellnessService.log_sleep(
-            db, current_user.id, sleep_data, user_db
+            db, current_user.id, sleep_data, current_user
         )
 
         # Convert to response with decrypted notes
@@ -213,10 +220,82 @@ def create_sleep_log(
         )
 
 
+@router.post(
+    "/import",
+    response_model=WellnessImportResponse,
+    openapi_extra={"requestBody": IMPORT_REQUEST_BODY},
+)
+async def import_wellness_logs(
+    request: Request,
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_db),
+    import_format: Literal["csv", "ndjson"] = Query(
+        "csv", alias="format", description="csv (with a header row) or ndjson"
+    ),
+):
+    """Import mood, stress and sleep history from another app or a wearable.
+
+    The body is spooled to a temporary file and imported in chunks, each in
+    its own transaction. Records may be on any past date; records that fail
+    validation or fall on a local date that already has a log of their type
+    are skipped and reported, the rest are imported.
+
+    Args:
+        request: Incoming request, whose body is the file
+        current_user: Authenticated user
+        db: Database session
+        import_format: "csv" or "ndjson"
+
+    Returns:
+        Import counts and the first rejected records
+
+    Raises:
+        HTTPException: If the file is too large or unreadable, or the
+            import fails
+
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > WELLNESS_IMPORT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Import exceeds the {WELLNESS_IMPORT_MAX_BYTES} byte limit",
+        )
+
+    with tempfile.TemporaryFile() as spool:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > WELLNESS_IMPORT_MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail=f"Import exceeds the {WELLNESS_IMPORT_MAX_BYTES} byte limit",
+                )
+            # Disk writes run in the thread pool to keep the event loop free
+            await run_in_threadpool(spool.write, chunk)
+        spool.seek(0)
+
+        lines = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        try:
+            return await run_in_threadpool(
+                WellnessImportService.import_logs,
+                db,
+                current_user,
+                lines,
+                import_format,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to import wellness logs: {e!s}",
+            )
+
+
 @router.get("/logs", response_model=WellnessLogsResponse)
 def get_wellness_logs(
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     start_date: Optional[datetime] = Query(
         None, description="Filter by start datetime (ISO 8601 format, UTC)"
     ),
@@ -226,6 +305,11 @@ def get_wellness_logs(
     log_type: Optional[LogType] = Query(
         None, description="Filter by type: 'mood', 'stress', or 'sleep'"
     ),
+    include_notes: bool = Query(
+        True,
+        description="Include decrypted notes and triggers; false returns them "
+        "as null without reading or decrypting them (e.g. for charts)",
+    ),
 ):
     """Get user's wellness logs with optional filters.
 
@@ -235,6 +319,7 @@ def get_wellness_logs(
         start_date: Optional start datetime filter (UTC)
         end_date: Optional end datetime filter (UTC)
         log_type: Optional log type filter ('mood', 'stress', 'sleep')
+        include_notes: Whether to include notes and triggers
 
     Returns:
         Wellness logs (mood, stress, sleep) with decrypted data
@@ -247,6 +332,7 @@ def get_wellness_logs(
             start_date=start_date,
             end_date=end_date,
             log_type=log_type,
+            include_notes=include_notes,
         )
 
         total_count = len(mood_logs) + len(stress_logs) + len(sleep_logs)
@@ -264,11 +350,136 @@ def get_wellness_logs(
         )
 
 
+@router.get("/logs/timeline", response_model=WellnessTimelineResponse)
+def get_wellness_timeline(
+    current_user: Annotated[UserResponse, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    start_date: Optional[datetime] = Query(
+        None, description="Filter by start datetime (ISO 8601 format, UTC)"
+    ),
+    end_date: Optional[datetime] = Query(
+        None, description="Filter by end datetime (ISO 8601 format, UTC)"
+    ),
+    log_type: Optional[LogType] = Query(
+        None, description="Filter by type: 'mood', 'stress', or 'sleep'"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    limit: int = Query(50, ge=1, le=200, description="Entries per page"),
+    include_notes: bool = Query(
+        True, description="Include decrypted notes and triggers"
+    ),
+):
+    """Get mood, stress and sleep logs merged into one timeline, newest first.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+        start_date: Optional start datetime filter (UTC)
+        end_date: Optional end datetime filter (UTC)
+        log_type: Optional log type filter ('mood', 'stress', 'sleep')
+        cursor: Optional next_cursor from a previous page
+        limit: Entries per page
+        include_notes: Whether to include notes and triggers
+
+    Returns:
+        One page of timeline entries and the cursor of the next page
+
+    Raises:
+        HTTPException: If the cursor is invalid
+
+    """
+    try:
+        entries, has_more = MentalWellnessService.get_wellness_timeline(
+            db=db,
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+            log_type=log_type,
+            cursor=cursor,
+            limit=limit,
+            include_notes=include_notes,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return WellnessTimelineResponse(
+        entries=entries,
+        has_more=has_more,
+        next_cursor=next_cursor(entries, has_more, "occurred_at_utc"),
+    )
+
+
+@router.get("/insights", response_model=WellnessInsightsResponse)
+def get_wellness_insights(
+    current_user: Annotated[UserDB, Depends(get_current_user)],
+    db: Session = Depends(get_read_db),
+    start_date: Optional[date] = Query(
+        None, description="First local date (defaults to one year before end_date)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last local date (defaults to today in your timezone)"
+    ),
+    window: int = Query(7, ge=1, le=90, description="Days in the rolling average"),
+):
+    """Get wellness averages, logging streaks and metric correlations.
+
+    Mood, stress and sleep come from the daily wellness rollup and calories
+    from the daily nutrition rollup, so no individual logs are loaded.
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+        start_date: First local date (inclusive)
+        end_date: Last local date (inclusive)
+        window: Number of days in the rolling average
+
+    Returns:
+        Per metric insights, weekly averages and correlations
+
+    Raises:
+        HTTPException: If the range is invalid or too long, or computing fails
+
+    """
+    if end_date is None:
+        end_date = get_local_date(utcnow(), current_user.timezone)
+    if start_date is None:
+        start_date = end_date - timedelta(days=364)
+
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+    if (end_date - start_date).days >= MAX_WELLNESS_INSIGHTS_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range must not exceed {MAX_WELLNESS_INSIGHTS_DAYS} days",
+        )
+
+    try:
+        insights = WellnessInsightsService.get_insights(
+            db, current_user.id, start_date, end_date, window
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compute wellness insights: {e!s}",
+        )
+
+    return WellnessInsightsResponse(
+        start_date=start_date,
+        end_date=end_date,
+        timezone=current_user.timezone,
+        rolling_window=window,
+        **insights,
+    )
+
+
 @router.get("/mood-logs/{log_id}", response_model=MoodLogResponse)
 def get_mood_log(
     log_id: str,
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get a specific mood log by ID.
 
@@ -374,7 +585,7 @@ def delete_mood_log(
 def get_stress_log(
     log_id: str,
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get a specific stress log by ID.
 
@@ -482,7 +693,7 @@ def delete_stress_log(
 def get_sleep_log(
     log_id: str,
     current_user: Annotated[UserResponse, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get a specific sleep log by ID.
 
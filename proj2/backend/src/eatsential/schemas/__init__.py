@@ -11,6 +11,7 @@ from .schemas import (
     DietaryPreferenceResponse,
     DietaryPreferenceUpdate,
     EmailRequest,
+    EndpointQueryMetricsResponse,
     HealthProfileCreate,
     HealthProfileResponse,
     HealthProfileUpdate,
@@ -40,6 +41,7 @@ __all__ = [
     "DietaryPreferenceResponse",
     "DietaryPreferenceUpdate",
     "EmailRequest",
+    "EndpointQueryMetricsResponse",
     "HealthProfileCreate",
     "HealthProfileResponse",
     "HealthProfileUpdate",
@@ -2,13 +2,14 @@
 
 import re
 from datetime import date, datetime, timedelta, timezone
-from typing import Annotated, Optional
+from typing import Annotated, Any, Literal, Optional
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     EmailStr,
     Field,
+    GetPydanticSchema,
     computed_field,
     field_serializer,
     field_validator,
@@ -20,6 +21,7 @@ from ..models.models import (
     AllergySeverity,
     GoalStatus,
     GoalType,
+    LogType,
     MealType,
     PreferenceType,
     UserRole,
@@ -308,6 +310,16 @@ class UserAuditLogResponse(BaseModel):
     created_at: datetime
 
 
+class EndpointQueryMetricsResponse(BaseModel):
+    """Schema for the aggregated SQL metrics of one endpoint (admin view)"""
+
+    endpoint: str
+    requests: int
+    avg_queries: float
+    max_queries: int
+    total_time_ms: float
+
+
 # --- Admin User Management Schemas ---
 
 
@@ -367,6 +379,19 @@ class MealFoodItemCreate(BaseModel):
     fat_g: Optional[float] = Field(None, ge=0)
 
 
+class MealFoodItemUpdate(MealFoodItemCreate):
+    """Schema for a food item in a meal update.
+
+    Items with the id of an existing food item update that row in place;
+    items without an id are added.
+    """
+
+    # Also accept MealFoodItemCreate objects (read as items without an id)
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[str] = None
+
+
 class MealFoodItemResponse(BaseModel):
     """Schema for food item response"""
 
@@ -416,7 +441,8 @@ class MealUpdate(BaseModel):
     meal_time: Optional[datetime] = None
     notes: Optional[str] = Field(None, max_length=1000)
     photo_url: Optional[str] = Field(None, max_length=500)
-    food_items: Optional[list[MealFoodItemCreate]] = Field(None, min_length=1)
+    # Full list of the meal's food items; existing items omitted are removed
+    food_items: Optional[list[MealFoodItemUpdate]] = Field(None, min_length=1)
 
     @field_validator("meal_time")
     @classmethod
@@ -458,13 +484,169 @@ class MealResponse(BaseModel):
     updated_at: datetime
 
 
+class MealPhotoResponse(BaseModel):
+    """Schema for an uploaded meal photo"""
+
+    meal_id: str
+    photo_url: str
+    thumbnail_url: str
+    content_hash: str
+    content_type: str
+    size_bytes: int
+    deduplicated: bool  # Same image was already stored
+    processing: bool  # Photo and thumbnail are still being generated
+
+
 class MealListResponse(BaseModel):
     """Schema for paginated meal list response"""
 
     meals: list[MealResponse]
-    total: int
+    total: Optional[int] = None  # Only set when include_total=true
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class MealSparseListResponse(MealListResponse):
+    """Schema for a meal list requested with fields= (partial meals)"""
+
+    meals: list[dict[str, Any]] = Field(
+        description=(
+            "Meals with only the requested MealResponse fields, plus id and meal_time"
+        )
+    )
+
+
+# Longest date range served by GET /api/meals/summary, in days
+MAX_NUTRITION_SUMMARY_DAYS = 366
+
+
+class DailyNutritionResponse(BaseModel):
+    """Schema for one day of nutrition totals"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    local_date: date
+    meal_count: int
+    total_calories: float
+    total_protein_g: float
+    total_carbs_g: float
+    total_fat_g: float
+
+
+class NutritionSummaryResponse(BaseModel):
+    """Schema for nutrition totals over a date range"""
+
+    start_date: date
+    end_date: date
+    timezone: str
+    days: list[DailyNutritionResponse]  # Only days with meals
+    meal_count: int
+    total_calories: float
+    total_protein_g: float
+    total_carbs_g: float
+    total_fat_g: float
+    average_daily_calories: Optional[float] = None  # Over days with meals
+
+
+# Longest date range served by GET /api/meals/trends, in days (ten years)
+MAX_NUTRITION_TRENDS_DAYS = 3660
+
+
+class NutritionTrendBucket(BaseModel):
+    """Schema for one week or month of nutrition trends"""
+
+    period_start: date
+    days_logged: int
+    meal_count: int
+    total_calories: float
+    total_protein_g: float
+    total_carbs_g: float
+    total_fat_g: float
+    average_daily_calories: float  # Over days logged in the period
+    moving_average_calories: float  # Of average_daily_calories over the window
+    # Share of macro calories (4/4/9 kcal per gram); None without macros
+    protein_pct: Optional[float] = None
+    carbs_pct: Optional[float] = None
+    fat_pct: Optional[float] = None
+
+
+class MealTypeBreakdown(BaseModel):
+    """Schema for nutrition totals of one meal type"""
+
+    meal_type: str
+    meal_count: int
+    total_calories: float
+    total_protein_g: float
+    total_carbs_g: float
+    total_fat_g: float
+    calorie_share: Optional[float] = None  # Percent of the range's calories
+
+
+class NutritionTrendsResponse(BaseModel):
+    """Schema for weekly or monthly nutrition trends"""
+
+    period: Literal["week", "month"]
+    start_date: date
+    end_date: date
+    timezone: str
+    moving_average_window: int
+    buckets: list[NutritionTrendBucket]  # Only periods with meals
+    meal_types: list[MealTypeBreakdown]
+
+
+# Maximum number of meals accepted by POST /api/meals/batch
+MAX_MEAL_BATCH_SIZE = 100
+
+
+class MealBatchItem(MealCreate):
+    """Schema for one meal in a batch upload"""
+
+    # Retrying a meal with the same key returns the original instead of a copy
+    idempotency_key: Optional[str] = Field(None, min_length=1, max_length=100)
+
+
+# A raw meal object documented as MealBatchItem in the OpenAPI schema
+_RawMealBatchItem = Annotated[
+    dict[str, Any],
+    GetPydanticSchema(
+        get_pydantic_json_schema=lambda _schema, handler: handler(
+            MealBatchItem.__pydantic_core_schema__
+        )
+    ),
+]
+
+
+class MealBatchCreate(BaseModel):
+    """Schema for batch meal logging.
+
+    Meals are kept as raw objects here and validated one by one against
+    MealBatchItem, so a single invalid meal is reported in its result instead
+    of rejecting the whole batch. The OpenAPI schema still documents each
+    meal as a MealBatchItem.
+    """
+
+    meals: list[_RawMealBatchItem] = Field(min_length=1, max_length=MAX_MEAL_BATCH_SIZE)
+
+
+class MealBatchItemResult(BaseModel):
+    """Schema for the outcome of one meal in a batch"""
+
+    index: int
+    status: Literal["created", "duplicate", "error"]
+    idempotency_key: Optional[str] = None
+    meal: Optional[MealResponse] = None
+    errors: list[str] = []
+
+
+class MealBatchResponse(BaseModel):
+    """Schema for batch meal logging response"""
+
+    results: list[MealBatchItemResult]
+    created: int
+    duplicates: int
+    failed: int
 
 
 # --- Goal Tracking Schemas ---
@@ -523,6 +705,19 @@ class GoalUpdate(BaseModel):
         return value
 
 
+def goal_completion_percentage(current_value: float, target_value: float) -> float:
+    """Calculate goal completion percentage, capped at 100"""
+    if target_value <= 0:
+        return 0.0
+    percentage = (current_value / target_value) * 100
+    return min(percentage, 100.0)
+
+
+def goal_is_active(status: str, start_date: date, end_date: date) -> bool:
+    """Check if a goal is active and today is within its date range"""
+    return status == GoalStatus.ACTIVE.value and start_date <= date.today() <= end_date
+
+
 class GoalResponse(BaseModel):
     """Schema for goal response"""
 
@@ -545,34 +740,41 @@ class GoalResponse(BaseModel):
     @property
     def completion_percentage(self) -> float:
         """Calculate goal completion percentage"""
-        if self.target_value <= 0:
-            return 0.0
-        percentage = (self.current_value / self.target_value) * 100
-        return min(percentage, 100.0)
+        return goal_completion_percentage(self.current_value, self.target_value)
 
     @computed_field
     @property
     def is_active(self) -> bool:
         """Check if goal is currently active"""
-        today = date.today()
-        return (
-            self.status == GoalStatus.ACTIVE.value
-            and self.start_date <= today <= self.end_date
-        )
+        return goal_is_active(self.status, self.start_date, self.end_date)
 
 
 class GoalListResponse(BaseModel):
     """Schema for paginated goal list response"""
 
     goals: list[GoalResponse]
-    total: int
+    total: Optional[int] = None  # Only set when include_total=true
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class GoalSparseListResponse(GoalListResponse):
+    """Schema for a goal list requested with fields= (partial goals)"""
+
+    goals: list[dict[str, Any]] = Field(
+        description=(
+            "Goals with only the requested GoalResponse fields, plus id and created_at"
+        )
+    )
 
 
 class GoalProgressResponse(BaseModel):
     """Schema for goal progress statistics"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     goal_id: str
     goal_type: str
     target_type: str
@@ -583,6 +785,27 @@ class GoalProgressResponse(BaseModel):
     days_remaining: int
 
 
+class GoalProgressPoint(BaseModel):
+    """Schema for one point of a goal's progress history"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    snapshot_date: date = Field(..., description="First day the point covers")
+    period_days: int = Field(..., description="Number of days the point covers")
+    value: float = Field(..., description="Progress at the end of the period")
+    min_value: float
+    max_value: float
+
+
+class GoalHistoryResponse(BaseModel):
+    """Schema for a goal's downsampled progress history"""
+
+    goal_id: str
+    start_date: date
+    end_date: date
+    points: list[GoalProgressPoint]
+
+
 # ============================================================================
 # Mental Wellness Schemas
 # ============================================================================
@@ -820,3 +1043,110 @@ class WellnessLogsResponse(BaseModel):
     stress_logs: list[StressLogResponse] = []
     sleep_logs: list[SleepLogResponse] = []
     total_count: int
+
+
+class WellnessTimelineEntry(BaseModel):
+    """Schema for one mood, stress or sleep log in the merged timeline.
+
+    Only the score fields of the entry's log_type are set.
+    """
+
+    log_type: LogType
+    id: str
+    occurred_at_utc: datetime
+    mood_score: Optional[int] = None
+    stress_level: Optional[int] = None
+    duration_hours: Optional[float] = None
+    quality_score: Optional[int] = None
+    triggers: Optional[str] = None
+    notes: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    @field_serializer("occurred_at_utc", "created_at", "updated_at")
+    def serialize_datetime(self, dt: datetime) -> str:
+        """Serialize datetime as UTC ISO8601 string with Z suffix."""
+        if dt.tzinfo is None:
+            # Treat naive datetime as UTC
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            # Convert to UTC if it has timezone info
+            dt = dt.astimezone(timezone.utc)
+        return dt.isoformat().replace("+00:00", "Z")
+
+
+class WellnessImportError(BaseModel):
+    """Schema for a rejected line of a wellness import"""
+
+    line: int  # 1-based line number in the file
+    log_type: Optional[LogType] = None
+    errors: list[str]
+
+
+class WellnessImportResponse(BaseModel):
+    """Schema for the outcome of a wellness log import"""
+
+    processed: int = 0  # Records read, imported or not
+    imported: int = 0
+    imported_by_type: dict[str, int] = {}  # Log type -> logs imported
+    failed: int = 0
+    errors: list[WellnessImportError] = []  # The first rejected records
+
+
+class WellnessTimelineResponse(BaseModel):
+    """Schema for a page of the merged wellness timeline, newest first"""
+
+    entries: list[WellnessTimelineEntry]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+# Longest date range served by GET /api/wellness/insights, in days (ten years)
+MAX_WELLNESS_INSIGHTS_DAYS = 3660
+
+WellnessMetric = Literal[
+    "mood_score", "stress_level", "sleep_hours", "sleep_quality", "calories"
+]
+
+
+class WellnessMetricInsight(BaseModel):
+    """Schema for the averages and logging streaks of one metric"""
+
+    metric: WellnessMetric
+    days_logged: int
+    average: Optional[float] = None  # Of daily averages; None without logs
+    rolling_average: Optional[float] = None  # Over the last `window` days
+    current_streak: int  # Consecutive logged days up to end_date or the day before
+    longest_streak: int
+
+
+class WellnessWeeklyBucket(BaseModel):
+    """Schema for one week (starting Monday) of daily metric averages"""
+
+    week_start: date
+    mood_score: Optional[float] = None
+    stress_level: Optional[float] = None
+    sleep_hours: Optional[float] = None
+    sleep_quality: Optional[float] = None
+    calories: Optional[float] = None
+
+
+class WellnessCorrelation(BaseModel):
+    """Schema for the Pearson correlation of two daily metrics"""
+
+    metric_x: WellnessMetric
+    metric_y: WellnessMetric
+    coefficient: Optional[float] = None  # None with too few or constant days
+    days: int  # Days with both metrics logged
+
+
+class WellnessInsightsResponse(BaseModel):
+    """Schema for wellness averages, streaks and correlations"""
+
+    start_date: date
+    end_date: date
+    timezone: str
+    rolling_window: int
+    metrics: list[WellnessMetricInsight]
+    weeks: list[WellnessWeeklyBucket]  # Only weeks with data
+    correlations: list[WellnessCorrelation]
@@ -0,0 +1,322 @@
+"""Scripted user sessions against a running API, with latency percentiles.
+
+Each virtual user logs in as one synthetic user (see synthetic_data) and
+repeats a session until the run ends: list meals, log a meal, check goal
+progress and ask for meal recommendations. Mood, stress and sleep are
+logged once per virtual user, as the API accepts one of each per day.
+
+Latencies are recorded per endpoint. summarize turns them into throughput
+and p50/p95/p99, in a JSON-serializable report; compare_reports lines two
+reports (e.g. of two commits) up endpoint by endpoint.
+"""
+
+import asyncio
+import math
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import httpx
+
+from .synthetic_data import DEFAULT_PASSWORD, FOODS, user_email
+
+# Report keys compared between runs, with the direction that is better
+COMPARED_METRICS = (
+    ("throughput_rps", "higher"),
+    ("p50_ms", "lower"),
+    ("p95_ms", "lower"),
+    ("p99_ms", "lower"),
+)
+
+# Seconds before a request counts as failed
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ascending values.
+
+    Args:
+        sorted_values: Values in ascending order (not empty)
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Smallest value with at least pct percent of values at or below it
+
+    """
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class LoadTestStats:
+    """Latencies and failures per endpoint"""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: Optional[float], ok: bool) -> None:
+        """Record one request; seconds is None when no response arrived"""
+        self.latencies.setdefault(endpoint, [])
+        self.errors.setdefault(endpoint, 0)
+        if seconds is not None:
+            self.latencies[endpoint].append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+
+
+def _summary(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """Compute throughput and latency statistics of one endpoint (or all)"""
+    values = sorted(seconds * 1000 for seconds in latencies)
+    summary: dict[str, Any] = {
+        "requests": len(values),
+        "errors": errors,
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+    }
+    if values:
+        summary.update(
+            {
+                "mean_ms": round(statistics.fmean(values), 2),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2),
+            }
+        )
+    return summary
+
+
+def summarize(stats: LoadTestStats, elapsed: float) -> dict:
+    """Build the report of a run.
+
+    Args:
+        stats: Recorded requests
+        elapsed: Wall-clock duration of the run in seconds
+
+    Returns:
+        {"elapsed_seconds", "total", "endpoints": {endpoint: summary}}
+
+    """
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "total": _summary(
+            [s for values in stats.latencies.values() for s in values],
+            sum(stats.errors.values()),
+            elapsed,
+        ),
+        "endpoints": {
+            endpoint: _summary(latencies, stats.errors[endpoint], elapsed)
+            for endpoint, latencies in sorted(stats.latencies.items())
+        },
+    }
+
+
+def compare_reports(baseline: dict, current: dict) -> list[dict]:
+    """Line up the metrics of two reports endpoint by endpoint.
+
+    Args:
+        baseline: Earlier report (e.g. from the main branch)
+        current: Report to compare against it
+
+    Returns:
+        One row per endpoint and metric present in both reports, with the
+        relative change in percent and whether it is an improvement
+
+    """
+    rows = []
+    endpoints = {"total": (baseline["total"], current["total"])}
+    for endpoint, summary in current["endpoints"].items():
+        if endpoint in baseline["endpoints"]:
+            endpoints[endpoint] = (baseline["endpoints"][endpoint], summary)
+
+    for endpoint, (before, after) in endpoints.items():
+        for metric, better in COMPARED_METRICS:
+            if metric not in before or metric not in after:
+                continue
+            change = (
+                (after[metric] - before[metric]) / before[metric] * 100
+                if before[metric]
+                else 0.0
+            )
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "metric": metric,
+                    "baseline": before[metric],
+                    "current": after[metric],
+                    "change_pct": round(change, 1),
+                    "improved": change > 0 if better == "higher" else change < 0,
+                }
+            )
+    return rows
+
+
+async def _request(
+    client: httpx.AsyncClient,
+    stats: LoadTestStats,
+    endpoint: str,
+    path: str,
+    expected: tuple[int, ...],
+    **kwargs: Any,
+) -> Optional[httpx.Response]:
+    """Send one request and record its latency under an endpoint name"""
+    method = endpoint.split(" ", 1)[0]
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, path, **kwargs)
+    except httpx.HTTPError:
+        stats.record(endpoint, None, ok=False)
+        return None
+    stats.record(
+        endpoint, time.perf_counter() - start, ok=response.status_code in expected
+    )
+    return response
+
+
+def _meal_payload(rng: random.Random) -> dict:
+    """Build a meal of one to three food items eaten within the last hours"""
+    meal_time = datetime.now(timezone.utc) - timedelta(minutes=rng.randint(1, 240))
+    food_items = []
+    for name, unit, calories, protein, carbs, fat in rng.sample(
+        FOODS, rng.randint(1, 3)
+    ):
+        food_items.append(
+            {
+                "food_name": name,
+                "portion_size": 1,
+                "portion_unit": unit,
+                "calories": calories,
+                "protein_g": protein,
+                "carbs_g": carbs,
+                "fat_g": fat,
+            }
+        )
+    return {
+        "meal_type": rng.choice(("breakfast", "lunch", "dinner", "snack")),
+        "meal_time": meal_time.isoformat(),
+        "food_items": food_items,
+    }
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    stats: LoadTestStats,
+    user_index: int,
+    password: str,
+    deadline: float,
+    think_time: float,
+    recommendation_mode: str,
+    seed: int,
+) -> int:
+    """Run sessions as one user until the deadline; returns sessions run"""
+    rng = random.Random(f"{seed}:{user_index}")  # noqa: S311
+    response = await _request(
+        client,
+        stats,
+        "POST /api/auth/login",
+        "/api/auth/login",
+        (200,),
+        json={"email": user_email(user_index), "password": password},
+    )
+    if response is None or response.status_code != 200:
+        return 0
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def step(endpoint: str, path: str, expected: tuple[int, ...], **kw: Any):
+        await _request(client, stats, endpoint, path, expected, headers=headers, **kw)
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+
+    now = datetime.now(timezone.utc).isoformat()
+    # One per type and day; 409 means an earlier run already logged today
+    await step(
+        "POST /api/wellness/mood-logs",
+        "/api/wellness/mood-logs",
+        (201, 409),
+        json={"occurred_at": now, "mood_score": rng.randint(3, 9)},
+    )
+    await step(
+        "POST /api/wellness/stress-logs",
+        "/api/wellness/stress-logs",
+        (201, 409),
+        json={"occurred_at": now, "stress_level": rng.randint(2, 8)},
+    )
+    await step(
+        "POST /api/wellness/sleep-logs",
+        "/api/wellness/sleep-logs",
+        (201, 409),
+        json={
+            "occurred_at": now,
+            "duration_hours": rng.choice((6, 6.5, 7, 7.5, 8)),
+            "quality_score": rng.randint(4, 9),
+        },
+    )
+
+    sessions = 0
+    while time.perf_counter() < deadline:
+        await step("GET /api/meals", "/api/meals", (200,), params={"page_size": 20})
+        await step("POST /api/meals", "/api/meals", (201,), json=_meal_payload(rng))
+        await step("GET /api/goals/progress", "/api/goals/progress", (200,))
+        await step(
+            "POST /api/recommend/meal",
+            "/api/recommend/meal",
+            (200,),
+            json={"mode": recommendation_mode},
+        )
+        sessions += 1
+    return sessions
+
+
+async def run_load_test(
+    base_url: str,
+    users: int,
+    duration: float,
+    password: str = DEFAULT_PASSWORD,
+    first_user: int = 0,
+    think_time: float = 0.0,
+    recommendation_mode: str = "llm",
+    seed: int = 42,
+) -> dict:
+    """Drive concurrent user sessions against an API for a while.
+
+    Args:
+        base_url: Root URL of the running API (e.g. http://127.0.0.1:8000)
+        users: Concurrent virtual users, each a different synthetic user
+        duration: Seconds to start new sessions for
+        password: Password of the synthetic users
+        first_user: Index of the first synthetic user to log in as
+        think_time: Mean seconds a user waits between requests
+        recommendation_mode: "llm" or "baseline" ranking
+        seed: Seed of the users' choices
+
+    Returns:
+        Report from summarize, plus the sessions completed
+
+    """
+    stats = LoadTestStats()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=REQUEST_TIMEOUT_SECONDS
+    ) as client:
+        start = time.perf_counter()
+        sessions = await asyncio.gather(
+            *(
+                _virtual_user(
+                    client,
+                    stats,
+                    first_user + index,
+                    password,
+                    start + duration,
+                    think_time,
+                    recommendation_mode,
+                    seed,
+                )
+                for index in range(users)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    report = summarize(stats, elapsed)
+    report["sessions"] = sum(sessions)
+    return report
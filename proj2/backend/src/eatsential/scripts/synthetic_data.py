@@ -0,0 +1,559 @@
+"""Deterministic synthetic data at benchmark scale.
+
+Users (with health profiles, meals, food items, goals and mood, stress and
+sleep history) and the restaurant catalog are generated in partitions. Each
+partition draws from its own random stream, derived from the seed and the
+partition's index, so a seed always yields the same rows no matter which
+worker process generates a partition or in which order partitions finish.
+
+Every partition is bulk inserted and committed in one transaction. The
+daily nutrition and daily wellness rollups and goal progress are then
+computed from the inserted rows by the services that maintain them, so the
+generated database looks exactly like one built through the API.
+"""
+
+import multiprocessing
+import random
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..db.database import _connect_args
+from ..models import (
+    GoalDB,
+    HealthProfileDB,
+    MealDB,
+    MealFoodItemDB,
+    MenuItem,
+    MoodLogDB,
+    Restaurant,
+    SleepLogDB,
+    StressLogDB,
+    UserDB,
+)
+from ..models.models import AccountStatus, ActivityLevel, GoalStatus, UserRole
+from ..services.daily_nutrition_service import DailyNutritionService
+from ..services.daily_wellness_service import DailyWellnessService
+from ..services.goal_progress_service import GoalProgressService
+from ..utils.timezones import get_zoneinfo
+
+# Users generated, inserted and rolled up per transaction
+USER_PARTITION_SIZE = 200
+
+# Menu items per catalog partition and per restaurant
+MENU_PARTITION_SIZE = 2000
+MENU_ITEMS_PER_RESTAURANT = 20
+
+# Synthetic users log in as <prefix><index>@example.com with this password
+USER_PREFIX = "synth"
+DEFAULT_PASSWORD = "Synthetic123!"  # noqa: S105
+
+# (IANA timezone, relative share of users)
+TIMEZONES = (
+    ("America/New_York", 30),
+    ("America/Chicago", 15),
+    ("America/Los_Angeles", 20),
+    ("Europe/London", 10),
+    ("Europe/Berlin", 10),
+    ("Asia/Kolkata", 5),
+    ("Asia/Tokyo", 5),
+    ("Australia/Sydney", 5),
+)
+
+# (meal type, earliest local hour, latest local hour)
+MEAL_SLOTS = (
+    ("breakfast", 6, 9),
+    ("lunch", 11, 14),
+    ("dinner", 17, 21),
+    ("snack", 15, 22),
+)
+
+# (food name, unit, calories, protein g, carbs g, fat g) per portion
+FOODS = (
+    ("Oatmeal", "cup", 150, 5, 27, 3),
+    ("Scrambled eggs", "serving", 200, 14, 2, 15),
+    ("Greek yogurt", "cup", 130, 23, 9, 0),
+    ("Banana", "piece", 105, 1, 27, 0),
+    ("Chicken breast", "serving", 165, 31, 0, 4),
+    ("Brown rice", "cup", 215, 5, 45, 2),
+    ("Salmon fillet", "serving", 280, 39, 0, 13),
+    ("Mixed salad", "bowl", 90, 3, 10, 5),
+    ("Whole wheat pasta", "cup", 175, 7, 37, 1),
+    ("Tofu stir fry", "serving", 250, 17, 15, 14),
+    ("Lentil soup", "bowl", 230, 18, 40, 1),
+    ("Cheeseburger", "piece", 540, 30, 40, 29),
+    ("Almonds", "oz", 165, 6, 6, 14),
+    ("Apple", "piece", 95, 0, 25, 0),
+)
+
+CUISINES = (
+    "American",
+    "Chinese",
+    "French",
+    "Healthy",
+    "Indian",
+    "Italian",
+    "Japanese",
+    "Korean",
+    "Mediterranean",
+    "Mexican",
+    "Thai",
+    "Vegan",
+)
+
+# (goal type, target type, lowest target, highest target), tracked from logs
+GOAL_TEMPLATES = (
+    ("nutrition", "daily_calories", 1600, 2800),
+    ("nutrition", "daily_protein", 60, 160),
+    ("wellness", "mood_score", 6, 9),
+    ("wellness", "stress_level", 2, 5),
+    ("wellness", "sleep_hours", 7, 9),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticDataConfig:
+    """Size and shape of a synthetic dataset"""
+
+    seed: int = 42
+    users: int = 1000
+    meals_per_user: int = 100
+    # Days of history, ending the day before end_date
+    days: int = 365
+    # Chance that a user logs each wellness type on a given day
+    log_rate: float = 0.8
+    menu_items: int = 10000
+    end_date: date = date(2026, 1, 1)
+
+    @property
+    def user_partitions(self) -> int:
+        """Number of user partitions"""
+        return -(-self.users // USER_PARTITION_SIZE)
+
+    @property
+    def menu_partitions(self) -> int:
+        """Number of menu item partitions"""
+        return -(-self.menu_items // MENU_PARTITION_SIZE)
+
+
+def _rng(seed: int, *key: Any) -> random.Random:
+    """Return an independent, reproducible random stream for one partition"""
+    return random.Random(":".join(str(part) for part in (seed, *key)))  # noqa: S311
+
+
+def _uuid(rng: random.Random) -> str:
+    """Return a reproducible UUID4-shaped ID"""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _to_utc(local_date: date, hour: int, minute: int, zone: str) -> datetime:
+    """Convert a local wall-clock time in a zone to a naive UTC datetime"""
+    local = datetime.combine(local_date, time(hour, minute), get_zoneinfo(zone))
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Limit a value to a range"""
+    return max(low, min(high, value))
+
+
+def user_email(index: int) -> str:
+    """Return the login email of the synthetic user with an index"""
+    return f"{USER_PREFIX}{index}@example.com"
+
+
+def generate_menu_partition(
+    config: SyntheticDataConfig, partition: int
+) -> dict[type, list[dict]]:
+    """Generate the restaurants and menu items of one catalog partition.
+
+    Args:
+        config: Dataset configuration
+        partition: Partition index
+
+    Returns:
+        Rows to insert per model
+
+    """
+    rng = _rng(config.seed, "menu", partition)
+    created = datetime.combine(config.end_date - timedelta(days=config.days), time())
+    first = partition * MENU_PARTITION_SIZE
+    last = min(first + MENU_PARTITION_SIZE, config.menu_items)
+
+    restaurants: list[dict] = []
+    menu_items: list[dict] = []
+    for index in range(first, last):
+        if index % MENU_ITEMS_PER_RESTAURANT == 0 or not restaurants:
+            cuisine = rng.choice(CUISINES)
+            restaurants.append(
+                {
+                    "id": _uuid(rng),
+                    "name": f"{cuisine} Kitchen {index // MENU_ITEMS_PER_RESTAURANT}",
+                    "address": f"{rng.randint(1, 9999)} Main St",
+                    "cuisine": cuisine,
+                    "is_active": rng.random() < 0.9,
+                    "created_at": created,
+                }
+            )
+        food = rng.choice(FOODS)
+        menu_items.append(
+            {
+                "id": _uuid(rng),
+                "restaurant_id": restaurants[-1]["id"],
+                "name": f"{food[0]} #{index}",
+                "description": f"{food[0]} ({food[1]})",
+                "calories": round(food[2] * rng.uniform(1, 3), 2),
+                "price": round(rng.uniform(4, 35), 2),
+                "created_at": created,
+            }
+        )
+
+    return {Restaurant: restaurants, MenuItem: menu_items}
+
+
+def _user_meals(
+    rng: random.Random,
+    config: SyntheticDataConfig,
+    user_id: str,
+    zone: str,
+    rows: dict[type, list[dict]],
+) -> None:
+    """Append one user's meals and food items"""
+    first_day = config.end_date - timedelta(days=config.days)
+    for _ in range(config.meals_per_user):
+        meal_type, earliest, latest = rng.choice(MEAL_SLOTS)
+        local_day = first_day + timedelta(days=rng.randrange(config.days))
+        meal_time = _to_utc(
+            local_day, rng.randint(earliest, latest), rng.randrange(60), zone
+        )
+        meal_id = _uuid(rng)
+
+        totals = [0.0, 0.0, 0.0, 0.0]
+        for _ in range(rng.randint(1, 3)):
+            name, unit, *nutrients = rng.choice(FOODS)
+            portion = rng.choice((0.5, 1, 1, 1.5, 2))
+            amounts = [round(value * portion, 2) for value in nutrients]
+            totals = [total + amount for total, amount in zip(totals, amounts)]
+            rows[MealFoodItemDB].append(
+                {
+                    "id": _uuid(rng),
+                    "meal_id": meal_id,
+                    "food_name": name,
+                    "portion_size": portion,
+                    "portion_unit": unit,
+                    "calories": amounts[0],
+                    "protein_g": amounts[1],
+                    "carbs_g": amounts[2],
+                    "fat_g": amounts[3],
+                    "created_at": meal_time,
+                }
+            )
+
+        rows[MealDB].append(
+            {
+                "id": meal_id,
+                "user_id": user_id,
+                "meal_type": meal_type,
+                "meal_time": meal_time,
+                "total_calories": round(totals[0], 2),
+                "total_protein_g": round(totals[1], 2),
+                "total_carbs_g": round(totals[2], 2),
+                "total_fat_g": round(totals[3], 2),
+                "created_at": meal_time,
+                "updated_at": meal_time,
+            }
+        )
+
+
+def _user_wellness(
+    rng: random.Random,
+    config: SyntheticDataConfig,
+    user_id: str,
+    zone: str,
+    rows: dict[type, list[dict]],
+) -> None:
+    """Append one user's mood, stress and sleep logs, at most one per day.
+
+    Sleep drives sleep quality and mood, and stress moves against mood, so
+    the wellness insights find the correlations real users show.
+    """
+    mood_base = rng.uniform(4, 8)
+    sleep_base = rng.uniform(6, 8.5)
+    first_day = config.end_date - timedelta(days=config.days)
+
+    for offset in range(config.days):
+        local_day = first_day + timedelta(days=offset)
+        sleep_hours = round(_clamp(rng.gauss(sleep_base, 0.9), 3, 12) * 4) / 4
+        mood = round(
+            _clamp(mood_base + (sleep_hours - 7) * 0.6 + rng.gauss(0, 1.2), 1, 10)
+        )
+
+        if rng.random() < config.log_rate:
+            occurred = _to_utc(local_day, 7, rng.randrange(60), zone)
+            quality = _clamp(2 + sleep_hours * 0.8 + rng.gauss(0, 1), 1, 10)
+            rows[SleepLogDB].append(
+                {
+                    "id": _uuid(rng),
+                    "user_id": user_id,
+                    "occurred_at_utc": occurred,
+                    "duration_hours": sleep_hours,
+                    "quality_score": round(quality),
+                    "created_at": occurred,
+                    "updated_at": occurred,
+                }
+            )
+        if rng.random() < config.log_rate:
+            occurred = _to_utc(local_day, 20, rng.randrange(60), zone)
+            rows[MoodLogDB].append(
+                {
+                    "id": _uuid(rng),
+                    "user_id": user_id,
+                    "occurred_at_utc": occurred,
+                    "mood_score": mood,
+                    "created_at": occurred,
+                    "updated_at": occurred,
+                }
+            )
+        if rng.random() < config.log_rate:
+            occurred = _to_utc(local_day, 18, rng.randrange(60), zone)
+            stress = _clamp(11 - mood + rng.gauss(0, 1.5), 1, 10)
+            rows[StressLogDB].append(
+                {
+                    "id": _uuid(rng),
+                    "user_id": user_id,
+                    "occurred_at_utc": occurred,
+                    "stress_level": round(stress),
+                    "created_at": occurred,
+                    "updated_at": occurred,
+                }
+            )
+
+
+def generate_user_partition(
+    config: SyntheticDataConfig, partition: int, password_hash: str
+) -> dict[type, list[dict]]:
+    """Generate the users of one partition with all their data.
+
+    Args:
+        config: Dataset configuration
+        partition: Partition index
+        password_hash: Password hash shared by all synthetic users
+
+    Returns:
+        Rows to insert per model, in foreign key order
+
+    """
+    rng = _rng(config.seed, "users", partition)
+    zones, weights = zip(*TIMEZONES)
+    created = datetime.combine(config.end_date - timedelta(days=config.days), time())
+    first = partition * USER_PARTITION_SIZE
+    last = min(first + USER_PARTITION_SIZE, config.users)
+
+    rows: dict[type, list[dict]] = {
+        model: []
+        for model in (
+            UserDB,
+            HealthProfileDB,
+            GoalDB,
+            MealDB,
+            MealFoodItemDB,
+            MoodLogDB,
+            StressLogDB,
+            SleepLogDB,
+        )
+    }
+    for index in range(first, last):
+        user_id = _uuid(rng)
+        zone = rng.choices(zones, weights)[0]
+        rows[UserDB].append(
+            {
+                "id": user_id,
+                "email": user_email(index),
+                "username": f"{USER_PREFIX}{index}",
+                "password_hash": password_hash,
+                "account_status": AccountStatus.VERIFIED.value,
+                "email_verified": True,
+                "role": UserRole.USER.value,
+                "timezone": zone,
+                "created_at": created,
+                "updated_at": created,
+            }
+        )
+        rows[HealthProfileDB].append(
+            {
+                "id": _uuid(rng),
+                "user_id": user_id,
+                "height_cm": round(rng.gauss(170, 10), 1),
+                "weight_kg": round(rng.gauss(72, 14), 1),
+                "activity_level": rng.choice(list(ActivityLevel)).value,
+                "created_at": created,
+                "updated_at": created,
+            }
+        )
+        for goal_type, target_type, low, high in rng.sample(
+            GOAL_TEMPLATES, rng.randint(0, 2)
+        ):
+            start_date = config.end_date - timedelta(days=rng.randint(14, 120))
+            rows[GoalDB].append(
+                {
+                    "id": _uuid(rng),
+                    "user_id": user_id,
+                    "goal_type": goal_type,
+                    "target_type": target_type,
+                    "target_value": rng.randint(low, high),
+                    "current_value": 0,
+                    "progress_sum": 0,
+                    "progress_days": 0,
+                    "start_date": start_date,
+                    "end_date": config.end_date + timedelta(days=rng.randint(7, 90)),
+                    "status": GoalStatus.ACTIVE.value,
+                    "created_at": datetime.combine(start_date, time()),
+                    "updated_at": datetime.combine(start_date, time()),
+                }
+            )
+        _user_meals(rng, config, user_id, zone, rows)
+        _user_wellness(rng, config, user_id, zone, rows)
+
+    return rows
+
+
+def create_seed_engine(database_url: str) -> Engine:
+    """Create an engine for bulk loading; SQLite waits for the write lock.
+
+    Args:
+        database_url: Target database
+
+    Returns:
+        Engine whose SQLite connections use WAL and a long busy timeout
+
+    """
+    connect_args = _connect_args(database_url)
+    if database_url.startswith("sqlite"):
+        connect_args["timeout"] = 600
+    engine = create_engine(database_url, connect_args=connect_args)
+
+    if engine.dialect.name == "sqlite":
+
+        @event.listens_for(engine, "connect")
+        def _sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+    return engine
+
+
+def _load_partition(
+    engine: Engine, rows: dict[type, list[dict]], rollups: bool
+) -> dict[str, int]:
+    """Insert one partition in bulk and build its rollups and goal progress"""
+    with Session(engine) as db:
+        for model, model_rows in rows.items():
+            if model_rows:
+                db.execute(insert(model), model_rows)
+        db.commit()
+
+        user_ids = [user["id"] for user in rows.get(UserDB, [])]
+        if rollups and user_ids:
+            DailyNutritionService.rebuild(db, user_ids)
+            DailyWellnessService.rebuild(db, user_ids)
+            GoalProgressService.reconcile(db, user_ids)
+
+    return {model.__tablename__: len(model_rows) for model, model_rows in rows.items()}
+
+
+# Per worker process state, set by _init_worker
+_worker_engine: Optional[Engine] = None
+_worker_args: tuple = ()
+
+
+def _init_worker(
+    database_url: str, config: SyntheticDataConfig, password_hash: str, rollups: bool
+) -> None:
+    """Open the worker's own engine; connections are not shared across fork"""
+    global _worker_engine, _worker_args
+    _worker_engine = create_seed_engine(database_url)
+    _worker_args = (config, password_hash, rollups)
+
+
+def _run_task(task: tuple[str, int]) -> dict[str, int]:
+    """Generate and load one partition in a worker"""
+    kind, partition = task
+    config, password_hash, rollups = _worker_args
+    if kind == "menu":
+        rows = generate_menu_partition(config, partition)
+    else:
+        rows = generate_user_partition(config, partition, password_hash)
+    return _load_partition(_worker_engine, rows, rollups)
+
+
+def generate(
+    database_url: str,
+    config: SyntheticDataConfig,
+    password_hash: str,
+    workers: int = 1,
+    rollups: bool = True,
+    on_progress: Optional[Callable[[dict[str, int]], None]] = None,
+) -> dict[str, int]:
+    """Generate a dataset into a migrated database.
+
+    Args:
+        database_url: Target database (schema must already exist)
+        config: Dataset configuration
+        password_hash: Password hash shared by all synthetic users
+        workers: Processes generating and loading partitions in parallel
+        rollups: Whether to build the rollups and goal progress
+        on_progress: Called with the running row counts after each partition
+
+    Returns:
+        Rows inserted per table
+
+    Raises:
+        ValueError: If the database already holds synthetic users
+
+    """
+    engine = create_seed_engine(database_url)
+    try:
+        with Session(engine) as db:
+            existing = db.scalar(
+                select(func.count())
+                .select_from(UserDB)
+                .where(UserDB.email == user_email(0))
+            )
+    finally:
+        engine.dispose()
+    if existing:
+        raise ValueError(
+            f"{user_email(0)} already exists; generate into an empty database"
+        )
+
+    tasks = [("menu", partition) for partition in range(config.menu_partitions)]
+    tasks += [("users", partition) for partition in range(config.user_partitions)]
+    totals: dict[str, int] = {}
+
+    def results() -> Iterator[dict[str, int]]:
+        init_args = (database_url, config, password_hash, rollups)
+        if workers <= 1:
+            _init_worker(*init_args)
+            try:
+                yield from map(_run_task, tasks)
+            finally:
+                _worker_engine.dispose()
+            return
+        with multiprocessing.Pool(workers, _init_worker, init_args) as pool:
+            yield from pool.imap_unordered(_run_task, tasks)
+
+    for counts in results():
+        for table, count in counts.items():
+            totals[table] = totals.get(table, 0) + count
+        if on_progress is not None:
+            on_progress(totals)
+
+    return totals
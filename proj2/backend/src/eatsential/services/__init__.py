@@ -1,7 +1,12 @@
 """Business logic services for Eatsential application."""
 
+# DailyWellnessService and GoalProgressService are also imported for their
+# event subscriptions: goal progress and the daily wellness rollup follow
+# meal and wellness writes wherever they are made
 from .auth_service import get_current_admin_user, get_current_user
+from .daily_wellness_service import DailyWellnessService
 from .emailer import send_verification_email
+from .goal_progress_service import GoalProgressService
 from .user_service import (
     create_user,
     login_user_service,
@@ -10,6 +15,8 @@ from .user_service import (
 )
 
 __all__ = [
+    "DailyWellnessService",
+    "GoalProgressService",
     "create_user",
     "get_current_admin_user",
     "get_current_user",
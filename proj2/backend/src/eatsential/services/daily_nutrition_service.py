@@ -0,0 +1,251 @@
+"""Daily nutrition rollup maintained from meal writes."""
+
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.models import DailyNutritionDB, MealDB, UserDB, utcnow
+from ..utils.timezones import local_dates
+
+# Timezone used when a user row has none (matches the UserDB column default)
+DEFAULT_TIMEZONE = "America/New_York"
+
+# Meal total columns summed into the rollup under the same name
+NUTRIENT_FIELDS = ("total_calories", "total_protein_g", "total_carbs_g", "total_fat_g")
+
+ROLLUP_FIELDS = ("meal_count", *NUTRIENT_FIELDS)
+
+# Per local date changes to apply: {local_date: {rollup field: delta}}
+RollupChanges = dict[date, dict[str, float]]
+
+
+def _rollup_row(
+    user_id: str, local_date: date, day: dict[str, float], now: datetime
+) -> dict:
+    """Build a daily_nutrition row (or row delta) for one day"""
+    return {
+        "user_id": user_id,
+        "local_date": local_date,
+        "meal_count": int(day["meal_count"]),
+        "updated_at": now,
+        **{field: round(day[field], 2) for field in NUTRIENT_FIELDS},
+    }
+
+
+def _add_meal(changes: RollupChanges, local_date: date, meal: Any, sign: int) -> None:
+    """Add (or subtract) one meal's totals to its local date"""
+    day = changes.setdefault(local_date, dict.fromkeys(ROLLUP_FIELDS, 0))
+    day["meal_count"] += sign
+    for field in NUTRIENT_FIELDS:
+        day[field] += sign * float(getattr(meal, field) or 0)
+
+
+class DailyNutritionService:
+    """Service class for the daily_nutrition rollup"""
+
+    @staticmethod
+    def get_user_timezone(db: Session, user_id: str) -> str:
+        """Get the IANA timezone of a user.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Timezone string, or DEFAULT_TIMEZONE if the user has none
+
+        """
+        user_tz = db.query(UserDB.timezone).filter(UserDB.id == user_id).scalar()
+        return user_tz or DEFAULT_TIMEZONE
+
+    @staticmethod
+    def add_meal_changes(
+        changes: RollupChanges, meals: Iterable[Any], user_tz: str, sign: int = 1
+    ) -> RollupChanges:
+        """Add (or with ``sign=-1`` subtract) meals to a set of rollup changes.
+
+        Values are read immediately, so a meal can be subtracted before it is
+        modified and added again afterwards; if its local date is unchanged
+        the two contributions net out to the nutrient delta.
+
+        Args:
+            changes: Changes to add to (modified in place)
+            meals: Meals or rows with meal_time and total_* attributes
+            user_tz: IANA timezone the local dates are computed in
+            sign: 1 to add the meals, -1 to subtract them
+
+        Returns:
+            The updated changes
+
+        """
+        meals = list(meals)
+        dates = local_dates([meal.meal_time for meal in meals], user_tz)
+        for meal, local_date in zip(meals, dates):
+            _add_meal(changes, local_date, meal, sign)
+        return changes
+
+    @staticmethod
+    def apply_changes(db: Session, user_id: str, changes: RollupChanges) -> None:
+        """Add rollup changes to a user's daily_nutrition rows.
+
+        Runs one upsert (``INSERT ... ON CONFLICT DO UPDATE``) for all changed
+        days in the caller's transaction, so concurrent meal writes for the
+        same day add up instead of overwriting each other. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            changes: Per local date deltas
+
+        """
+        now = utcnow()
+        rows = [
+            _rollup_row(user_id, local_date, day, now)
+            for local_date, day in changes.items()
+        ]
+        # Edits that do not change a day's totals need no write
+        rows = [row for row in rows if any(row[f] for f in ROLLUP_FIELDS)]
+        if not rows:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            table = DailyNutritionDB.__table__
+            stmt = dialect_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.local_date],
+                set_={
+                    "updated_at": stmt.excluded.updated_at,
+                    **{
+                        field: table.c[field] + stmt.excluded[field]
+                        for field in ROLLUP_FIELDS
+                    },
+                },
+            )
+            db.execute(stmt, rows)
+            return
+
+        # Other dialects: read-modify-write through the ORM
+        for row in rows:
+            day = db.get(DailyNutritionDB, (user_id, row["local_date"]))
+            if day is None:
+                db.add(DailyNutritionDB(**row))
+                continue
+            day.meal_count += row["meal_count"]
+            for field in NUTRIENT_FIELDS:
+                setattr(day, field, float(getattr(day, field)) + row[field])
+        db.flush()
+
+    @staticmethod
+    def get_daily_totals(
+        db: Session, user_id: str, start_date: date, end_date: date
+    ) -> list[DailyNutritionDB]:
+        """Get a user's rollup rows for days with meals in a date range.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+
+        Returns:
+            Rollup rows ordered by local date
+
+        """
+        return (
+            db.query(DailyNutritionDB)
+            .filter(
+                DailyNutritionDB.user_id == user_id,
+                DailyNutritionDB.local_date >= start_date,
+                DailyNutritionDB.local_date <= end_date,
+                DailyNutritionDB.meal_count > 0,
+            )
+            .order_by(DailyNutritionDB.local_date)
+            .all()
+        )
+
+    @staticmethod
+    def rebuild(db: Session, user_ids: list[str], yield_per: int = 5000) -> int:
+        """Recompute the rollup rows of users from their raw meals.
+
+        Deletes the users' rollup rows, streams their meal totals (no food
+        items) and bulk inserts the recomputed days, then commits. Call it
+        with bounded batches of users to keep transactions short.
+
+        Args:
+            db: Database session
+            user_ids: Users to rebuild
+            yield_per: Meal rows fetched per round trip
+
+        Returns:
+            Number of rollup rows written
+
+        """
+        if not user_ids:
+            return 0
+
+        timezones = dict(
+            db.query(UserDB.id, UserDB.timezone).filter(UserDB.id.in_(user_ids))
+        )
+        nutrient_columns = [getattr(MealDB, field) for field in NUTRIENT_FIELDS]
+        meals = db.execute(
+            select(MealDB.user_id, MealDB.meal_time, *nutrient_columns)
+            .where(MealDB.user_id.in_(user_ids))
+            .execution_options(yield_per=yield_per)
+        )
+
+        changes_by_user: dict[str, RollupChanges] = {}
+        for partition in meals.partitions():
+            dates = local_dates(
+                [meal.meal_time for meal in partition],
+                [timezones.get(meal.user_id) or DEFAULT_TIMEZONE for meal in partition],
+            )
+            for meal, local_date in zip(partition, dates):
+                _add_meal(
+                    changes_by_user.setdefault(meal.user_id, {}), local_date, meal, 1
+                )
+
+        now = utcnow()
+        rows = [
+            _rollup_row(user_id, local_date, day, now)
+            for user_id, changes in changes_by_user.items()
+            for local_date, day in changes.items()
+        ]
+
+        db.execute(
+            delete(DailyNutritionDB).where(DailyNutritionDB.user_id.in_(user_ids))
+        )
+        if rows:
+            db.execute(insert(DailyNutritionDB), rows)
+        db.commit()
+
+        return len(rows)
+
+    @staticmethod
+    def summarize(days: list[DailyNutritionDB]) -> dict[str, Optional[float]]:
+        """Sum rollup rows into range totals.
+
+        Args:
+            days: Rollup rows
+
+        Returns:
+            Dict of meal_count, total_* sums and average_daily_calories over
+            the days with meals (None if there are none)
+
+        """
+        totals: dict[str, Optional[float]] = {
+            "meal_count": sum(day.meal_count for day in days),
+            **{
+                field: round(sum(float(getattr(day, field)) for day in days), 2)
+                for field in NUTRIENT_FIELDS
+            },
+        }
+        totals["average_daily_calories"] = (
+            round(totals["total_calories"] / len(days), 2) if days else None
+        )
+        return totals
@@ -0,0 +1,230 @@
+"""Daily wellness rollup maintained from mood, stress and sleep log writes.
+
+Each ``daily_wellness`` row holds, per user and local date, the sum and count
+of every metric logged that day. Wellness writes publish WellnessChanged
+events (see events.py); the handler here folds all events of a transaction
+into one upsert, so insights read a year of history as at most 366 rows.
+"""
+
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.models import (
+    DailyWellnessDB,
+    MoodLogDB,
+    SleepLogDB,
+    StressLogDB,
+    UserDB,
+    utcnow,
+)
+from ..utils.timezones import local_dates
+from .daily_nutrition_service import DEFAULT_TIMEZONE
+from .events import WellnessChanged, subscribe
+
+# Rolled up metric -> (log model, value column)
+WELLNESS_ROLLUP_METRICS = {
+    "mood_score": (MoodLogDB, "mood_score"),
+    "stress_level": (StressLogDB, "stress_level"),
+    "sleep_hours": (SleepLogDB, "duration_hours"),
+    "sleep_quality": (SleepLogDB, "quality_score"),
+}
+
+WELLNESS_ROLLUP_FIELDS = tuple(
+    f"{metric}_{part}"
+    for metric in WELLNESS_ROLLUP_METRICS
+    for part in ("sum", "count")
+)
+
+# Per local date changes to apply: {local_date: {rollup field: delta}}
+WellnessRollupChanges = dict[date, dict[str, float]]
+
+
+def _rollup_row(
+    user_id: str, local_date: date, day: dict[str, float], now: datetime
+) -> dict:
+    """Build a daily_wellness row (or row delta) for one day"""
+    row: dict[str, Any] = {
+        "user_id": user_id,
+        "local_date": local_date,
+        "updated_at": now,
+    }
+    for metric in WELLNESS_ROLLUP_METRICS:
+        row[f"{metric}_sum"] = round(day[f"{metric}_sum"], 2)
+        row[f"{metric}_count"] = int(day[f"{metric}_count"])
+    return row
+
+
+def _add_change(
+    changes: WellnessRollupChanges,
+    local_date: date,
+    metric: str,
+    value: float,
+    count: int,
+) -> None:
+    """Accumulate one metric change"""
+    day = changes.setdefault(local_date, dict.fromkeys(WELLNESS_ROLLUP_FIELDS, 0))
+    day[f"{metric}_sum"] += value
+    day[f"{metric}_count"] += count
+
+
+def _user_timezones(db: Session, user_ids: set[str]) -> dict[str, str]:
+    """Timezones of users, reusing users already loaded in the session"""
+    timezones = {}
+    for user_id in user_ids:
+        user = db.identity_map.get(db.identity_key(UserDB, user_id))
+        if user is not None and "timezone" in user.__dict__:
+            timezones[user_id] = user.timezone
+    missing = user_ids - timezones.keys()
+    if missing:
+        timezones.update(
+            db.query(UserDB.id, UserDB.timezone).filter(UserDB.id.in_(missing))
+        )
+    return {user_id: tz or DEFAULT_TIMEZONE for user_id, tz in timezones.items()}
+
+
+class DailyWellnessService:
+    """Service class for the daily_wellness rollup"""
+
+    @staticmethod
+    def apply_changes(
+        db: Session, user_id: str, changes: WellnessRollupChanges
+    ) -> None:
+        """Add rollup changes to a user's daily_wellness rows.
+
+        Runs one upsert (``INSERT ... ON CONFLICT DO UPDATE``) for all changed
+        days in the caller's transaction, so concurrent log writes for the
+        same day add up instead of overwriting each other. Does not commit.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            changes: Per local date deltas
+
+        """
+        now = utcnow()
+        rows = [
+            _rollup_row(user_id, local_date, day, now)
+            for local_date, day in changes.items()
+        ]
+        # Edits that cancel out need no write
+        rows = [row for row in rows if any(row[f] for f in WELLNESS_ROLLUP_FIELDS)]
+        if not rows:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            table = DailyWellnessDB.__table__
+            stmt = dialect_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.local_date],
+                set_={
+                    "updated_at": stmt.excluded.updated_at,
+                    **{
+                        field: table.c[field] + stmt.excluded[field]
+                        for field in WELLNESS_ROLLUP_FIELDS
+                    },
+                },
+            )
+            db.execute(stmt, rows)
+            return
+
+        # Other dialects: read-modify-write through the ORM
+        for row in rows:
+            day = db.get(DailyWellnessDB, (user_id, row["local_date"]))
+            if day is None:
+                db.add(DailyWellnessDB(**row))
+                continue
+            for field in WELLNESS_ROLLUP_FIELDS:
+                setattr(day, field, float(getattr(day, field)) + row[field])
+        db.flush()
+
+    @staticmethod
+    def rebuild(db: Session, user_ids: list[str], yield_per: int = 5000) -> int:
+        """Recompute the rollup rows of users from their raw wellness logs.
+
+        Deletes the users' rollup rows, streams their log values (never the
+        encrypted notes) and bulk inserts the recomputed days, then commits.
+        Call it with bounded batches of users to keep transactions short.
+
+        Args:
+            db: Database session
+            user_ids: Users to rebuild
+            yield_per: Log rows fetched per round trip
+
+        Returns:
+            Number of rollup rows written
+
+        """
+        if not user_ids:
+            return 0
+
+        timezones = dict(
+            db.query(UserDB.id, UserDB.timezone).filter(UserDB.id.in_(user_ids))
+        )
+        changes_by_user: dict[str, WellnessRollupChanges] = {}
+        for metric, (model, column) in WELLNESS_ROLLUP_METRICS.items():
+            logs = db.execute(
+                select(model.user_id, model.occurred_at_utc, getattr(model, column))
+                .where(model.user_id.in_(user_ids))
+                .execution_options(yield_per=yield_per)
+            )
+            for partition in logs.partitions():
+                dates = local_dates(
+                    [log.occurred_at_utc for log in partition],
+                    [
+                        timezones.get(log.user_id) or DEFAULT_TIMEZONE
+                        for log in partition
+                    ],
+                )
+                for (user_id, _, value), local_date in zip(partition, dates):
+                    _add_change(
+                        changes_by_user.setdefault(user_id, {}),
+                        local_date,
+                        metric,
+                        float(value),
+                        1,
+                    )
+
+        now = utcnow()
+        rows = [
+            _rollup_row(user_id, local_date, day, now)
+            for user_id, changes in changes_by_user.items()
+            for local_date, day in changes.items()
+        ]
+
+        db.execute(delete(DailyWellnessDB).where(DailyWellnessDB.user_id.in_(user_ids)))
+        if rows:
+            db.execute(insert(DailyWellnessDB), rows)
+        db.commit()
+
+        return len(rows)
+
+
+@subscribe(WellnessChanged)
+def _on_wellness_changed(db: Session, events: list[WellnessChanged]) -> None:
+    """Apply a transaction's wellness log changes to the daily rollup"""
+    events = [e for e in events if e.metric in WELLNESS_ROLLUP_METRICS]
+    if not events:
+        return
+
+    timezones = _user_timezones(db, {e.user_id for e in events})
+    dates = local_dates(
+        [e.occurred_at_utc for e in events],
+        [timezones.get(e.user_id, DEFAULT_TIMEZONE) for e in events],
+    )
+    changes_by_user: dict[str, WellnessRollupChanges] = {}
+    for changed, local_date in zip(events, dates):
+        _add_change(
+            changes_by_user.setdefault(changed.user_id, {}),
+            local_date,
+            changed.metric,
+            changed.value_delta,
+            changed.day_delta,
+        )
+    for user_id, changes in changes_by_user.items():
+        DailyWellnessService.apply_changes(db, user_id, changes)
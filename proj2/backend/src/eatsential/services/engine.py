@@ -35,6 +35,7 @@ from ..schemas.recommendation_schemas import (
     RecommendationResponse,
     RecommendedItem,
 )
+from .llm_stand_in import LLM_STAND_IN_LATENCY_MS, StandInLLMClient
 
 logger = logging.getLogger(__name__)
 
@@ -216,7 +217,6 @@ class RecommendationService:
                 selectinload(UserDB.health_profile).selectinload(
                     HealthProfileDB.dietary_preferences
                 ),
-                selectinload(UserDB.goals),
             )
             .filter(UserDB.id == user.id)
             .first()
@@ -238,9 +238,15 @@ class RecommendationService:
                 if pref.preference_type == PreferenceType.CUISINE.value:
                     preferred_cuisines.append(pref.preference_name.lower())
 
-        active_goals = [
-            goal for goal in refreshed.goals if goal.status == GoalStatus.ACTIVE.value
-        ]
+        # Ended goals are moved out of active by the goal status worker
+        active_goals = (
+            self.db.query(GoalDB)
+            .filter(
+                GoalDB.user_id == refreshed.id,
+                GoalDB.status == GoalStatus.ACTIVE.value,
+            )
+            .all()
+        )
 
         return _UserContext(
             user=refreshed,
@@ -501,7 +507,13 @@ class RecommendationService:
     # ------------------------------------------------------------------ #
 
     def _get_llm_client(self) -> GenAiClient:
-        """Create or reuse a Gemini client."""
+        """Create or reuse a Gemini client (or the local stand-in)."""
+        if LLM_STAND_IN_LATENCY_MS is not None:
+            if self._llm_client is None:
+                self._llm_client = cast(
+                    "GenAiClient", StandInLLMClient(LLM_STAND_IN_LATENCY_MS)
+                )
+            return self._llm_client
         if not self.llm_api_key:
             raise RuntimeError("LLM API key is not configured")
         if self._llm_client is None:
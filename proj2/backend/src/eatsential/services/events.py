@@ -0,0 +1,108 @@
+"""In-process domain events delivered once per transaction.
+
+Services publish events on the Session they write with. Events are buffered
+in ``session.info`` and handed to subscribers in a ``before_commit`` hook,
+all events of a type in one call, so a transaction that logs twenty meals
+updates derived data once. Handlers run inside the committing transaction:
+their writes commit (or roll back) atomically with the change that caused
+them. Rolled back transactions deliver nothing.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+PENDING_EVENTS_KEY = "pending_domain_events"
+
+# Rounds of delivery allowed when handlers publish further events
+MAX_DELIVERY_ROUNDS = 10
+
+EventHandler = Callable[[Session, list[Any]], None]
+E = TypeVar("E")
+
+_subscribers: dict[type, list[EventHandler]] = defaultdict(list)
+
+
+@dataclass(frozen=True)
+class NutritionChanged:
+    """A user's daily_nutrition rollup changed.
+
+    ``changes`` maps each local date to the deltas applied to its rollup row
+    (``meal_count`` and the ``total_*`` nutrient fields).
+    """
+
+    user_id: str
+    changes: dict[date, dict[str, float]]
+
+
+@dataclass(frozen=True)
+class WellnessChanged:
+    """A mood, stress or sleep log value was added, edited or removed.
+
+    ``day_delta`` is 1 for a new log, -1 for a deleted log and 0 for an edit.
+    """
+
+    user_id: str
+    metric: str
+    occurred_at_utc: datetime
+    value_delta: float
+    day_delta: int
+
+
+def subscribe(event_type: type[E]) -> Callable[[EventHandler], EventHandler]:
+    """Register a handler for an event type.
+
+    The handler is called with the committing session and the list of all
+    events of that type published in the transaction.
+
+    Args:
+        event_type: Event class to handle
+
+    Returns:
+        Decorator registering the handler
+
+    """
+
+    def register(handler: EventHandler) -> EventHandler:
+        _subscribers[event_type].append(handler)
+        return handler
+
+    return register
+
+
+def publish(db: Session, domain_event: Any) -> None:
+    """Queue an event for delivery when the session commits.
+
+    Args:
+        db: Session the triggering change was made in
+        domain_event: Event instance
+
+    """
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append(domain_event)
+
+
+@event.listens_for(Session, "before_commit")
+def _deliver_events(session: Session) -> None:
+    """Hand queued events to their subscribers, grouped by type"""
+    for _ in range(MAX_DELIVERY_ROUNDS):
+        queued = session.info.pop(PENDING_EVENTS_KEY, None)
+        if not queued:
+            return
+        by_type: dict[type, list[Any]] = defaultdict(list)
+        for domain_event in queued:
+            by_type[type(domain_event)].append(domain_event)
+        for event_type, events in by_type.items():
+            for handler in _subscribers.get(event_type, ()):
+                handler(session, events)
+    raise RuntimeError("Domain event handlers kept publishing new events")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_events(session: Session, previous_transaction: Any) -> None:
+    """Drop events of a rolled back transaction"""
+    session.info.pop(PENDING_EVENTS_KEY, None)
@@ -0,0 +1,422 @@
+"""Goal progress history for charts.
+
+Each goal status run appends the closing progress of every active goal on
+its owner's previous local day to ``goal_progress_snapshots``, at most once
+per goal and day. Daily rows older than ``GOAL_SNAPSHOT_DAILY_DAYS`` are
+compacted into weekly rows (mean, min and max of the week), so a goal
+running for years keeps about 52 rows per year plus the recent daily ones.
+History reads return at most ``max_points`` points, bucketing older or
+denser ranges by date.
+"""
+
+import logging
+import math
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Insert, Integer, Table, and_, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models.models import GoalDB, GoalProgressSnapshotDB, GoalStatus, UserDB
+from ..utils.timezones import local_dates
+from .daily_nutrition_service import DEFAULT_TIMEZONE
+from .goal_progress_service import GoalProgressService
+from .nutrition_trends_service import period_start_expression
+
+logger = logging.getLogger(__name__)
+
+# Days of daily snapshots kept before they are compacted into weeks
+GOAL_SNAPSHOT_DAILY_DAYS = int(os.getenv("GOAL_SNAPSHOT_DAILY_DAYS", "90"))
+
+# Goals snapshotted per transaction
+GOAL_SNAPSHOT_RECORD_BATCH_SIZE = 1000
+
+# Goals compacted per transaction
+GOAL_SNAPSHOT_COMPACT_BATCH_SIZE = 500
+
+# Default and maximum number of points returned for a chart
+DEFAULT_HISTORY_POINTS = 100
+MAX_HISTORY_POINTS = 1000
+
+SNAPSHOT_COLUMNS = (
+    "goal_id",
+    "snapshot_date",
+    "period_days",
+    "value",
+    "min_value",
+    "max_value",
+    "sample_count",
+)
+
+
+@dataclass(frozen=True)
+class ProgressPoint:
+    """One chart point: a day, a compacted week or a downsampled bucket"""
+
+    snapshot_date: date
+    period_days: int
+    value: float
+    min_value: float
+    max_value: float
+
+
+def downsample(
+    points: Sequence[ProgressPoint], start_date: date, max_points: int
+) -> list[ProgressPoint]:
+    """Reduce points to at most ``max_points`` equal-width date buckets.
+
+    Each bucket starts at ``start_date`` plus a multiple of its width and
+    keeps the last value, so a line through the buckets ends at the latest
+    progress, with the min/max envelope of the points it replaces.
+
+    Args:
+        points: Points ordered by date, ending on or after start_date
+        start_date: First date of the range
+        max_points: Maximum number of points to return
+
+    Returns:
+        Downsampled points ordered by date
+
+    """
+    if len(points) <= max_points:
+        return list(points)
+
+    last = points[-1]
+    span_days = (last.snapshot_date - start_date).days + last.period_days
+    width = math.ceil(span_days / max_points)
+
+    buckets: dict[int, list[ProgressPoint]] = {}
+    for point in points:
+        # A compacted week may start a few days before the range
+        index = max((point.snapshot_date - start_date).days, 0) // width
+        buckets.setdefault(index, []).append(point)
+
+    return [
+        ProgressPoint(
+            snapshot_date=start_date + timedelta(days=index * width),
+            period_days=width,
+            value=bucket[-1].value,
+            min_value=min(point.min_value for point in bucket),
+            max_value=max(point.max_value for point in bucket),
+        )
+        for index, bucket in buckets.items()
+    ]
+
+
+def _week_start(day: date) -> date:
+    """Monday of a date's ISO week"""
+    return day - timedelta(days=day.weekday())
+
+
+@dataclass(frozen=True)
+class _ClosingWindow:
+    """A goal's window cut at the day being recorded, for compute_totals"""
+
+    id: str
+    user_id: str
+    target_type: str
+    start_date: date
+    end_date: date
+
+
+def _insert_skipping_existing(db: Session, table: Table) -> Insert:
+    """INSERT that leaves rows whose primary key already exists alone.
+
+    SQLite and PostgreSQL skip the conflicting rows themselves, so runs in
+    several processes cannot fail on the primary key. Other dialects get a
+    plain INSERT and rely on the callers' existence checks.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    return table.insert()
+
+
+class GoalHistoryService:
+    """Service class for goal progress snapshots"""
+
+    @staticmethod
+    def record_snapshots(
+        db: Session,
+        now: Optional[datetime] = None,
+        batch_size: int = GOAL_SNAPSHOT_RECORD_BATCH_SIZE,
+    ) -> int:
+        """Append the closing progress of the previous local day of every goal.
+
+        The day is yesterday in the goal owner's timezone. Tracked goals get
+        the value their totals had at the end of that day, computed from the
+        daily rollups and wellness logs up to it, so it does not depend on
+        when the run happens. Goals updated manually have no history, so
+        they get their ``current_value`` at the time of the run, which is
+        the closing value when the first run after local midnight comes
+        before the next manual update.
+
+        Goals are walked by ID in batches. Goals that already have a
+        snapshot for their day are skipped, so the worker can run as often
+        as it likes, and a concurrent run cannot insert a second row.
+
+        Args:
+            db: Database session
+            now: Current time (defaults to now)
+            batch_size: Goals per transaction
+
+        Returns:
+            Number of snapshots written
+
+        """
+        now = now or datetime.now(timezone.utc)
+        utc_today = (
+            now.date() if now.tzinfo is None else now.astimezone(timezone.utc).date()
+        )
+        table = GoalProgressSnapshotDB.__table__
+        insert_stmt = _insert_skipping_existing(db, table)
+
+        written = 0
+        last_id = ""
+        while True:
+            goals = db.execute(
+                select(
+                    GoalDB.id,
+                    GoalDB.user_id,
+                    GoalDB.target_type,
+                    GoalDB.start_date,
+                    GoalDB.end_date,
+                    GoalDB.current_value,
+                    UserDB.timezone,
+                )
+                .join(UserDB, UserDB.id == GoalDB.user_id)
+                .where(
+                    GoalDB.status == GoalStatus.ACTIVE.value,
+                    # Local yesterday is within a day of UTC yesterday
+                    GoalDB.start_date <= utc_today,
+                    GoalDB.end_date >= utc_today - timedelta(days=2),
+                    GoalDB.id > last_id,
+                )
+                .order_by(GoalDB.id)
+                .limit(batch_size)
+            ).all()
+            if not goals:
+                break
+            last_id = goals[-1].id
+
+            local_todays = local_dates(
+                [now] * len(goals),
+                [goal.timezone or DEFAULT_TIMEZONE for goal in goals],
+            )
+            days = {
+                goal.id: local_today - timedelta(days=1)
+                for goal, local_today in zip(goals, local_todays)
+                if goal.start_date < local_today <= goal.end_date + timedelta(days=1)
+            }
+            recorded = set()
+            if days:
+                recorded = {
+                    (row.goal_id, row.snapshot_date)
+                    for row in db.execute(
+                        select(table.c.goal_id, table.c.snapshot_date).where(
+                            table.c.goal_id.in_(days),
+                            table.c.snapshot_date.in_(set(days.values())),
+                            table.c.period_days == 1,
+                        )
+                    )
+                }
+            goals = [
+                goal
+                for goal in goals
+                if goal.id in days and (goal.id, days[goal.id]) not in recorded
+            ]
+
+            if goals:
+                totals = GoalProgressService.compute_totals(
+                    db,
+                    [
+                        _ClosingWindow(
+                            goal.id,
+                            goal.user_id,
+                            goal.target_type,
+                            goal.start_date,
+                            days[goal.id],
+                        )
+                        for goal in goals
+                    ],
+                )
+                rows = []
+                for goal in goals:
+                    if goal.id in totals:
+                        progress_sum, progress_days = totals[goal.id]
+                        value = (
+                            round(progress_sum / progress_days, 2)
+                            if progress_days
+                            else 0
+                        )
+                    else:
+                        value = float(goal.current_value)
+                    rows.append(
+                        {
+                            "goal_id": goal.id,
+                            "snapshot_date": days[goal.id],
+                            "period_days": 1,
+                            "value": value,
+                            "min_value": value,
+                            "max_value": value,
+                            "sample_count": 1,
+                        }
+                    )
+                db.execute(insert_stmt, rows)
+                written += len(rows)
+            db.commit()
+
+        logger.info("Recorded %d goal progress snapshots", written)
+        return written
+
+    @staticmethod
+    def compact_snapshots(
+        db: Session,
+        today: Optional[date] = None,
+        batch_size: int = GOAL_SNAPSHOT_COMPACT_BATCH_SIZE,
+    ) -> int:
+        """Merge daily snapshots of complete weeks past retention into weeks.
+
+        Only whole weeks before the cutoff are compacted, so new work shows
+        up once a week. Goals are processed in batches, each with one
+        INSERT ... SELECT ... GROUP BY and one DELETE.
+
+        Args:
+            db: Database session
+            today: Current UTC date (defaults to today)
+            batch_size: Goals per transaction
+
+        Returns:
+            Number of daily snapshots compacted
+
+        """
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = _week_start(today - timedelta(days=GOAL_SNAPSHOT_DAILY_DAYS))
+        table = GoalProgressSnapshotDB.__table__
+        week = period_start_expression(db, table.c.snapshot_date, "week")
+
+        compacted = 0
+        last_goal_id = ""
+        while True:
+            goal_ids = (
+                db.execute(
+                    select(table.c.goal_id)
+                    .where(
+                        table.c.period_days == 1,
+                        table.c.snapshot_date < cutoff,
+                        table.c.goal_id > last_goal_id,
+                    )
+                    .group_by(table.c.goal_id)
+                    .order_by(table.c.goal_id)
+                    .limit(batch_size)
+                )
+                .scalars()
+                .all()
+            )
+            if not goal_ids:
+                break
+
+            daily_rows = and_(
+                table.c.goal_id.in_(goal_ids),
+                table.c.period_days == 1,
+                table.c.snapshot_date < cutoff,
+            )
+            weekly = (
+                select(
+                    table.c.goal_id,
+                    week,
+                    literal(7, Integer),
+                    func.round(func.avg(table.c.value), 2),
+                    func.min(table.c.min_value),
+                    func.max(table.c.max_value),
+                    func.sum(table.c.sample_count),
+                )
+                .where(daily_rows)
+                .group_by(table.c.goal_id, week)
+            )
+            # A concurrent run may have written the same weeks already
+            db.execute(
+                _insert_skipping_existing(db, table).from_select(
+                    SNAPSHOT_COLUMNS, weekly
+                )
+            )
+            compacted += db.execute(table.delete().where(daily_rows)).rowcount
+            db.commit()
+            last_goal_id = goal_ids[-1]
+
+        if compacted:
+            logger.info("Compacted %d daily goal snapshots into weeks", compacted)
+        return compacted
+
+    @staticmethod
+    def get_history(
+        db: Session,
+        goal: GoalDB,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_points: int = DEFAULT_HISTORY_POINTS,
+        today: Optional[date] = None,
+    ) -> list[ProgressPoint]:
+        """Get a goal's downsampled progress between two dates.
+
+        When the range includes today, the goal's live ``current_value`` is
+        added as the last point.
+
+        Args:
+            db: Database session
+            goal: Goal (already authorized)
+            start_date: First date (defaults to the goal's start date)
+            end_date: Last date (defaults to the goal's end date)
+            max_points: Maximum number of points returned
+            today: The owner's local date (defaults to the UTC date)
+
+        Returns:
+            Points ordered by date
+
+        """
+        today = today or datetime.now(timezone.utc).date()
+        start_date = start_date or goal.start_date
+        end_date = end_date or goal.end_date
+
+        snapshot = GoalProgressSnapshotDB
+        rows = db.execute(
+            select(
+                snapshot.snapshot_date,
+                snapshot.period_days,
+                snapshot.value,
+                snapshot.min_value,
+                snapshot.max_value,
+            )
+            .where(
+                snapshot.goal_id == goal.id,
+                # Include a compacted week overlapping the start of the range
+                snapshot.snapshot_date > start_date - timedelta(days=7),
+                snapshot.snapshot_date <= end_date,
+            )
+            .order_by(snapshot.snapshot_date, snapshot.period_days)
+        ).all()
+
+        points = [
+            ProgressPoint(
+                snapshot_date=row.snapshot_date,
+                period_days=row.period_days,
+                value=float(row.value),
+                min_value=float(row.min_value),
+                max_value=float(row.max_value),
+            )
+            for row in rows
+            if row.snapshot_date + timedelta(days=row.period_days) > start_date
+        ]
+        if start_date <= today <= end_date and (
+            not points or points[-1].snapshot_date < today
+        ):
+            current = float(goal.current_value)
+            points.append(ProgressPoint(today, 1, current, current, current))
+
+        return downsample(points, start_date, max_points)
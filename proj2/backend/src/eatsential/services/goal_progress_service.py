@@ -0,0 +1,432 @@
+"""Goal progress maintained from meal and wellness logs.
+
+Goals whose ``target_type`` names a tracked metric (``calories``, ``protein``,
+``carbs``, ``fat``, ``mood_score``, ``stress_level`` or ``sleep_hours``,
+optionally prefixed with ``daily_``) keep running totals over the local dates
+in their window: ``progress_sum`` of the metric and ``progress_days`` with
+data. ``current_value`` is their ratio, the average per logged day.
+
+Meal and wellness writes publish events (see events.py). The handlers here
+turn all events of one transaction into a single delta UPDATE per affected
+goal, so progress reads never aggregate logs. ``reconcile`` recomputes the
+totals from the raw data in batches, for goals created before tracking
+existed and to repair drift.
+"""
+
+from collections.abc import Collection, Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import Float, bindparam, case, cast, func, select
+from sqlalchemy.orm import Session
+
+from ..models.models import (
+    DailyNutritionDB,
+    GoalDB,
+    GoalStatus,
+    MoodLogDB,
+    SleepLogDB,
+    StressLogDB,
+    UserDB,
+)
+from ..utils.timezones import local_dates
+from .daily_nutrition_service import DEFAULT_TIMEZONE, ROLLUP_FIELDS, RollupChanges
+from .events import NutritionChanged, WellnessChanged, subscribe
+from .progress_cache import invalidate_after_commit
+
+# Nutrition metric -> daily_nutrition column
+NUTRITION_METRICS = {
+    "calories": "total_calories",
+    "protein": "total_protein_g",
+    "carbs": "total_carbs_g",
+    "fat": "total_fat_g",
+}
+
+# Wellness metric -> (log model, value column); one log per user and day
+WELLNESS_METRICS = {
+    "mood_score": (MoodLogDB, "mood_score"),
+    "stress_level": (StressLogDB, "stress_level"),
+    "sleep_hours": (SleepLogDB, "duration_hours"),
+}
+
+TRACKED_METRICS = (*NUTRITION_METRICS, *WELLNESS_METRICS)
+
+# Per metric and local date: [value delta, logged days delta]
+MetricDeltas = dict[str, dict[date, list[float]]]
+
+
+def goal_metric(target_type: str) -> Optional[str]:
+    """Return the tracked metric a goal target type refers to, if any.
+
+    Args:
+        target_type: Goal target type, e.g. "protein" or "daily_calories"
+
+    Returns:
+        Metric name, or None if the goal is only updated manually
+
+    """
+    metric = target_type.strip().lower()
+    if metric.startswith("daily_"):
+        metric = metric[len("daily_") :]
+    return metric if metric in TRACKED_METRICS else None
+
+
+def _target_types(metrics: Iterable[str]) -> list[str]:
+    """target_type values (lower case) that track the given metrics"""
+    return [name for metric in metrics for name in (metric, f"daily_{metric}")]
+
+
+def _tracked_goals(
+    db: Session, user_ids: Collection[str], metrics: Iterable[str]
+) -> list[Any]:
+    """Active goals of users that track one of the metrics (as plain rows)"""
+    if not user_ids:
+        return []
+    return db.execute(
+        select(
+            GoalDB.id,
+            GoalDB.user_id,
+            GoalDB.target_type,
+            GoalDB.start_date,
+            GoalDB.end_date,
+        ).where(
+            GoalDB.user_id.in_(user_ids),
+            GoalDB.status == GoalStatus.ACTIVE.value,
+            func.lower(GoalDB.target_type).in_(_target_types(metrics)),
+        )
+    ).all()
+
+
+def _apply_deltas(
+    db: Session, goals: Iterable[Any], deltas: dict[str, MetricDeltas]
+) -> int:
+    """Add per-date metric deltas to the totals of the goals covering them.
+
+    Uses one executemany UPDATE with relative SET expressions, so concurrent
+    transactions add up instead of overwriting each other.
+    """
+    rows = []
+    user_ids = set()
+    for goal in goals:
+        per_date = deltas.get(goal.user_id, {}).get(goal_metric(goal.target_type))
+        if not per_date:
+            continue
+        value_delta = day_delta = 0.0
+        for local_date, (value, days) in per_date.items():
+            if goal.start_date <= local_date <= goal.end_date:
+                value_delta += value
+                day_delta += days
+        if value_delta or day_delta:
+            rows.append(
+                {
+                    "goal_id": goal.id,
+                    "value_delta": round(value_delta, 2),
+                    "day_delta": int(day_delta),
+                }
+            )
+            user_ids.add(goal.user_id)
+    if not rows:
+        return 0
+
+    table = GoalDB.__table__
+    new_sum = table.c.progress_sum + bindparam("value_delta")
+    new_days = table.c.progress_days + bindparam("day_delta")
+    db.execute(
+        table.update()
+        .where(table.c.id == bindparam("goal_id"))
+        .values(
+            progress_sum=new_sum,
+            progress_days=new_days,
+            current_value=case(
+                (new_days > 0, cast(new_sum, Float) / new_days), else_=0
+            ),
+        ),
+        rows,
+    )
+    invalidate_after_commit(db, user_ids)
+    return len(rows)
+
+
+def _add_delta(
+    deltas: dict[str, MetricDeltas],
+    user_id: str,
+    metric: str,
+    local_date: date,
+    value: float,
+    days: int,
+) -> None:
+    """Accumulate one metric change"""
+    entry = deltas.setdefault(user_id, {}).setdefault(metric, {})
+    total = entry.setdefault(local_date, [0.0, 0])
+    total[0] += value
+    total[1] += days
+
+
+@subscribe(NutritionChanged)
+def _on_nutrition_changed(db: Session, events: list[NutritionChanged]) -> None:
+    """Apply a transaction's rollup changes to nutrition goals"""
+    merged: dict[str, RollupChanges] = {}
+    for changed in events:
+        user_changes = merged.setdefault(changed.user_id, {})
+        for local_date, day in changed.changes.items():
+            total = user_changes.setdefault(local_date, dict.fromkeys(ROLLUP_FIELDS, 0))
+            for field, value in day.items():
+                total[field] += value
+
+    goals = _tracked_goals(db, list(merged), NUTRITION_METRICS)
+    if not goals:
+        return
+
+    # A day counts once it has a meal: compare meal counts after the changes
+    # (already written to the rollup) with the counts before them
+    user_ids = {goal.user_id for goal in goals}
+    dates = {local_date for user_id in user_ids for local_date in merged[user_id]}
+    meal_counts = {
+        (row.user_id, row.local_date): row.meal_count
+        for row in db.execute(
+            select(
+                DailyNutritionDB.user_id,
+                DailyNutritionDB.local_date,
+                DailyNutritionDB.meal_count,
+            ).where(
+                DailyNutritionDB.user_id.in_(user_ids),
+                DailyNutritionDB.local_date.in_(dates),
+            )
+        )
+    }
+
+    deltas: dict[str, MetricDeltas] = {}
+    for user_id in user_ids:
+        for local_date, day in merged[user_id].items():
+            after = meal_counts.get((user_id, local_date), 0)
+            before = after - day["meal_count"]
+            day_delta = int(after > 0) - int(before > 0)
+            for metric, field in NUTRITION_METRICS.items():
+                _add_delta(deltas, user_id, metric, local_date, day[field], day_delta)
+    _apply_deltas(db, goals, deltas)
+
+
+@subscribe(WellnessChanged)
+def _on_wellness_changed(db: Session, events: list[WellnessChanged]) -> None:
+    """Apply a transaction's wellness log changes to wellness goals"""
+    goals = _tracked_goals(db, {e.user_id for e in events}, WELLNESS_METRICS)
+    if not goals:
+        return
+
+    user_ids = {goal.user_id for goal in goals}
+    timezones = dict(
+        db.query(UserDB.id, UserDB.timezone).filter(UserDB.id.in_(user_ids))
+    )
+    events = [
+        e for e in events if e.user_id in user_ids and e.metric in WELLNESS_METRICS
+    ]
+    dates = local_dates(
+        [e.occurred_at_utc for e in events],
+        [timezones.get(e.user_id) or DEFAULT_TIMEZONE for e in events],
+    )
+    deltas: dict[str, MetricDeltas] = {}
+    for changed, local_date in zip(events, dates):
+        _add_delta(
+            deltas,
+            changed.user_id,
+            changed.metric,
+            local_date,
+            changed.value_delta,
+            changed.day_delta,
+        )
+    _apply_deltas(db, goals, deltas)
+
+
+class GoalProgressService:
+    """Service class for log-driven goal progress"""
+
+    @staticmethod
+    def compute_totals(
+        db: Session, goals: Iterable[Any]
+    ) -> dict[str, tuple[float, int]]:
+        """Compute progress totals of tracked goals from the raw data.
+
+        Reads the daily_nutrition rollup and the wellness logs of the goals'
+        users once per metric family, over the span covering all goal
+        windows, and buckets them per goal. Untracked goals are skipped.
+
+        Args:
+            db: Database session
+            goals: Goals (or rows) with id, user_id, target_type, start_date
+                and end_date
+
+        Returns:
+            Dict of goal ID -> (progress_sum, progress_days)
+
+        """
+        goals = [goal for goal in goals if goal_metric(goal.target_type)]
+        if not goals:
+            return {}
+
+        user_ids = {goal.user_id for goal in goals}
+        first_day = min(goal.start_date for goal in goals)
+        last_day = max(goal.end_date for goal in goals)
+        metrics = {goal_metric(goal.target_type) for goal in goals}
+
+        # (user_id, metric) -> [(local_date, value)]
+        daily: dict[tuple[str, str], list[tuple[date, float]]] = {}
+
+        if metrics & NUTRITION_METRICS.keys():
+            rows = db.execute(
+                select(
+                    DailyNutritionDB.user_id,
+                    DailyNutritionDB.local_date,
+                    *(
+                        getattr(DailyNutritionDB, field)
+                        for field in NUTRITION_METRICS.values()
+                    ),
+                ).where(
+                    DailyNutritionDB.user_id.in_(user_ids),
+                    DailyNutritionDB.local_date >= first_day,
+                    DailyNutritionDB.local_date <= last_day,
+                    DailyNutritionDB.meal_count > 0,
+                )
+            )
+            for row in rows:
+                for metric, field in NUTRITION_METRICS.items():
+                    daily.setdefault((row.user_id, metric), []).append(
+                        (row.local_date, float(getattr(row, field)))
+                    )
+
+        wellness_metrics = metrics & WELLNESS_METRICS.keys()
+        if wellness_metrics:
+            timezones = dict(
+                db.query(UserDB.id, UserDB.timezone).filter(UserDB.id.in_(user_ids))
+            )
+            # Local dates are within a day of UTC dates
+            window_start = datetime.combine(first_day - timedelta(days=1), time.min)
+            window_end = datetime.combine(last_day + timedelta(days=2), time.min)
+            for metric in wellness_metrics:
+                model, column = WELLNESS_METRICS[metric]
+                rows = db.execute(
+                    select(
+                        model.user_id, model.occurred_at_utc, getattr(model, column)
+                    ).where(
+                        model.user_id.in_(user_ids),
+                        model.occurred_at_utc >= window_start,
+                        model.occurred_at_utc < window_end,
+                    )
+                )
+                rows = rows.all()
+                dates = local_dates(
+                    [row.occurred_at_utc for row in rows],
+                    [timezones.get(row.user_id) or DEFAULT_TIMEZONE for row in rows],
+                )
+                for (user_id, _, value), local_date in zip(rows, dates):
+                    daily.setdefault((user_id, metric), []).append(
+                        (local_date, float(value))
+                    )
+
+        totals = {}
+        for goal in goals:
+            values = [
+                value
+                for local_date, value in daily.get(
+                    (goal.user_id, goal_metric(goal.target_type)), ()
+                )
+                if goal.start_date <= local_date <= goal.end_date
+            ]
+            totals[goal.id] = (round(sum(values), 2), len(values))
+        return totals
+
+    @staticmethod
+    def refresh_goal(db: Session, goal: GoalDB) -> None:
+        """Recompute a tracked goal's totals in place (for new or moved goals).
+
+        Does nothing for goals updated manually. Does not commit.
+
+        Args:
+            db: Database session
+            goal: Goal to refresh
+
+        """
+        totals = GoalProgressService.compute_totals(db, [goal])
+        if goal.id not in totals:
+            return
+        goal.progress_sum, goal.progress_days = totals[goal.id]
+        goal.current_value = (
+            round(goal.progress_sum / goal.progress_days, 2)
+            if goal.progress_days
+            else 0
+        )
+
+    @staticmethod
+    def reconcile(
+        db: Session,
+        user_ids: Optional[list[str]] = None,
+        batch_size: int = 500,
+    ) -> int:
+        """Recompute the totals of all active tracked goals in batches.
+
+        Walks goals by ID, computes each batch's totals with
+        compute_totals, writes them with one executemany UPDATE and
+        commits, so transactions stay short. Log writes made while a batch
+        is computed can be overwritten; run it when traffic is low.
+
+        Args:
+            db: Database session
+            user_ids: Optional users to limit reconciliation to
+            batch_size: Goals per transaction
+
+        Returns:
+            Number of goals reconciled
+
+        """
+        table = GoalDB.__table__
+        update_stmt = (
+            table.update()
+            .where(table.c.id == bindparam("goal_id"))
+            .values(
+                progress_sum=bindparam("new_sum"),
+                progress_days=bindparam("new_days"),
+                current_value=bindparam("new_value"),
+            )
+        )
+
+        reconciled = 0
+        last_id = ""
+        while True:
+            query = select(
+                GoalDB.id,
+                GoalDB.user_id,
+                GoalDB.target_type,
+                GoalDB.start_date,
+                GoalDB.end_date,
+            ).where(
+                GoalDB.status == GoalStatus.ACTIVE.value,
+                func.lower(GoalDB.target_type).in_(_target_types(TRACKED_METRICS)),
+                GoalDB.id > last_id,
+            )
+            if user_ids is not None:
+                query = query.where(GoalDB.user_id.in_(user_ids))
+            goals = db.execute(query.order_by(GoalDB.id).limit(batch_size)).all()
+            if not goals:
+                return reconciled
+
+            totals = GoalProgressService.compute_totals(db, goals)
+            db.execute(
+                update_stmt,
+                [
+                    {
+                        "goal_id": goal_id,
+                        "new_sum": progress_sum,
+                        "new_days": progress_days,
+                        "new_value": (
+                            round(progress_sum / progress_days, 2)
+                            if progress_days
+                            else 0
+                        ),
+                    }
+                    for goal_id, (progress_sum, progress_days) in totals.items()
+                ],
+            )
+            invalidate_after_commit(db, {goal.user_id for goal in goals})
+            db.commit()
+
+            reconciled += len(goals)
+            last_id = goals[-1].id
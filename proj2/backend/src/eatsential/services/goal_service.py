@@ -1,14 +1,23 @@
 """Goal tracking service for CRUD operations."""
 
+import time
 import uuid
+from collections.abc import Collection
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, Integer, and_, case, cast, delete, desc, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, load_only
 
-from ..models.models import GoalDB, GoalStatus
+from ..models.models import GoalDB, GoalProgressSnapshotDB, GoalStatus
 from ..schemas.schemas import GoalCreate, GoalUpdate
+from ..utils.pagination import keyset_filter
+from .goal_progress_service import GoalProgressService, goal_metric
+from .progress_cache import invalidate_after_commit, progress_snapshots
+
+# Goal fields whose change requires recomputing log-driven progress
+PROGRESS_FIELDS = {"target_type", "start_date", "end_date", "status"}
 
 
 class GoalService:
@@ -18,6 +27,9 @@ class GoalService:
     def create_goal(db: Session, user_id: str, goal_data: GoalCreate) -> GoalDB:
         """Create a new goal.
 
+        Goals tracking a logged metric start with the progress already
+        logged in their date range.
+
         Args:
             db: Database session
             user_id: User ID
@@ -44,8 +56,10 @@ class GoalService:
             status=GoalStatus.ACTIVE.value,
             notes=goal_data.notes if hasattr(goal_data, "notes") else None,
         )
+        GoalProgressService.refresh_goal(db, db_goal)
 
         db.add(db_goal)
+        invalidate_after_commit(db, [user_id])
         db.commit()
         db.refresh(db_goal)
 
@@ -71,7 +85,7 @@ class GoalService:
         )
 
     @staticmethod
-    def get_user_goals(
+    def get_user_goals_page(
         db: Session,
         user_id: str,
         skip: int = 0,
@@ -80,21 +94,34 @@ class GoalService:
         status: Optional[str] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> tuple[list[GoalDB], int]:
-        """Get user's goals with optional filters.
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        columns: Optional[Collection[str]] = None,
+    ) -> tuple[list[GoalDB], Optional[int], bool]:
+        """Get one page of a user's goals with optional filters.
+
+        Fetches ``limit + 1`` rows to tell whether another page exists, so the
+        COUNT(*) query only runs when the caller asks for the total.
 
         Args:
             db: Database session
             user_id: User ID
-            skip: Number of records to skip (for pagination)
+            skip: Number of records to skip (for pagination, ignored with cursor)
             limit: Maximum number of records to return
             goal_type: Optional goal type filter
             status: Optional status filter
             start_date: Optional start date filter (starting on or after)
             end_date: Optional end date filter (ending on or before)
+            cursor: Optional keyset cursor on (created_at, id) from the last page
+            include_total: Whether to count all goals matching the filters
+            columns: Optional GoalDB attributes to load (sparse fieldsets);
+                other attributes raise on access instead of lazy loading
 
         Returns:
-            Tuple of (list of goals, total count)
+            Tuple of (list of goals, total count or None, has_more)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
         """
         # Build query with filters
@@ -112,12 +139,72 @@ class GoalService:
         if end_date:
             query = query.filter(GoalDB.end_date <= end_date)
 
-        # Get total count
-        total = query.count()
+        # Get total count only on request
+        total = query.count() if include_total else None
+
+        # Keyset pagination seeks past the cursor instead of skipping rows
+        if cursor:
+            query = query.filter(keyset_filter(GoalDB.created_at, GoalDB.id, cursor))
+            skip = 0
+
+        if columns is not None:
+            attributes = [getattr(GoalDB, column) for column in columns]
+            query = query.options(load_only(*attributes, raiseload=True))
+
+        # Apply pagination and ordering, plus one row to detect a next page
+        goals = (
+            query.order_by(desc(GoalDB.created_at), desc(GoalDB.id))
+            .offset(skip)
+            .limit(limit + 1)
+            .all()
+        )
+
+        return goals[:limit], total, len(goals) > limit
+
+    @staticmethod
+    def get_user_goals(
+        db: Session,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        goal_type: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[GoalDB], int]:
+        """Get user's goals with optional filters and the total count.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            skip: Number of records to skip (for pagination, ignored with cursor)
+            limit: Maximum number of records to return
+            goal_type: Optional goal type filter
+            status: Optional status filter
+            start_date: Optional start date filter (starting on or after)
+            end_date: Optional end date filter (ending on or before)
+            cursor: Optional keyset cursor on (created_at, id) from the last page
+
+        Returns:
+            Tuple of (list of goals, total count)
 
-        # Apply pagination and ordering
-        goals = query.order_by(desc(GoalDB.created_at)).offset(skip).limit(limit).all()
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
+        """
+        goals, total, _ = GoalService.get_user_goals_page(
+            db,
+            user_id,
+            skip=skip,
+            limit=limit,
+            goal_type=goal_type,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            include_total=True,
+        )
         return goals, total
 
     @staticmethod
@@ -135,6 +222,10 @@ class GoalService:
         Returns:
             Updated goal database object or None if not found
 
+        Raises:
+            ValueError: If current_value is set on a goal whose progress is
+                tracked from logs, where the next log would overwrite it
+
         """
         db_goal = GoalService.get_goal_by_id(db, user_id, goal_id)
 
@@ -144,12 +235,25 @@ class GoalService:
         # Update fields if provided
         update_data = goal_data.model_dump(exclude_unset=True)
 
+        target_type = update_data.get("target_type") or db_goal.target_type
+        if "current_value" in update_data and goal_metric(target_type):
+            raise ValueError(
+                f"current_value of {target_type} goals is tracked from your "
+                "logs and cannot be set"
+            )
+
         for field, value in update_data.items():
             if field == "status" and value:
                 setattr(db_goal, field, value.value)
             else:
                 setattr(db_goal, field, value)
 
+        # Log events only reach active goals inside their window: recompute
+        # when either changes
+        if PROGRESS_FIELDS.intersection(update_data):
+            GoalProgressService.refresh_goal(db, db_goal)
+
+        invalidate_after_commit(db, [user_id])
         db.commit()
         db.refresh(db_goal)
 
@@ -173,7 +277,14 @@ class GoalService:
         if not db_goal:
             return False
 
+        # Delete the history in one statement rather than loading it to cascade
+        db.execute(
+            delete(GoalProgressSnapshotDB)
+            .where(GoalProgressSnapshotDB.goal_id == goal_id)
+            .execution_options(synchronize_session=False)
+        )
         db.delete(db_goal)
+        invalidate_after_commit(db, [user_id])
         db.commit()
 
         return True
@@ -201,49 +312,71 @@ class GoalService:
         user_id: str,
         goal_type: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> list[dict]:
+        use_cache: bool = True,
+    ) -> list[Row]:
         """Get progress statistics for user's goals.
 
+        Completion percentage and days remaining are computed by the
+        database, and the resulting rows are cached per user until one of
+        the user's goals is written (see progress_cache).
+
         Args:
             db: Database session
             user_id: User ID
             goal_type: Optional goal type filter
             status: Optional status filter
+            use_cache: Whether to serve and store cached snapshots; pass
+                False for reads pinned to the primary after a write, which
+                another process's cache may not have seen
 
         Returns:
-            List of goal progress dictionaries
+            List of rows with goal_id, goal_type, target_type, target_value,
+            current_value, completion_percentage, status and days_remaining
 
         """
-        # Build query with filters
-        query = db.query(GoalDB).filter(GoalDB.user_id == user_id)
+        today = date.today()
+        # days_remaining changes at midnight, so the date is part of the key
+        cache_key = (goal_type, status, today)
+        started_at = time.monotonic()
+        if use_cache:
+            cached = progress_snapshots.get(user_id, cache_key, now=started_at)
+            if cached is not None:
+                return list(cached)
+
+        target_value = cast(GoalDB.target_value, Float)
+        current_value = cast(GoalDB.current_value, Float)
+        query = select(
+            GoalDB.id.label("goal_id"),
+            GoalDB.goal_type,
+            GoalDB.target_type,
+            target_value.label("target_value"),
+            current_value.label("current_value"),
+            case(
+                (target_value <= 0, 0.0),
+                (current_value >= target_value, 100.0),
+                else_=current_value * 100.0 / target_value,
+            ).label("completion_percentage"),
+            GoalDB.status,
+            GoalService._days_until(db, GoalDB.end_date, today).label("days_remaining"),
+        ).where(GoalDB.user_id == user_id)
 
         if goal_type:
-            query = query.filter(GoalDB.goal_type == goal_type)
+            query = query.where(GoalDB.goal_type == goal_type)
 
         if status:
-            query = query.filter(GoalDB.status == status)
-
-        goals = query.all()
-
-        # Calculate progress for each goal
-        progress_list = []
-        today = date.today()
+            query = query.where(GoalDB.status == status)
 
-        for goal in goals:
-            completion_percentage = GoalService.calculate_goal_progress(goal)
-            days_remaining = (goal.end_date - today).days
-
-            progress_list.append(
-                {
-                    "goal_id": goal.id,
-                    "goal_type": goal.goal_type,
-                    "target_type": goal.target_type,
-                    "target_value": float(goal.target_value),
-                    "current_value": float(goal.current_value),
-                    "completion_percentage": completion_percentage,
-                    "status": goal.status,
-                    "days_remaining": days_remaining,
-                }
-            )
+        rows = tuple(db.execute(query.order_by(GoalDB.created_at, GoalDB.id)).all())
+        if use_cache:
+            progress_snapshots.put(user_id, cache_key, rows, started_at)
+        return list(rows)
 
-        return progress_list
+    @staticmethod
+    def _days_until(db: Session, column: Any, today: date) -> Any:
+        """Build a SQL expression for the days from today to a date column"""
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return column - today
+        if dialect in ("mysql", "mariadb"):
+            return func.datediff(column, today)
+        return cast(func.julianday(column) - func.julianday(today), Integer)
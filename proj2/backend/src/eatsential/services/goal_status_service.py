@@ -0,0 +1,191 @@
+"""Scheduled evaluation of goals whose date range has ended.
+
+Goals stay ``active`` until their end date has passed, then a scheduled run
+moves them to ``completed`` (``current_value`` reached ``target_value``) or
+``expired``. Ended goals are found through the ``(status, end_date)`` index
+and updated in set-based batches across all users, one transaction per
+batch, so request handlers can treat ``active`` as "still running".
+
+``scripts/evaluate_goal_statuses.py`` is meant to run from cron; the in-app
+worker is opt-in for single-process deployments.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import not_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..models.models import GoalDB, GoalStatus
+from .goal_history_service import GoalHistoryService
+from .progress_cache import invalidate_after_commit
+
+logger = logging.getLogger(__name__)
+
+# Seconds between runs of the in-app worker; 0 (the default) disables it
+GOAL_STATUS_INTERVAL_SECONDS = float(os.getenv("GOAL_STATUS_INTERVAL_SECONDS", "0"))
+
+# Goals updated per transaction
+GOAL_STATUS_BATCH_SIZE = int(os.getenv("GOAL_STATUS_BATCH_SIZE", "1000"))
+
+# end_date is a local date: wait until it has ended in every timezone
+GOAL_EXPIRY_GRACE_DAYS = 1
+
+
+@dataclass
+class GoalStatusRunStats:
+    """Outcome and throughput of one evaluation run"""
+
+    completed: int = 0
+    expired: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def evaluated(self) -> int:
+        """Goals moved out of active"""
+        return self.completed + self.expired
+
+    @property
+    def goals_per_second(self) -> float:
+        """Evaluation throughput"""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.evaluated / self.elapsed_seconds
+
+
+class GoalStatusService:
+    """Service class for moving ended goals out of active"""
+
+    @staticmethod
+    def evaluate_ended_goals(
+        db: Session,
+        today: Optional[date] = None,
+        batch_size: int = GOAL_STATUS_BATCH_SIZE,
+    ) -> GoalStatusRunStats:
+        """Complete or expire every active goal whose end date has passed.
+
+        Each batch selects up to ``batch_size`` ended goals by the
+        ``(status, end_date)`` index, then issues one UPDATE for those that
+        reached their target and one for the rest, and commits. The UPDATEs
+        re-check the status, so goals edited meanwhile are left alone.
+
+        Args:
+            db: Database session
+            today: Current UTC date (defaults to today)
+            batch_size: Goals per transaction
+
+        Returns:
+            Counts and throughput of the run
+
+        """
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = today - timedelta(days=GOAL_EXPIRY_GRACE_DAYS)
+        reached = GoalDB.current_value >= GoalDB.target_value
+        stats = GoalStatusRunStats()
+        start = time.perf_counter()
+
+        while True:
+            batch = db.execute(
+                select(GoalDB.id, GoalDB.user_id)
+                .where(
+                    GoalDB.status == GoalStatus.ACTIVE.value,
+                    GoalDB.end_date < cutoff,
+                )
+                .order_by(GoalDB.end_date)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+
+            goal_ids = [row.id for row in batch]
+            for outcome, condition in (
+                (GoalStatus.COMPLETED, reached),
+                (GoalStatus.EXPIRED, not_(reached)),
+            ):
+                result = db.execute(
+                    update(GoalDB)
+                    .where(
+                        GoalDB.id.in_(goal_ids),
+                        GoalDB.status == GoalStatus.ACTIVE.value,
+                        condition,
+                    )
+                    .values(status=outcome.value)
+                    .execution_options(synchronize_session=False)
+                )
+                if outcome is GoalStatus.COMPLETED:
+                    stats.completed += result.rowcount
+                else:
+                    stats.expired += result.rowcount
+
+            invalidate_after_commit(db, {row.user_id for row in batch})
+            db.commit()
+            stats.batches += 1
+
+        stats.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            "Goal status run: %d completed, %d expired in %d batches "
+            "(%.2fs, %.0f goals/s)",
+            stats.completed,
+            stats.expired,
+            stats.batches,
+            stats.elapsed_seconds,
+            stats.goals_per_second,
+        )
+        return stats
+
+    @staticmethod
+    def run_once(
+        session_factory: sessionmaker, batch_size: int = GOAL_STATUS_BATCH_SIZE
+    ) -> GoalStatusRunStats:
+        """Record progress snapshots and evaluate ended goals in a new session.
+
+        Snapshots are recorded first, so goals ending yesterday keep their
+        final day; old snapshots are compacted last.
+
+        Args:
+            session_factory: Session factory for the primary database
+            batch_size: Goals per transaction
+
+        Returns:
+            Counts and throughput of the run
+
+        """
+        db = session_factory()
+        try:
+            GoalHistoryService.record_snapshots(db)
+            stats = GoalStatusService.evaluate_ended_goals(db, batch_size=batch_size)
+            GoalHistoryService.compact_snapshots(db)
+            return stats
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+async def run_goal_status_worker(
+    session_factory: sessionmaker, interval_seconds: float
+) -> None:
+    """Run GoalStatusService.run_once now and every interval, until cancelled.
+
+    Every app process that enables the worker runs it, and concurrent runs
+    are not coordinated, so enable it in one process only or use the cron
+    script instead.
+
+    Args:
+        session_factory: Session factory for the primary database
+        interval_seconds: Seconds between runs
+
+    """
+    while True:
+        try:
+            await asyncio.to_thread(GoalStatusService.run_once, session_factory)
+        except Exception:
+            logger.exception("Goal status evaluation failed")
+        await asyncio.sleep(interval_seconds)
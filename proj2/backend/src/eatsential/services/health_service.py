@@ -25,6 +25,7 @@ from ..schemas.schemas import (
     UserAllergyCreate,
     UserAllergyUpdate,
 )
+from ..utils.pagination import keyset_filter
 
 
 class HealthProfileService:
@@ -696,24 +697,36 @@ class HealthProfileService:
         self,
         allergen_id: Optional[str] = None,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> list[AllergenAuditLogDB]:
         """Get audit logs for allergen operations.
 
         Args:
             allergen_id: Optional allergen ID to filter logs
             limit: Maximum number of logs to return
+            cursor: Optional keyset cursor on (created_at, id) from the last page
 
         Returns:
             List of AllergenAuditLogDB objects
 
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
         """
         query = self.db.query(AllergenAuditLogDB).order_by(
-            AllergenAuditLogDB.created_at.desc()
+            AllergenAuditLogDB.created_at.desc(), AllergenAuditLogDB.id.desc()
         )
 
         if allergen_id:
             query = query.filter(AllergenAuditLogDB.allergen_id == allergen_id)
 
+        if cursor:
+            query = query.filter(
+                keyset_filter(
+                    AllergenAuditLogDB.created_at, AllergenAuditLogDB.id, cursor
+                )
+            )
+
         return query.limit(limit).all()
 
     # Bulk operations
@@ -799,25 +812,35 @@ class HealthProfileService:
 
         return (success_count, failure_count, errors)
 
-    def search_allergens(
+    def search_allergens_page(
         self,
         name: Optional[str] = None,
         category: Optional[str] = None,
         is_major_allergen: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[AllergenDB], int]:
-        """Search and filter allergens with pagination.
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> tuple[list[AllergenDB], Optional[int], bool]:
+        """Search and filter one page of allergens.
+
+        Fetches ``limit + 1`` rows to tell whether another page exists, so the
+        COUNT(*) query only runs when the caller asks for the total.
 
         Args:
             name: Optional name filter (partial match)
             category: Optional category filter (exact match)
             is_major_allergen: Optional major allergen filter
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored with cursor)
             limit: Maximum number of records to return
+            cursor: Optional keyset cursor on (name, id) from the last page
+            include_total: Whether to count all allergens matching the filters
 
         Returns:
-            Tuple of (allergen_list, total_count)
+            Tuple of (allergen_list, total_count or None, has_more)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
         """
         query = self.db.query(AllergenDB)
@@ -832,12 +855,61 @@ class HealthProfileService:
         if is_major_allergen is not None:
             query = query.filter(AllergenDB.is_major_allergen == is_major_allergen)
 
-        # Get total count
-        total_count = query.count()
+        # Get total count only on request
+        total_count = query.count() if include_total else None
+
+        # Keyset pagination seeks past the cursor instead of skipping rows
+        if cursor:
+            query = query.filter(
+                keyset_filter(AllergenDB.name, AllergenDB.id, cursor, descending=False)
+            )
+            skip = 0
+
+        # Apply pagination and ordering, plus one row to detect a next page
+        allergens = (
+            query.order_by(AllergenDB.name, AllergenDB.id)
+            .offset(skip)
+            .limit(limit + 1)
+            .all()
+        )
+
+        return (allergens[:limit], total_count, len(allergens) > limit)
+
+    def search_allergens(
+        self,
+        name: Optional[str] = None,
+        category: Optional[str] = None,
+        is_major_allergen: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[AllergenDB], int]:
+        """Search and filter allergens with pagination and the total count.
+
+        Args:
+            name: Optional name filter (partial match)
+            category: Optional category filter (exact match)
+            is_major_allergen: Optional major allergen filter
+            skip: Number of records to skip (ignored with cursor)
+            limit: Maximum number of records to return
+            cursor: Optional keyset cursor on (name, id) from the last page
+
+        Returns:
+            Tuple of (allergen_list, total_count)
 
-        # Apply pagination and ordering
-        allergens = query.order_by(AllergenDB.name).offset(skip).limit(limit).all()
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
+        """
+        allergens, total_count, _ = self.search_allergens_page(
+            name=name,
+            category=category,
+            is_major_allergen=is_major_allergen,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=True,
+        )
         return (allergens, total_count)
         self.db.commit()
 
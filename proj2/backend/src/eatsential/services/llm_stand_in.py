@@ -0,0 +1,67 @@
+"""Local stand-in for the Gemini client, for load tests and offline runs.
+
+Enabled by setting LLM_STAND_IN_LATENCY_MS. The recommendation engine then
+builds and parses prompts exactly as with Gemini, but the answer comes from
+this process after the configured delay, so load tests measure the
+application rather than a remote model and cost nothing.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+# Milliseconds the stand-in waits before answering; unset disables it
+LLM_STAND_IN_LATENCY_MS: Optional[float] = (
+    float(os.environ["LLM_STAND_IN_LATENCY_MS"])
+    if os.getenv("LLM_STAND_IN_LATENCY_MS")
+    else None
+)
+
+# Candidates ranked per answer, like the prompt asks of Gemini
+STAND_IN_RESULTS = 5
+
+
+def _candidates(prompt: str) -> list[dict[str, Any]]:
+    """Extract the candidate list embedded in a recommendation prompt"""
+    start = prompt.index("[", prompt.index("Candidate "))
+    end = prompt.index("\n\nTask:", start)
+    return json.loads(prompt[start:end])
+
+
+class _StandInModels:
+    """The models surface of google.genai.Client used by the engine"""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.latency_ms = latency_ms
+
+    def generate_content(self, *, model: str, contents: list, config: Any) -> list:
+        """Rank the prompt's candidates in a stable pseudo-random order.
+
+        Returns:
+            Suggestions in the JSON shape the prompt asks for
+
+        """
+        time.sleep(self.latency_ms / 1000)
+        candidates = _candidates(contents[0])
+        ranked = sorted(
+            candidates,
+            key=lambda c: hashlib.sha256(str(c.get("item_id")).encode()).hexdigest(),
+        )[:STAND_IN_RESULTS]
+        return [
+            {
+                "item_id": candidate.get("item_id"),
+                "name": candidate.get("name"),
+                "score": round(1 - rank / (2 * STAND_IN_RESULTS), 2),
+                "explanation": "Ranked by the local LLM stand-in.",
+            }
+            for rank, candidate in enumerate(ranked)
+        ]
+
+
+class StandInLLMClient:
+    """Drop-in for google.genai.Client that answers locally"""
+
+    def __init__(self, latency_ms: float = 0) -> None:
+        self.models = _StandInModels(latency_ms)
@@ -0,0 +1,220 @@
+"""Streaming meal history export in CSV and NDJSON."""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Literal, Optional
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from ..models.models import MealDB, MealFoodItemDB
+
+ExportFormat = Literal["csv", "ndjson"]
+
+# Meal rows fetched per round trip from the (server-side, where supported) cursor
+EXPORT_YIELD_PER = 1000
+
+# Serialized bytes buffered before a chunk is sent to the client
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+MEAL_COLUMNS = (
+    "id",
+    "meal_type",
+    "meal_time",
+    "notes",
+    "total_calories",
+    "total_protein_g",
+    "total_carbs_g",
+    "total_fat_g",
+)
+FOOD_ITEM_COLUMNS = (
+    "food_name",
+    "portion_size",
+    "portion_unit",
+    "calories",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+)
+
+# One CSV line per food item, with the meal columns repeated
+CSV_HEADER = ("meal_id", *MEAL_COLUMNS[1:], *FOOD_ITEM_COLUMNS)
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to a JSON/CSV friendly value"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class MealExportService:
+    """Service class for streaming meal exports"""
+
+    @staticmethod
+    def iter_rows(
+        db: Session,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        yield_per: int = EXPORT_YIELD_PER,
+    ) -> Iterator[Row]:
+        """Stream a user's meals joined to their food items, oldest first.
+
+        Runs one query with ``yield_per`` so rows are fetched in fixed-size
+        batches (a server-side cursor on PostgreSQL) instead of loading the
+        whole history; no ORM objects are built.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: Optional earliest meal_time
+            end_date: Optional latest meal_time
+            yield_per: Rows fetched per round trip
+
+        Yields:
+            Rows with the MEAL_COLUMNS (``id`` as meal id) and
+            FOOD_ITEM_COLUMNS, consecutive for each meal
+
+        """
+        stmt = (
+            select(
+                *(getattr(MealDB, column) for column in MEAL_COLUMNS),
+                *(getattr(MealFoodItemDB, column) for column in FOOD_ITEM_COLUMNS),
+            )
+            .outerjoin(MealFoodItemDB, MealFoodItemDB.meal_id == MealDB.id)
+            .where(MealDB.user_id == user_id)
+            .order_by(MealDB.meal_time, MealDB.id, MealFoodItemDB.id)
+            .execution_options(yield_per=yield_per)
+        )
+        if start_date:
+            stmt = stmt.where(MealDB.meal_time >= start_date)
+        if end_date:
+            stmt = stmt.where(MealDB.meal_time <= end_date)
+
+        yield from db.execute(stmt)
+
+    @staticmethod
+    def iter_csv(rows: Iterable[Row]) -> Iterator[bytes]:
+        """Serialize export rows as CSV, one line per food item.
+
+        Args:
+            rows: Rows from iter_rows
+
+        Yields:
+            UTF-8 encoded chunks of about EXPORT_CHUNK_SIZE bytes
+
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+        for row in rows:
+            writer.writerow([_plain(value) for value in row])
+            if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    @staticmethod
+    def iter_ndjson(rows: Iterable[Row]) -> Iterator[bytes]:
+        """Serialize export rows as NDJSON, one meal object per line.
+
+        Consecutive rows of the same meal are folded into its ``food_items``
+        list, so only one meal is held in memory at a time.
+
+        Args:
+            rows: Rows from iter_rows
+
+        Yields:
+            UTF-8 encoded chunks of about EXPORT_CHUNK_SIZE bytes
+
+        """
+        chunk: list[str] = []
+        chunk_size = 0
+        meal: Optional[dict[str, Any]] = None
+
+        def finish(done: dict[str, Any]) -> None:
+            nonlocal chunk_size
+            line = json.dumps(done, separators=(",", ":")) + "\n"
+            chunk.append(line)
+            chunk_size += len(line)
+
+        for row in rows:
+            values = [_plain(value) for value in row]
+            meal_values = values[: len(MEAL_COLUMNS)]
+            item_values = values[len(MEAL_COLUMNS) :]
+
+            if meal is None or meal["id"] != meal_values[0]:
+                if meal is not None:
+                    finish(meal)
+                meal = dict(zip(MEAL_COLUMNS, meal_values))
+                meal["food_items"] = []
+            # Outer join: meals without food items have a NULL item row
+            if item_values[0] is not None:
+                meal["food_items"].append(dict(zip(FOOD_ITEM_COLUMNS, item_values)))
+
+            if chunk_size >= EXPORT_CHUNK_SIZE:
+                yield "".join(chunk).encode()
+                chunk.clear()
+                chunk_size = 0
+
+        if meal is not None:
+            finish(meal)
+        yield "".join(chunk).encode()
+
+    @staticmethod
+    def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Gzip-compress a byte stream incrementally.
+
+        Args:
+            chunks: Uncompressed chunks
+
+        Yields:
+            Compressed chunks forming one gzip member
+
+        """
+        # wbits=31: zlib deflate with a gzip header and trailer
+        compressor = zlib.compressobj(wbits=31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    def stream(
+        db: Session,
+        user_id: str,
+        export_format: ExportFormat,
+        use_gzip: bool = False,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """Stream a user's meal history in the requested format.
+
+        Args:
+            db: Database session (must stay open while the stream is consumed)
+            user_id: User ID
+            export_format: "csv" or "ndjson"
+            use_gzip: Whether to gzip the output
+            start_date: Optional earliest meal_time
+            end_date: Optional latest meal_time
+
+        Returns:
+            Iterator of output chunks
+
+        """
+        rows = MealExportService.iter_rows(db, user_id, start_date, end_date)
+        if export_format == "csv":
+            chunks = MealExportService.iter_csv(rows)
+        else:
+            chunks = MealExportService.iter_ndjson(rows)
+        return MealExportService.gzip_stream(chunks) if use_gzip else chunks
@@ -1,77 +1,312 @@
 """Meal logging service for CRUD operations."""
 
 import uuid
-from datetime import datetime
+from collections.abc import Collection
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, desc, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..models.models import MealDB, MealFoodItemDB
-from ..schemas.schemas import MealCreate, MealUpdate
+from ..schemas.schemas import (
+    MealBatchItem,
+    MealCreate,
+    MealFoodItemCreate,
+    MealFoodItemUpdate,
+    MealUpdate,
+)
+from ..utils.pagination import keyset_filter
+from .daily_nutrition_service import DailyNutritionService, RollupChanges
+from .events import NutritionChanged, publish
+
+# Food item columns copied from MealFoodItemCreate/MealFoodItemUpdate
+FOOD_ITEM_FIELDS = (
+    "food_name",
+    "portion_size",
+    "portion_unit",
+    "calories",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+)
+
+# Meal total column -> food item column it sums
+NUTRIENT_TOTALS = {
+    "total_calories": "calories",
+    "total_protein_g": "protein_g",
+    "total_carbs_g": "carbs_g",
+    "total_fat_g": "fat_g",
+}
 
 
 class MealService:
     """Service class for meal logging operations"""
 
     @staticmethod
-    def create_meal(db: Session, user_id: str, meal_data: MealCreate) -> MealDB:
+    def _stored_meal_time(meal_time: datetime) -> datetime:
+        """Return a meal time as naive UTC, the way it is stored and rolled up"""
+        if meal_time.tzinfo is None:
+            return meal_time
+        return meal_time.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _meal_row(user_id: str, meal_data: MealCreate) -> dict:
+        """Build the meal column values, including nutritional totals"""
+        food_items = meal_data.food_items
+        total_calories = sum(item.calories for item in food_items if item.calories)
+        total_protein = sum(item.protein_g for item in food_items if item.protein_g)
+        total_carbs = sum(item.carbs_g for item in food_items if item.carbs_g)
+        total_fat = sum(item.fat_g for item in food_items if item.fat_g)
+
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "meal_type": meal_data.meal_type.value,
+            "meal_time": MealService._stored_meal_time(meal_data.meal_time),
+            "notes": meal_data.notes,
+            "photo_url": meal_data.photo_url,
+            "total_calories": total_calories or 0,
+            "total_protein_g": total_protein or 0,
+            "total_carbs_g": total_carbs or 0,
+            "total_fat_g": total_fat or 0,
+        }
+
+    @staticmethod
+    def _food_item_rows(
+        meal_id: str, food_items: list[MealFoodItemCreate]
+    ) -> list[dict]:
+        """Build insert parameter rows for a meal's food items"""
+        return [
+            {
+                "id": str(uuid.uuid4()),
+                "meal_id": meal_id,
+                "food_name": item.food_name,
+                "portion_size": item.portion_size,
+                "portion_unit": item.portion_unit,
+                "calories": item.calories,
+                "protein_g": item.protein_g,
+                "carbs_g": item.carbs_g,
+                "fat_g": item.fat_g,
+            }
+            for item in food_items
+        ]
+
+    @staticmethod
+    def _insert_food_items(db: Session, rows: list[dict]) -> list[MealFoodItemDB]:
+        """Bulk insert food item rows and return them as ORM objects.
+
+        Uses a single executemany INSERT (batched into multi-row VALUES via
+        insertmanyvalues) with RETURNING, so the created rows come back without
+        a SELECT. Rows are returned in the order of ``rows``.
+        """
+        if not rows:
+            return []
+        created = db.scalars(insert(MealFoodItemDB).returning(MealFoodItemDB), rows)
+        # RETURNING order is not guaranteed across batches; IDs are client-side
+        by_id = {item.id: item for item in created}
+        return [by_id[row["id"]] for row in rows]
+
+    @staticmethod
+    def _commit_without_expiring(db: Session) -> None:
+        """Commit while keeping loaded attributes, so no reload is needed"""
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+
+    @staticmethod
+    def _record_daily_nutrition(
+        db: Session,
+        user_id: str,
+        user_tz: Optional[str],
+        meals: list[MealDB],
+        sign: int = 1,
+    ) -> None:
+        """Add (or with ``sign=-1`` remove) meals in the daily_nutrition rollup"""
+        user_tz = user_tz or DailyNutritionService.get_user_timezone(db, user_id)
+        changes = DailyNutritionService.add_meal_changes({}, meals, user_tz, sign)
+        MealService._apply_nutrition_changes(db, user_id, changes)
+
+    @staticmethod
+    def _apply_nutrition_changes(
+        db: Session, user_id: str, changes: RollupChanges
+    ) -> None:
+        """Apply rollup changes and publish them to goal progress"""
+        DailyNutritionService.apply_changes(db, user_id, changes)
+        # Goal progress is updated from these changes when the session commits
+        publish(db, NutritionChanged(user_id, changes))
+
+    @staticmethod
+    def create_meal(
+        db: Session,
+        user_id: str,
+        meal_data: MealCreate,
+        user_tz: Optional[str] = None,
+    ) -> MealDB:
         """Create a new meal log with food items.
 
+        The meal row is flushed first, then all food items are bulk inserted
+        with RETURNING and attached to the meal, so the returned object is
+        fully loaded without a refresh or lazy load. The daily_nutrition
+        rollup is updated in the same transaction.
+
         Args:
             db: Database session
             user_id: User ID
             meal_data: Meal creation data
+            user_tz: User's timezone (looked up if not given)
 
         Returns:
             Created meal database object
 
         """
-        # Calculate nutritional totals
-        total_calories = sum(
-            item.calories for item in meal_data.food_items if item.calories
-        )
-        total_protein = sum(
-            item.protein_g for item in meal_data.food_items if item.protein_g
-        )
-        total_carbs = sum(item.carbs_g for item in meal_data.food_items if item.carbs_g)
-        total_fat = sum(item.fat_g for item in meal_data.food_items if item.fat_g)
-
-        # Create meal record
-        db_meal = MealDB(
-            id=str(uuid.uuid4()),
-            user_id=user_id,
-            meal_type=meal_data.meal_type.value,
-            meal_time=meal_data.meal_time,
-            notes=meal_data.notes,
-            photo_url=meal_data.photo_url,
-            total_calories=total_calories or 0,
-            total_protein_g=total_protein or 0,
-            total_carbs_g=total_carbs or 0,
-            total_fat_g=total_fat or 0,
-        )
-
-        # Create food items
-        for food_item_data in meal_data.food_items:
-            db_food_item = MealFoodItemDB(
-                id=str(uuid.uuid4()),
-                meal_id=db_meal.id,
-                food_name=food_item_data.food_name,
-                portion_size=food_item_data.portion_size,
-                portion_unit=food_item_data.portion_unit,
-                calories=food_item_data.calories,
-                protein_g=food_item_data.protein_g,
-                carbs_g=food_item_data.carbs_g,
-                fat_g=food_item_data.fat_g,
-            )
-            db_meal.food_items.append(db_food_item)
+        # Create meal record with nutritional totals
+        db_meal = MealDB(**MealService._meal_row(user_id, meal_data))
 
         db.add(db_meal)
-        db.commit()
-        db.refresh(db_meal)
+        db.flush()
+
+        # Create food items in one bulk statement
+        food_items = MealService._insert_food_items(
+            db, MealService._food_item_rows(db_meal.id, meal_data.food_items)
+        )
+        set_committed_value(db_meal, "food_items", food_items)
+
+        MealService._record_daily_nutrition(db, user_id, user_tz, [db_meal])
+        MealService._commit_without_expiring(db)
 
         return db_meal
 
+    @staticmethod
+    def _meals_by_idempotency_key(
+        db: Session, user_id: str, keys: Collection[str]
+    ) -> dict[str, MealDB]:
+        """Load the user's meals carrying any of the idempotency keys"""
+        if not keys:
+            return {}
+        return {
+            meal.idempotency_key: meal
+            for meal in db.query(MealDB)
+            .options(selectinload(MealDB.food_items))
+            .filter(MealDB.user_id == user_id, MealDB.idempotency_key.in_(keys))
+        }
+
+    @staticmethod
+    def _insert_meals(
+        db: Session, meal_rows: list[dict], food_item_rows: dict[str, list[dict]]
+    ) -> list[MealDB]:
+        """Bulk insert meal rows and their food items, returning loaded meals"""
+        created = list(db.scalars(insert(MealDB).returning(MealDB), meal_rows))
+
+        items_by_meal: dict[str, list[MealFoodItemDB]] = {}
+        for item in MealService._insert_food_items(
+            db, [item for row in meal_rows for item in food_item_rows[row["id"]]]
+        ):
+            items_by_meal.setdefault(item.meal_id, []).append(item)
+        for meal in created:
+            set_committed_value(meal, "food_items", items_by_meal.get(meal.id, []))
+
+        return created
+
+    @staticmethod
+    def create_meals_batch(
+        db: Session,
+        user_id: str,
+        meals: list[MealBatchItem],
+        user_tz: Optional[str] = None,
+    ) -> list[tuple[str, MealDB]]:
+        """Create many meals in one transaction with bulk inserts.
+
+        Meals whose idempotency key was already used by this user (earlier,
+        within the same batch or by a concurrent request) are not inserted
+        again; the original meal is returned with status "duplicate".
+
+        Args:
+            db: Database session
+            user_id: User ID
+            meals: Validated meals to create
+            user_tz: User's timezone (looked up if not given)
+
+        Returns:
+            List aligned with ``meals`` of (status, meal) where status is
+            "created" or "duplicate"
+
+        """
+        existing = MealService._meals_by_idempotency_key(
+            db,
+            user_id,
+            {meal.idempotency_key for meal in meals if meal.idempotency_key},
+        )
+
+        outcomes: list[tuple[str, str]] = []
+        meal_rows: list[dict] = []
+        food_item_rows: dict[str, list[dict]] = {}
+        batch_keys: dict[str, str] = {}
+
+        for meal_data in meals:
+            key = meal_data.idempotency_key
+            if key in existing:
+                outcomes.append(("duplicate", existing[key].id))
+                continue
+            if key in batch_keys:
+                outcomes.append(("duplicate", batch_keys[key]))
+                continue
+
+            row = MealService._meal_row(user_id, meal_data)
+            row["idempotency_key"] = key
+            meal_rows.append(row)
+            food_item_rows[row["id"]] = MealService._food_item_rows(
+                row["id"], meal_data.food_items
+            )
+            outcomes.append(("created", row["id"]))
+            if key:
+                batch_keys[key] = row["id"]
+
+        meals_by_id = {meal.id: meal for meal in existing.values()}
+        # Row ID -> ID of the meal a concurrent request stored under its key
+        replaced: dict[str, str] = {}
+
+        if meal_rows:
+            try:
+                created = MealService._insert_meals(db, meal_rows, food_item_rows)
+            except IntegrityError:
+                # A concurrent request used one of the keys after the lookup:
+                # retry meal by meal and return the stored meal for conflicts
+                db.rollback()
+                created = []
+                for row in meal_rows:
+                    try:
+                        with db.begin_nested():
+                            created.extend(
+                                MealService._insert_meals(db, [row], food_item_rows)
+                            )
+                    except IntegrityError:
+                        key = row["idempotency_key"]
+                        stored = MealService._meals_by_idempotency_key(
+                            db, user_id, [key] if key else []
+                        ).get(key)
+                        if stored is None:
+                            raise
+                        meals_by_id[stored.id] = stored
+                        replaced[row["id"]] = stored.id
+
+            meals_by_id.update((meal.id, meal) for meal in created)
+            if created:
+                MealService._record_daily_nutrition(db, user_id, user_tz, created)
+            MealService._commit_without_expiring(db)
+
+        return [
+            ("duplicate", meals_by_id[replaced[meal_id]])
+            if meal_id in replaced
+            else (status, meals_by_id[meal_id])
+            for status, meal_id in outcomes
+        ]
+
     @staticmethod
     def get_meal_by_id(db: Session, user_id: str, meal_id: str) -> Optional[MealDB]:
         """Get a meal by ID for a specific user.
@@ -93,7 +328,7 @@ class MealService:
         )
 
     @staticmethod
-    def get_user_meals(
+    def get_user_meals_page(
         db: Session,
         user_id: str,
         skip: int = 0,
@@ -101,20 +336,34 @@ class MealService:
         meal_type: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[list[MealDB], int]:
-        """Get meals for a user with optional filters.
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        columns: Optional[Collection[str]] = None,
+    ) -> tuple[list[MealDB], Optional[int], bool]:
+        """Get one page of a user's meals with optional filters.
+
+        Fetches ``limit + 1`` rows to tell whether another page exists, so the
+        COUNT(*) query only runs when the caller asks for the total.
 
         Args:
             db: Database session
             user_id: User ID
-            skip: Number of records to skip (pagination)
+            skip: Number of records to skip (pagination, ignored with cursor)
             limit: Maximum number of records to return
             meal_type: Optional filter by meal type
             start_date: Optional filter for meals after this date
             end_date: Optional filter for meals before this date
+            cursor: Optional keyset cursor on (meal_time, id) from the last page
+            include_total: Whether to count all meals matching the filters
+            columns: Optional MealDB attributes to load (sparse fieldsets);
+                food items are only loaded if "food_items" is listed. Other
+                attributes raise on access instead of lazy loading.
 
         Returns:
-            Tuple of (list of meals, total count)
+            Tuple of (list of meals, total count or None, has_more)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
         """
         # Build query
@@ -128,31 +377,95 @@ class MealService:
         if end_date:
             query = query.filter(MealDB.meal_time <= end_date)
 
-        # Get total count
-        total = query.count()
+        # Get total count only on request
+        total = query.count() if include_total else None
 
-        # Get paginated results
+        # Keyset pagination seeks past the cursor instead of skipping rows
+        if cursor:
+            query = query.filter(keyset_filter(MealDB.meal_time, MealDB.id, cursor))
+            skip = 0
+
+        if columns is None:
+            query = query.options(selectinload(MealDB.food_items))
+        else:
+            attributes = [getattr(MealDB, c) for c in columns if c != "food_items"]
+            query = query.options(load_only(*attributes, raiseload=True))
+            if "food_items" in columns:
+                query = query.options(selectinload(MealDB.food_items))
+
+        # Get paginated results plus one row to detect a next page
         meals = (
-            query.options(selectinload(MealDB.food_items))
-            .order_by(desc(MealDB.meal_time))
+            query.order_by(desc(MealDB.meal_time), desc(MealDB.id))
             .offset(skip)
-            .limit(limit)
+            .limit(limit + 1)
             .all()
         )
 
+        return meals[:limit], total, len(meals) > limit
+
+    @staticmethod
+    def get_user_meals(
+        db: Session,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 20,
+        meal_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[MealDB], int]:
+        """Get meals for a user with optional filters and the total count.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            skip: Number of records to skip (pagination, ignored with cursor)
+            limit: Maximum number of records to return
+            meal_type: Optional filter by meal type
+            start_date: Optional filter for meals after this date
+            end_date: Optional filter for meals before this date
+            cursor: Optional keyset cursor on (meal_time, id) from the last page
+
+        Returns:
+            Tuple of (list of meals, total count)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        """
+        meals, total, _ = MealService.get_user_meals_page(
+            db,
+            user_id,
+            skip=skip,
+            limit=limit,
+            meal_type=meal_type,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            include_total=True,
+        )
         return meals, total
 
     @staticmethod
     def update_meal(
-        db: Session, user_id: str, meal_id: str, meal_data: MealUpdate
+        db: Session,
+        user_id: str,
+        meal_id: str,
+        meal_data: MealUpdate,
+        user_tz: Optional[str] = None,
     ) -> Optional[MealDB]:
         """Update an existing meal log.
 
+        The meal's old contribution is subtracted from the daily_nutrition
+        rollup and its new one added in the same transaction; goal progress
+        follows the net change.
+
         Args:
             db: Database session
             user_id: User ID
             meal_id: Meal ID
             meal_data: Meal update data
+            user_tz: User's timezone (looked up if not given)
 
         Returns:
             Updated meal database object or None if not found
@@ -163,68 +476,125 @@ class MealService:
         if not db_meal:
             return None
 
+        user_tz = user_tz or DailyNutritionService.get_user_timezone(db, user_id)
+        rollup_changes = DailyNutritionService.add_meal_changes(
+            {}, [db_meal], user_tz, sign=-1
+        )
+
         # Update meal fields
         update_data = meal_data.model_dump(exclude_unset=True, exclude={"food_items"})
         for field, value in update_data.items():
             if field == "meal_type" and value:
                 setattr(db_meal, field, value.value)
+            elif field == "meal_time" and value:
+                db_meal.meal_time = MealService._stored_meal_time(value)
             else:
                 setattr(db_meal, field, value)
 
-        # Update food items if provided
+        # Apply only the food item changes, adjusting totals incrementally
         if meal_data.food_items is not None:
-            # Delete existing food items
-            db.query(MealFoodItemDB).filter(MealFoodItemDB.meal_id == meal_id).delete()
-
-            # Create new food items
-            total_calories = 0.0
-            total_protein = 0.0
-            total_carbs = 0.0
-            total_fat = 0.0
-
-            for food_item_data in meal_data.food_items:
-                db_food_item = MealFoodItemDB(
-                    id=str(uuid.uuid4()),
-                    meal_id=db_meal.id,
-                    food_name=food_item_data.food_name,
-                    portion_size=food_item_data.portion_size,
-                    portion_unit=food_item_data.portion_unit,
-                    calories=food_item_data.calories,
-                    protein_g=food_item_data.protein_g,
-                    carbs_g=food_item_data.carbs_g,
-                    fat_g=food_item_data.fat_g,
-                )
-                db_meal.food_items.append(db_food_item)
-
-                # Calculate totals
-                if food_item_data.calories:
-                    total_calories += food_item_data.calories
-                if food_item_data.protein_g:
-                    total_protein += food_item_data.protein_g
-                if food_item_data.carbs_g:
-                    total_carbs += food_item_data.carbs_g
-                if food_item_data.fat_g:
-                    total_fat += food_item_data.fat_g
-
-            # Update nutritional totals
-            db_meal.total_calories = total_calories or 0
-            db_meal.total_protein_g = total_protein or 0
-            db_meal.total_carbs_g = total_carbs or 0
-            db_meal.total_fat_g = total_fat or 0
+            MealService._apply_food_item_diff(db_meal, meal_data.food_items)
 
-        db.commit()
-        db.refresh(db_meal)
+        DailyNutritionService.add_meal_changes(rollup_changes, [db_meal], user_tz)
+        MealService._apply_nutrition_changes(db, user_id, rollup_changes)
+        MealService._commit_without_expiring(db)
 
         return db_meal
 
     @staticmethod
-    def delete_meal(db: Session, user_id: str, meal_id: str) -> bool:
-        """Delete a meal log.
+    def _apply_food_item_diff(
+        db_meal: MealDB, food_items: list[MealFoodItemUpdate]
+    ) -> None:
+        """Turn a meal's food items into ``food_items`` touching only changes.
+
+        Existing rows referenced by id are updated only if a value changed,
+        rows without an id are inserted and existing rows not referenced are
+        deleted. Meal totals are adjusted by the nutrient delta of the changed
+        rows instead of being recomputed from every item.
+
+        Args:
+            db_meal: Meal with food_items loaded
+            food_items: Desired food items of the meal
+
+        Raises:
+            ValueError: If an id does not belong to one of the meal's items
+
+        """
+        existing = {item.id: item for item in db_meal.food_items}
+        deltas = dict.fromkeys(NUTRIENT_TOTALS.values(), 0.0)
+
+        def add_nutrients(values: dict, sign: int) -> None:
+            for nutrient in deltas:
+                deltas[nutrient] += sign * float(values[nutrient] or 0)
+
+        kept_ids = set()
+        for item_data in food_items:
+            values = item_data.model_dump(include=set(FOOD_ITEM_FIELDS))
+
+            if item_data.id is None:
+                db_meal.food_items.append(
+                    MealFoodItemDB(id=str(uuid.uuid4()), meal_id=db_meal.id, **values)
+                )
+                add_nutrients(values, 1)
+                continue
+
+            db_item = existing.get(item_data.id)
+            if db_item is None or item_data.id in kept_ids:
+                raise ValueError(
+                    f"Food item {item_data.id} does not belong to this meal"
+                )
+            kept_ids.add(item_data.id)
+
+            old_values = {field: getattr(db_item, field) for field in FOOD_ITEM_FIELDS}
+            if not MealService._food_item_changed(old_values, values):
+                continue
+
+            add_nutrients(old_values, -1)
+            add_nutrients(values, 1)
+            for field, value in values.items():
+                setattr(db_item, field, value)
+
+        for item_id, db_item in existing.items():
+            if item_id not in kept_ids:
+                add_nutrients(
+                    {field: getattr(db_item, field) for field in FOOD_ITEM_FIELDS}, -1
+                )
+                # delete-orphan cascade deletes the row on flush
+                db_meal.food_items.remove(db_item)
+
+        for total_field, nutrient in NUTRIENT_TOTALS.items():
+            if deltas[nutrient]:
+                current = float(getattr(db_meal, total_field) or 0)
+                setattr(
+                    db_meal, total_field, round(max(current + deltas[nutrient], 0), 2)
+                )
+
+    @staticmethod
+    def _food_item_changed(old_values: dict, new_values: dict) -> bool:
+        """Compare stored food item values with requested ones"""
+        for field, new_value in new_values.items():
+            old_value = old_values[field]
+            if old_value is None or new_value is None:
+                if old_value is not new_value:
+                    return True
+            elif isinstance(new_value, float):
+                if float(old_value) != new_value:
+                    return True
+            elif old_value != new_value:
+                return True
+        return False
+
+    @staticmethod
+    def delete_meal(
+        db: Session, user_id: str, meal_id: str, user_tz: Optional[str] = None
+    ) -> bool:
+        """Delete a meal log and remove it from the daily_nutrition rollup.
 
         Args:
             db: Database session
             user_id: User ID
             meal_id: Meal ID
+            user_tz: User's timezone (looked up if not given)
 
         Returns:
             True if meal was deleted, False if not found
@@ -235,6 +605,7 @@ class MealService:
         if not db_meal:
             return False
 
+        MealService._record_daily_nutrition(db, user_id, user_tz, [db_meal], sign=-1)
         db.delete(db_meal)
         db.commit()
 
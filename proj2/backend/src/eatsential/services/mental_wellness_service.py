@@ -1,13 +1,23 @@
 """Mental wellness logging service for mood, stress, and sleep tracking."""
 
+import itertools
 import uuid
-from datetime import date, datetime, timezone
-from typing import Optional
-from zoneinfo import ZoneInfo
-
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+
+from sqlalchemy import (
+    Float,
+    and_,
+    desc,
+    literal,
+    null,
+    select,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.orm import Session, load_only
 
+from ..db.types import EncryptedText
 from ..models.models import LogType, MoodLogDB, SleepLogDB, StressLogDB, UserDB
 from ..schemas.schemas import (
     MoodLogCreate,
@@ -19,32 +29,84 @@ from ..schemas.schemas import (
     StressLogCreate,
     StressLogResponse,
     StressLogUpdate,
+    WellnessTimelineEntry,
+)
+from ..utils.pagination import keyset_filter
+from ..utils.security import decrypt_many, encrypt_sensitive_data
+from ..utils.timezones import get_local_date, get_zoneinfo, local_dates
+from .events import WellnessChanged, publish
+
+# Score columns of the merged timeline; each is NULL for the other log types
+TIMELINE_SCORE_COLUMNS = (
+    "mood_score",
+    "stress_level",
+    "duration_hours",
+    "quality_score",
 )
-from ..utils.security import decrypt_sensitive_data, encrypt_sensitive_data
 
 
-def get_local_date(dt_utc: datetime, user_tz: str) -> date:
-    """Convert UTC datetime to local date in user's timezone.
+def _unencrypted_columns(model: type) -> list:
+    """All columns of a wellness log model except the encrypted ones"""
+    return [
+        getattr(model, column.key)
+        for column in model.__table__.columns
+        if not isinstance(column.type, EncryptedText)
+    ]
 
-    Args:
-        dt_utc: Datetime in UTC (naive or aware)
-        user_tz: IANA timezone string (e.g., "America/New_York")
 
-    Returns:
-        Local date in user's timezone
+def _local_date_taken(
+    db: Session,
+    model: type,
+    user_id: str,
+    occurred_at_utc: datetime,
+    user_tz: str,
+) -> bool:
+    """Whether the user already has a log of a model on a timestamp's local date.
 
+    Only logs within two days of the timestamp can share its local date, so
+    the check reads their timestamps alone, not every log of the user.
     """
-    # Ensure dt_utc is timezone-aware UTC
-    if dt_utc.tzinfo is None:
-        dt_utc = dt_utc.replace(tzinfo=timezone.utc)
-    else:
-        dt_utc = dt_utc.astimezone(timezone.utc)
+    naive_utc = occurred_at_utc.astimezone(timezone.utc).replace(tzinfo=None)
+    nearby = db.scalars(
+        select(model.occurred_at_utc).where(
+            model.user_id == user_id,
+            model.occurred_at_utc >= naive_utc - timedelta(days=2),
+            model.occurred_at_utc <= naive_utc + timedelta(days=2),
+        )
+    ).all()
+    return get_local_date(occurred_at_utc, user_tz) in local_dates(nearby, user_tz)
 
-    # Convert to user's local timezone
-    tz = ZoneInfo(user_tz)
-    dt_local = dt_utc.astimezone(tz)
 
-    return dt_local.date()
+def _publish_wellness_change(
+    db: Session,
+    log: Union[MoodLogDB, StressLogDB, SleepLogDB],
+    metric: str,
+    before: Optional[float],
+    after: Optional[float],
+) -> None:
+    """Queue goal progress and daily wellness updates for a log value.
+
+    Args:
+        db: Database session the log is written in
+        log: Mood, stress or sleep log
+        metric: Metric the value feeds (see goal_progress_service and
+            daily_wellness_service)
+        before: Previous value, or None for a new log
+        after: New value, or None for a deleted log
+
+    """
+    if before == after:
+        return
+    publish(
+        db,
+        WellnessChanged(
+            user_id=log.user_id,
+            metric=metric,
+            occurred_at_utc=log.occurred_at_utc,
+            value_delta=float(after or 0) - float(before or 0),
+            day_delta=int(after is not None) - int(before is not None),
+        ),
+    )
 
 
 class MentalWellnessService:
@@ -74,7 +136,7 @@ class MentalWellnessService:
         occurred_at_utc = mood_data.occurred_at.astimezone(timezone.utc)
 
         # Validate: occurred_at must be on user's local calendar today
-        tz = ZoneInfo(user_tz)
+        tz = get_zoneinfo(user_tz)
         now_local = datetime.now(timezone.utc).astimezone(tz)
         occurred_local = occurred_at_utc.astimezone(tz)
 
@@ -85,19 +147,12 @@ class MentalWellnessService:
             )
 
         # Check if a log already exists for this local date
-        # We need to find all logs on the same local date
         local_date = occurred_local.date()
-
-        # Query all mood logs for this user and check their local dates
-        existing_logs = db.query(MoodLogDB).filter(MoodLogDB.user_id == user_id).all()
-
-        for log in existing_logs:
-            log_local_date = get_local_date(log.occurred_at_utc, user_tz)
-            if log_local_date == local_date:
-                raise ValueError(
-                    f"A mood log already exists for {local_date}. "
-                    "Please update the existing entry or delete it first."
-                )
+        if _local_date_taken(db, MoodLogDB, user_id, occurred_at_utc, user_tz):
+            raise ValueError(
+                f"A mood log already exists for {local_date}. "
+                "Please update the existing entry or delete it first."
+            )
 
         # Encrypt notes if provided
         encrypted_notes = encrypt_sensitive_data(mood_data.notes)
@@ -112,6 +167,9 @@ class MentalWellnessService:
         )
 
         db.add(db_mood_log)
+        _publish_wellness_change(
+            db, db_mood_log, "mood_score", None, db_mood_log.mood_score
+        )
         db.commit()
         db.refresh(db_mood_log)
 
@@ -141,7 +199,7 @@ class MentalWellnessService:
         occurred_at_utc = stress_data.occurred_at.astimezone(timezone.utc)
 
         # Validate: occurred_at must be on user's local calendar today
-        tz = ZoneInfo(user_tz)
+        tz = get_zoneinfo(user_tz)
         now_local = datetime.now(timezone.utc).astimezone(tz)
         occurred_local = occurred_at_utc.astimezone(tz)
 
@@ -153,18 +211,11 @@ class MentalWellnessService:
 
         # Check if a log already exists for this local date
         local_date = occurred_local.date()
-
-        existing_logs = (
-            db.query(StressLogDB).filter(StressLogDB.user_id == user_id).all()
-        )
-
-        for log in existing_logs:
-            log_local_date = get_local_date(log.occurred_at_utc, user_tz)
-            if log_local_date == local_date:
-                raise ValueError(
-                    f"A stress log already exists for {local_date}. "
-                    "Please update the existing entry or delete it first."
-                )
+        if _local_date_taken(db, StressLogDB, user_id, occurred_at_utc, user_tz):
+            raise ValueError(
+                f"A stress log already exists for {local_date}. "
+                "Please update the existing entry or delete it first."
+            )
 
         # Encrypt sensitive data if provided
         encrypted_triggers = encrypt_sensitive_data(stress_data.triggers)
@@ -181,6 +232,9 @@ class MentalWellnessService:
         )
 
         db.add(db_stress_log)
+        _publish_wellness_change(
+            db, db_stress_log, "stress_level", None, db_stress_log.stress_level
+        )
         db.commit()
         db.refresh(db_stress_log)
 
@@ -210,7 +264,7 @@ class MentalWellnessService:
         occurred_at_utc = sleep_data.occurred_at.astimezone(timezone.utc)
 
         # Validate: occurred_at must be on user's local calendar today
-        tz = ZoneInfo(user_tz)
+        tz = get_zoneinfo(user_tz)
         now_local = datetime.now(timezone.utc).astimezone(tz)
         occurred_local = occurred_at_utc.astimezone(tz)
 
@@ -222,16 +276,11 @@ class MentalWellnessService:
 
         # Check if a log already exists for this local date
         local_date = occurred_local.date()
-
-        existing_logs = db.query(SleepLogDB).filter(SleepLogDB.user_id == user_id).all()
-
-        for log in existing_logs:
-            log_local_date = get_local_date(log.occurred_at_utc, user_tz)
-            if log_local_date == local_date:
-                raise ValueError(
-                    f"A sleep log already exists for {local_date}. "
-                    "Please update the existing entry or delete it first."
-                )
+        if _local_date_taken(db, SleepLogDB, user_id, occurred_at_utc, user_tz):
+            raise ValueError(
+                f"A sleep log already exists for {local_date}. "
+                "Please update the existing entry or delete it first."
+            )
 
         # Encrypt notes if provided
         encrypted_notes = encrypt_sensitive_data(sleep_data.notes)
@@ -247,6 +296,12 @@ class MentalWellnessService:
         )
 
         db.add(db_sleep_log)
+        _publish_wellness_change(
+            db, db_sleep_log, "sleep_hours", None, db_sleep_log.duration_hours
+        )
+        _publish_wellness_change(
+            db, db_sleep_log, "sleep_quality", None, db_sleep_log.quality_score
+        )
         db.commit()
         db.refresh(db_sleep_log)
 
@@ -322,6 +377,7 @@ class MentalWellnessService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         log_type: Optional[LogType] = None,
+        include_notes: bool = True,
     ) -> tuple[list[MoodLogResponse], list[StressLogResponse], list[SleepLogResponse]]:
         """Get wellness logs for a user with optional filters.
 
@@ -331,14 +387,17 @@ class MentalWellnessService:
             start_date: Optional start datetime filter (UTC)
             end_date: Optional end datetime filter (UTC)
             log_type: Optional log type filter ('mood', 'stress', 'sleep')
+            include_notes: Whether to load and decrypt notes and triggers;
+                without them the encrypted columns are left out of the
+                SELECT and returned as None
 
         Returns:
             Tuple of (mood_logs, stress_logs, sleep_logs) with decrypted data
 
         """
-        mood_logs = []
-        stress_logs = []
-        sleep_logs = []
+        db_mood_logs: list[MoodLogDB] = []
+        db_stress_logs: list[StressLogDB] = []
+        db_sleep_logs: list[SleepLogDB] = []
 
         # Query mood logs if requested
         if log_type is None or log_type == "mood":
@@ -355,21 +414,11 @@ class MentalWellnessService:
                     end_date = end_date.replace(tzinfo=timezone.utc)
                 query = query.filter(MoodLogDB.occurred_at_utc <= end_date)
 
-            db_mood_logs = query.order_by(desc(MoodLogDB.occurred_at_utc)).all()
-
-            # Decrypt and convert to response objects
-            for log in db_mood_logs:
-                mood_logs.append(
-                    MoodLogResponse(
-                        id=log.id,
-                        user_id=log.user_id,
-                        occurred_at_utc=log.occurred_at_utc,
-                        mood_score=int(log.mood_score),
-                        notes=decrypt_sensitive_data(log.encrypted_notes),
-                        created_at=log.created_at,
-                        updated_at=log.updated_at,
-                    )
+            if not include_notes:
+                query = query.options(
+                    load_only(*_unencrypted_columns(MoodLogDB), raiseload=True)
                 )
+            db_mood_logs = query.order_by(desc(MoodLogDB.occurred_at_utc)).all()
 
         # Query stress logs if requested
         if log_type is None or log_type == "stress":
@@ -386,22 +435,11 @@ class MentalWellnessService:
                     end_date = end_date.replace(tzinfo=timezone.utc)
                 query = query.filter(StressLogDB.occurred_at_utc <= end_date)
 
-            db_stress_logs = query.order_by(desc(StressLogDB.occurred_at_utc)).all()
-
-            # Decrypt and convert to response objects
-            for log in db_stress_logs:
-                stress_logs.append(
-                    StressLogResponse(
-                        id=log.id,
-                        user_id=log.user_id,
-                        occurred_at_utc=log.occurred_at_utc,
-                        stress_level=int(log.stress_level),
-                        triggers=decrypt_sensitive_data(log.encrypted_triggers),
-                        notes=decrypt_sensitive_data(log.encrypted_notes),
-                        created_at=log.created_at,
-                        updated_at=log.updated_at,
-                    )
+            if not include_notes:
+                query = query.options(
+                    load_only(*_unencrypted_columns(StressLogDB), raiseload=True)
                 )
+            db_stress_logs = query.order_by(desc(StressLogDB.occurred_at_utc)).all()
 
         # Query sleep logs if requested
         if log_type is None or log_type == "sleep":
@@ -418,25 +456,189 @@ class MentalWellnessService:
                     end_date = end_date.replace(tzinfo=timezone.utc)
                 query = query.filter(SleepLogDB.occurred_at_utc <= end_date)
 
+            if not include_notes:
+                query = query.options(
+                    load_only(*_unencrypted_columns(SleepLogDB), raiseload=True)
+                )
             db_sleep_logs = query.order_by(desc(SleepLogDB.occurred_at_utc)).all()
 
-            # Decrypt and convert to response objects
-            for log in db_sleep_logs:
-                sleep_logs.append(
-                    SleepLogResponse(
-                        id=log.id,
-                        user_id=log.user_id,
-                        occurred_at_utc=log.occurred_at_utc,
-                        duration_hours=float(log.duration_hours),
-                        quality_score=int(log.quality_score),
-                        notes=decrypt_sensitive_data(log.encrypted_notes),
-                        created_at=log.created_at,
-                        updated_at=log.updated_at,
-                    )
+        if include_notes:
+            # Decrypt every note and trigger in one batch, in the order they
+            # are consumed below
+            decrypted = iter(
+                decrypt_many(
+                    [log.encrypted_notes for log in db_mood_logs]
+                    + [
+                        text
+                        for log in db_stress_logs
+                        for text in (log.encrypted_triggers, log.encrypted_notes)
+                    ]
+                    + [log.encrypted_notes for log in db_sleep_logs]
                 )
+            )
+        else:
+            decrypted = itertools.repeat(None)
+
+        mood_logs = [
+            MoodLogResponse(
+                id=log.id,
+                user_id=log.user_id,
+                occurred_at_utc=log.occurred_at_utc,
+                mood_score=int(log.mood_score),
+                notes=next(decrypted),
+                created_at=log.created_at,
+                updated_at=log.updated_at,
+            )
+            for log in db_mood_logs
+        ]
+        stress_logs = [
+            StressLogResponse(
+                id=log.id,
+                user_id=log.user_id,
+                occurred_at_utc=log.occurred_at_utc,
+                stress_level=int(log.stress_level),
+                triggers=next(decrypted),
+                notes=next(decrypted),
+                created_at=log.created_at,
+                updated_at=log.updated_at,
+            )
+            for log in db_stress_logs
+        ]
+        sleep_logs = [
+            SleepLogResponse(
+                id=log.id,
+                user_id=log.user_id,
+                occurred_at_utc=log.occurred_at_utc,
+                duration_hours=float(log.duration_hours),
+                quality_score=int(log.quality_score),
+                notes=next(decrypted),
+                created_at=log.created_at,
+                updated_at=log.updated_at,
+            )
+            for log in db_sleep_logs
+        ]
 
         return mood_logs, stress_logs, sleep_logs
 
+    @staticmethod
+    def get_wellness_timeline(
+        db: Session,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        log_type: Optional[LogType] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_notes: bool = True,
+    ) -> tuple[list[WellnessTimelineEntry], bool]:
+        """Get one page of a user's mood, stress and sleep logs, newest first.
+
+        All log types are read in a single UNION ALL query. Each branch
+        takes at most ``limit + 1`` rows from its (user_id, occurred_at_utc)
+        index before the merge, so only those are sorted.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: Optional start datetime filter (UTC)
+            end_date: Optional end datetime filter (UTC)
+            log_type: Optional log type filter ('mood', 'stress', 'sleep')
+            cursor: Optional keyset cursor on (occurred_at_utc, id) from the
+                last page
+            limit: Maximum number of entries to return
+            include_notes: Whether to load and decrypt notes and triggers
+
+        Returns:
+            Tuple of (entries, has_more)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        """
+        if start_date and start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=timezone.utc)
+        if end_date and end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=timezone.utc)
+
+        branches = []
+        for model, model_type in (
+            (MoodLogDB, LogType.MOOD),
+            (StressLogDB, LogType.STRESS),
+            (SleepLogDB, LogType.SLEEP),
+        ):
+            if log_type is not None and log_type != model_type:
+                continue
+
+            columns = [
+                literal(model_type.value).label("log_type"),
+                model.id.label("id"),
+                model.occurred_at_utc.label("occurred_at_utc"),
+            ]
+            for name in TIMELINE_SCORE_COLUMNS:
+                column = getattr(model, name, null())
+                columns.append(type_coerce(column, Float).label(name))
+            for name in ("triggers", "notes"):
+                column = getattr(model, f"encrypted_{name}", null())
+                if not include_notes:
+                    column = null()
+                columns.append(type_coerce(column, EncryptedText).label(name))
+            columns += [
+                model.created_at.label("created_at"),
+                model.updated_at.label("updated_at"),
+            ]
+
+            query = select(*columns).where(model.user_id == user_id)
+            if start_date:
+                query = query.where(model.occurred_at_utc >= start_date)
+            if end_date:
+                query = query.where(model.occurred_at_utc <= end_date)
+            if cursor:
+                query = query.where(
+                    keyset_filter(model.occurred_at_utc, model.id, cursor)
+                )
+            branch = (
+                query.order_by(desc(model.occurred_at_utc), desc(model.id))
+                .limit(limit + 1)
+                .subquery()
+            )
+            branches.append(select(branch))
+
+        timeline = union_all(*branches).subquery("timeline")
+        rows = db.execute(
+            select(timeline)
+            .order_by(desc(timeline.c.occurred_at_utc), desc(timeline.c.id))
+            .limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if include_notes:
+            encrypted = [text for row in rows for text in (row.triggers, row.notes)]
+            decrypted = iter(decrypt_many(encrypted))
+        else:
+            decrypted = itertools.repeat(None)
+
+        entries = []
+        for row in rows:
+            scores = {
+                name: getattr(row, name)
+                for name in TIMELINE_SCORE_COLUMNS
+                if getattr(row, name) is not None
+            }
+            entries.append(
+                WellnessTimelineEntry(
+                    log_type=row.log_type,
+                    id=row.id,
+                    occurred_at_utc=row.occurred_at_utc,
+                    **scores,
+                    triggers=next(decrypted),
+                    notes=next(decrypted),
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                )
+            )
+        return entries, has_more
+
     @staticmethod
     def update_mood_log(
         db: Session, user_id: str, log_id: str, update_data: MoodLogUpdate
@@ -459,6 +661,9 @@ class MentalWellnessService:
 
         # Update fields if provided
         if update_data.mood_score is not None:
+            _publish_wellness_change(
+                db, db_log, "mood_score", db_log.mood_score, update_data.mood_score
+            )
             db_log.mood_score = update_data.mood_score
 
         if update_data.notes is not None:
@@ -490,6 +695,13 @@ class MentalWellnessService:
 
         # Update fields if provided
         if update_data.stress_level is not None:
+            _publish_wellness_change(
+                db,
+                db_log,
+                "stress_level",
+                db_log.stress_level,
+                update_data.stress_level,
+            )
             db_log.stress_level = update_data.stress_level
 
         if update_data.triggers is not None:
@@ -524,9 +736,23 @@ class MentalWellnessService:
 
         # Update fields if provided
         if update_data.duration_hours is not None:
+            _publish_wellness_change(
+                db,
+                db_log,
+                "sleep_hours",
+                db_log.duration_hours,
+                update_data.duration_hours,
+            )
             db_log.duration_hours = update_data.duration_hours
 
         if update_data.quality_score is not None:
+            _publish_wellness_change(
+                db,
+                db_log,
+                "sleep_quality",
+                db_log.quality_score,
+                update_data.quality_score,
+            )
             db_log.quality_score = update_data.quality_score
 
         if update_data.notes is not None:
@@ -553,6 +779,7 @@ class MentalWellnessService:
         if not db_log:
             return False
 
+        _publish_wellness_change(db, db_log, "mood_score", db_log.mood_score, None)
         db.delete(db_log)
         db.commit()
         return True
@@ -574,6 +801,7 @@ class MentalWellnessService:
         if not db_log:
             return False
 
+        _publish_wellness_change(db, db_log, "stress_level", db_log.stress_level, None)
         db.delete(db_log)
         db.commit()
         return True
@@ -595,6 +823,10 @@ class MentalWellnessService:
         if not db_log:
             return False
 
+        _publish_wellness_change(db, db_log, "sleep_hours", db_log.duration_hours, None)
+        _publish_wellness_change(
+            db, db_log, "sleep_quality", db_log.quality_score, None
+        )
         db.delete(db_log)
         db.commit()
         return True
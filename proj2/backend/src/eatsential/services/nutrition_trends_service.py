@@ -0,0 +1,340 @@
+"""Weekly/monthly nutrition trends aggregated in the database.
+
+Period buckets are grouped from the daily_nutrition rollup (one row per local
+day), so ten years of history is at most a few thousand rows however many
+meals were logged. Where the database supports window functions the moving
+average is computed in SQL as well; otherwise the rollup rows are aggregated
+with NumPy. Meal type breakdowns use a plain GROUP BY over the meals table.
+Full meal objects are never loaded.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Literal, Optional
+
+from sqlalchemy import Date, Float, cast, func, select
+from sqlalchemy.orm import Session
+
+from ..models.models import DailyNutritionDB, MealDB
+from ..utils.timezones import get_zoneinfo
+from .daily_nutrition_service import NUTRIENT_FIELDS
+
+TrendPeriod = Literal["week", "month"]
+
+# Macro share field -> (total column, calories per gram)
+MACRO_CALORIES = {
+    "protein_pct": ("total_protein_g", 4),
+    "carbs_pct": ("total_carbs_g", 4),
+    "fat_pct": ("total_fat_g", 9),
+}
+
+# Minimum SQLite version with window function support
+SQLITE_WINDOW_FUNCTIONS_VERSION = (3, 25, 0)
+
+
+def _local_midnight_utc(local_date: date, user_tz: str) -> datetime:
+    """Return the naive UTC datetime of midnight at the start of a local date"""
+    local_midnight = datetime.combine(
+        local_date, time.min, tzinfo=get_zoneinfo(user_tz)
+    )
+    return local_midnight.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _macro_shares(bucket: dict[str, Any]) -> dict[str, Optional[float]]:
+    """Return each macro's percentage of the calories coming from macros"""
+    macro_calories = {
+        share: float(bucket[field]) * factor
+        for share, (field, factor) in MACRO_CALORIES.items()
+    }
+    total = sum(macro_calories.values())
+    return {
+        share: round(calories * 100 / total, 1) if total else None
+        for share, calories in macro_calories.items()
+    }
+
+
+def period_start_expression(db: Session, column: Any, period: TrendPeriod) -> Any:
+    """Build the SQL expression for the first day of a date column's week or month.
+
+    Weeks start on Monday (ISO weeks).
+
+    Args:
+        db: Database session (selects the dialect)
+        column: Date column or expression
+        period: "week" or "month"
+
+    Returns:
+        Date-typed SQL expression
+
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.date_trunc(period, column), Date)
+    if period == "month":
+        return func.date(column, "start of month", type_=Date)
+    # Next Sunday (or the same day), minus six days: the ISO week's Monday
+    return func.date(column, "weekday 0", "-6 days", type_=Date)
+
+
+def _rollup_filter(user_id: str, start_date: date, end_date: date) -> tuple:
+    """WHERE clauses selecting a user's non-empty rollup days in a range"""
+    return (
+        DailyNutritionDB.user_id == user_id,
+        DailyNutritionDB.local_date >= start_date,
+        DailyNutritionDB.local_date <= end_date,
+        DailyNutritionDB.meal_count > 0,
+    )
+
+
+class NutritionTrendsService:
+    """Service class for nutrition trend aggregation"""
+
+    @staticmethod
+    def supports_window_functions(db: Session) -> bool:
+        """Whether the session's database can run the SQL aggregation path.
+
+        Args:
+            db: Database session
+
+        Returns:
+            True for PostgreSQL and SQLite 3.25+
+
+        """
+        dialect = db.get_bind().dialect
+        if dialect.name == "postgresql":
+            return True
+        if dialect.name == "sqlite":
+            version = dialect.server_version_info or ()
+            return tuple(version) >= SQLITE_WINDOW_FUNCTIONS_VERSION
+        return False
+
+    @staticmethod
+    def sql_buckets(
+        db: Session,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        period: TrendPeriod,
+        window: int,
+    ) -> list[dict[str, Any]]:
+        """Aggregate period buckets with GROUP BY and a window function.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+            period: Bucket size
+            window: Number of buckets in the moving average
+
+        Returns:
+            Bucket dicts ordered by period_start
+
+        """
+        period_start = period_start_expression(db, DailyNutritionDB.local_date, period)
+        grouped = (
+            select(
+                period_start.label("period_start"),
+                func.count().label("days_logged"),
+                func.sum(DailyNutritionDB.meal_count).label("meal_count"),
+                *(
+                    func.sum(getattr(DailyNutritionDB, field)).label(field)
+                    for field in NUTRIENT_FIELDS
+                ),
+            )
+            .where(*_rollup_filter(user_id, start_date, end_date))
+            .group_by(period_start)
+            .subquery()
+        )
+        average_daily = cast(grouped.c.total_calories, Float) / grouped.c.days_logged
+        stmt = select(
+            grouped,
+            average_daily.label("average_daily_calories"),
+            func.avg(average_daily)
+            .over(order_by=grouped.c.period_start, rows=(-(window - 1), 0))
+            .label("moving_average_calories"),
+        ).order_by(grouped.c.period_start)
+
+        return [dict(row._mapping) for row in db.execute(stmt)]
+
+    @staticmethod
+    def numpy_buckets(
+        db: Session,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        period: TrendPeriod,
+        window: int,
+    ) -> list[dict[str, Any]]:
+        """Aggregate period buckets from rollup columns with NumPy.
+
+        Used when the database has no window functions. Only the rollup
+        columns are fetched (as plain tuples).
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+            period: Bucket size
+            window: Number of buckets in the moving average
+
+        Returns:
+            Bucket dicts ordered by period_start
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError(
+                "Nutrition trends on this database require NumPy "
+                "(install the 'analytics' extra)"
+            ) from e
+
+        columns = ["meal_count", *NUTRIENT_FIELDS]
+        rows = db.execute(
+            select(
+                DailyNutritionDB.local_date,
+                *(getattr(DailyNutritionDB, column) for column in columns),
+            )
+            .where(*_rollup_filter(user_id, start_date, end_date))
+            .order_by(DailyNutritionDB.local_date)
+        ).all()
+        if not rows:
+            return []
+
+        dates = np.array([row[0] for row in rows], dtype="datetime64[D]")
+        values = np.array([row[1:] for row in rows], dtype=float)
+
+        if period == "month":
+            keys = dates.astype("datetime64[M]").astype("datetime64[D]")
+        else:
+            # Day 0 (1970-01-01) was a Thursday; shift back to the Monday
+            days = dates.astype(np.int64)
+            keys = (days - (days + 3) % 7).astype("datetime64[D]")
+
+        period_starts, inverse = np.unique(keys, return_inverse=True)
+        sums = np.zeros((len(period_starts), len(columns)))
+        np.add.at(sums, inverse, values)
+        days_logged = np.bincount(inverse)
+
+        average_daily = sums[:, columns.index("total_calories")] / days_logged
+        cumulative = np.concatenate(([0.0], np.cumsum(average_daily)))
+        end = np.arange(1, len(period_starts) + 1)
+        begin = np.maximum(end - window, 0)
+        moving_average = (cumulative[end] - cumulative[begin]) / (end - begin)
+
+        return [
+            {
+                "period_start": period_starts[i].astype(object),
+                "days_logged": int(days_logged[i]),
+                **{column: sums[i, j] for j, column in enumerate(columns)},
+                "average_daily_calories": average_daily[i],
+                "moving_average_calories": moving_average[i],
+            }
+            for i in range(len(period_starts))
+        ]
+
+    @staticmethod
+    def meal_type_breakdown(
+        db: Session, user_id: str, user_tz: str, start_date: date, end_date: date
+    ) -> list[dict[str, Any]]:
+        """Sum meal totals per meal type over a local date range.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            user_tz: IANA timezone the dates are local to
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+
+        Returns:
+            Dicts with meal_type, meal_count, total_* and calorie_share (percent
+            of the range's calories), ordered by meal type
+
+        """
+        rows = db.execute(
+            select(
+                MealDB.meal_type,
+                func.count().label("meal_count"),
+                *(
+                    func.coalesce(func.sum(getattr(MealDB, field)), 0).label(field)
+                    for field in NUTRIENT_FIELDS
+                ),
+            )
+            .where(
+                MealDB.user_id == user_id,
+                MealDB.meal_time >= _local_midnight_utc(start_date, user_tz),
+                MealDB.meal_time
+                < _local_midnight_utc(end_date + timedelta(days=1), user_tz),
+            )
+            .group_by(MealDB.meal_type)
+            .order_by(MealDB.meal_type)
+        ).all()
+
+        breakdown = [
+            {
+                "meal_type": row.meal_type,
+                "meal_count": row.meal_count,
+                **{field: round(float(row[field]), 2) for field in NUTRIENT_FIELDS},
+            }
+            for row in (row._mapping for row in rows)
+        ]
+        total_calories = sum(row["total_calories"] for row in breakdown)
+        for row in breakdown:
+            row["calorie_share"] = (
+                round(row["total_calories"] * 100 / total_calories, 1)
+                if total_calories
+                else None
+            )
+        return breakdown
+
+    @staticmethod
+    def get_trends(
+        db: Session,
+        user_id: str,
+        user_tz: str,
+        start_date: date,
+        end_date: date,
+        period: TrendPeriod = "week",
+        window: int = 4,
+    ) -> dict[str, Any]:
+        """Compute period buckets, macro distribution and meal type breakdown.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            user_tz: IANA timezone the dates are local to
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+            period: "week" (ISO weeks starting Monday) or "month"
+            window: Number of buckets in the calorie moving average
+
+        Returns:
+            Dict with "buckets" and "meal_types" lists
+
+        """
+        if NutritionTrendsService.supports_window_functions(db):
+            aggregate = NutritionTrendsService.sql_buckets
+        else:
+            aggregate = NutritionTrendsService.numpy_buckets
+        buckets = aggregate(db, user_id, start_date, end_date, period, window)
+
+        for bucket in buckets:
+            for field in ("meal_count", "days_logged"):
+                bucket[field] = int(bucket[field])
+            for field in (
+                *NUTRIENT_FIELDS,
+                "average_daily_calories",
+                "moving_average_calories",
+            ):
+                bucket[field] = round(float(bucket[field] or 0), 2)
+            bucket.update(_macro_shares(bucket))
+
+        return {
+            "buckets": buckets,
+            "meal_types": NutritionTrendsService.meal_type_breakdown(
+                db, user_id, user_tz, start_date, end_date
+            ),
+        }
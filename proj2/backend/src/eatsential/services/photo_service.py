@@ -0,0 +1,190 @@
+"""Meal photo uploads and background image processing.
+
+Decoding, resizing and re-encoding images is CPU bound, so it runs in a
+process pool rather than on the request path (or in the event loop's thread
+pool, where it would hold the GIL). The upload request only streams the
+original to storage and schedules the work; the derived images appear at the
+returned URLs once processing finishes.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.models import MealDB
+from .photo_storage import PhotoStorage, StoredPhoto
+
+logger = logging.getLogger(__name__)
+
+PHOTO_WORKERS = int(os.getenv("PHOTO_WORKERS", "2"))
+
+# Longest edge of the served photo and of the thumbnail, in pixels
+PHOTO_MAX_EDGE = 2048
+THUMBNAIL_MAX_EDGE = 320
+JPEG_QUALITY = 85
+
+
+def _save_jpeg(image, path: str) -> None:
+    """Encode an image as JPEG and move it into place atomically"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    image.save(tmp_path, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    os.replace(tmp_path, path)
+
+
+def process_photo(source_path: str, photo_path: str, thumbnail_path: str) -> None:
+    """Generate the metadata-free photo and thumbnail for an original.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+
+    Args:
+        source_path: Path of the uploaded original
+        photo_path: Destination of the display-size JPEG
+        thumbnail_path: Destination of the thumbnail JPEG
+
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as original:
+        # Let the JPEG decoder downscale while decoding when it can
+        original.draft("RGB", (PHOTO_MAX_EDGE, PHOTO_MAX_EDGE))
+        # Apply the EXIF orientation before the EXIF block is dropped
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    # Keep only the colour profile: EXIF (GPS, device), XMP and comments
+    # carried over in image.info would otherwise be written back out
+    icc_profile = image.info.get("icc_profile")
+    image.info = {"icc_profile": icc_profile} if icc_profile else {}
+
+    image.thumbnail((PHOTO_MAX_EDGE, PHOTO_MAX_EDGE))
+    _save_jpeg(image, photo_path)
+    image.thumbnail((THUMBNAIL_MAX_EDGE, THUMBNAIL_MAX_EDGE))
+    _save_jpeg(image, thumbnail_path)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+# Content hashes with processing in flight, so concurrent duplicate uploads
+# schedule the work once
+_pending: set[str] = set()
+
+
+class PhotoService:
+    """Service class for meal photos"""
+
+    @staticmethod
+    def get_process_pool() -> ProcessPoolExecutor:
+        """Return the shared image processing pool, starting it on first use.
+
+        Returns:
+            Process pool with PHOTO_WORKERS workers
+
+        """
+        global _process_pool
+        with _pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(max_workers=PHOTO_WORKERS)
+            return _process_pool
+
+    @staticmethod
+    def shutdown_process_pool() -> None:
+        """Stop the image processing pool, waiting for queued work"""
+        global _process_pool
+        with _pool_lock:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=True)
+                _process_pool = None
+
+    @staticmethod
+    def schedule_processing(
+        storage: PhotoStorage, photo: StoredPhoto
+    ) -> Optional[Future]:
+        """Generate a photo's derived images in the background if needed.
+
+        Args:
+            storage: Storage holding the original
+            photo: Stored original
+
+        Returns:
+            Future for the scheduled work, or None if the derived images
+            already exist or are being generated
+
+        """
+        content_hash = photo.content_hash
+        with _pool_lock:
+            if content_hash in _pending or storage.has_variants(content_hash):
+                return None
+            _pending.add(content_hash)
+
+        def finished(future: Future) -> None:
+            with _pool_lock:
+                _pending.discard(content_hash)
+            if future.exception() is not None:
+                logger.error(
+                    "Processing photo %s failed",
+                    content_hash,
+                    exc_info=future.exception(),
+                )
+
+        try:
+            future = storage.submit_processing(photo, PhotoService.get_process_pool())
+        except Exception:
+            with _pool_lock:
+                _pending.discard(content_hash)
+            raise
+        future.add_done_callback(finished)
+        return future
+
+    @staticmethod
+    def get_meal(db: Session, user_id: str, meal_id: str) -> Optional[MealDB]:
+        """Get a user's meal without loading its food items.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            meal_id: Meal ID
+
+        Returns:
+            Meal database object or None if not found
+
+        """
+        return (
+            db.query(MealDB)
+            .filter(MealDB.id == meal_id, MealDB.user_id == user_id)
+            .first()
+        )
+
+    @staticmethod
+    def attach_photo(
+        db: Session, meal: MealDB, storage: PhotoStorage, photo: StoredPhoto
+    ) -> dict:
+        """Point a meal at a stored photo and schedule its processing.
+
+        Args:
+            db: Database session
+            meal: Meal to update
+            storage: Storage holding the photo
+            photo: Stored original
+
+        Returns:
+            Dict matching MealPhotoResponse
+
+        """
+        meal.photo_url = storage.url(photo.content_hash)
+        db.commit()
+
+        future = PhotoService.schedule_processing(storage, photo)
+        return {
+            "meal_id": meal.id,
+            "photo_url": meal.photo_url,
+            "thumbnail_url": storage.url(photo.content_hash, "thumbnail"),
+            "content_hash": photo.content_hash,
+            "content_type": photo.content_type,
+            "size_bytes": photo.size_bytes,
+            "deduplicated": photo.deduplicated,
+            "processing": future is not None and not future.done(),
+        }
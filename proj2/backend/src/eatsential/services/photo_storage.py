@@ -0,0 +1,297 @@
+"""Content-addressed storage for meal photos.
+
+Uploads are streamed to disk while being hashed, so memory use is bounded by
+the chunk size whatever the file size, and an upload is abandoned as soon as
+it exceeds the size cap. An upload is only kept if Pillow can parse it, so a
+meal never points at a photo that processing will fail on. Files are stored
+under their SHA-256 digest, which makes identical uploads share one original
+and one set of derived images.
+
+Originals keep whatever metadata the client sent (EXIF GPS tags included), so
+they are stored outside the public directory. Only the derived photo and
+thumbnail, generated by ``photo_service.process_photo`` with metadata
+stripped, are served.
+"""
+
+import hashlib
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+PHOTO_STORAGE_DIR = os.getenv("PHOTO_STORAGE_DIR", "media")
+PHOTO_MEDIA_URL = os.getenv("PHOTO_MEDIA_URL", "/media").rstrip("/")
+PHOTO_MAX_BYTES = int(os.getenv("PHOTO_MAX_BYTES", str(10 * 1024 * 1024)))
+
+PhotoVariant = Literal["photo", "thumbnail"]
+
+# Leading bytes of the accepted formats -> content type and file extension
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+)
+# Bytes needed to recognise every accepted format
+SIGNATURE_BYTES = 12
+
+
+class PhotoTooLargeError(ValueError):
+    """Raised when an upload exceeds the size cap."""
+
+    pass
+
+
+class UnsupportedImageError(ValueError):
+    """Raised when an upload is not a supported image format."""
+
+    pass
+
+
+@dataclass
+class StoredPhoto:
+    """An original photo saved in storage."""
+
+    content_hash: str
+    content_type: str
+    extension: str
+    size_bytes: int
+    deduplicated: bool = False
+
+
+def sniff_image_type(head: bytes) -> tuple[str, str]:
+    """Identify an image format from its leading bytes.
+
+    Args:
+        head: At least SIGNATURE_BYTES bytes from the start of the file
+            (fewer only if the file is shorter)
+
+    Returns:
+        Tuple of (content type, file extension)
+
+    Raises:
+        UnsupportedImageError: If the bytes are not a JPEG, PNG or WebP image
+
+    """
+    for signature, content_type, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type, extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    raise UnsupportedImageError("Photo must be a JPEG, PNG or WebP image")
+
+
+def verify_image(path: Path) -> None:
+    """Check that a file parses as an image, not just a valid signature.
+
+    Args:
+        path: File to check
+
+    Raises:
+        UnsupportedImageError: If Pillow cannot identify or verify the image
+
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            image.verify()
+    except Exception as e:
+        raise UnsupportedImageError("Photo is not a valid image") from e
+
+
+def _sharded(content_hash: str) -> str:
+    """Relative path of a hash, sharded two levels deep to keep folders small"""
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+class PhotoStorage(ABC):
+    """Storage backend for meal photos and their derived images"""
+
+    @abstractmethod
+    async def save_original(
+        self, chunks: AsyncIterable[bytes], max_bytes: int = PHOTO_MAX_BYTES
+    ) -> StoredPhoto:
+        """Stream an upload into storage under its content hash.
+
+        Args:
+            chunks: Upload body chunks
+            max_bytes: Size cap for the upload
+
+        Returns:
+            The stored original (deduplicated if it was already stored)
+
+        Raises:
+            PhotoTooLargeError: If the upload exceeds max_bytes
+            UnsupportedImageError: If the upload is not a supported image
+
+        """
+
+    @abstractmethod
+    def has_variants(self, content_hash: str) -> bool:
+        """Whether the derived photo and thumbnail already exist"""
+
+    @abstractmethod
+    def submit_processing(self, photo: StoredPhoto, executor: Executor) -> Future:
+        """Schedule generation of the derived images on an executor"""
+
+    @abstractmethod
+    def url(self, content_hash: str, variant: PhotoVariant = "photo") -> str:
+        """Public URL of a derived image"""
+
+
+class LocalPhotoStorage(PhotoStorage):
+    """Photo storage on the local filesystem.
+
+    Layout under ``root``::
+
+        originals/ab/cd/<hash>.<ext>   uploads as received (not served)
+        public/photos/ab/cd/<hash>.jpg display size, metadata stripped
+        public/thumbs/ab/cd/<hash>.jpg thumbnails
+        tmp/                           in-progress uploads
+
+    ``public`` is what the app mounts at PHOTO_MEDIA_URL.
+    """
+
+    def __init__(
+        self,
+        root: str = PHOTO_STORAGE_DIR,
+        media_url: str = PHOTO_MEDIA_URL,
+        chunk_size: int = 64 * 1024,
+    ):
+        """Initialize local storage, creating its directories.
+
+        Args:
+            root: Storage root directory
+            media_url: URL prefix the public directory is served under
+            chunk_size: Bytes buffered before each write to disk
+
+        """
+        self.root = Path(root)
+        self.public_dir = self.root / "public"
+        self.media_url = media_url.rstrip("/")
+        self.chunk_size = chunk_size
+        for directory in ("originals", "tmp", "public/photos", "public/thumbs"):
+            (self.root / directory).mkdir(parents=True, exist_ok=True)
+
+    def original_path(self, photo: StoredPhoto) -> Path:
+        """Filesystem path of a stored original"""
+        relative = f"{_sharded(photo.content_hash)}.{photo.extension}"
+        return self.root / "originals" / relative
+
+    def variant_path(self, content_hash: str, variant: PhotoVariant) -> Path:
+        """Filesystem path of a derived image"""
+        folder = "photos" if variant == "photo" else "thumbs"
+        return self.public_dir / folder / f"{_sharded(content_hash)}.jpg"
+
+    async def save_original(
+        self, chunks: AsyncIterable[bytes], max_bytes: int = PHOTO_MAX_BYTES
+    ) -> StoredPhoto:
+        """Stream an upload to a temporary file, then move it under its hash.
+
+        See PhotoStorage.save_original.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        head = b""
+        buffer = bytearray()
+        detected: Optional[tuple[str, str]] = None
+        tmp_path = self.root / "tmp" / uuid.uuid4().hex
+
+        # File I/O runs in the thread pool so disk writes do not block the
+        # event loop
+        tmp_file = await run_in_threadpool(open, tmp_path, "wb")
+        try:
+            try:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise PhotoTooLargeError(
+                            f"Photo exceeds the {max_bytes} byte limit"
+                        )
+                    if detected is None and len(head) < SIGNATURE_BYTES:
+                        head += chunk[: SIGNATURE_BYTES - len(head)]
+                        if len(head) >= SIGNATURE_BYTES:
+                            detected = sniff_image_type(head)
+                    digest.update(chunk)
+                    buffer += chunk
+                    if len(buffer) >= self.chunk_size:
+                        await run_in_threadpool(tmp_file.write, buffer)
+                        buffer.clear()
+                await run_in_threadpool(tmp_file.write, buffer)
+            finally:
+                await run_in_threadpool(tmp_file.close)
+
+            if detected is None:
+                # Shorter than a signature (or empty): sniffing rejects it
+                detected = sniff_image_type(head)
+
+            # A valid signature followed by garbage would only fail later, in
+            # background processing, after the meal already points at it
+            await run_in_threadpool(verify_image, tmp_path)
+
+            content_type, extension = detected
+            photo = StoredPhoto(
+                content_hash=digest.hexdigest(),
+                content_type=content_type,
+                extension=extension,
+                size_bytes=size,
+            )
+            photo.deduplicated = await run_in_threadpool(
+                self._move_into_place, tmp_path, self.original_path(photo)
+            )
+            return photo
+        finally:
+            await run_in_threadpool(tmp_path.unlink, missing_ok=True)
+
+    @staticmethod
+    def _move_into_place(tmp_path: Path, final_path: Path) -> bool:
+        """Move an upload under its hash; return whether it already existed"""
+        if final_path.exists():
+            return True
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, final_path)
+        return False
+
+    def has_variants(self, content_hash: str) -> bool:
+        """Whether the derived photo and thumbnail already exist"""
+        return all(
+            self.variant_path(content_hash, variant).exists()
+            for variant in ("photo", "thumbnail")
+        )
+
+    def submit_processing(self, photo: StoredPhoto, executor: Executor) -> Future:
+        """Schedule process_photo for an original on an executor"""
+        from .photo_service import process_photo
+
+        return executor.submit(
+            process_photo,
+            str(self.original_path(photo)),
+            str(self.variant_path(photo.content_hash, "photo")),
+            str(self.variant_path(photo.content_hash, "thumbnail")),
+        )
+
+    def url(self, content_hash: str, variant: PhotoVariant = "photo") -> str:
+        """Public URL of a derived image"""
+        relative = self.variant_path(content_hash, variant).relative_to(self.public_dir)
+        return f"{self.media_url}/{relative.as_posix()}"
+
+
+_storage: Optional[PhotoStorage] = None
+
+
+def get_photo_storage() -> PhotoStorage:
+    """FastAPI dependency returning the configured photo storage.
+
+    Returns:
+        The process-wide LocalPhotoStorage instance
+
+    """
+    global _storage
+    if _storage is None:
+        _storage = LocalPhotoStorage()
+    return _storage
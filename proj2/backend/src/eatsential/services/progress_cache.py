@@ -0,0 +1,166 @@
+"""Per-user cache of goal progress snapshots.
+
+Dashboards poll ``GET /api/goals/progress`` every few seconds while goals
+change far less often. Snapshots are kept per user and filter combination
+and dropped when the user's goals are written: goal CRUD and log-driven
+progress updates call ``invalidate_after_commit``, which invalidates once
+the transaction has committed, so a concurrent read cannot cache the
+pre-commit state again. Writes made by other processes are never seen by
+this in-process cache: requests pinned to the primary by read-your-writes
+bypass it, and otherwise the TTL bounds the staleness.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Seconds a snapshot is served before it is recomputed
+GOAL_PROGRESS_CACHE_SECONDS = float(os.getenv("GOAL_PROGRESS_CACHE_SECONDS", "30"))
+
+# Users whose snapshots are kept; the least recently used are evicted
+GOAL_PROGRESS_CACHE_USERS = int(os.getenv("GOAL_PROGRESS_CACHE_USERS", "10000"))
+
+PENDING_INVALIDATIONS_KEY = "pending_progress_invalidations"
+
+
+class ProgressSnapshotCache:
+    """Thread-safe LRU of per-user snapshots with a TTL.
+
+    Readers note the time before querying and pass it to ``put``. A snapshot
+    is only stored if the user was not invalidated since, and it expires
+    ``ttl_seconds`` after that start time.
+    """
+
+    def __init__(self, ttl_seconds: float, max_users: int):
+        """Create an empty cache.
+
+        Args:
+            ttl_seconds: Seconds a snapshot stays valid
+            max_users: Maximum number of users with cached snapshots
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._lock = threading.Lock()
+        # user_id -> {key: (expires_at, value)}
+        self._snapshots: OrderedDict[str, dict[Hashable, tuple[float, Any]]] = (
+            OrderedDict()
+        )
+        # user_id -> monotonic time of the last invalidation
+        self._invalidated_at: dict[str, float] = {}
+
+    def get(
+        self, user_id: str, key: Hashable, now: Optional[float] = None
+    ) -> Optional[Any]:
+        """Return a user's snapshot for a key, or None if missing or expired.
+
+        Args:
+            user_id: User ID
+            key: Snapshot key (e.g. the filters and date it was computed for)
+            now: Optional monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            Cached value or None
+
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entries = self._snapshots.get(user_id)
+            if not entries or key not in entries:
+                return None
+            expires_at, value = entries[key]
+            if expires_at <= now:
+                del entries[key]
+                return None
+            self._snapshots.move_to_end(user_id)
+            return value
+
+    def put(self, user_id: str, key: Hashable, value: Any, started_at: float) -> bool:
+        """Store a snapshot computed from a read that began at ``started_at``.
+
+        Args:
+            user_id: User ID
+            key: Snapshot key
+            value: Snapshot to store (should be immutable)
+            started_at: Monotonic time taken before the snapshot was read
+
+        Returns:
+            True if stored, False if the user was invalidated meanwhile
+
+        """
+        if self.ttl_seconds <= 0:
+            return False
+        with self._lock:
+            invalidated_at = self._invalidated_at.get(user_id)
+            if invalidated_at is not None and invalidated_at >= started_at:
+                return False
+            entries = self._snapshots.setdefault(user_id, {})
+            entries[key] = (started_at + self.ttl_seconds, value)
+            self._snapshots.move_to_end(user_id)
+            while len(self._snapshots) > self.max_users:
+                self._snapshots.popitem(last=False)
+            return True
+
+    def invalidate(self, user_ids: Iterable[str], now: Optional[float] = None) -> None:
+        """Drop the snapshots of users whose goals changed.
+
+        Args:
+            user_ids: Users to invalidate
+            now: Optional monotonic timestamp (defaults to time.monotonic())
+
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for user_id in user_ids:
+                self._snapshots.pop(user_id, None)
+                self._invalidated_at[user_id] = now
+
+            # Reads started more than a TTL ago store already expired
+            # snapshots, so older invalidations no longer matter
+            cutoff = now - self.ttl_seconds
+            for key in [k for k, ts in self._invalidated_at.items() if ts < cutoff]:
+                del self._invalidated_at[key]
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        with self._lock:
+            self._snapshots.clear()
+            self._invalidated_at.clear()
+
+
+progress_snapshots = ProgressSnapshotCache(
+    GOAL_PROGRESS_CACHE_SECONDS, GOAL_PROGRESS_CACHE_USERS
+)
+
+
+def invalidate_after_commit(db: Session, user_ids: Iterable[str]) -> None:
+    """Invalidate users' progress snapshots once the session commits.
+
+    Args:
+        db: Session the goal writes are made in
+        user_ids: Users whose goals are written
+
+    """
+    db.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Invalidate snapshots of users whose goals the transaction changed"""
+    user_ids = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+    if user_ids:
+        progress_snapshots.invalidate(user_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_invalidations(session: Session, previous_transaction: Any) -> None:
+    """Nothing changed in a rolled back transaction"""
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from ..models import AccountStatus, UserAuditLogDB, UserDB
 from ..schemas import UserCreate, UserLogin
 from ..utils.auth_util import create_access_token, get_password_hash, verify_password
+from ..utils.pagination import keyset_filter
 from .emailer import send_verification_email
 
 
@@ -254,6 +255,7 @@ def get_user_audit_logs(
     db: Session,
     target_user_id: Optional[str] = None,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> list:
     """Get audit logs for user management operations.
 
@@ -261,16 +263,27 @@ def get_user_audit_logs(
         db: Database session
         target_user_id: Optional user ID to filter logs
         limit: Maximum number of logs to return
+        cursor: Optional keyset cursor on (created_at, id) from the last page
 
     Returns:
         List of UserAuditLogDB objects
 
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+
     """
-    query = db.query(UserAuditLogDB).order_by(UserAuditLogDB.created_at.desc())
+    query = db.query(UserAuditLogDB).order_by(
+        UserAuditLogDB.created_at.desc(), UserAuditLogDB.id.desc()
+    )
 
     if target_user_id:
         query = query.filter(UserAuditLogDB.target_user_id == target_user_id)
 
+    if cursor:
+        query = query.filter(
+            keyset_filter(UserAuditLogDB.created_at, UserAuditLogDB.id, cursor)
+        )
+
     return query.limit(limit).all()
 
 
@@ -0,0 +1,350 @@
+"""Bulk import of mood, stress and sleep history from CSV or NDJSON.
+
+Records are read one line at a time and processed in chunks: each chunk is
+validated against the regular create schemas, checked against the user's
+existing logs with one query per log type (one log per type and local day),
+encrypted in one batch and bulk inserted in its own transaction. Inserts
+publish WellnessChanged events, so goal progress and the daily wellness
+rollup follow the import like any other write.
+"""
+
+import csv
+import json
+import os
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ..models.models import MoodLogDB, SleepLogDB, StressLogDB, UserDB
+from ..schemas.schemas import (
+    MoodLogCreate,
+    SleepLogCreate,
+    StressLogCreate,
+    WellnessImportError,
+    WellnessImportResponse,
+)
+from ..utils.security import encrypt_many
+from ..utils.timezones import local_dates
+from .events import WellnessChanged, publish
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# Records validated, checked and inserted per transaction
+WELLNESS_IMPORT_CHUNK_SIZE = int(os.getenv("WELLNESS_IMPORT_CHUNK_SIZE", "1000"))
+
+# Largest file accepted by POST /api/wellness/import
+WELLNESS_IMPORT_MAX_BYTES = int(
+    os.getenv("WELLNESS_IMPORT_MAX_BYTES", str(50 * 1024 * 1024))
+)
+
+# Record errors kept in the import report; every error goes to on_error
+MAX_IMPORT_ERRORS_REPORTED = 100
+
+# CSV columns; a record only needs log_type, occurred_at and its scores
+IMPORT_COLUMNS = (
+    "log_type",
+    "occurred_at",
+    "mood_score",
+    "stress_level",
+    "duration_hours",
+    "quality_score",
+    "triggers",
+    "notes",
+)
+
+# Log type -> (create schema, model, {goal/rollup metric: value column})
+IMPORT_LOG_TYPES: dict[str, tuple[type[BaseModel], type, dict[str, str]]] = {
+    "mood": (MoodLogCreate, MoodLogDB, {"mood_score": "mood_score"}),
+    "stress": (StressLogCreate, StressLogDB, {"stress_level": "stress_level"}),
+    "sleep": (
+        SleepLogCreate,
+        SleepLogDB,
+        {"sleep_hours": "duration_hours", "sleep_quality": "quality_score"},
+    ),
+}
+
+# Schema field -> encrypted column, per log type
+ENCRYPTED_IMPORT_FIELDS = {
+    "mood": {"notes": "encrypted_notes"},
+    "stress": {"triggers": "encrypted_triggers", "notes": "encrypted_notes"},
+    "sleep": {"notes": "encrypted_notes"},
+}
+
+# Line number, log type and validated record of an importable line
+ValidRecord = tuple[int, str, BaseModel]
+
+ImportErrorHandler = Callable[[WellnessImportError], None]
+
+
+def _error_messages(e: ValidationError) -> list[str]:
+    """Flatten a validation error like the meal batch endpoint does"""
+    return [
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in e.errors()
+    ]
+
+
+def read_records(
+    lines: Iterable[str], import_format: ImportFormat
+) -> Iterator[tuple[int, Optional[dict[str, Any]], Optional[str]]]:
+    """Parse import lines into raw records.
+
+    Args:
+        lines: Text lines of the file (a text file object works)
+        import_format: "csv" (with a header row) or "ndjson"
+
+    Yields:
+        (line number, record, None) for parsed lines, or
+        (line number, None, error) for lines that could not be parsed
+
+    Raises:
+        ValueError: If the CSV header lacks log_type or occurred_at
+
+    """
+    if import_format == "ndjson":
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "Each line must be a JSON object"
+                continue
+            yield line_number, record, None
+        return
+
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [column.strip() for column in header]
+    if not {"log_type", "occurred_at"} <= set(header):
+        raise ValueError("CSV header must include log_type and occurred_at")
+    for row in reader:
+        if not any(row):
+            continue
+        if len(row) != len(header):
+            yield (
+                reader.line_num,
+                None,
+                (f"Expected {len(header)} columns, got {len(row)}"),
+            )
+            continue
+        # Empty cells are missing values
+        yield (
+            reader.line_num,
+            {column: value for column, value in zip(header, row) if value != ""},
+            None,
+        )
+
+
+def _validate(
+    line_number: int, record: dict[str, Any]
+) -> tuple[Optional[ValidRecord], Optional[WellnessImportError]]:
+    """Validate a raw record against its log type's create schema"""
+    log_type = record.get("log_type")
+    if log_type not in IMPORT_LOG_TYPES:
+        return None, WellnessImportError(
+            line=line_number,
+            errors=["log_type: must be one of mood, stress, sleep"],
+        )
+    schema = IMPORT_LOG_TYPES[log_type][0]
+    try:
+        return (line_number, log_type, schema.model_validate(record)), None
+    except ValidationError as e:
+        return None, WellnessImportError(
+            line=line_number, log_type=log_type, errors=_error_messages(e)
+        )
+
+
+def _local_dates_taken(
+    db: Session,
+    user_id: str,
+    log_type: str,
+    occurred: list[datetime],
+    user_tz: str,
+) -> set[date]:
+    """Local dates of existing logs of a type around the given UTC times.
+
+    One indexed range query per chunk and log type; two days before and
+    after cover every local date the times can fall on.
+    """
+    model = IMPORT_LOG_TYPES[log_type][1]
+    taken = db.scalars(
+        select(model.occurred_at_utc).where(
+            model.user_id == user_id,
+            model.occurred_at_utc >= min(occurred) - timedelta(days=2),
+            model.occurred_at_utc <= max(occurred) + timedelta(days=2),
+        )
+    ).all()
+    return set(local_dates(taken, user_tz))
+
+
+class WellnessImportService:
+    """Service class for bulk wellness log imports"""
+
+    @staticmethod
+    def import_logs(
+        db: Session,
+        user: UserDB,
+        lines: Iterable[str],
+        import_format: ImportFormat,
+        chunk_size: int = WELLNESS_IMPORT_CHUNK_SIZE,
+        on_error: Optional[ImportErrorHandler] = None,
+        on_progress: Optional[Callable[[WellnessImportResponse], None]] = None,
+    ) -> WellnessImportResponse:
+        """Import a file of mood, stress and sleep logs for a user.
+
+        Unlike log_mood and friends, records may be on any past date. A
+        record is rejected if its log type already has a log on the same
+        local date, in the database or earlier in the file. Each chunk is
+        committed on its own, so a failure keeps the chunks before it.
+
+        Args:
+            db: Database session
+            user: User to import for (contains timezone)
+            lines: Text lines of the file
+            import_format: "csv" or "ndjson"
+            chunk_size: Records per transaction
+            on_error: Called with every rejected record
+            on_progress: Called with the running report after each chunk
+
+        Returns:
+            Import report with counts and the first rejected records
+
+        Raises:
+            ValueError: If the file cannot be read as the given format
+
+        """
+        report = WellnessImportResponse()
+        # Local dates used per log type, from the database and this file
+        taken: dict[str, set[date]] = {log_type: set() for log_type in IMPORT_LOG_TYPES}
+
+        def reject(error: WellnessImportError) -> None:
+            report.failed += 1
+            if len(report.errors) < MAX_IMPORT_ERRORS_REPORTED:
+                report.errors.append(error)
+            if on_error is not None:
+                on_error(error)
+
+        def flush(chunk: list[ValidRecord]) -> None:
+            try:
+                WellnessImportService._import_chunk(
+                    db, user, chunk, taken, reject, report
+                )
+            except Exception:
+                db.rollback()
+                raise
+            if on_progress is not None:
+                on_progress(report)
+
+        chunk: list[ValidRecord] = []
+        for line_number, record, parse_error in read_records(lines, import_format):
+            report.processed += 1
+            if record is None:
+                reject(WellnessImportError(line=line_number, errors=[parse_error]))
+                continue
+            valid, error = _validate(line_number, record)
+            if error is not None:
+                reject(error)
+                continue
+            chunk.append(valid)
+            if len(chunk) >= chunk_size:
+                flush(chunk)
+                chunk = []
+        if chunk:
+            flush(chunk)
+
+        return report
+
+    @staticmethod
+    def _import_chunk(
+        db: Session,
+        user: UserDB,
+        chunk: list[ValidRecord],
+        taken: dict[str, set[date]],
+        reject: ImportErrorHandler,
+        report: WellnessImportResponse,
+    ) -> None:
+        """Check, encrypt and insert one chunk of validated records, then commit"""
+        occurred = [
+            data.occurred_at.astimezone(timezone.utc).replace(tzinfo=None)
+            for _, _, data in chunk
+        ]
+        for log_type in {log_type for _, log_type, _ in chunk}:
+            taken[log_type] |= _local_dates_taken(
+                db,
+                user.id,
+                log_type,
+                [at for at, (_, t, _) in zip(occurred, chunk) if t == log_type],
+                user.timezone,
+            )
+
+        accepted: list[tuple[str, BaseModel, datetime]] = []
+        for (line_number, log_type, data), occurred_at_utc, local_date in zip(
+            chunk, occurred, local_dates(occurred, user.timezone)
+        ):
+            if local_date in taken[log_type]:
+                reject(
+                    WellnessImportError(
+                        line=line_number,
+                        log_type=log_type,
+                        errors=[f"A {log_type} log already exists for {local_date}"],
+                    )
+                )
+                continue
+            taken[log_type].add(local_date)
+            accepted.append((log_type, data, occurred_at_utc))
+
+        # One encryption batch for every note and trigger of the chunk
+        plaintexts = [
+            getattr(data, field)
+            for log_type, data, _ in accepted
+            for field in ENCRYPTED_IMPORT_FIELDS[log_type]
+        ]
+        encrypted = iter(encrypt_many(plaintexts))
+
+        rows: dict[str, list[dict[str, Any]]] = {
+            log_type: [] for log_type in IMPORT_LOG_TYPES
+        }
+        for log_type, data, occurred_at_utc in accepted:
+            metrics = IMPORT_LOG_TYPES[log_type][2]
+            row: dict[str, Any] = {
+                "id": str(uuid.uuid4()),
+                "user_id": user.id,
+                "occurred_at_utc": occurred_at_utc,
+            }
+            for column in metrics.values():
+                row[column] = getattr(data, column)
+            for column in ENCRYPTED_IMPORT_FIELDS[log_type].values():
+                row[column] = next(encrypted)
+            rows[log_type].append(row)
+
+            for metric, column in metrics.items():
+                publish(
+                    db,
+                    WellnessChanged(
+                        user_id=user.id,
+                        metric=metric,
+                        occurred_at_utc=occurred_at_utc,
+                        value_delta=float(row[column]),
+                        day_delta=1,
+                    ),
+                )
+
+        for log_type, type_rows in rows.items():
+            if type_rows:
+                db.execute(insert(IMPORT_LOG_TYPES[log_type][1]), type_rows)
+                report.imported += len(type_rows)
+                report.imported_by_type[log_type] = report.imported_by_type.get(
+                    log_type, 0
+                ) + len(type_rows)
+        db.commit()
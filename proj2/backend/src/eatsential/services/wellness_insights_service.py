@@ -0,0 +1,343 @@
+"""Wellness insights computed from the daily rollups.
+
+The daily_wellness and daily_nutrition rollups of a date range (at most one
+row per day each) are loaded as one value per day and metric. With NumPy
+(the 'analytics' extra) each metric becomes a dense array, NaN for days
+without data, and averages, weekly buckets, logging streaks and Pearson
+correlations are whole-array operations, so a year of history takes
+milliseconds however many logs it holds. Without NumPy the same insights
+are computed in plain Python.
+"""
+
+import math
+import statistics
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.models import DailyNutritionDB, DailyWellnessDB
+from .daily_wellness_service import WELLNESS_ROLLUP_METRICS
+
+# Metrics in the insights, in response order
+INSIGHT_METRICS = (*WELLNESS_ROLLUP_METRICS, "calories")
+
+# Metric pairs correlated by default
+CORRELATION_PAIRS = (
+    ("sleep_hours", "mood_score"),
+    ("sleep_quality", "mood_score"),
+    ("stress_level", "mood_score"),
+    ("stress_level", "calories"),
+    ("sleep_hours", "stress_level"),
+)
+
+# Days with both values needed before a correlation is reported
+MIN_CORRELATION_DAYS = 7
+
+DailyValues = dict[str, list[Optional[float]]]
+
+
+def _streaks(logged: Any) -> tuple[int, int]:
+    """Return (current, longest) runs of consecutive logged days.
+
+    The current streak may end yesterday, so it is not broken before the
+    day's log is written.
+    """
+    import numpy as np
+
+    edges = np.diff(np.concatenate(([0], logged.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return 0, 0
+    lengths = ends - starts
+    current = int(lengths[-1]) if ends[-1] >= len(logged) - 1 else 0
+    return current, int(lengths.max())
+
+
+def _pearson(x: Any, y: Any) -> tuple[Optional[float], int]:
+    """Return the correlation of two series over days with both, and the days"""
+    import numpy as np
+
+    both = ~np.isnan(x) & ~np.isnan(y)
+    days = int(both.sum())
+    if days < MIN_CORRELATION_DAYS:
+        return None, days
+    xs, ys = x[both], y[both]
+    if xs.std() == 0 or ys.std() == 0:
+        return None, days
+    return round(float(np.corrcoef(xs, ys)[0, 1]), 3), days
+
+
+def _mean(values: Any) -> Optional[float]:
+    """Mean of the non-NaN values, or None if there are none"""
+    import numpy as np
+
+    present = values[~np.isnan(values)]
+    return round(float(present.mean()), 2) if len(present) else None
+
+
+def _python_streaks(logged: list[bool]) -> tuple[int, int]:
+    """Return (current, longest) runs of consecutive logged days, like _streaks"""
+    current = longest = run = 0
+    for day, is_logged in enumerate(logged):
+        run = run + 1 if is_logged else 0
+        longest = max(longest, run)
+        if run and day >= len(logged) - 2:
+            current = run
+    return current, longest
+
+
+def _python_pearson(
+    x: list[Optional[float]], y: list[Optional[float]]
+) -> tuple[Optional[float], int]:
+    """Return the correlation over days with both values, like _pearson"""
+    pairs = [(a, b) for a, b in zip(x, y) if a is not None and b is not None]
+    days = len(pairs)
+    if days < MIN_CORRELATION_DAYS:
+        return None, days
+    xs, ys = zip(*pairs)
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    x_var = sum((a - x_mean) ** 2 for a in xs)
+    y_var = sum((b - y_mean) ** 2 for b in ys)
+    if x_var == 0 or y_var == 0:
+        return None, days
+    covariance = sum((a - x_mean) * (b - y_mean) for a, b in pairs)
+    return round(covariance / math.sqrt(x_var * y_var), 3), days
+
+
+def _python_mean(values: list[Optional[float]]) -> Optional[float]:
+    """Mean of the logged values, or None if there are none"""
+    present = [value for value in values if value is not None]
+    return round(statistics.fmean(present), 2) if present else None
+
+
+class WellnessInsightsService:
+    """Service class for wellness insights"""
+
+    @staticmethod
+    def load_daily_values(
+        db: Session, user_id: str, start_date: date, end_date: date
+    ) -> DailyValues:
+        """Load one value per day and metric from the daily rollups.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+
+        Returns:
+            Dict of metric -> list indexed by days since start_date, None
+            where nothing was logged
+
+        """
+        day_count = (end_date - start_date).days + 1
+        values: DailyValues = {metric: [None] * day_count for metric in INSIGHT_METRICS}
+
+        columns = [
+            getattr(DailyWellnessDB, f"{metric}_{part}")
+            for metric in WELLNESS_ROLLUP_METRICS
+            for part in ("sum", "count")
+        ]
+        rows = db.execute(
+            select(DailyWellnessDB.local_date, *columns).where(
+                DailyWellnessDB.user_id == user_id,
+                DailyWellnessDB.local_date >= start_date,
+                DailyWellnessDB.local_date <= end_date,
+            )
+        ).all()
+        for local_date, *totals in rows:
+            day = (local_date - start_date).days
+            for i, metric in enumerate(WELLNESS_ROLLUP_METRICS):
+                total, count = totals[2 * i], totals[2 * i + 1]
+                if count:
+                    values[metric][day] = float(total) / count
+
+        rows = db.execute(
+            select(DailyNutritionDB.local_date, DailyNutritionDB.total_calories).where(
+                DailyNutritionDB.user_id == user_id,
+                DailyNutritionDB.local_date >= start_date,
+                DailyNutritionDB.local_date <= end_date,
+                DailyNutritionDB.meal_count > 0,
+            )
+        ).all()
+        for local_date, calories in rows:
+            values["calories"][(local_date - start_date).days] = float(calories)
+
+        return values
+
+    @staticmethod
+    def numpy_insights(
+        values: DailyValues, start_date: date, window: int
+    ) -> dict[str, Any]:
+        """Compute the insights of daily values as NumPy array operations.
+
+        Args:
+            values: Daily values from load_daily_values
+            start_date: Local date of the first value
+            window: Days in the trailing rolling average
+
+        Returns:
+            Dict with "metrics", "weeks" and "correlations" lists
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise RuntimeError(
+                "Wellness insights require NumPy (install the 'analytics' extra)"
+            ) from e
+
+        # None becomes NaN
+        series = {metric: np.array(values[metric], dtype=float) for metric in values}
+
+        metrics = []
+        for metric in INSIGHT_METRICS:
+            daily = series[metric]
+            logged = ~np.isnan(daily)
+            current_streak, longest_streak = _streaks(logged)
+            metrics.append(
+                {
+                    "metric": metric,
+                    "days_logged": int(logged.sum()),
+                    "average": _mean(daily),
+                    "rolling_average": _mean(daily[-window:]),
+                    "current_streak": current_streak,
+                    "longest_streak": longest_streak,
+                }
+            )
+
+        # ISO weeks: day 0 (1970-01-01) was a Thursday
+        days = np.arange(len(series["calories"])) + (
+            np.datetime64(start_date, "D").astype(np.int64)
+        )
+        week_starts = days - (days + 3) % 7
+        week_keys, inverse = np.unique(week_starts, return_inverse=True)
+        weeks = [
+            {"week_start": week_start}
+            for week_start in week_keys.astype("datetime64[D]").tolist()
+        ]
+        for metric in INSIGHT_METRICS:
+            daily = series[metric]
+            logged = ~np.isnan(daily)
+            sums = np.bincount(inverse, weights=np.where(logged, daily, 0))
+            counts = np.bincount(inverse, weights=logged)
+            for i, week in enumerate(weeks):
+                week[metric] = round(sums[i] / counts[i], 2) if counts[i] else None
+        weeks = [
+            week
+            for week in weeks
+            if any(week[metric] is not None for metric in INSIGHT_METRICS)
+        ]
+
+        correlations = []
+        for first, second in CORRELATION_PAIRS:
+            coefficient, days_compared = _pearson(series[first], series[second])
+            correlations.append(
+                {
+                    "metric_x": first,
+                    "metric_y": second,
+                    "coefficient": coefficient,
+                    "days": days_compared,
+                }
+            )
+
+        return {"metrics": metrics, "weeks": weeks, "correlations": correlations}
+
+    @staticmethod
+    def python_insights(
+        values: DailyValues, start_date: date, window: int
+    ) -> dict[str, Any]:
+        """Compute the same insights as numpy_insights in plain Python.
+
+        Args:
+            values: Daily values from load_daily_values
+            start_date: Local date of the first value
+            window: Days in the trailing rolling average
+
+        Returns:
+            Dict with "metrics", "weeks" and "correlations" lists
+
+        """
+        metrics = []
+        for metric in INSIGHT_METRICS:
+            daily = values[metric]
+            logged = [value is not None for value in daily]
+            current_streak, longest_streak = _python_streaks(logged)
+            metrics.append(
+                {
+                    "metric": metric,
+                    "days_logged": sum(logged),
+                    "average": _python_mean(daily),
+                    "rolling_average": _python_mean(daily[-window:]),
+                    "current_streak": current_streak,
+                    "longest_streak": longest_streak,
+                }
+            )
+
+        # ISO weeks start on Monday
+        week_days: dict[date, list[int]] = {}
+        for day in range(len(values["calories"])):
+            local_date = start_date + timedelta(days=day)
+            week_start = local_date - timedelta(days=local_date.weekday())
+            week_days.setdefault(week_start, []).append(day)
+        weeks = []
+        for week_start, days in week_days.items():
+            week: dict[str, Any] = {"week_start": week_start}
+            for metric in INSIGHT_METRICS:
+                logged = [values[metric][day] for day in days]
+                logged = [value for value in logged if value is not None]
+                week[metric] = round(sum(logged) / len(logged), 2) if logged else None
+            if any(week[metric] is not None for metric in INSIGHT_METRICS):
+                weeks.append(week)
+
+        correlations = []
+        for first, second in CORRELATION_PAIRS:
+            coefficient, days_compared = _python_pearson(values[first], values[second])
+            correlations.append(
+                {
+                    "metric_x": first,
+                    "metric_y": second,
+                    "coefficient": coefficient,
+                    "days": days_compared,
+                }
+            )
+
+        return {"metrics": metrics, "weeks": weeks, "correlations": correlations}
+
+    @staticmethod
+    def get_insights(
+        db: Session,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        window: int = 7,
+    ) -> dict[str, Any]:
+        """Compute averages, streaks, weekly buckets and correlations.
+
+        Uses NumPy when it is installed and plain Python otherwise.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First local date (inclusive)
+            end_date: Last local date (inclusive)
+            window: Days in the trailing rolling average
+
+        Returns:
+            Dict with "metrics", "weeks" and "correlations" lists
+
+        """
+        values = WellnessInsightsService.load_daily_values(
+            db, user_id, start_date, end_date
+        )
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return WellnessInsightsService.python_insights(values, start_date, window)
+        return WellnessInsightsService.numpy_insights(values, start_date, window)
@@ -0,0 +1,127 @@
+"""Opaque cursor helpers for keyset pagination.
+
+A cursor encodes the sort key and ID of the last row on a page. The next page
+is fetched with ``WHERE (sort_key, id) < (:sort_key, :id)`` (or ``>`` for
+ascending order), so deep pages cost the same as the first page instead of
+scanning and discarding every skipped row as OFFSET does.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Response header carrying the next cursor for endpoints that return a bare list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+def encode_cursor(sort_value: Any, row_id: str) -> str:
+    """Encode the sort key and ID of a row as an opaque cursor.
+
+    Args:
+        sort_value: Value of the sort column (datetime or string)
+        row_id: Primary key of the row
+
+    Returns:
+        URL-safe cursor string
+
+    """
+    if isinstance(sort_value, datetime):
+        payload = {"t": "dt", "v": sort_value.isoformat(), "id": row_id}
+    else:
+        payload = {"t": "str", "v": str(sort_value), "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["v"]
+        if payload["t"] == "dt":
+            value = datetime.fromisoformat(value)
+        return value, str(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def keyset_filter(
+    sort_column: Any, id_column: Any, cursor: str, descending: bool = True
+) -> ColumnElement[bool]:
+    """Build the WHERE clause selecting rows after a cursor.
+
+    Args:
+        sort_column: Column the page is ordered by
+        id_column: Primary key column used as tie-breaker
+        cursor: Cursor of the last row on the previous page
+        descending: Whether the page is ordered newest/largest first
+
+    Returns:
+        SQLAlchemy boolean expression
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    # The redundant bound on the sort column lets the planner seek the
+    # (..., sort column, id) index to the cursor instead of filtering a scan
+    if descending:
+        return and_(
+            sort_column <= sort_value,
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id),
+            ),
+        )
+    return and_(
+        sort_column >= sort_value,
+        or_(
+            sort_column > sort_value,
+            and_(sort_column == sort_value, id_column > row_id),
+        ),
+    )
+
+
+def next_cursor(
+    items: list, has_more: bool, sort_attr: str, id_attr: str = "id"
+) -> Optional[str]:
+    """Return the cursor for the page after ``items``.
+
+    Args:
+        items: Rows on the current page
+        has_more: Whether rows exist beyond this page
+        sort_attr: Attribute name of the sort key
+        id_attr: Attribute name of the primary key
+
+    Returns:
+        Cursor string, or None when there are no more rows
+
+    """
+    if not items or not has_more:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
@@ -2,16 +2,34 @@
 
 This module provides AES-256 encryption/decryption for sensitive mental wellness data.
 The encryption key is managed via environment variable ENCRYPTION_KEY.
+
+Deriving the key takes 100,000 PBKDF2 rounds, so one cipher is kept per secret
+and shared by all calls. Lists of values are encrypted with encrypt_many and
+decrypted with decrypt_many, which spread large batches over a thread pool:
+the cryptography library releases the GIL while it runs the cipher.
 """
 
 import base64
 import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# Threads used by encrypt_many and decrypt_many for large batches
+DECRYPT_WORKERS = int(os.getenv("DECRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Smallest batch encrypt_many and decrypt_many spread over the thread pool
+DECRYPT_PARALLEL_THRESHOLD = int(os.getenv("DECRYPT_PARALLEL_THRESHOLD", "256"))
+
+_decrypt_pool: Optional[ThreadPoolExecutor] = None
+_decrypt_pool_lock = threading.Lock()
+
 
 class EncryptionError(Exception):
     """Exception raised for encryption-related errors."""
@@ -25,6 +43,25 @@ class DecryptionError(Exception):
     pass
 
 
+class EncryptedValue(str):
+    """Ciphertext read from an encrypted column, decrypted on first use.
+
+    It is the ciphertext string itself, so it can be stored, compared and
+    passed to decrypt_sensitive_data like any other; ``plaintext`` decrypts
+    it once and keeps the result.
+    """
+
+    @cached_property
+    def plaintext(self) -> Optional[str]:
+        """The decrypted text
+
+        Raises:
+            DecryptionError: If decryption fails
+
+        """
+        return decrypt_sensitive_data(str(self))
+
+
 def _get_encryption_key() -> bytes:
     """Get or generate encryption key from environment variable.
 
@@ -41,7 +78,20 @@ def _get_encryption_key() -> bytes:
             "ENCRYPTION_KEY environment variable not set. "
             "Please set it to a secure random string."
         )
+    return _derive_key(secret_key)
+
 
+@lru_cache(maxsize=4)
+def _derive_key(secret_key: str) -> bytes:
+    """Derive a Fernet key from a secret, once per secret.
+
+    Args:
+        secret_key: Value of ENCRYPTION_KEY
+
+    Returns:
+        bytes: The derived encryption key
+
+    """
     # Use PBKDF2 to derive a proper Fernet key from the secret
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -53,6 +103,25 @@ def _get_encryption_key() -> bytes:
     return key
 
 
+@lru_cache(maxsize=4)
+def _fernet_for_key(key: bytes) -> Fernet:
+    """Get the shared cipher for a derived key"""
+    return Fernet(key)
+
+
+def _get_fernet() -> Fernet:
+    """Get the cipher for the current ENCRYPTION_KEY.
+
+    Returns:
+        Fernet: Cipher shared by all calls with the same key
+
+    Raises:
+        EncryptionError: If ENCRYPTION_KEY environment variable is not set
+
+    """
+    return _fernet_for_key(_get_encryption_key())
+
+
 def encrypt_sensitive_data(plaintext: Optional[str]) -> Optional[str]:
     """Encrypt sensitive data using AES-256 (via Fernet).
 
@@ -74,8 +143,7 @@ def encrypt_sensitive_data(plaintext: Optional[str]) -> Optional[str]:
         return None
 
     try:
-        key = _get_encryption_key()
-        fernet = Fernet(key)
+        fernet = _get_fernet()
         encrypted_bytes = fernet.encrypt(plaintext.encode("utf-8"))
         return encrypted_bytes.decode("utf-8")
     except Exception as e:
@@ -101,10 +169,38 @@ def decrypt_sensitive_data(encrypted_text: Optional[str]) -> Optional[str]:
     """
     if not encrypted_text:
         return None
+    if isinstance(encrypted_text, EncryptedValue):
+        return encrypted_text.plaintext
+
+    try:
+        fernet = _get_fernet()
+    except Exception as e:
+        raise DecryptionError(f"Failed to decrypt data: {e!s}") from e
+    return _decrypt_with(fernet, encrypted_text)
+
+
+def _decrypt_with(fernet: Fernet, encrypted_text: Optional[str]) -> Optional[str]:
+    """Decrypt one value with a given cipher.
+
+    Args:
+        fernet: Cipher to decrypt with
+        encrypted_text: The encrypted text. Can be None or empty.
+
+    Returns:
+        str: The decrypted plain text, or None if input is None/empty
+
+    Raises:
+        DecryptionError: If decryption fails
+
+    """
+    if not encrypted_text:
+        return None
+    if isinstance(encrypted_text, EncryptedValue):
+        if "plaintext" not in encrypted_text.__dict__:
+            encrypted_text.plaintext = _decrypt_with(fernet, str(encrypted_text))
+        return encrypted_text.plaintext
 
     try:
-        key = _get_encryption_key()
-        fernet = Fernet(key)
         decrypted_bytes = fernet.decrypt(encrypted_text.encode("utf-8"))
         return decrypted_bytes.decode("utf-8")
     except InvalidToken as e:
@@ -113,6 +209,137 @@ def decrypt_sensitive_data(encrypted_text: Optional[str]) -> Optional[str]:
         raise DecryptionError(f"Failed to decrypt data: {e!s}") from e
 
 
+def _encrypt_chunk(
+    fernet: Fernet, plaintexts: Sequence[Optional[str]]
+) -> list[Optional[str]]:
+    """Encrypt a slice of a batch in one pool task"""
+    return [
+        fernet.encrypt(text.encode("utf-8")).decode("utf-8") if text else None
+        for text in plaintexts
+    ]
+
+
+def _decrypt_chunk(
+    fernet: Fernet, encrypted_texts: Sequence[Optional[str]]
+) -> list[Optional[str]]:
+    """Decrypt a slice of a batch in one pool task"""
+    return [_decrypt_with(fernet, text) for text in encrypted_texts]
+
+
+def _get_decrypt_pool() -> ThreadPoolExecutor:
+    """Return the shared decryption pool, starting it on first use"""
+    global _decrypt_pool
+    with _decrypt_pool_lock:
+        if _decrypt_pool is None:
+            _decrypt_pool = ThreadPoolExecutor(
+                max_workers=DECRYPT_WORKERS, thread_name_prefix="decrypt"
+            )
+        return _decrypt_pool
+
+
+def shutdown_decrypt_pool() -> None:
+    """Stop the decryption pool, waiting for queued work"""
+    global _decrypt_pool
+    with _decrypt_pool_lock:
+        if _decrypt_pool is not None:
+            _decrypt_pool.shutdown(wait=True)
+            _decrypt_pool = None
+
+
+def decrypt_many(
+    encrypted_texts: Sequence[Optional[str]],
+    parallel_threshold: int = DECRYPT_PARALLEL_THRESHOLD,
+) -> list[Optional[str]]:
+    """Decrypt a batch of values encrypted with encrypt_sensitive_data.
+
+    All values share one cipher, and EncryptedValue entries keep their
+    plaintext for later reads. Batches of at least ``parallel_threshold``
+    values are split into one chunk per worker thread; smaller ones are
+    decrypted in the calling thread, where the pool would only add overhead.
+
+    Args:
+        encrypted_texts: Encrypted texts; None or empty entries are allowed
+        parallel_threshold: Smallest batch decrypted on the thread pool
+
+    Returns:
+        list: Decrypted texts in input order, None for None/empty entries
+
+    Raises:
+        DecryptionError: If any value fails to decrypt
+
+    Example:
+        >>> notes, triggers = decrypt_many([notes_text, triggers_text])
+
+    """
+    if not any(encrypted_texts):
+        return [None] * len(encrypted_texts)
+
+    try:
+        fernet = _get_fernet()
+    except Exception as e:
+        raise DecryptionError(f"Failed to decrypt data: {e!s}") from e
+
+    if DECRYPT_WORKERS <= 1 or len(encrypted_texts) < parallel_threshold:
+        return _decrypt_chunk(fernet, encrypted_texts)
+
+    chunk_size = -(-len(encrypted_texts) // DECRYPT_WORKERS)
+    chunks = [
+        encrypted_texts[start : start + chunk_size]
+        for start in range(0, len(encrypted_texts), chunk_size)
+    ]
+    pool = _get_decrypt_pool()
+    decrypted: list[Optional[str]] = []
+    for part in pool.map(_decrypt_chunk, [fernet] * len(chunks), chunks):
+        decrypted.extend(part)
+    return decrypted
+
+
+def encrypt_many(
+    plaintexts: Sequence[Optional[str]],
+    parallel_threshold: int = DECRYPT_PARALLEL_THRESHOLD,
+) -> list[Optional[str]]:
+    """Encrypt a batch of values like encrypt_sensitive_data.
+
+    Splits batches of at least ``parallel_threshold`` values over the
+    worker threads, as decrypt_many does.
+
+    Args:
+        plaintexts: Plain texts; None or empty entries are allowed
+        parallel_threshold: Smallest batch encrypted on the thread pool
+
+    Returns:
+        list: Encrypted texts in input order, None for None/empty entries
+
+    Raises:
+        EncryptionError: If encryption fails
+
+    Example:
+        >>> encrypted_notes = encrypt_many([log.notes for log in logs])
+
+    """
+    if not any(plaintexts):
+        return [None] * len(plaintexts)
+
+    try:
+        fernet = _get_fernet()
+        if DECRYPT_WORKERS <= 1 or len(plaintexts) < parallel_threshold:
+            return _encrypt_chunk(fernet, plaintexts)
+
+        chunk_size = -(-len(plaintexts) // DECRYPT_WORKERS)
+        chunks = [
+            plaintexts[start : start + chunk_size]
+            for start in range(0, len(plaintexts), chunk_size)
+        ]
+        encrypted: list[Optional[str]] = []
+        for part in _get_decrypt_pool().map(
+            _encrypt_chunk, [fernet] * len(chunks), chunks
+        ):
+            encrypted.extend(part)
+        return encrypted
+    except Exception as e:
+        raise EncryptionError(f"Failed to encrypt data: {e!s}") from e
+
+
 def generate_encryption_key() -> str:
     """Generate a new random encryption key for ENCRYPTION_KEY environment variable.
 
@@ -0,0 +1,68 @@
+"""Sparse fieldset helpers for list endpoints.
+
+Clients pass ``fields=id,meal_time,total_calories`` to receive only those
+keys for each item. Services then load only the matching columns (and skip
+relationship loads that were not requested), which cuts database I/O,
+serialization time and payload size for list views.
+"""
+
+from collections.abc import Collection, Iterable, Mapping
+from typing import Optional
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a fields parameter names unknown fields."""
+
+    pass
+
+
+def parse_fields(
+    fields: Optional[str], allowed: Iterable[str], always: Collection[str] = ("id",)
+) -> Optional[list[str]]:
+    """Parse a comma-separated ``fields`` query parameter.
+
+    Args:
+        fields: Raw parameter value, or None when not given
+        allowed: Field names of the full response item, in response order
+        always: Fields included even when not requested (e.g. cursor keys)
+
+    Returns:
+        Requested fields in response order, or None for the full response
+
+    Raises:
+        InvalidFieldsError: If a requested field is not allowed
+
+    """
+    if fields is None:
+        return None
+
+    allowed = list(allowed)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise InvalidFieldsError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(allowed)}"
+        )
+
+    requested.update(always)
+    return [field for field in allowed if field in requested]
+
+
+def required_columns(
+    fields: Iterable[str], derived: Mapping[str, Collection[str]]
+) -> set[str]:
+    """Map response fields to the model attributes needed to build them.
+
+    Args:
+        fields: Requested response fields
+        derived: Computed fields mapped to the attributes they are derived from
+
+    Returns:
+        Model attribute names to load
+
+    """
+    columns: set[str] = set()
+    for field in fields:
+        columns.update(derived.get(field, (field,)))
+    return columns
@@ -0,0 +1,185 @@
+"""Conversion of UTC timestamps to local dates in users' timezones.
+
+ZoneInfo objects are kept in a bounded cache, so hot paths do not look the
+zone up again for every timestamp. Batches (rollup rebuilds, imports,
+reconciliation) go through local_dates, which with NumPy converts them as
+arrays: each zone's UTC offset is constant between transitions, so a
+per-year table of transition instants and a binary search give the offset
+of every timestamp at once. The tables are built from ZoneInfo itself and
+match ``datetime.astimezone`` exactly, including across DST changes.
+"""
+
+import calendar
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Union
+from zoneinfo import ZoneInfo
+
+# Timezones kept in the ZoneInfo cache
+ZONEINFO_CACHE_SIZE = int(os.getenv("ZONEINFO_CACHE_SIZE", "512"))
+
+# Smallest batch converted with NumPy; smaller ones loop over astimezone
+VECTORIZE_THRESHOLD = 64
+
+# Widest range of UTC years converted with transition tables
+MAX_TABLE_YEARS = 200
+
+# Offsets are sampled this far apart when a year is searched for
+# transitions; no zone changes its offset twice within this span
+TRANSITION_SCAN_SECONDS = 6 * 3600
+
+SECONDS_PER_DAY = 86400
+
+# Naive UTC epoch; subtracting it is much faster than a datetime64 cast
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_ONE_SECOND = timedelta(seconds=1)
+
+
+@lru_cache(maxsize=ZONEINFO_CACHE_SIZE)
+def get_zoneinfo(name: str) -> ZoneInfo:
+    """Return the (cached) ZoneInfo of an IANA timezone name.
+
+    Raises:
+        ZoneInfoNotFoundError: If the timezone does not exist
+
+    """
+    return ZoneInfo(name)
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    """Naive UTC datetime of a naive (UTC) or aware datetime"""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def get_local_date(dt_utc: datetime, user_tz: str) -> date:
+    """Convert UTC datetime to local date in user's timezone.
+
+    Args:
+        dt_utc: Datetime in UTC (naive or aware)
+        user_tz: IANA timezone string (e.g., "America/New_York")
+
+    Returns:
+        Local date in user's timezone
+
+    """
+    # Ensure dt_utc is timezone-aware UTC
+    if dt_utc.tzinfo is None:
+        dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+    else:
+        dt_utc = dt_utc.astimezone(timezone.utc)
+
+    return dt_utc.astimezone(get_zoneinfo(user_tz)).date()
+
+
+def _offset_at(tz: ZoneInfo, timestamp: int) -> int:
+    """UTC offset in seconds of a zone at a POSIX timestamp"""
+    return int(datetime.fromtimestamp(timestamp, tz).utcoffset().total_seconds())
+
+
+@lru_cache(maxsize=ZONEINFO_CACHE_SIZE * 4)
+def _year_transitions(name: str, year: int) -> tuple[list[int], list[int]]:
+    """Constant-offset spans of a zone within one UTC calendar year.
+
+    Returns:
+        (start timestamps, offsets in seconds); the first span starts at
+        the beginning of the year
+
+    """
+    tz = get_zoneinfo(name)
+    end = calendar.timegm((year + 1, 1, 1, 0, 0, 0))
+    starts = [calendar.timegm((year, 1, 1, 0, 0, 0))]
+    offsets = [_offset_at(tz, starts[0])]
+
+    scanned = starts[0]
+    while scanned < end:
+        probe = min(scanned + TRANSITION_SCAN_SECONDS, end)
+        if _offset_at(tz, probe) == offsets[-1]:
+            scanned = probe
+            continue
+        # Binary search for the first second with the new offset
+        low, high = scanned, probe
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _offset_at(tz, middle) == offsets[-1]:
+                low = middle
+            else:
+                high = middle
+        starts.append(high)
+        offsets.append(_offset_at(tz, high))
+        scanned = high
+
+    return starts, offsets
+
+
+def _vectorized_local_dates(
+    np: Any, datetimes: list[datetime], name: str
+) -> list[date]:
+    """Local dates of naive UTC datetimes via a zone's transition table"""
+    seconds = np.array([(dt - _EPOCH) // _ONE_SECOND for dt in datetimes], np.int64)
+
+    first_year, last_year = (
+        datetime.fromtimestamp(int(bound), timezone.utc).year
+        for bound in (seconds.min(), seconds.max())
+    )
+    if last_year - first_year >= MAX_TABLE_YEARS:
+        return [get_local_date(dt, name) for dt in datetimes]
+
+    starts: list[int] = []
+    offsets: list[int] = []
+    for year in range(first_year, last_year + 1):
+        year_starts, year_offsets = _year_transitions(name, year)
+        starts.extend(year_starts)
+        offsets.extend(year_offsets)
+
+    span = np.searchsorted(np.array(starts), seconds, side="right") - 1
+    local_seconds = seconds + np.array(offsets)[span]
+    ordinals = np.floor_divide(local_seconds, SECONDS_PER_DAY) + _EPOCH_ORDINAL
+    return list(map(date.fromordinal, ordinals.tolist()))
+
+
+def local_dates(
+    datetimes: Iterable[datetime], timezones: Union[str, Sequence[str]]
+) -> list[date]:
+    """Convert many UTC datetimes to local dates.
+
+    Gives the same dates as get_local_date for each value. Batches of at
+    least VECTORIZE_THRESHOLD values per zone are converted with NumPy when
+    it is installed.
+
+    Args:
+        datetimes: Datetimes in UTC (naive or aware)
+        timezones: One IANA timezone for all values, or one per value
+
+    Returns:
+        Local dates in input order
+
+    """
+    values = [_naive_utc(dt) for dt in datetimes]
+    if isinstance(timezones, str):
+        groups: dict[str, list[int]] = {timezones: list(range(len(values)))}
+    else:
+        groups = defaultdict(list)
+        for index, name in enumerate(timezones):
+            groups[name].append(index)
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    result: list[date] = [date.min] * len(values)
+    for name, indices in groups.items():
+        group = [values[index] for index in indices]
+        if np is not None and len(group) >= VECTORIZE_THRESHOLD:
+            converted = _vectorized_local_dates(np, group, name)
+        else:
+            converted = [get_local_date(dt, name) for dt in group]
+        for index, local_date in zip(indices, converted):
+            result[index] = local_date
+    return result
@@ -1,11 +1,15 @@
 """Test configuration and fixtures"""
 
 import os
+import struct
+import zlib
 
 # Set test mode to disable rate limiting
 os.environ["TEST_MODE"] = "true"
 # Set encryption key for mental wellness tests
 os.environ["ENCRYPTION_KEY"] = "test_encryption_key_for_unit_testing_only_12345678"
+# Keep the goal status worker from running against the default database
+os.environ["GOAL_STATUS_INTERVAL_SECONDS"] = "0"
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -14,6 +18,7 @@ from sqlalchemy.pool import StaticPool
 
 from src.eatsential.db.database import Base, get_db
 from src.eatsential.index import app
+from src.eatsential.services.progress_cache import progress_snapshots
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite://"
@@ -43,6 +48,14 @@ def db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_progress_snapshots():
+    """Start each test without goal progress cached by earlier tests"""
+    progress_snapshots.clear()
+    yield
+    progress_snapshots.clear()
+
+
 @pytest.fixture(scope="function")
 def client(db):
     """Create a test client using the test database"""
@@ -73,3 +86,39 @@ def mock_send_email(monkeypatch):
     )
 
     return sent_emails
+
+
+@pytest.fixture
+def query_budget():
+    """Assert that a response stayed within a SQL statement budget.
+
+    Uses the X-DB-Query-Count header set by QueryCounterMiddleware.
+    """
+
+    def check(response, max_queries: int) -> int:
+        count = int(response.headers["X-DB-Query-Count"])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} issued "
+            f"{count} SQL statements (budget {max_queries})"
+        )
+        return count
+
+    return check
+
+
+@pytest.fixture
+def png_image() -> bytes:
+    """Build a valid 1x1 RGB PNG without an imaging library."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00\xff\x00\x00")  # filter byte + one red pixel
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", pixels)
+        + chunk(b"IEND", b"")
+    )
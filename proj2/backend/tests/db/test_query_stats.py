@@ -0,0 +1,248 @@
+"""Tests for per-request SQL statement counting and N+1 detection."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.eatsential.db import query_stats
+from src.eatsential.db.query_stats import (
+    RepeatedQueryError,
+    statement_shape,
+    track_queries,
+)
+from src.eatsential.middleware.query_counter import QueryCounterMiddleware
+from src.eatsential.models.models import MealType, UserDB, UserRole
+from src.eatsential.schemas.schemas import MealCreate, MealFoodItemCreate
+from src.eatsential.services.meal_service import MealService
+from src.eatsential.utils.auth_util import create_access_token
+
+
+@pytest.fixture
+def stats_user(db: Session) -> UserDB:
+    """Create a user for query counting tests."""
+    user = UserDB(
+        id="query_stats_user",
+        email="query_stats@example.com",
+        username="query_stats",
+        password_hash="hashed_password",
+        email_verified=True,
+        timezone="UTC",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@pytest.fixture
+def stats_headers(stats_user: UserDB) -> dict[str, str]:
+    """Get authentication headers for the query counting user."""
+    token = create_access_token(data={"sub": stats_user.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_meals(db: Session, user_id: str, count: int) -> None:
+    for i in range(count):
+        MealService.create_meal(
+            db,
+            user_id,
+            MealCreate(
+                meal_type=MealType.SNACK,
+                meal_time=datetime.now() - timedelta(hours=i + 1),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name=f"Snack {i}",
+                        portion_size=1.0,
+                        portion_unit="item",
+                        calories=100,
+                    )
+                ],
+            ),
+        )
+
+
+class TestStatementShape:
+    """Tests for statement normalization"""
+
+    def test_collapses_whitespace(self):
+        """Whitespace differences do not create new shapes"""
+        assert statement_shape("SELECT  *\n FROM meals") == "SELECT * FROM meals"
+
+    def test_collapses_in_lists(self):
+        """Expanded IN lists of different sizes share a shape"""
+        assert statement_shape("SELECT * FROM t WHERE id IN (?, ?)") == (
+            statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?, ?)")
+        )
+
+
+class TestQueryCounterMiddleware:
+    """Tests for the query count headers and endpoint budgets"""
+
+    def test_headers_present(self, client: TestClient, stats_headers, db):
+        """Responses carry query count and DB time headers"""
+        response = client.get("/api/meals", headers=stats_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert int(response.headers["X-DB-Query-Count"]) >= 1
+        assert float(response.headers["X-DB-Query-Time-Ms"]) >= 0
+
+    def test_meal_list_has_no_n_plus_one(
+        self, client: TestClient, stats_user, stats_headers, db, query_budget
+    ):
+        """Listing meals uses a fixed number of statements regardless of size"""
+        _create_meals(db, stats_user.id, 10)
+
+        response = client.get("/api/meals", headers=stats_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["meals"]) == 10
+        # user lookup, meal page, food items (no COUNT without include_total)
+        query_budget(response, 3)
+
+    def test_create_mood_log_reuses_current_user(
+        self, client: TestClient, stats_headers, db, query_budget
+    ):
+        """Creating a mood log does not query the user a second time"""
+        response = client.post(
+            "/api/wellness/mood-logs",
+            json={
+                "occurred_at": datetime.now(timezone.utc).isoformat(),
+                "mood_score": 7,
+            },
+            headers=stats_headers,
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        # user lookup, duplicate check, insert, tracked goals lookup,
+        # daily wellness upsert, refresh
+        query_budget(response, 6)
+
+    def test_endpoint_metrics_recorded(self, client: TestClient, stats_headers, db):
+        """Per-endpoint metrics are grouped by route template"""
+        query_stats.endpoint_metrics.clear()
+
+        client.get("/api/meals/missing-id", headers=stats_headers)
+
+        metrics = query_stats.endpoint_metrics["GET /api/meals/{meal_id}"]
+        assert metrics.requests == 1
+        assert metrics.queries >= 1
+
+    def test_unmatched_paths_share_one_metrics_key(self, client: TestClient):
+        """Requests no route matches are not keyed by their raw path"""
+        query_stats.endpoint_metrics.clear()
+
+        for i in range(3):
+            client.get(f"/no-such-page-{i}")
+
+        assert list(query_stats.endpoint_metrics) == ["GET <unmatched>"]
+        assert query_stats.endpoint_metrics["GET <unmatched>"].requests == 3
+
+    def test_streamed_queries_are_recorded(self, db: Session):
+        """Metrics include statements a streamed body issues after the headers"""
+        app = FastAPI()
+        app.add_middleware(QueryCounterMiddleware)
+
+        @app.get("/stream")
+        def stream():
+            def body():
+                yield b"first chunk, sent after the headers\n"
+                with db.get_bind().connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                yield b"second chunk\n"
+
+            return StreamingResponse(body())
+
+        query_stats.endpoint_metrics.clear()
+        response = TestClient(app).get("/stream")
+
+        assert response.headers["X-DB-Query-Count"] == "0"
+        assert query_stats.endpoint_metrics["GET /stream"].queries == 1
+
+    def test_admin_reads_endpoint_metrics(
+        self, client: TestClient, stats_user, stats_headers, db
+    ):
+        """Admins can read the per-endpoint metrics; other users cannot"""
+        query_stats.endpoint_metrics.clear()
+        client.get("/api/meals", headers=stats_headers)
+
+        response = client.get("/api/users/admin/query-metrics", headers=stats_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        stats_user.role = UserRole.ADMIN
+        db.commit()
+        response = client.get("/api/users/admin/query-metrics", headers=stats_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        metrics = {m["endpoint"]: m for m in response.json()}
+        assert metrics["GET /api/meals"]["requests"] == 1
+        assert metrics["GET /api/meals"]["avg_queries"] >= 1
+
+
+class TestTrackQueries:
+    """Tests for service-level query tracking and strict mode"""
+
+    def test_counts_service_queries(self, db: Session, stats_user: UserDB):
+        """track_queries counts statements issued in the current context"""
+        user_id = stats_user.id
+        _create_meals(db, user_id, 3)
+
+        with track_queries() as stats:
+            meals, total = MealService.get_user_meals(db, user_id)
+
+        assert total == 3
+        assert len(meals) == 3
+        assert stats.count <= 3
+
+    def test_no_counting_outside_context(self, db: Session, stats_user: UserDB):
+        """Statements outside a collector are not recorded"""
+        with track_queries() as stats:
+            pass
+
+        db.query(UserDB).filter(UserDB.id == stats_user.id).first()
+
+        assert stats.count == 0
+
+    def test_failed_statement_releases_start_time(self, db: Session):
+        """A statement that raises does not leave its start time behind"""
+        with track_queries() as stats:
+            with pytest.raises(OperationalError):
+                db.execute(text("SELECT * FROM missing_table"))
+            db.rollback()
+            db.execute(text("SELECT 1"))
+            start_times = db.connection().info.get(query_stats._START_TIME_KEY)
+
+        assert stats.count == 2
+        assert not start_times
+
+    def test_strict_mode_raises_on_repeats(
+        self, db: Session, stats_user: UserDB, monkeypatch
+    ):
+        """Strict mode fails when one statement shape repeats too often"""
+        monkeypatch.setattr(query_stats, "SQL_STRICT_MODE", "raise")
+        monkeypatch.setattr(query_stats, "SQL_REPEAT_THRESHOLD", 2)
+
+        with pytest.raises(RepeatedQueryError), track_queries():
+            for _ in range(3):
+                db.query(UserDB).filter(UserDB.id == stats_user.id).first()
+
+    def test_strict_mode_logs_on_repeats(
+        self, db: Session, stats_user: UserDB, monkeypatch, caplog
+    ):
+        """Log mode warns once per repeated shape instead of failing"""
+        monkeypatch.setattr(query_stats, "SQL_STRICT_MODE", "log")
+        monkeypatch.setattr(query_stats, "SQL_REPEAT_THRESHOLD", 2)
+
+        with track_queries() as stats:
+            for _ in range(4):
+                db.query(UserDB).filter(UserDB.id == stats_user.id).first()
+
+        assert stats.count == 4
+        assert len(stats.repeated_shapes(2)) == 1
+        warnings = [r for r in caplog.records if "times in one request" in r.message]
+        assert len(warnings) == 1
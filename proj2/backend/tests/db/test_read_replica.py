@@ -0,0 +1,256 @@
+"""Tests for read replica routing with two SQLite files kept in sync."""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.eatsential.db import database
+from src.eatsential.db.database import Base, get_db
+from src.eatsential.index import app
+from src.eatsential.middleware.read_your_writes import (
+    cookie_has_recent_write,
+    write_cookie_value,
+)
+from src.eatsential.models.models import GoalType, MealType, UserDB
+from src.eatsential.services.progress_cache import progress_snapshots
+from src.eatsential.utils.auth_util import create_access_token
+
+
+@pytest.fixture
+def replica_setup(tmp_path, monkeypatch):
+    """Create a primary and a replica SQLite file and route reads to the replica"""
+    primary_path = tmp_path / "primary.db"
+    replica_path = tmp_path / "replica.db"
+
+    primary_engine = create_engine(
+        f"sqlite:///{primary_path}", connect_args={"check_same_thread": False}
+    )
+    replica_engine = create_engine(
+        f"sqlite:///{replica_path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=primary_engine)
+
+    def sync_replica():
+        """Copy the primary file onto the replica file"""
+        source = sqlite3.connect(primary_path)
+        target = sqlite3.connect(replica_path)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+            target.close()
+
+    primary_session = sessionmaker(autoflush=False, bind=primary_engine)
+    replica_session = sessionmaker(autoflush=False, bind=replica_engine)
+
+    primary_db = primary_session()
+    user = UserDB(
+        id="replica_test_user",
+        email="replica@example.com",
+        username="replica_user",
+        password_hash="hashed_password",
+        email_verified=True,
+    )
+    primary_db.add(user)
+    primary_db.commit()
+    sync_replica()
+
+    def override_get_db():
+        db = primary_session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(database, "ReadSessionLocal", replica_session)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    app.dependency_overrides[get_db] = override_get_db
+
+    token = create_access_token(data={"sub": user.id})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with TestClient(app) as client:
+        yield client, headers, sync_replica
+
+    app.dependency_overrides.clear()
+    primary_db.close()
+    primary_engine.dispose()
+    replica_engine.dispose()
+
+
+def _meal_payload(name: str) -> dict:
+    return {
+        "meal_type": MealType.LUNCH.value,
+        "meal_time": (datetime.now() - timedelta(hours=1)).isoformat(),
+        "food_items": [
+            {
+                "food_name": name,
+                "portion_size": 1.0,
+                "portion_unit": "serving",
+                "calories": 300,
+            }
+        ],
+    }
+
+
+class TestReadReplicaRouting:
+    """Tests for get_read_db and ReadYourWritesMiddleware"""
+
+    def test_reads_served_from_replica(self, replica_setup, monkeypatch):
+        """Reads outside the read-your-writes window hit the replica"""
+        client, headers, sync_replica = replica_setup
+
+        response = client.post(
+            "/api/meals", json=_meal_payload("Soup"), headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Expire the read-your-writes window without syncing the replica
+        monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 0)
+
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 0
+
+        sync_replica()
+
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.json()["total"] == 1
+
+    def test_read_your_writes_uses_primary(self, replica_setup):
+        """A user's reads right after their write see the new row"""
+        client, headers, _ = replica_setup
+
+        response = client.post(
+            "/api/meals", json=_meal_payload("Salad"), headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # The replica has not been synced, so only the primary has the meal
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 1
+
+    def test_read_your_writes_across_workers(self, replica_setup, monkeypatch):
+        """The signed cookie pins reads in a process that did not see the write"""
+        client, headers, _ = replica_setup
+
+        response = client.post(
+            "/api/meals", json=_meal_payload("Curry"), headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # Another worker process has no record of the write
+        monkeypatch.setattr(database, "_recent_writes", {})
+
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.json()["total"] == 1
+
+        # Without the cookie that worker reads the (stale) replica
+        client.cookies.clear()
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.json()["total"] == 0
+
+    def test_pinned_reads_skip_progress_cache(self, replica_setup, monkeypatch):
+        """Progress cached by a worker that missed the write is not served"""
+        client, headers, sync_replica = replica_setup
+
+        response = client.post(
+            "/api/goals",
+            json={
+                "goal_type": GoalType.WELLNESS.value,
+                "target_type": "weekly_meditation",
+                "target_value": 4.0,
+                "start_date": date.today().isoformat(),
+                "end_date": (date.today() + timedelta(days=7)).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        goal_id = response.json()["id"]
+        sync_replica()
+
+        # Outside the write window the progress snapshot is cached
+        client.cookies.clear()
+        monkeypatch.setattr(database, "_recent_writes", {})
+        response = client.get("/api/goals/progress", headers=headers)
+        assert response.json()[0]["completion_percentage"] == 0.0
+
+        # The write lands in a worker whose invalidation this one never sees
+        monkeypatch.setattr(progress_snapshots, "invalidate", lambda *a, **k: None)
+        response = client.put(
+            f"/api/goals/{goal_id}", json={"current_value": 2.0}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        monkeypatch.setattr(database, "_recent_writes", {})
+
+        response = client.get("/api/goals/progress", headers=headers)
+        assert response.json()[0]["completion_percentage"] == 50.0
+
+    def test_unreachable_replica_falls_back_to_primary(
+        self, replica_setup, tmp_path, monkeypatch
+    ):
+        """Reads fall back to the primary when the replica cannot connect"""
+        client, headers, _ = replica_setup
+
+        response = client.post(
+            "/api/meals", json=_meal_payload("Stew"), headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        broken_engine = create_engine(
+            f"sqlite:///{tmp_path / 'missing' / 'replica.db'}",
+            connect_args={"check_same_thread": False},
+        )
+        monkeypatch.setattr(
+            database, "ReadSessionLocal", sessionmaker(bind=broken_engine)
+        )
+        monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 0)
+
+        response = client.get("/api/meals?include_total=true", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 1
+
+
+class TestRecentWriteTracking:
+    """Unit tests for the read-your-writes bookkeeping"""
+
+    def test_window_expires(self, monkeypatch):
+        """A recorded write only pins reads for READ_YOUR_WRITES_SECONDS"""
+        monkeypatch.setattr(database, "_recent_writes", {})
+        monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 5)
+
+        database.record_user_write("user-1", now=100.0)
+
+        assert database.has_recent_write("user-1", now=104.0)
+        assert not database.has_recent_write("user-1", now=105.0)
+        assert not database.has_recent_write("user-2", now=100.0)
+
+    def test_expired_entries_are_pruned(self, monkeypatch):
+        """Old entries are dropped when new writes are recorded"""
+        monkeypatch.setattr(database, "_recent_writes", {})
+        monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 5)
+
+        database.record_user_write("user-1", now=100.0)
+        database.record_user_write("user-2", now=200.0)
+
+        assert "user-1" not in database._recent_writes
+        assert "user-2" in database._recent_writes
+
+    def test_cookie_is_signed_per_user(self, monkeypatch):
+        """A write cookie only pins its own user, within the window"""
+        monkeypatch.setattr(database, "READ_YOUR_WRITES_SECONDS", 5)
+        cookie = write_cookie_value("user-1", 100_000)
+
+        assert cookie_has_recent_write(cookie, "user-1", now=104.0)
+        assert not cookie_has_recent_write(cookie, "user-1", now=105.0)
+        assert not cookie_has_recent_write(cookie, "user-2", now=100.0)
+        forged = f"200000.{cookie.partition('.')[2]}"
+        assert not cookie_has_recent_write(forged, "user-1", now=200.0)
+        assert not cookie_has_recent_write(None, "user-1", now=100.0)
+        assert not cookie_has_recent_write("garbage", "user-1", now=100.0)
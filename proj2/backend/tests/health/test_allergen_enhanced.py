@@ -153,7 +153,7 @@ def test_search_allergens_by_name(
 
     # Search for "pea" (should match Peanuts and Peas)
     response = client.get(
-        "/api/health/admin/allergens/search?name=pea",
+        "/api/health/admin/allergens/search?name=pea&include_total=true",
         headers=admin_auth_headers,
     )
 
@@ -188,7 +188,7 @@ def test_search_allergens_by_category(
     )
 
     response = client.get(
-        "/api/health/admin/allergens/search?category=nuts",
+        "/api/health/admin/allergens/search?category=nuts&include_total=true",
         headers=admin_auth_headers,
     )
 
@@ -244,7 +244,7 @@ def test_search_allergens_pagination(
 
     # Get first page (2 items)
     response = client.get(
-        "/api/health/admin/allergens/search?skip=0&limit=2",
+        "/api/health/admin/allergens/search?skip=0&limit=2&include_total=true",
         headers=admin_auth_headers,
     )
 
@@ -49,7 +49,7 @@ class TestMealGoalIntegration:
         goal_check = client.get(f"/api/goals/{goal_id}", headers=auth_headers)
         assert goal_check.status_code == status.HTTP_200_OK
 
-        meals_check = client.get("/api/meals", headers=auth_headers)
+        meals_check = client.get("/api/meals?include_total=true", headers=auth_headers)
         assert meals_check.status_code == status.HTTP_200_OK
         assert meals_check.json()["total"] >= 1
 
@@ -86,7 +86,9 @@ class TestMealGoalIntegration:
             assert response.status_code == status.HTTP_201_CREATED
 
         # Verify meals were created
-        meals_response = client.get("/api/meals", headers=auth_headers)
+        meals_response = client.get(
+            "/api/meals?include_total=true", headers=auth_headers
+        )
         assert meals_response.status_code == status.HTTP_200_OK
         assert meals_response.json()["total"] >= 3
 
@@ -145,7 +147,9 @@ class TestMealGoalIntegration:
             client.post("/api/meals", json=meal_data, headers=auth_headers)
 
         # Get meals
-        meals_response = client.get("/api/meals", headers=auth_headers)
+        meals_response = client.get(
+            "/api/meals?include_total=true", headers=auth_headers
+        )
         assert meals_response.status_code == status.HTTP_200_OK
         meals_data = meals_response.json()
         assert "meals" in meals_data
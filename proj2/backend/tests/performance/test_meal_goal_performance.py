@@ -1,13 +1,61 @@
 """Performance tests for Meal and Goal tracking (Issue #103)."""
 
+import statistics
 import time
+import tracemalloc
+import uuid
 from datetime import date, datetime, timedelta
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from src.eatsential.models.models import GoalType, MealType
+from src.eatsential.db.query_stats import track_queries
+from src.eatsential.models.models import GoalType, MealDB, MealType, UserDB
+from src.eatsential.schemas.schemas import (
+    MealCreate,
+    MealFoodItemCreate,
+    MealFoodItemUpdate,
+    MealResponse,
+    MealUpdate,
+)
+from src.eatsential.services.daily_nutrition_service import DailyNutritionService
+from src.eatsential.services.meal_export_service import MealExportService
+from src.eatsential.services.meal_service import MealService
+from src.eatsential.services.nutrition_trends_service import NutritionTrendsService
+from src.eatsential.utils.pagination import encode_cursor
+
+
+def _seed_meals(db: Session, user_id: str, count: int) -> None:
+    """Bulk insert meals one minute apart without food items."""
+    now = datetime.now()
+    db.execute(
+        insert(MealDB),
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "meal_type": MealType.SNACK.value,
+                "meal_time": now - timedelta(minutes=i),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+def _median_ms(fn, runs: int = 5) -> float:
+    """Return the median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
 
 
 class TestPerformance:
@@ -119,6 +167,311 @@ class TestPerformance:
         assert response_time < 2.0, f"Response time {response_time}s exceeds 2s limit"
 
 
+class TestBulkMealWritePerformance:
+    """Meal creation cost with growing numbers of food items."""
+
+    @pytest.mark.parametrize("item_count", [1, 20, 200])
+    def test_create_meal_statement_count_is_constant(
+        self, db: Session, test_user: UserDB, item_count: int
+    ):
+        """Food items are bulk inserted; no refresh or per-item INSERT."""
+        meal_data = MealCreate(
+            meal_type=MealType.DINNER,
+            meal_time=datetime.now() - timedelta(hours=1),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name=f"Item {i}",
+                    portion_size=1.0,
+                    portion_unit="serving",
+                    calories=10,
+                )
+                for i in range(item_count)
+            ],
+        )
+
+        user_id, user_tz = test_user.id, test_user.timezone
+
+        with track_queries() as stats:
+            start = time.perf_counter()
+            meal = MealService.create_meal(db, user_id, meal_data, user_tz)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            # Building the response must not trigger lazy loads
+            response = MealResponse.model_validate(meal)
+
+        # INSERT meal, one bulk INSERT ... RETURNING for all food items, the
+        # daily_nutrition upsert and the tracked goals lookup
+        assert stats.count == 4
+        assert [item.food_name for item in response.food_items] == [
+            f"Item {i}" for i in range(item_count)
+        ]
+        assert response.total_calories == 10 * item_count
+        assert elapsed_ms < 2000, f"{item_count} items took {elapsed_ms:.2f}ms"
+
+    @pytest.mark.parametrize("item_count", [1, 20, 200])
+    def test_create_meal_endpoint_performance(
+        self, client: TestClient, auth_headers: dict, item_count: int, query_budget
+    ):
+        """POST /api/meals stays within budget for large meals."""
+        meal_data = {
+            "meal_type": MealType.DINNER.value,
+            "meal_time": (datetime.now() - timedelta(hours=1)).isoformat(),
+            "food_items": [
+                {
+                    "food_name": f"Item {i}",
+                    "portion_size": 1.0,
+                    "portion_unit": "serving",
+                    "calories": 10,
+                }
+                for i in range(item_count)
+            ],
+        }
+
+        start_time = time.time()
+        response = client.post("/api/meals", json=meal_data, headers=auth_headers)
+        response_time = time.time() - start_time
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.json()["food_items"]) == item_count
+        # user lookup, INSERT meal, bulk INSERT food items, rollup upsert and
+        # the tracked goals lookup
+        query_budget(response, 5)
+        assert response_time < 2.0, f"Response time {response_time}s exceeds 2s limit"
+
+
+class TestMealUpdateDiffPerformance:
+    """Single-item edits on large meals."""
+
+    def test_single_item_edit_on_100_item_meal(self, db: Session, test_user: UserDB):
+        """Editing one of 100 items writes one food item row, not 100."""
+        meal = MealService.create_meal(
+            db,
+            test_user.id,
+            MealCreate(
+                meal_type=MealType.DINNER,
+                meal_time=datetime.now() - timedelta(hours=1),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name=f"Item {i}",
+                        portion_size=1.0,
+                        portion_unit="serving",
+                        calories=10,
+                    )
+                    for i in range(100)
+                ],
+            ),
+        )
+        items = [MealFoodItemUpdate.model_validate(item) for item in meal.food_items]
+        items[42] = items[42].model_copy(update={"calories": 50})
+        meal_id, user_id, user_tz = meal.id, test_user.id, test_user.timezone
+
+        with track_queries() as stats:
+            start = time.perf_counter()
+            updated = MealService.update_meal(
+                db, user_id, meal_id, MealUpdate(food_items=items), user_tz
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        shapes = " | ".join(stats.shapes)
+        assert float(updated.total_calories) == 100 * 10 + 40
+        assert "DELETE FROM meal_food_items" not in shapes
+        assert "INSERT INTO meal_food_items" not in shapes
+        assert (
+            sum(
+                count
+                for shape, count in stats.shapes.items()
+                if shape.startswith("UPDATE meal_food_items")
+            )
+            == 1
+        )
+        # meal + food items SELECTs, one food item UPDATE, one meal UPDATE,
+        # the daily_nutrition upsert and the tracked goals lookup
+        assert stats.count <= 6
+        assert elapsed_ms < 2000, f"1 of 100 items edited in {elapsed_ms:.2f}ms"
+
+
+class TestNutritionTrendsPerformance:
+    """Trend aggregation over ten years of meals."""
+
+    @pytest.fixture
+    def ten_years_of_meals(self, db: Session, test_user: UserDB) -> date:
+        """Bulk insert three meals a day for ten years and build the rollup."""
+        first_day = date.today() - timedelta(days=3652)
+        meal_types = [MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER]
+        now = datetime.now()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": test_user.id,
+                "meal_type": meal_type.value,
+                "meal_time": datetime.combine(
+                    first_day + timedelta(days=day), datetime.min.time()
+                )
+                + timedelta(hours=12 + 5 * slot),
+                "total_calories": 400 + (day * 7 + slot * 13) % 500,
+                "total_protein_g": 20 + slot * 5,
+                "total_carbs_g": 50,
+                "total_fat_g": 15,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for day in range(3652)
+            for slot, meal_type in enumerate(meal_types)
+        ]
+        for start in range(0, len(rows), 5000):
+            db.execute(insert(MealDB), rows[start : start + 5000])
+        db.commit()
+        DailyNutritionService.rebuild(db, [test_user.id])
+        return first_day
+
+    @pytest.mark.parametrize("period", ["week", "month"])
+    def test_trends_endpoint_over_ten_years(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        ten_years_of_meals: date,
+        period: str,
+        query_budget,
+    ):
+        """GET /api/meals/trends aggregates ~11k meals without loading them."""
+        url = (
+            f"/api/meals/trends?period={period}"
+            f"&start_date={ten_years_of_meals.isoformat()}"
+            f"&end_date={date.today().isoformat()}"
+        )
+
+        start_time = time.perf_counter()
+        response = client.get(url, headers=auth_headers)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert sum(bucket["meal_count"] for bucket in data["buckets"]) == 3 * 3652
+        assert sum(row["meal_count"] for row in data["meal_types"]) == 3 * 3652
+        # user lookup, period buckets, meal type breakdown
+        query_budget(response, 3)
+        assert elapsed_ms < 2000, f"{period} trends took {elapsed_ms:.2f}ms"
+
+    def test_sql_and_numpy_paths_over_ten_years(
+        self, db: Session, test_user: UserDB, ten_years_of_meals: date
+    ):
+        """Compare the window function and NumPy aggregation paths."""
+        args = (db, test_user.id, ten_years_of_meals, date.today(), "week", 4)
+
+        sql_ms = _median_ms(lambda: NutritionTrendsService.sql_buckets(*args))
+        assert sql_ms < 1000, f"SQL window functions took {sql_ms:.2f}ms"
+
+        pytest.importorskip("numpy")
+        numpy_ms = _median_ms(lambda: NutritionTrendsService.numpy_buckets(*args))
+        assert numpy_ms < 1000, f"NumPy took {numpy_ms:.2f}ms"
+
+
+class TestMealExportPerformance:
+    """Streaming export memory and throughput."""
+
+    @staticmethod
+    def _export_peak_kib(db: Session, user_id: str, export_format: str) -> float:
+        """Consume an export and return the peak traced memory in KiB."""
+        tracemalloc.start()
+        try:
+            size = sum(
+                len(chunk)
+                for chunk in MealExportService.stream(db, user_id, export_format)
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert size > 0
+        return peak / 1024
+
+    @pytest.mark.parametrize("export_format", ["csv", "ndjson"])
+    def test_export_memory_does_not_grow_with_history(
+        self, db: Session, test_user: UserDB, export_format: str
+    ):
+        """Peak memory for 20k meals stays close to that for 2k meals."""
+        _seed_meals(db, test_user.id, 2000)
+        small_kib = self._export_peak_kib(db, test_user.id, export_format)
+
+        _seed_meals(db, test_user.id, 18000)
+        start = time.perf_counter()
+        large_kib = self._export_peak_kib(db, test_user.id, export_format)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert large_kib < small_kib * 2, (
+            f"{export_format}: 2k meals {small_kib:.0f}KiB peak, "
+            f"20k meals {large_kib:.0f}KiB peak"
+        )
+        assert elapsed_ms < 10000, f"20k meals exported in {elapsed_ms:.0f}ms"
+
+
+class TestKeysetPaginationPerformance:
+    """Deep-page latency of OFFSET vs keyset (cursor) pagination."""
+
+    PAGE_SIZE = 20
+    PAGE = 1000
+
+    def test_page_1000_cursor_vs_offset(self, db: Session, test_user: UserDB):
+        """Cursor page 1000 returns the same rows as OFFSET, faster."""
+        _seed_meals(db, test_user.id, self.PAGE * self.PAGE_SIZE)
+        skip = (self.PAGE - 1) * self.PAGE_SIZE
+
+        # Cursor of the last row on page 999
+        previous, _ = MealService.get_user_meals(
+            db, test_user.id, skip=skip - 1, limit=1
+        )
+        cursor = encode_cursor(previous[0].meal_time, previous[0].id)
+
+        offset_page, _ = MealService.get_user_meals(
+            db, test_user.id, skip=skip, limit=self.PAGE_SIZE
+        )
+        cursor_page, _ = MealService.get_user_meals(
+            db, test_user.id, limit=self.PAGE_SIZE, cursor=cursor
+        )
+        assert [m.id for m in cursor_page] == [m.id for m in offset_page]
+
+        offset_ms = _median_ms(
+            lambda: MealService.get_user_meals(
+                db, test_user.id, skip=skip, limit=self.PAGE_SIZE
+            )
+        )
+        cursor_ms = _median_ms(
+            lambda: MealService.get_user_meals(
+                db, test_user.id, limit=self.PAGE_SIZE, cursor=cursor
+            )
+        )
+
+        assert cursor_ms < offset_ms, (
+            f"page {self.PAGE}: cursor {cursor_ms:.2f}ms, offset {offset_ms:.2f}ms"
+        )
+
+
+class TestOptionalTotalPerformance:
+    """List latency with and without the COUNT(*) total."""
+
+    def test_meal_list_without_total_is_faster(self, db: Session, test_user: UserDB):
+        """Skipping the total avoids a second scan of the filtered set."""
+        _seed_meals(db, test_user.id, 20000)
+
+        def page(include_total: bool):
+            return MealService.get_user_meals_page(
+                db, test_user.id, limit=20, include_total=include_total
+            )
+
+        meals, total, has_more = page(True)
+        assert total == 20000
+        assert len(meals) == 20
+        assert has_more is True
+        assert page(False)[1] is None
+
+        with_total_ms = _median_ms(lambda: page(True))
+        without_total_ms = _median_ms(lambda: page(False))
+
+        assert without_total_ms < with_total_ms, (
+            f"meal list: without total {without_total_ms:.2f}ms, "
+            f"with total {with_total_ms:.2f}ms"
+        )
+
+
 class TestDataValidation:
     """Additional data validation tests."""
 
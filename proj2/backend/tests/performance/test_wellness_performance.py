@@ -0,0 +1,118 @@
+"""Performance tests for wellness log listing and date conversion."""
+
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import MoodLogDB, UserDB
+from src.eatsential.utils.security import (
+    decrypt_many,
+    decrypt_sensitive_data,
+    encrypt_sensitive_data,
+)
+from src.eatsential.utils.timezones import get_local_date, local_dates
+
+
+def _seed_mood_logs(db: Session, user_id: str, count: int) -> None:
+    """Bulk insert mood logs one hour apart, each with encrypted notes."""
+    now = datetime.now()
+    db.execute(
+        insert(MoodLogDB),
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "occurred_at_utc": now - timedelta(hours=i),
+                "mood_score": 5,
+                "encrypted_notes": encrypt_sensitive_data(f"Felt fine, entry {i}"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+def _median_ms(fn, runs: int = 3) -> float:
+    """Return the median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+class TestLocalDatePerformance:
+    """Throughput of batch UTC to local date conversion."""
+
+    def test_vectorized_vs_per_value_conversion(self):
+        """Converting a batch with NumPy beats converting value by value."""
+        pytest.importorskip("numpy")
+        start = datetime(2015, 1, 1)
+        values = [start + timedelta(minutes=37 * i) for i in range(200_000)]
+
+        loop_ms = _median_ms(
+            lambda: [get_local_date(v, "America/New_York") for v in values]
+        )
+        vectorized_ms = _median_ms(lambda: local_dates(values, "America/New_York"))
+
+        assert vectorized_ms < loop_ms, (
+            f"{len(values)} timestamps: vectorized {vectorized_ms:.0f}ms, "
+            f"per value {loop_ms:.0f}ms"
+        )
+
+
+class TestWellnessDecryptionPerformance:
+    """Decryption throughput against the number of rows."""
+
+    @pytest.mark.parametrize("row_count", [100, 1000, 5000])
+    def test_batched_vs_serial_decryption(self, row_count: int):
+        """Batched decryption is not slower than decrypting values one by one."""
+        encrypted = [
+            encrypt_sensitive_data(f"Felt fine, entry {i}") for i in range(row_count)
+        ]
+
+        serial_ms = _median_ms(
+            lambda: [decrypt_sensitive_data(text) for text in encrypted]
+        )
+        batched_ms = _median_ms(lambda: decrypt_many(encrypted))
+
+        assert decrypt_many(encrypted) == [
+            decrypt_sensitive_data(text) for text in encrypted
+        ]
+        # Allow for timer noise on small batches
+        assert batched_ms < serial_ms * 1.5 + 5, (
+            f"{row_count} rows: serial {serial_ms:.2f}ms, batched {batched_ms:.2f}ms"
+        )
+
+    @pytest.mark.parametrize("row_count", [100, 2000])
+    def test_wellness_logs_endpoint_throughput(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db: Session,
+        test_user: UserDB,
+        row_count: int,
+    ):
+        """Listing decrypts every row's notes within the response budget."""
+        _seed_mood_logs(db, test_user.id, row_count)
+
+        start = time.perf_counter()
+        response = client.get("/api/wellness/logs?log_type=mood", headers=auth_headers)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_count"] == row_count
+        assert data["mood_logs"][0]["notes"] == "Felt fine, entry 0"
+
+        assert elapsed_ms < 5000, f"{row_count} mood logs took {elapsed_ms:.2f}ms"
@@ -5,7 +5,7 @@ from datetime import date, timedelta
 from fastapi import status
 from fastapi.testclient import TestClient
 
-from src.eatsential.models.models import GoalStatus, GoalType
+from src.eatsential.models.models import GoalProgressSnapshotDB, GoalStatus, GoalType
 from src.eatsential.services.goal_service import GoalService
 
 
@@ -127,7 +127,7 @@ class TestGetGoalsEndpoint:
                 type("GoalCreate", (), goal_data)(),
             )
 
-        response = client.get("/api/goals", headers=auth_headers)
+        response = client.get("/api/goals?include_total=true", headers=auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -158,7 +158,9 @@ class TestGetGoalsEndpoint:
             )
 
         # Get first page
-        response = client.get("/api/goals?page=1&page_size=2", headers=auth_headers)
+        response = client.get(
+            "/api/goals?page=1&page_size=2&include_total=true", headers=auth_headers
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -167,7 +169,9 @@ class TestGetGoalsEndpoint:
         assert data["page"] == 1
 
         # Get second page
-        response = client.get("/api/goals?page=2&page_size=2", headers=auth_headers)
+        response = client.get(
+            "/api/goals?page=2&page_size=2&include_total=true", headers=auth_headers
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -207,7 +211,8 @@ class TestGetGoalsEndpoint:
 
         # Filter by nutrition
         response = client.get(
-            f"/api/goals?goal_type={GoalType.NUTRITION.value}", headers=auth_headers
+            f"/api/goals?goal_type={GoalType.NUTRITION.value}&include_total=true",
+            headers=auth_headers,
         )
 
         assert response.status_code == status.HTTP_200_OK
@@ -242,7 +247,8 @@ class TestGetGoalsEndpoint:
 
         # Filter by active status
         response = client.get(
-            f"/api/goals?status={GoalStatus.ACTIVE.value}", headers=auth_headers
+            f"/api/goals?status={GoalStatus.ACTIVE.value}&include_total=true",
+            headers=auth_headers,
         )
 
         assert response.status_code == status.HTTP_200_OK
@@ -250,6 +256,59 @@ class TestGetGoalsEndpoint:
         assert data["total"] == 1
         assert data["goals"][0]["status"] == GoalStatus.ACTIVE.value
 
+    def test_get_goals_sparse_fields(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test fields= returns only requested keys, including computed ones."""
+        today = date.today()
+        goal = GoalService.create_goal(
+            db,
+            test_user.id,
+            type(
+                "GoalCreate",
+                (),
+                {
+                    "goal_type": GoalType.NUTRITION.value,
+                    "target_type": "daily_protein",
+                    "target_value": 200.0,
+                    "start_date": today,
+                    "end_date": today + timedelta(days=30),
+                },
+            )(),
+        )
+        goal.current_value = 50
+        db.commit()
+
+        response = client.get(
+            "/api/goals?fields=completion_percentage,is_active",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        (item,) = response.json()["goals"]
+        assert item == {
+            "id": goal.id,
+            "created_at": item["created_at"],
+            "completion_percentage": 25.0,
+            "is_active": True,
+        }
+
+    def test_get_goals_documents_sparse_shape(self, client: TestClient):
+        """Test the OpenAPI schema documents the partial goals of fields=."""
+        operation = client.get("/openapi.json").json()["paths"]["/api/goals"]["get"]
+        schema = operation["responses"]["200"]["content"]["application/json"]
+
+        refs = {
+            option["$ref"].rsplit("/", 1)[-1] for option in schema["schema"]["anyOf"]
+        }
+        assert "GoalSparseListResponse" in refs
+
+    def test_get_goals_unknown_field(self, client: TestClient, auth_headers: dict):
+        """Test an unknown field name returns 400."""
+        response = client.get("/api/goals?fields=id,owner", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_get_goals_requires_authentication(self, client: TestClient):
         """Test that getting goals requires authentication."""
         response = client.get("/api/goals")
@@ -283,7 +342,7 @@ class TestGetGoalsEndpoint:
         GoalService.create_goal(db, test_user_2.id, type("GoalCreate", (), goal_data)())
 
         # User 1 should see only their 2 goals
-        response = client.get("/api/goals", headers=auth_headers)
+        response = client.get("/api/goals?include_total=true", headers=auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -383,7 +442,7 @@ class TestUpdateGoalEndpoint:
         today = date.today()
         goal_data = {
             "goal_type": GoalType.NUTRITION.value,
-            "target_type": "daily_calories",
+            "target_type": "weekly_calories",
             "target_value": 2000.0,
             "start_date": today,
             "end_date": today + timedelta(days=30),
@@ -407,6 +466,34 @@ class TestUpdateGoalEndpoint:
         assert data["notes"] == "Making good progress"
         assert data["target_value"] == 2000.0  # Unchanged
 
+    def test_update_tracked_goal_current_value_rejected(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test current_value cannot be set on goals tracked from logs."""
+        today = date.today()
+        goal_data = {
+            "goal_type": GoalType.NUTRITION.value,
+            "target_type": "daily_calories",
+            "target_value": 2000.0,
+            "start_date": today,
+            "end_date": today + timedelta(days=30),
+        }
+        goal = GoalService.create_goal(
+            db, test_user.id, type("GoalCreate", (), goal_data)()
+        )
+
+        response = client.put(
+            f"/api/goals/{goal.id}",
+            json={"current_value": 1500.0, "notes": "Manual edit"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "current_value" in response.json()["detail"]
+        db.refresh(goal)
+        assert float(goal.current_value) == 0
+        assert goal.notes is None
+
     def test_update_goal_status(
         self, client: TestClient, auth_headers: dict, test_user, db
     ):
@@ -600,7 +687,7 @@ class TestGoalProgressEndpoint:
         # Create goals with different progress
         goal_data_1 = {
             "goal_type": GoalType.NUTRITION.value,
-            "target_type": "daily_calories",
+            "target_type": "weekly_calories",
             "target_value": 2000.0,
             "start_date": today,
             "end_date": today + timedelta(days=7),
@@ -705,3 +792,118 @@ class TestGoalProgressEndpoint:
         data = response.json()
         assert len(data) == 1
         assert data[0]["days_remaining"] == 10
+
+    def test_progress_polling_is_cached_until_goal_write(
+        self, client: TestClient, auth_headers: dict, query_budget
+    ):
+        """Test repeated polls skip the goals query until a goal changes."""
+        today = date.today()
+        created = client.post(
+            "/api/goals",
+            json={
+                "goal_type": GoalType.WELLNESS.value,
+                "target_type": "weekly_meditation",
+                "target_value": 10.0,
+                "start_date": today.isoformat(),
+                "end_date": (today + timedelta(days=7)).isoformat(),
+            },
+            headers=auth_headers,
+        ).json()
+
+        first = client.get("/api/goals/progress", headers=auth_headers)
+        second = client.get("/api/goals/progress", headers=auth_headers)
+
+        assert second.json() == first.json()
+        # user lookup only
+        query_budget(second, 1)
+
+        client.put(
+            f"/api/goals/{created['id']}",
+            json={"current_value": 4.0},
+            headers=auth_headers,
+        )
+        third = client.get("/api/goals/progress", headers=auth_headers)
+
+        assert third.json()[0]["completion_percentage"] == 40.0
+
+
+class TestGoalHistoryEndpoint:
+    """Tests for GET /api/goals/{goal_id}/history endpoint."""
+
+    def _goal(self, client: TestClient, auth_headers: dict) -> dict:
+        """Create a goal that started ten days ago."""
+        today = date.today()
+        return client.post(
+            "/api/goals",
+            json={
+                "goal_type": GoalType.WELLNESS.value,
+                "target_type": "weekly_meditation",
+                "target_value": 10.0,
+                "start_date": (today - timedelta(days=10)).isoformat(),
+                "end_date": (today + timedelta(days=10)).isoformat(),
+            },
+            headers=auth_headers,
+        ).json()
+
+    def test_history_is_downsampled(
+        self, client: TestClient, auth_headers: dict, db, query_budget
+    ):
+        """Test daily snapshots are bucketed to max_points points."""
+        goal = self._goal(client, auth_headers)
+        today = date.today()
+        db.add_all(
+            GoalProgressSnapshotDB(
+                goal_id=goal["id"],
+                snapshot_date=today - timedelta(days=days_ago),
+                period_days=1,
+                value=10 - days_ago,
+                min_value=10 - days_ago,
+                max_value=10 - days_ago,
+                sample_count=1,
+            )
+            for days_ago in range(1, 11)
+        )
+        db.commit()
+
+        response = client.get(
+            f"/api/goals/{goal['id']}/history?max_points=5", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["start_date"] == goal["start_date"]
+        assert len(data["points"]) <= 5
+        assert data["points"][0]["min_value"] == 0.0
+        assert data["points"][-1]["value"] == 0.0  # live current_value
+        # user lookup, goal, snapshots
+        query_budget(response, 3)
+
+    def test_history_of_other_users_goal_not_found(
+        self, client: TestClient, auth_headers: dict, auth_headers_2: dict
+    ):
+        """Test users cannot read other users' goal history."""
+        goal = self._goal(client, auth_headers)
+
+        response = client.get(
+            f"/api/goals/{goal['id']}/history", headers=auth_headers_2
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_history_rejects_inverted_range(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test start_date after end_date is rejected."""
+        goal = self._goal(client, auth_headers)
+        today = date.today()
+
+        response = client.get(
+            f"/api/goals/{goal['id']}/history",
+            params={
+                "start_date": today.isoformat(),
+                "end_date": (today - timedelta(days=1)).isoformat(),
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,13 +1,27 @@
 """Integration tests for Meal Logging API endpoints."""
 
-from datetime import datetime, timedelta
-
+import csv
+import gzip
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from src.eatsential.index import app
 from src.eatsential.models.models import MealType
-from src.eatsential.schemas.schemas import MealCreate, MealFoodItemCreate
+from src.eatsential.routers import meals as meals_router
+from src.eatsential.schemas.schemas import (
+    MAX_MEAL_BATCH_SIZE,
+    MealCreate,
+    MealFoodItemCreate,
+)
 from src.eatsential.services.meal_service import MealService
+from src.eatsential.services.photo_service import PhotoService
+from src.eatsential.services.photo_storage import LocalPhotoStorage, get_photo_storage
 
 
 class TestCreateMealEndpoint:
@@ -116,6 +130,194 @@ class TestCreateMealEndpoint:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
 
+def _batch_meal(index: int, **overrides) -> dict:
+    """Build a valid meal payload for batch requests."""
+    meal = {
+        "meal_type": MealType.SNACK.value,
+        "meal_time": (datetime.now() - timedelta(hours=index + 1)).isoformat(),
+        "food_items": [
+            {
+                "food_name": f"Snack {index}",
+                "portion_size": 1.0,
+                "portion_unit": "serving",
+                "calories": 100,
+            }
+        ],
+    }
+    meal.update(overrides)
+    return meal
+
+
+class TestBatchMealEndpoint:
+    """Tests for POST /api/meals/batch endpoint."""
+
+    def test_batch_creates_all_meals(
+        self, client: TestClient, auth_headers: dict, query_budget
+    ):
+        """Test a valid batch is inserted with a constant number of queries."""
+        meals = [_batch_meal(i) for i in range(20)]
+
+        response = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 20
+        assert data["failed"] == 0
+        assert [r["index"] for r in data["results"]] == list(range(20))
+        assert all(r["meal"]["food_items"] for r in data["results"])
+        # user lookup, INSERT meals, INSERT food items, rollup upsert and the
+        # tracked goals lookup
+        query_budget(response, 5)
+
+        response = client.get("/api/meals?include_total=true", headers=auth_headers)
+        assert response.json()["total"] == 20
+
+    def test_batch_reports_partial_failures(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test invalid meals are reported while valid meals are created."""
+        meals = [
+            _batch_meal(0),
+            _batch_meal(1, food_items=[]),
+            _batch_meal(2, meal_type="brunch"),
+            _batch_meal(3),
+        ]
+
+        response = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 2
+        statuses = [r["status"] for r in data["results"]]
+        assert statuses == ["created", "error", "error", "created"]
+        assert data["results"][1]["errors"][0].startswith("food_items")
+        assert data["results"][2]["meal"] is None
+
+    def test_batch_idempotency_keys_prevent_duplicates(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test retrying a batch with the same keys does not duplicate meals."""
+        meals = [
+            _batch_meal(0, idempotency_key="sync-1"),
+            _batch_meal(1, idempotency_key="sync-2"),
+            # Same key twice in one batch is logged once
+            _batch_meal(2, idempotency_key="sync-2"),
+        ]
+
+        first = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        ).json()
+        retry = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        ).json()
+
+        assert [r["status"] for r in first["results"]] == [
+            "created",
+            "created",
+            "duplicate",
+        ]
+        assert retry["created"] == 0
+        assert retry["duplicates"] == 3
+        assert [r["meal"]["id"] for r in retry["results"]] == [
+            r["meal"]["id"] for r in first["results"]
+        ]
+
+        response = client.get("/api/meals?include_total=true", headers=auth_headers)
+        assert response.json()["total"] == 2
+
+    def test_batch_returns_meal_stored_by_concurrent_request(
+        self, client: TestClient, auth_headers: dict, monkeypatch
+    ):
+        """Test a key used after the lookup is a duplicate, not a failed batch."""
+        first = client.post(
+            "/api/meals/batch",
+            json={"meals": [_batch_meal(0, idempotency_key="sync-1")]},
+            headers=auth_headers,
+        ).json()
+
+        # The first lookup misses sync-1, as if a concurrent request stored it
+        # between the lookup and the insert
+        lookup = MealService._meals_by_idempotency_key
+        calls = []
+
+        def stale_lookup(db, user_id, keys):
+            """Miss on the first call, then look up the stored meals."""
+            calls.append(keys)
+            return {} if len(calls) == 1 else lookup(db, user_id, keys)
+
+        monkeypatch.setattr(
+            MealService, "_meals_by_idempotency_key", staticmethod(stale_lookup)
+        )
+        meals = [
+            _batch_meal(1, idempotency_key="sync-1"),
+            _batch_meal(2, idempotency_key="sync-2"),
+            _batch_meal(3, idempotency_key="sync-2"),
+        ]
+        response = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == [
+            "duplicate",
+            "created",
+            "duplicate",
+        ]
+        assert data["results"][0]["meal"]["id"] == first["results"][0]["meal"]["id"]
+        assert data["results"][2]["meal"]["id"] == data["results"][1]["meal"]["id"]
+        # The conflicting insert was retried meal by meal
+        assert calls == [{"sync-1", "sync-2"}, ["sync-1"]]
+
+        response = client.get("/api/meals?include_total=true", headers=auth_headers)
+        assert response.json()["total"] == 2
+
+    def test_batch_documents_meal_schema(self):
+        """Test the OpenAPI schema describes each meal of a batch."""
+        schemas = app.openapi()["components"]["schemas"]
+        meal_schema = schemas["MealBatchCreate"]["properties"]["meals"]["items"]
+
+        assert meal_schema["title"] == "MealBatchItem"
+        assert {"meal_type", "meal_time", "food_items"} <= set(meal_schema["required"])
+        assert "idempotency_key" in meal_schema["properties"]
+
+    def test_batch_idempotency_keys_are_per_user(
+        self, client: TestClient, auth_headers: dict, auth_headers_2: dict
+    ):
+        """Test the same key used by two users creates two meals."""
+        meals = [_batch_meal(0, idempotency_key="shared-key")]
+
+        client.post("/api/meals/batch", json={"meals": meals}, headers=auth_headers)
+        response = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers_2
+        )
+
+        assert response.json()["created"] == 1
+
+    def test_batch_rejects_oversized_batches(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test batches larger than the limit are rejected."""
+        meals = [_batch_meal(0)] * (MAX_MEAL_BATCH_SIZE + 1)
+
+        response = client.post(
+            "/api/meals/batch", json={"meals": meals}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_batch_requires_authentication(self, client: TestClient):
+        """Test that batch logging requires authentication."""
+        response = client.post("/api/meals/batch", json={"meals": [_batch_meal(0)]})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 class TestGetMealsEndpoint:
     """Tests for GET /api/meals endpoint."""
 
@@ -138,7 +340,7 @@ class TestGetMealsEndpoint:
             )
             MealService.create_meal(db, test_user.id, meal_data)
 
-        response = client.get("/api/meals", headers=auth_headers)
+        response = client.get("/api/meals?include_total=true", headers=auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -167,7 +369,9 @@ class TestGetMealsEndpoint:
             MealService.create_meal(db, test_user.id, meal_data)
 
         # Get page 1 with page_size=2
-        response = client.get("/api/meals?page=1&page_size=2", headers=auth_headers)
+        response = client.get(
+            "/api/meals?page=1&page_size=2&include_total=true", headers=auth_headers
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -182,6 +386,154 @@ class TestGetMealsEndpoint:
         data = response.json()
         assert len(data["meals"]) == 2
 
+    def test_get_meals_total_is_opt_in(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test total is omitted by default and has_more marks the last page."""
+        for i in range(3):
+            meal_data = MealCreate(
+                meal_type=MealType.SNACK,
+                meal_time=datetime.now() - timedelta(hours=i),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name=f"Snack {i}",
+                        portion_size=1.0,
+                        portion_unit="serving",
+                    )
+                ],
+            )
+            MealService.create_meal(db, test_user.id, meal_data)
+
+        response = client.get("/api/meals?page_size=2", headers=auth_headers)
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_more"] is True
+
+        response = client.get("/api/meals?page=2&page_size=2", headers=auth_headers)
+        data = response.json()
+        assert len(data["meals"]) == 1
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+        # Exactly one full page left: has_more must not report a phantom page
+        response = client.get("/api/meals?page_size=3", headers=auth_headers)
+        assert response.json()["has_more"] is False
+
+    def test_get_meals_cursor_pagination(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test following next_cursor walks every meal exactly once."""
+        for i in range(5):
+            meal_data = MealCreate(
+                meal_type=MealType.SNACK,
+                meal_time=datetime.now() - timedelta(hours=i),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name=f"Snack {i}",
+                        portion_size=1.0,
+                        portion_unit="serving",
+                    )
+                ],
+            )
+            MealService.create_meal(db, test_user.id, meal_data)
+
+        response = client.get("/api/meals?page_size=2", headers=auth_headers)
+        data = response.json()
+        seen = [meal["id"] for meal in data["meals"]]
+
+        while data["next_cursor"]:
+            response = client.get(
+                "/api/meals",
+                params={"page_size": 2, "cursor": data["next_cursor"]},
+                headers=auth_headers,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            seen.extend(meal["id"] for meal in data["meals"])
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_get_meals_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Test a malformed cursor returns 400."""
+        response = client.get("/api/meals?cursor=garbage", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_meals_sparse_fields(
+        self, client: TestClient, auth_headers: dict, test_user, db, query_budget
+    ):
+        """Test fields= returns only the requested keys without food items."""
+        for i in range(3):
+            meal_data = MealCreate(
+                meal_type=MealType.LUNCH,
+                meal_time=datetime.now() - timedelta(hours=i),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name="Soup",
+                        portion_size=1.0,
+                        portion_unit="bowl",
+                        calories=250,
+                    )
+                ],
+            )
+            MealService.create_meal(db, test_user.id, meal_data)
+
+        response = client.get(
+            "/api/meals?fields=total_calories&page_size=2", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [set(meal) for meal in data["meals"]] == [
+            {"id", "meal_time", "total_calories"}
+        ] * 2
+        assert data["meals"][0]["total_calories"] == 250
+        assert data["next_cursor"] is not None
+        # User lookup and the page itself: food items are not loaded
+        query_budget(response, 2)
+
+    def test_get_meals_sparse_fields_with_food_items(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test requesting food_items in fields= still includes them."""
+        meal_data = MealCreate(
+            meal_type=MealType.DINNER,
+            meal_time=datetime.now() - timedelta(hours=1),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name="Rice", portion_size=1.0, portion_unit="cup"
+                )
+            ],
+        )
+        MealService.create_meal(db, test_user.id, meal_data)
+
+        response = client.get(
+            "/api/meals?fields=meal_type,food_items", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        (meal,) = response.json()["meals"]
+        assert set(meal) == {"id", "meal_type", "meal_time", "food_items"}
+        assert meal["food_items"][0]["food_name"] == "Rice"
+
+    def test_get_meals_documents_sparse_shape(self, client: TestClient):
+        """Test the OpenAPI schema documents the partial meals of fields=."""
+        operation = client.get("/openapi.json").json()["paths"]["/api/meals"]["get"]
+        schema = operation["responses"]["200"]["content"]["application/json"]
+
+        refs = {
+            option["$ref"].rsplit("/", 1)[-1] for option in schema["schema"]["anyOf"]
+        }
+        assert "MealSparseListResponse" in refs
+
+    def test_get_meals_unknown_field(self, client: TestClient, auth_headers: dict):
+        """Test an unknown field name returns 400."""
+        response = client.get("/api/meals?fields=id,password", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "password" in response.json()["detail"]
+
     def test_get_meals_filter_by_meal_type(
         self, client: TestClient, auth_headers: dict, test_user, db
     ):
@@ -210,7 +562,7 @@ class TestGetMealsEndpoint:
 
         # Filter for BREAKFAST
         response = client.get(
-            f"/api/meals?meal_type={MealType.BREAKFAST.value}",
+            f"/api/meals?meal_type={MealType.BREAKFAST.value}&include_total=true",
             headers=auth_headers,
         )
 
@@ -251,7 +603,7 @@ class TestGetMealsEndpoint:
         # Filter for last 2 days
         start_date = (now - timedelta(days=2)).isoformat()
         response = client.get(
-            f"/api/meals?start_date={start_date}",
+            f"/api/meals?start_date={start_date}&include_total=true",
             headers=auth_headers,
         )
 
@@ -285,7 +637,7 @@ class TestGetMealsEndpoint:
         MealService.create_meal(db, test_user_2.id, meal_data)
 
         # Get meals for authenticated user (test_user)
-        response = client.get("/api/meals", headers=auth_headers)
+        response = client.get("/api/meals?include_total=true", headers=auth_headers)
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -382,6 +734,158 @@ class TestGetMealEndpoint:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+def _create_meal(db, user_id: str):
+    """Create a meal with one food item."""
+    meal_data = MealCreate(
+        meal_type=MealType.LUNCH,
+        meal_time=datetime.now() - timedelta(hours=1),
+        food_items=[
+            MealFoodItemCreate(food_name="Salad", portion_size=1.0, portion_unit="bowl")
+        ],
+    )
+    return MealService.create_meal(db, user_id, meal_data)
+
+
+@pytest.fixture
+def photo_storage(client: TestClient, tmp_path, monkeypatch):
+    """Store photos in a temporary directory and process them in a thread."""
+    storage = LocalPhotoStorage(str(tmp_path))
+    executor = ThreadPoolExecutor(max_workers=1)
+    app.dependency_overrides[get_photo_storage] = lambda: storage
+    monkeypatch.setattr(PhotoService, "get_process_pool", lambda: executor)
+    yield storage
+    executor.shutdown(wait=True)
+
+
+class TestMealPhotoEndpoint:
+    """Tests for POST /api/meals/{meal_id}/photo endpoint."""
+
+    def test_upload_photo(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user,
+        db,
+        photo_storage,
+        png_image: bytes,
+    ):
+        """Test the upload is stored and the meal points at the photo URL."""
+        meal = _create_meal(db, test_user.id)
+
+        response = client.post(
+            f"/api/meals/{meal.id}/photo",
+            content=png_image,
+            headers={**auth_headers, "Content-Type": "image/png"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["meal_id"] == meal.id
+        assert data["content_type"] == "image/png"
+        assert data["size_bytes"] == len(png_image)
+        assert data["deduplicated"] is False
+        assert data["photo_url"].startswith("/media/photos/")
+        assert data["thumbnail_url"].startswith("/media/thumbs/")
+
+        meal_response = client.get(f"/api/meals/{meal.id}", headers=auth_headers)
+        assert meal_response.json()["photo_url"] == data["photo_url"]
+
+    def test_duplicate_photo_is_deduplicated(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user,
+        db,
+        photo_storage,
+        png_image: bytes,
+    ):
+        """Test two meals with the same image share one stored original."""
+        headers = {**auth_headers, "Content-Type": "image/png"}
+        first, second = _create_meal(db, test_user.id), _create_meal(db, test_user.id)
+
+        client.post(f"/api/meals/{first.id}/photo", content=png_image, headers=headers)
+        response = client.post(
+            f"/api/meals/{second.id}/photo", content=png_image, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["deduplicated"] is True
+        assert len(list((photo_storage.root / "originals").rglob("*.png"))) == 1
+
+    def test_photo_too_large(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user,
+        db,
+        photo_storage,
+        png_image: bytes,
+        monkeypatch,
+    ):
+        """Test uploads over the size limit return 413."""
+        monkeypatch.setattr(meals_router, "PHOTO_MAX_BYTES", len(png_image) - 1)
+        meal = _create_meal(db, test_user.id)
+
+        response = client.post(
+            f"/api/meals/{meal.id}/photo",
+            content=png_image,
+            headers={**auth_headers, "Content-Type": "image/png"},
+        )
+
+        assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+
+    def test_photo_unsupported_type(
+        self, client: TestClient, auth_headers: dict, test_user, db, photo_storage
+    ):
+        """Test non-image uploads return 415."""
+        meal = _create_meal(db, test_user.id)
+
+        response = client.post(
+            f"/api/meals/{meal.id}/photo",
+            content=b"definitely not an image",
+            headers={**auth_headers, "Content-Type": "image/jpeg"},
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_corrupt_photo_is_not_attached(
+        self, client: TestClient, auth_headers: dict, test_user, db, photo_storage
+    ):
+        """Test a JPEG signature followed by garbage returns 415."""
+        meal = _create_meal(db, test_user.id)
+
+        response = client.post(
+            f"/api/meals/{meal.id}/photo",
+            content=b"\xff\xd8\xff\xe0" + b"corrupt" * 100,
+            headers={**auth_headers, "Content-Type": "image/jpeg"},
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        db.refresh(meal)
+        assert meal.photo_url is None
+
+    def test_photo_user_isolation(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user_2,
+        db,
+        photo_storage,
+        png_image: bytes,
+    ):
+        """Test users can't attach photos to other users' meals."""
+        other_user_meal = _create_meal(db, test_user_2.id)
+
+        response = client.post(
+            f"/api/meals/{other_user_meal.id}/photo",
+            content=png_image,
+            headers={**auth_headers, "Content-Type": "image/png"},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert list((photo_storage.root / "originals").rglob("*.png")) == []
+
+
 class TestUpdateMealEndpoint:
     """Tests for PUT /api/meals/{meal_id} endpoint."""
 
@@ -464,6 +968,91 @@ class TestUpdateMealEndpoint:
         assert data["food_items"][0]["food_name"] == "Oatmeal"
         assert data["total_calories"] == 150
 
+    def test_update_meal_edits_food_item_by_id(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test editing an item by id keeps its id and adjusts totals."""
+        meal_data = MealCreate(
+            meal_type=MealType.LUNCH,
+            meal_time=datetime.now() - timedelta(hours=2),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name="Soup",
+                    portion_size=1.0,
+                    portion_unit="bowl",
+                    calories=200,
+                ),
+                MealFoodItemCreate(
+                    food_name="Bread",
+                    portion_size=1.0,
+                    portion_unit="slice",
+                    calories=80,
+                ),
+            ],
+        )
+        created_meal = MealService.create_meal(db, test_user.id, meal_data)
+        soup, bread = created_meal.food_items
+        soup_id, bread_id = soup.id, bread.id
+
+        update_data = {
+            "food_items": [
+                {
+                    "id": soup_id,
+                    "food_name": "Soup",
+                    "portion_size": 2.0,
+                    "portion_unit": "bowl",
+                    "calories": 400,
+                },
+                {
+                    "id": bread_id,
+                    "food_name": "Bread",
+                    "portion_size": 1.0,
+                    "portion_unit": "slice",
+                    "calories": 80,
+                },
+            ]
+        }
+
+        response = client.put(
+            f"/api/meals/{created_meal.id}", json=update_data, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert {item["id"] for item in data["food_items"]} == {soup_id, bread_id}
+        assert data["total_calories"] == 480
+
+    def test_update_meal_unknown_food_item_id(
+        self, client: TestClient, auth_headers: dict, test_user, db
+    ):
+        """Test an id that is not one of the meal's items returns 400."""
+        meal_data = MealCreate(
+            meal_type=MealType.SNACK,
+            meal_time=datetime.now() - timedelta(hours=1),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name="Apple", portion_size=1.0, portion_unit="medium"
+                )
+            ],
+        )
+        created_meal = MealService.create_meal(db, test_user.id, meal_data)
+        update_data = {
+            "food_items": [
+                {
+                    "id": "not-an-item",
+                    "food_name": "Apple",
+                    "portion_size": 1.0,
+                    "portion_unit": "medium",
+                }
+            ]
+        }
+
+        response = client.put(
+            f"/api/meals/{created_meal.id}", json=update_data, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_update_meal_not_found(self, client: TestClient, auth_headers: dict):
         """Test updating non-existent meal returns 404."""
         import uuid
@@ -593,3 +1182,215 @@ class TestDeleteMealEndpoint:
         # Verify meal still exists
         meal = MealService.get_meal_by_id(db, test_user_2.id, other_user_meal.id)
         assert meal is not None
+
+
+class TestNutritionSummaryEndpoint:
+    """Tests for GET /api/meals/summary endpoint."""
+
+    def test_summary_totals_from_rollup(
+        self, client: TestClient, auth_headers: dict, query_budget
+    ):
+        """Test summary reflects created, updated and deleted meals."""
+        meal_ids = []
+        for calories in (300, 500, 200):
+            response = client.post(
+                "/api/meals",
+                json={
+                    "meal_type": MealType.SNACK.value,
+                    "meal_time": (datetime.now() - timedelta(hours=1)).isoformat(),
+                    "food_items": [
+                        {
+                            "food_name": "Food",
+                            "portion_size": 1.0,
+                            "portion_unit": "serving",
+                            "calories": calories,
+                            "protein_g": 10.0,
+                        }
+                    ],
+                },
+                headers=auth_headers,
+            )
+            meal_ids.append(response.json()["id"])
+        client.delete(f"/api/meals/{meal_ids[2]}", headers=auth_headers)
+
+        start_date = (date.today() - timedelta(days=3)).isoformat()
+        end_date = (date.today() + timedelta(days=1)).isoformat()
+        response = client.get(
+            f"/api/meals/summary?start_date={start_date}&end_date={end_date}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["meal_count"] == 2
+        assert data["total_calories"] == 800
+        assert data["total_protein_g"] == 20
+        assert sum(day["meal_count"] for day in data["days"]) == 2
+        assert data["average_daily_calories"] == 800 / len(data["days"])
+        # user lookup, rollup rows
+        query_budget(response, 2)
+
+    def test_summary_defaults_to_last_week(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test an empty summary covers the last 7 local days by default."""
+        response = client.get("/api/meals/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        start = date.fromisoformat(data["start_date"])
+        end = date.fromisoformat(data["end_date"])
+        assert (end - start).days == 6
+        assert data["days"] == []
+        assert data["meal_count"] == 0
+        assert data["average_daily_calories"] is None
+
+    def test_summary_rejects_invalid_range(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test reversed and overly long ranges return 400."""
+        reversed_range = client.get(
+            "/api/meals/summary?start_date=2025-02-01&end_date=2025-01-01",
+            headers=auth_headers,
+        )
+        too_long = client.get(
+            "/api/meals/summary?start_date=2020-01-01&end_date=2025-01-01",
+            headers=auth_headers,
+        )
+
+        assert reversed_range.status_code == status.HTTP_400_BAD_REQUEST
+        assert too_long.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_summary_requires_authentication(self, client: TestClient):
+        """Test that the summary requires authentication."""
+        response = client.get("/api/meals/summary")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestNutritionTrendsEndpoint:
+    """Tests for GET /api/meals/trends endpoint."""
+
+    def test_trends_weekly_buckets_and_meal_types(
+        self, client: TestClient, auth_headers: dict, query_budget
+    ):
+        """Test trends include logged meals and stay within the query budget."""
+        for meal_type, calories in (("breakfast", 400), ("dinner", 800)):
+            client.post(
+                "/api/meals",
+                json={
+                    "meal_type": meal_type,
+                    "meal_time": (datetime.now() - timedelta(hours=1)).isoformat(),
+                    "food_items": [
+                        {
+                            "food_name": "Food",
+                            "portion_size": 1.0,
+                            "portion_unit": "serving",
+                            "calories": calories,
+                        }
+                    ],
+                },
+                headers=auth_headers,
+            )
+
+        start_date = (date.today() - timedelta(days=30)).isoformat()
+        end_date = (date.today() + timedelta(days=1)).isoformat()
+        response = client.get(
+            f"/api/meals/trends?start_date={start_date}&end_date={end_date}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["period"] == "week"
+        assert sum(bucket["meal_count"] for bucket in data["buckets"]) == 2
+        assert sum(bucket["total_calories"] for bucket in data["buckets"]) == 1200
+        shares = {row["meal_type"]: row["calorie_share"] for row in data["meal_types"]}
+        assert shares == {"breakfast": 33.3, "dinner": 66.7}
+        # user lookup, period buckets, meal type breakdown
+        query_budget(response, 3)
+
+    def test_trends_rejects_invalid_parameters(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test invalid periods, windows and ranges are rejected."""
+        bad_period = client.get("/api/meals/trends?period=day", headers=auth_headers)
+        bad_window = client.get("/api/meals/trends?window=0", headers=auth_headers)
+        too_long = client.get(
+            "/api/meals/trends?start_date=2000-01-01&end_date=2025-01-01",
+            headers=auth_headers,
+        )
+
+        assert bad_period.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert bad_window.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert too_long.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_trends_requires_authentication(self, client: TestClient):
+        """Test that trends require authentication."""
+        response = client.get("/api/meals/trends")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestExportMealsEndpoint:
+    """Tests for GET /api/meals/export endpoint."""
+
+    def _create_meals(self, db, user_id: str) -> None:
+        """Create a two-item meal and a one-item meal."""
+        for hours_ago, foods in ((3, ("Eggs", "Toast")), (1, ("Salad",))):
+            MealService.create_meal(
+                db,
+                user_id,
+                MealCreate(
+                    meal_type=MealType.LUNCH,
+                    meal_time=datetime.now() - timedelta(hours=hours_ago),
+                    food_items=[
+                        MealFoodItemCreate(
+                            food_name=food,
+                            portion_size=1.0,
+                            portion_unit="serving",
+                            calories=100,
+                        )
+                        for food in foods
+                    ],
+                ),
+            )
+
+    def test_export_csv(self, client: TestClient, auth_headers: dict, test_user, db):
+        """Test CSV export has a header and one line per food item."""
+        self._create_meals(db, test_user.id)
+
+        response = client.get("/api/meals/export", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["food_name"] for row in rows][-1] == "Salad"
+        assert sorted(row["food_name"] for row in rows) == ["Eggs", "Salad", "Toast"]
+        assert {row["total_calories"] for row in rows} == {"200.0", "100.0"}
+
+    def test_export_ndjson_gzip(
+        self, client: TestClient, auth_headers: dict, test_user, test_user_2, db
+    ):
+        """Test gzipped NDJSON export has one meal per line, oldest first."""
+        self._create_meals(db, test_user.id)
+        self._create_meals(db, test_user_2.id)
+
+        response = client.get(
+            "/api/meals/export?format=ndjson&gzip=true", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+        lines = gzip.decompress(response.content).decode().splitlines()
+        meals = [json.loads(line) for line in lines]
+        assert [len(meal["food_items"]) for meal in meals] == [2, 1]
+        assert meals[0]["meal_time"] < meals[1]["meal_time"]
+
+    def test_export_requires_authentication(self, client: TestClient):
+        """Test that export requires authentication."""
+        response = client.get("/api/meals/export")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
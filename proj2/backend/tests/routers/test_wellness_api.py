@@ -293,6 +293,32 @@ class TestGetWellnessLogsEndpoint:
         assert len(data["stress_logs"]) == 0
         assert len(data["sleep_logs"]) == 0
 
+    def test_get_wellness_logs_without_notes(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test that include_notes=false returns scores without notes."""
+        today = datetime.now(timezone.utc)
+        client.post(
+            "/api/wellness/stress-logs",
+            json={
+                "occurred_at": today.isoformat(),
+                "stress_level": 6,
+                "triggers": "Deadline",
+                "notes": "Long day",
+            },
+            headers=auth_headers,
+        )
+
+        response = client.get(
+            "/api/wellness/logs?include_notes=false", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        stress_log = response.json()["stress_logs"][0]
+        assert stress_log["stress_level"] == 6
+        assert stress_log["triggers"] is None
+        assert stress_log["notes"] is None
+
     def test_get_wellness_logs_requires_authentication(self, client: TestClient):
         """Test that getting logs requires authentication."""
         response = client.get("/api/wellness/logs")
@@ -310,6 +336,141 @@ class TestGetWellnessLogsEndpoint:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class TestGetWellnessTimelineEndpoint:
+    """Tests for GET /api/wellness/logs/timeline endpoint."""
+
+    def test_timeline_pages_through_all_types(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test the merged timeline is returned newest first, page by page."""
+        now = datetime.now(timezone.utc)
+        client.post(
+            "/api/wellness/sleep-logs",
+            json={
+                "occurred_at": (now - timedelta(seconds=2)).isoformat(),
+                "duration_hours": 7.0,
+                "quality_score": 8,
+            },
+            headers=auth_headers,
+        )
+        client.post(
+            "/api/wellness/stress-logs",
+            json={
+                "occurred_at": (now - timedelta(seconds=1)).isoformat(),
+                "stress_level": 4,
+            },
+            headers=auth_headers,
+        )
+        client.post(
+            "/api/wellness/mood-logs",
+            json={"occurred_at": now.isoformat(), "mood_score": 8},
+            headers=auth_headers,
+        )
+
+        first = client.get(
+            "/api/wellness/logs/timeline?limit=2", headers=auth_headers
+        ).json()
+        second = client.get(
+            "/api/wellness/logs/timeline",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+            headers=auth_headers,
+        ).json()
+
+        assert [entry["log_type"] for entry in first["entries"]] == ["mood", "stress"]
+        assert first["has_more"] is True
+        assert [entry["log_type"] for entry in second["entries"]] == ["sleep"]
+        assert second["entries"][0]["quality_score"] == 8
+        assert second["has_more"] is False
+        assert second["next_cursor"] is None
+
+    def test_timeline_rejects_invalid_cursor(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(
+            "/api/wellness/logs/timeline?cursor=not-a-cursor", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestImportWellnessLogsEndpoint:
+    """Tests for POST /api/wellness/import endpoint."""
+
+    def test_import_ndjson(self, client: TestClient, auth_headers: dict):
+        """Test an NDJSON body is imported and rejected lines are reported."""
+        body = (
+            '{"log_type": "mood", "occurred_at": "2023-05-01T12:00:00Z", '
+            '"mood_score": 6}\n'
+            '{"log_type": "mood", "occurred_at": "2023-05-02T12:00:00Z", '
+            '"mood_score": 0}\n'
+        )
+
+        response = client.post(
+            "/api/wellness/import?format=ndjson",
+            content=body,
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert (data["imported"], data["failed"]) == (1, 1)
+        assert data["errors"][0]["line"] == 2
+        assert data["errors"][0]["log_type"] == "mood"
+
+        logs = client.get(
+            "/api/wellness/logs?log_type=mood", headers=auth_headers
+        ).json()
+        assert logs["total_count"] == 1
+
+    def test_import_rejects_csv_without_header(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test that a CSV file without the required header is rejected."""
+        response = client.post(
+            "/api/wellness/import",
+            content="mood,2023-05-01T12:00:00Z,6\n",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestGetWellnessInsightsEndpoint:
+    """Tests for GET /api/wellness/insights endpoint."""
+
+    def test_insights_include_new_logs(self, client: TestClient, auth_headers: dict):
+        """Test logs show up in the insights through the daily rollup."""
+        now = datetime.now(timezone.utc)
+        client.post(
+            "/api/wellness/mood-logs",
+            json={"occurred_at": now.isoformat(), "mood_score": 7},
+            headers=auth_headers,
+        )
+
+        response = client.get("/api/wellness/insights", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["rolling_window"] == 7
+        mood = next(m for m in data["metrics"] if m["metric"] == "mood_score")
+        assert mood["days_logged"] == 1
+        assert mood["average"] == 7.0
+        assert mood["current_streak"] == 1
+        assert len(data["weeks"]) == 1
+
+    def test_insights_rejects_inverted_range(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test that start_date after end_date is rejected."""
+        response = client.get(
+            "/api/wellness/insights?start_date=2024-02-01&end_date=2024-01-01",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 class TestGetMoodLogEndpoint:
     """Tests for GET /api/wellness/mood-logs/{log_id} endpoint."""
 
@@ -0,0 +1,65 @@
+"""Tests for the load harness reporting."""
+
+import json
+
+from src.eatsential.scripts.load_harness import (
+    LoadTestStats,
+    compare_reports,
+    percentile,
+    summarize,
+)
+
+
+def _stats() -> LoadTestStats:
+    """Record 100 list requests of 1..100 ms and one failed login."""
+    stats = LoadTestStats()
+    for ms in range(1, 101):
+        stats.record("GET /api/meals", ms / 1000, ok=True)
+    stats.record("POST /api/auth/login", None, ok=False)
+    return stats
+
+
+def test_percentile_uses_nearest_rank():
+    """Percentiles are actual samples, never interpolated."""
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7
+    assert percentile(values, 0) == 1
+
+
+def test_summarize_reports_throughput_and_percentiles():
+    """Each endpoint and the total get throughput, errors and percentiles."""
+    report = summarize(_stats(), elapsed=10)
+
+    meals = report["endpoints"]["GET /api/meals"]
+    assert meals["requests"] == 100
+    assert meals["throughput_rps"] == 10
+    assert (meals["p50_ms"], meals["p95_ms"], meals["p99_ms"]) == (50, 95, 99)
+    login = report["endpoints"]["POST /api/auth/login"]
+    assert (login["requests"], login["errors"]) == (0, 1)
+    assert "p50_ms" not in login
+    assert report["total"]["errors"] == 1
+    # Reports are written as JSON
+    assert json.loads(json.dumps(report)) == report
+
+
+def test_compare_reports_marks_improvements():
+    """Lower latency and higher throughput count as improvements."""
+    baseline = summarize(_stats(), elapsed=10)
+    faster = LoadTestStats()
+    for ms in range(1, 101):
+        faster.record("GET /api/meals", ms / 2000, ok=True)
+    faster.record("POST /api/meals", 0.01, ok=True)
+
+    rows = compare_reports(baseline, summarize(faster, elapsed=10))
+    by_key = {(row["endpoint"], row["metric"]): row for row in rows}
+
+    p95 = by_key[("GET /api/meals", "p95_ms")]
+    assert (p95["baseline"], p95["current"], p95["change_pct"]) == (95, 47.5, -50)
+    assert p95["improved"]
+    assert by_key[("total", "throughput_rps")]["improved"]
+    # Endpoints missing from the baseline are not compared
+    assert not any(row["endpoint"] == "POST /api/meals" for row in rows)
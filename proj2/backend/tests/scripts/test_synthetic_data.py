@@ -0,0 +1,119 @@
+"""Tests for the synthetic data generator."""
+
+from collections import Counter
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.eatsential.db.database import Base
+from src.eatsential.models import (
+    DailyNutritionDB,
+    DailyWellnessDB,
+    MealDB,
+    MenuItem,
+    MoodLogDB,
+    SleepLogDB,
+    UserDB,
+)
+from src.eatsential.scripts.synthetic_data import (
+    SyntheticDataConfig,
+    generate,
+    generate_user_partition,
+)
+from src.eatsential.utils.timezones import local_dates
+
+CONFIG = SyntheticDataConfig(
+    seed=7,
+    users=250,
+    meals_per_user=5,
+    days=30,
+    menu_items=2100,
+    end_date=date(2025, 11, 5),
+)
+
+
+def _database(tmp_path, name: str) -> str:
+    """Create an empty schema in a temporary SQLite file."""
+    url = f"sqlite:///{tmp_path / name}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return url
+
+
+def _scalars(url: str, stmt) -> list:
+    """Run a query against a database and return its first column."""
+    engine = create_engine(url)
+    try:
+        with Session(engine) as db:
+            return list(db.scalars(stmt))
+    finally:
+        engine.dispose()
+
+
+def test_partitions_are_deterministic():
+    """The same seed gives the same rows; another seed does not."""
+    first = generate_user_partition(CONFIG, 1, "hash")
+    again = generate_user_partition(CONFIG, 1, "hash")
+    other = generate_user_partition(
+        SyntheticDataConfig(**{**CONFIG.__dict__, "seed": 8}), 1, "hash"
+    )
+
+    assert first == again
+    assert first[MealDB] != other[MealDB]
+    assert len(first[UserDB]) == 50
+    assert first[UserDB][0]["email"] == "synth200@example.com"
+
+
+def test_one_wellness_log_per_local_day():
+    """Each user logs each type at most once per local day, in range."""
+    rows = generate_user_partition(CONFIG, 0, "hash")
+    zones = {user["id"]: user["timezone"] for user in rows[UserDB]}
+
+    for model in (MoodLogDB, SleepLogDB):
+        logs = rows[model]
+        days = local_dates(
+            [log["occurred_at_utc"] for log in logs],
+            [zones[log["user_id"]] for log in logs],
+        )
+        per_day = Counter(zip((log["user_id"] for log in logs), days))
+        assert max(per_day.values()) == 1
+        assert all(CONFIG.end_date > day for day in days)
+
+    assert all(1 <= log["mood_score"] <= 10 for log in rows[MoodLogDB])
+    assert all(0 < log["duration_hours"] <= 24 for log in rows[SleepLogDB])
+
+
+def test_generate_loads_rows_and_rollups(tmp_path):
+    """Rows are inserted in parallel identically and rolled up."""
+    serial = _database(tmp_path, "serial.db")
+    parallel = _database(tmp_path, "parallel.db")
+
+    totals = generate(serial, CONFIG, "hash", workers=1)
+    generate(parallel, CONFIG, "hash", workers=2)
+
+    assert totals["users"] == 250
+    assert totals["meals"] == 250 * 5
+    assert totals["menu_items"] == 2100
+    assert _scalars(serial, select(func.count()).select_from(MenuItem)) == [2100]
+    assert _scalars(serial, select(func.sum(DailyNutritionDB.meal_count))) == [
+        totals["meals"]
+    ]
+    assert _scalars(serial, select(func.sum(DailyWellnessDB.mood_score_count))) == [
+        totals["mood_logs"]
+    ]
+
+    meal_ids = select(MealDB.id).order_by(MealDB.id)
+    assert _scalars(serial, meal_ids) == _scalars(parallel, meal_ids)
+
+
+def test_generate_refuses_seeded_database(tmp_path):
+    """A second run into the same database is rejected."""
+    url = _database(tmp_path, "seeded.db")
+    config = SyntheticDataConfig(users=1, meals_per_user=1, days=2, menu_items=1)
+    generate(url, config, "hash")
+
+    with pytest.raises(ValueError, match="already exists"):
+        generate(url, config, "hash")
@@ -6,7 +6,8 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from sqlalchemy.orm import Session
 
-from src.eatsential.models.models import MoodLogDB, UserDB
+from src.eatsential.db.query_stats import track_queries
+from src.eatsential.models.models import MoodLogDB, SleepLogDB, StressLogDB, UserDB
 from src.eatsential.schemas.schemas import (
     MoodLogCreate,
     MoodLogUpdate,
@@ -16,7 +17,12 @@ from src.eatsential.schemas.schemas import (
     StressLogUpdate,
 )
 from src.eatsential.services.mental_wellness_service import MentalWellnessService
-from src.eatsential.utils.security import decrypt_sensitive_data
+from src.eatsential.utils.pagination import encode_cursor
+from src.eatsential.utils.security import (
+    EncryptedValue,
+    decrypt_sensitive_data,
+    encrypt_sensitive_data,
+)
 
 
 @pytest.fixture
@@ -441,6 +447,52 @@ class TestGetWellnessLogs:
         assert len(mood_logs) == 1
         assert mood_logs[0].notes == "Decryption test"
 
+    def test_get_wellness_logs_without_notes(self, db: Session, test_user: UserDB):
+        """Test that include_notes=False leaves encrypted columns unread."""
+        today = datetime.now(timezone.utc)
+        MentalWellnessService.log_stress(
+            db,
+            test_user.id,
+            StressLogCreate(
+                occurred_at=today, stress_level=6, triggers="Work", notes="Busy"
+            ),
+            test_user,
+        )
+
+        with track_queries() as stats:
+            _, stress_logs, _ = MentalWellnessService.get_wellness_logs(
+                db, test_user.id, log_type="stress", include_notes=False
+            )
+
+        assert stress_logs[0].stress_level == 6
+        assert stress_logs[0].triggers is None
+        assert stress_logs[0].notes is None
+        assert not any("encrypted_" in shape for shape in stats.shapes)
+
+    def test_encrypted_columns_decrypt_on_first_access(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test that loaded notes stay encrypted until they are read."""
+        today = datetime.now(timezone.utc)
+        MentalWellnessService.log_stress(
+            db,
+            test_user.id,
+            StressLogCreate(
+                occurred_at=today, stress_level=6, triggers="Work", notes="Busy"
+            ),
+            test_user,
+        )
+        db.expire_all()
+
+        stress_log = db.query(StressLogDB).one()
+        notes = stress_log.encrypted_notes
+
+        assert isinstance(notes, EncryptedValue)
+        assert notes != "Busy"
+        assert "plaintext" not in notes.__dict__
+        assert notes.plaintext == "Busy"
+        assert decrypt_sensitive_data(stress_log.encrypted_triggers) == "Work"
+
     def test_get_wellness_logs_user_isolation(
         self, db: Session, test_user: UserDB, test_user_2: UserDB
     ):
@@ -482,6 +534,82 @@ class TestGetWellnessLogs:
         assert len(sleep_logs) == 0
 
 
+class TestGetWellnessTimeline:
+    """Tests for MentalWellnessService.get_wellness_timeline."""
+
+    @pytest.fixture
+    def timeline_logs(self, db: Session, test_user: UserDB) -> list[str]:
+        """Create two logs of each type an hour apart; return IDs newest first."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        logs = []
+        for hours_ago in range(6):
+            common = {
+                "id": str(uuid.uuid4()),
+                "user_id": test_user.id,
+                "occurred_at_utc": now - timedelta(hours=hours_ago),
+            }
+            if hours_ago % 3 == 0:
+                logs.append(MoodLogDB(**common, mood_score=hours_ago + 1))
+            elif hours_ago % 3 == 1:
+                logs.append(StressLogDB(**common, stress_level=hours_ago))
+            else:
+                logs.append(
+                    SleepLogDB(**common, duration_hours=7.5, quality_score=hours_ago)
+                )
+        db.add_all(logs)
+        db.commit()
+        return [log.id for log in logs]
+
+    def test_pages_merge_all_types_in_one_query(
+        self, db: Session, test_user: UserDB, timeline_logs: list[str]
+    ):
+        """Test cursor pages walk the merged timeline, one statement each."""
+        user_id = test_user.id
+        seen = []
+        cursor = None
+        while True:
+            with track_queries() as stats:
+                entries, has_more = MentalWellnessService.get_wellness_timeline(
+                    db, user_id, cursor=cursor, limit=4
+                )
+            assert stats.count == 1
+            seen.extend(entries)
+            if not has_more:
+                break
+            cursor = encode_cursor(entries[-1].occurred_at_utc, entries[-1].id)
+
+        assert [entry.id for entry in seen] == timeline_logs
+        assert [entry.log_type for entry in seen[:3]] == ["mood", "stress", "sleep"]
+        assert seen[0].mood_score == 1
+        assert seen[0].stress_level is None
+        assert seen[1].stress_level == 1
+        assert (seen[2].duration_hours, seen[2].quality_score) == (7.5, 2)
+
+    def test_timeline_filters_by_type_and_decrypts_notes(
+        self, db: Session, test_user: UserDB, timeline_logs: list[str]
+    ):
+        """Test log_type keeps one branch and notes are decrypted."""
+        db.add(
+            StressLogDB(
+                id=str(uuid.uuid4()),
+                user_id=test_user.id,
+                occurred_at_utc=datetime.now(timezone.utc).replace(tzinfo=None),
+                stress_level=3,
+                encrypted_triggers=encrypt_sensitive_data("Traffic"),
+                encrypted_notes=encrypt_sensitive_data("Late"),
+            )
+        )
+        db.commit()
+
+        entries, has_more = MentalWellnessService.get_wellness_timeline(
+            db, test_user.id, log_type="stress"
+        )
+
+        assert not has_more
+        assert [entry.log_type for entry in entries] == ["stress"] * 3
+        assert (entries[0].triggers, entries[0].notes) == ("Traffic", "Late")
+
+
 class TestUpdateMoodLog:
     """Tests for MentalWellnessService.update_mood_log."""
 
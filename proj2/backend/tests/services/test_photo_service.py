@@ -0,0 +1,138 @@
+"""Unit tests for meal photo storage and processing."""
+
+import asyncio
+import hashlib
+import io
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.eatsential.services.photo_service import PhotoService, process_photo
+from src.eatsential.services.photo_storage import (
+    LocalPhotoStorage,
+    PhotoTooLargeError,
+    StoredPhoto,
+    UnsupportedImageError,
+)
+
+
+async def _chunks(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    """Yield data in small chunks, like a streamed request body."""
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _save(storage: LocalPhotoStorage, data: bytes, max_bytes: int = 1024):
+    """Run save_original to completion."""
+    return asyncio.run(storage.save_original(_chunks(data), max_bytes))
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalPhotoStorage:
+    """Local photo storage in a temporary directory."""
+    return LocalPhotoStorage(str(tmp_path), media_url="/media/")
+
+
+class TestLocalPhotoStorage:
+    """Tests for LocalPhotoStorage.save_original."""
+
+    def test_save_is_content_addressed(self, storage, png_image: bytes):
+        """Test originals are stored under their SHA-256 digest."""
+        photo = _save(storage, png_image)
+
+        assert photo.content_hash == hashlib.sha256(png_image).hexdigest()
+        assert photo.content_type == "image/png"
+        assert photo.size_bytes == len(png_image)
+        assert photo.deduplicated is False
+        assert storage.original_path(photo).read_bytes() == png_image
+        assert storage.url(photo.content_hash, "thumbnail") == (
+            f"/media/thumbs/{photo.content_hash[:2]}/{photo.content_hash[2:4]}/"
+            f"{photo.content_hash}.jpg"
+        )
+
+    def test_duplicate_upload_is_deduplicated(self, storage, png_image: bytes):
+        """Test the same bytes uploaded twice share one original."""
+        first = _save(storage, png_image)
+        second = _save(storage, png_image)
+
+        assert second.deduplicated is True
+        assert second.content_hash == first.content_hash
+        assert len(list((storage.root / "originals").rglob("*.png"))) == 1
+        assert list((storage.root / "tmp").iterdir()) == []
+
+    def test_upload_over_limit_is_abandoned(self, storage, png_image: bytes):
+        """Test an oversized upload raises and leaves no files behind."""
+        with pytest.raises(PhotoTooLargeError):
+            _save(storage, png_image, max_bytes=len(png_image) - 1)
+
+        assert list((storage.root / "tmp").iterdir()) == []
+        assert list((storage.root / "originals").rglob("*.*")) == []
+
+    @pytest.mark.parametrize("data", [b"", b"GIF89a", b"not an image at all"])
+    def test_unsupported_upload_is_rejected(self, storage, data: bytes):
+        """Test empty, short and non-image bodies are rejected."""
+        with pytest.raises(UnsupportedImageError):
+            _save(storage, data)
+
+        assert list((storage.root / "tmp").iterdir()) == []
+
+    def test_corrupt_image_is_rejected(self, storage, png_image: bytes):
+        """Test a valid signature followed by corrupt data is rejected."""
+        # Flip a byte of the pixel data, breaking the IDAT checksum
+        corrupt_png = bytearray(png_image)
+        corrupt_png[-20] ^= 0xFF
+
+        for data in (bytes(corrupt_png), b"\xff\xd8\xff\xe0" + b"\x00" * 64):
+            with pytest.raises(UnsupportedImageError):
+                _save(storage, data)
+
+        assert list((storage.root / "tmp").iterdir()) == []
+        assert list((storage.root / "originals").rglob("*.*")) == []
+
+
+class TestProcessPhoto:
+    """Tests for thumbnail generation and metadata stripping."""
+
+    def test_strips_exif_and_resizes(self, storage):
+        """Test derived images drop EXIF, honour orientation and are bounded."""
+        pil_image = pytest.importorskip("PIL.Image")
+        exif = pil_image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise
+        exif[0x010F] = "PhoneMaker"  # Camera make
+        original = io.BytesIO()
+        pil_image.new("RGB", (4000, 1000), "green").save(original, "JPEG", exif=exif)
+        photo = _save(storage, original.getvalue(), max_bytes=10 * 1024 * 1024)
+
+        process_photo(
+            str(storage.original_path(photo)),
+            str(storage.variant_path(photo.content_hash, "photo")),
+            str(storage.variant_path(photo.content_hash, "thumbnail")),
+        )
+
+        with pil_image.open(storage.variant_path(photo.content_hash, "photo")) as image:
+            assert image.size == (512, 2048)
+            assert not image.getexif()
+        with pil_image.open(
+            storage.variant_path(photo.content_hash, "thumbnail")
+        ) as thumb:
+            assert max(thumb.size) == 320
+            assert not thumb.getexif()
+
+
+class TestScheduleProcessing:
+    """Tests for PhotoService.schedule_processing."""
+
+    def test_processing_is_scheduled_once(self, storage, png_image, monkeypatch):
+        """Test existing derived images are not generated again."""
+        pytest.importorskip("PIL")
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(PhotoService, "get_process_pool", lambda: executor)
+        photo: StoredPhoto = _save(storage, png_image)
+
+        future = PhotoService.schedule_processing(storage, photo)
+        future.result(timeout=10)
+        executor.shutdown(wait=True)
+
+        assert storage.has_variants(photo.content_hash)
+        assert PhotoService.schedule_processing(storage, photo) is None
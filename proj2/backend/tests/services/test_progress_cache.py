@@ -0,0 +1,78 @@
+"""Unit tests for the goal progress snapshot cache."""
+
+from sqlalchemy.orm import Session
+
+from src.eatsential.services.progress_cache import (
+    ProgressSnapshotCache,
+    invalidate_after_commit,
+    progress_snapshots,
+)
+
+
+class TestProgressSnapshotCache:
+    """Tests for ProgressSnapshotCache."""
+
+    def test_snapshot_expires_after_ttl(self):
+        """Test snapshots are served until the TTL from the read start."""
+        cache = ProgressSnapshotCache(ttl_seconds=30, max_users=10)
+
+        assert cache.put("user", "key", ("row",), started_at=100.0)
+
+        assert cache.get("user", "key", now=129.0) == ("row",)
+        assert cache.get("user", "key", now=130.0) is None
+
+    def test_invalidate_drops_user_snapshots(self):
+        """Test invalidation drops every key of that user only."""
+        cache = ProgressSnapshotCache(ttl_seconds=30, max_users=10)
+        cache.put("user", "a", 1, started_at=100.0)
+        cache.put("user", "b", 2, started_at=100.0)
+        cache.put("other", "a", 3, started_at=100.0)
+
+        cache.invalidate(["user"], now=101.0)
+
+        assert cache.get("user", "a", now=102.0) is None
+        assert cache.get("user", "b", now=102.0) is None
+        assert cache.get("other", "a", now=102.0) == 3
+
+    def test_read_started_before_invalidation_is_not_stored(self):
+        """Test a read racing with a write cannot cache the old state."""
+        cache = ProgressSnapshotCache(ttl_seconds=30, max_users=10)
+
+        cache.invalidate(["user"], now=101.0)
+
+        assert not cache.put("user", "key", "stale", started_at=100.0)
+        assert cache.put("user", "key", "fresh", started_at=102.0)
+        assert cache.get("user", "key", now=103.0) == "fresh"
+
+    def test_least_recently_used_user_is_evicted(self):
+        """Test the cache holds at most max_users users."""
+        cache = ProgressSnapshotCache(ttl_seconds=30, max_users=2)
+        cache.put("a", "key", 1, started_at=100.0)
+        cache.put("b", "key", 2, started_at=100.0)
+        cache.get("a", "key", now=101.0)
+
+        cache.put("c", "key", 3, started_at=102.0)
+
+        assert cache.get("a", "key", now=103.0) == 1
+        assert cache.get("b", "key", now=103.0) is None
+        assert cache.get("c", "key", now=103.0) == 3
+
+
+class TestInvalidateAfterCommit:
+    """Tests for invalidation tied to the session transaction."""
+
+    def test_invalidates_on_commit_only(self, db: Session, monkeypatch):
+        """Test invalidation waits for commit and is dropped on rollback."""
+        monkeypatch.setattr(progress_snapshots, "ttl_seconds", 1e9)
+        progress_snapshots.put("user", "key", "snapshot", started_at=0.0)
+
+        db.connection()  # open the transaction to roll back
+        invalidate_after_commit(db, ["user"])
+        db.rollback()
+        db.commit()
+        assert progress_snapshots.get("user", "key") == "snapshot"
+
+        invalidate_after_commit(db, ["user"])
+        assert progress_snapshots.get("user", "key") == "snapshot"
+        db.commit()
+        assert progress_snapshots.get("user", "key") is None
@@ -25,6 +25,7 @@ from src.eatsential.schemas.recommendation_schemas import (
     RecommendationFilters,
     RecommendationRequest,
 )
+from src.eatsential.services import engine as engine_module
 from src.eatsential.services.engine import RecommendationService
 
 
@@ -714,6 +715,32 @@ def test_llm_missing_api_key(db: Session):
     assert len(result.items) > 0
 
 
+def test_llm_stand_in_answers_without_api_key(
+    monkeypatch: pytest.MonkeyPatch, db: Session
+):
+    """Test the local stand-in ranks candidates through the LLM path."""
+    monkeypatch.setattr(engine_module, "LLM_STAND_IN_LATENCY_MS", 0.0)
+    user, items = _build_user_and_items(db)
+    service = RecommendationService(db, llm_api_key=None, max_results=5)
+
+    meals = service.get_meal_recommendations(
+        user=user, request=RecommendationRequest(mode="llm")
+    )
+    again = service.get_meal_recommendations(
+        user=user, request=RecommendationRequest(mode="llm")
+    )
+    restaurants = service.get_restaurant_recommendations(
+        user=user, request=RecommendationRequest(mode="llm")
+    )
+
+    assert sorted(item.item_id for item in meals.items) == sorted(
+        item.id for item in items
+    )
+    assert meals == again
+    assert all("stand-in" in item.explanation for item in meals.items)
+    assert [item.item_id for item in restaurants.items] == ["engine_restaurant"]
+
+
 def test_llm_response_with_parsed_field(monkeypatch: pytest.MonkeyPatch, db: Session):
     """Test LLM response parsing when using parsed field."""
     user, items = _build_user_and_items(db)
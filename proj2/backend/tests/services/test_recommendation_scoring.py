@@ -160,6 +160,32 @@ class TestPhysicalScoring:
         # Items exceeding goal should not be supported
         assert service._supports_calorie_goal(context.health_goals, 900.0) is False
 
+    def test_only_active_goals_are_loaded(
+        self, db: Session, scoring_user_with_profile: UserDB
+    ):
+        """Test completed and expired goals are left out of the context."""
+        today = date.today()
+        for status in (GoalStatus.ACTIVE, GoalStatus.COMPLETED, GoalStatus.EXPIRED):
+            db.add(
+                GoalDB(
+                    id=f"{status.value}_goal",
+                    user_id=scoring_user_with_profile.id,
+                    goal_type=GoalType.NUTRITION,
+                    target_type="calorie_intake",
+                    target_value=Decimal("500.0"),
+                    current_value=Decimal("0.0"),
+                    start_date=today - timedelta(days=30),
+                    end_date=today + timedelta(days=30),
+                    status=status,
+                )
+            )
+        db.commit()
+
+        service = RecommendationService(db, max_results=10)
+        context = service._load_user_context(scoring_user_with_profile)
+
+        assert [goal.id for goal in context.health_goals] == ["active_goal"]
+
     def test_protein_goal_keyword_matching(
         self,
         db: Session,
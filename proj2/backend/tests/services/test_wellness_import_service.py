@@ -0,0 +1,180 @@
+"""Unit tests for WellnessImportService."""
+
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import (
+    DailyWellnessDB,
+    MoodLogDB,
+    SleepLogDB,
+    StressLogDB,
+    UserDB,
+)
+from src.eatsential.schemas.schemas import MoodLogCreate
+from src.eatsential.services.mental_wellness_service import MentalWellnessService
+from src.eatsential.services.wellness_import_service import (
+    IMPORT_COLUMNS,
+    WellnessImportService,
+)
+from src.eatsential.utils.security import decrypt_sensitive_data
+
+# Midday UTC is the same date in New York
+HISTORY_START = datetime(2023, 3, 1, 15, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user in New York."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="importer@example.com",
+        username="importeruser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="America/New_York",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _csv(*rows: dict) -> list[str]:
+    """Build CSV lines with the full import header."""
+    lines = [",".join(IMPORT_COLUMNS) + "\n"]
+    for row in rows:
+        lines.append(",".join(str(row.get(c, "")) for c in IMPORT_COLUMNS) + "\n")
+    return lines
+
+
+def _day(days: int) -> str:
+    """ISO8601 timestamp a number of days into the history."""
+    return (HISTORY_START + timedelta(days=days)).isoformat()
+
+
+def _count(db: Session, model: type) -> int:
+    """Count the logs of a model."""
+    return db.scalar(select(func.count()).select_from(model))
+
+
+class TestImportLogs:
+    """Tests for WellnessImportService.import_logs."""
+
+    def test_imports_past_logs_of_all_types(self, db: Session, test_user: UserDB):
+        """Test historical records are inserted, encrypted and rolled up."""
+        lines = _csv(
+            {"log_type": "mood", "occurred_at": _day(0), "mood_score": 7},
+            {
+                "log_type": "stress",
+                "occurred_at": _day(0),
+                "stress_level": 4,
+                "triggers": "work",
+                "notes": "deadline",
+            },
+            {
+                "log_type": "sleep",
+                "occurred_at": _day(1),
+                "duration_hours": 7.5,
+                "quality_score": 8,
+            },
+        )
+
+        report = WellnessImportService.import_logs(db, test_user, lines, "csv")
+
+        assert (report.processed, report.imported, report.failed) == (3, 3, 0)
+        assert report.imported_by_type == {"mood": 1, "stress": 1, "sleep": 1}
+        stress = db.scalars(select(StressLogDB)).one()
+        assert decrypt_sensitive_data(stress.encrypted_triggers) == "work"
+        assert decrypt_sensitive_data(stress.encrypted_notes) == "deadline"
+
+        day = db.get(DailyWellnessDB, (test_user.id, date(2023, 3, 1)))
+        assert (float(day.mood_score_sum), day.mood_score_count) == (7.0, 1)
+        assert day.stress_level_count == 1
+        next_day = db.get(DailyWellnessDB, (test_user.id, date(2023, 3, 2)))
+        assert float(next_day.sleep_quality_sum) == 8.0
+
+    def test_rejects_days_already_logged(self, db: Session, test_user: UserDB):
+        """Test one log per type and local day against the database and file."""
+        now = datetime.now(timezone.utc)
+        MentalWellnessService.log_mood(
+            db, test_user.id, MoodLogCreate(occurred_at=now, mood_score=5), test_user
+        )
+        lines = _csv(
+            {"log_type": "mood", "occurred_at": now.isoformat(), "mood_score": 6},
+            {"log_type": "mood", "occurred_at": _day(0), "mood_score": 6},
+            {"log_type": "mood", "occurred_at": _day(0), "mood_score": 8},
+            # Same day, other log type
+            {"log_type": "stress", "occurred_at": _day(0), "stress_level": 2},
+        )
+
+        report = WellnessImportService.import_logs(db, test_user, lines, "csv")
+
+        assert (report.imported, report.failed) == (2, 2)
+        assert [error.line for error in report.errors] == [2, 4]
+        assert "already exists" in report.errors[0].errors[0]
+        assert _count(db, MoodLogDB) == 2
+
+    def test_reports_invalid_records(self, db: Session, test_user: UserDB):
+        """Test unparsable and invalid lines are reported, others imported."""
+        lines = [
+            json.dumps({"log_type": "mood", "occurred_at": _day(0), "mood_score": 4}),
+            "not json",
+            json.dumps({"log_type": "walk", "occurred_at": _day(0)}),
+            json.dumps({"log_type": "mood", "occurred_at": _day(1), "mood_score": 11}),
+            "",
+            json.dumps(
+                {"log_type": "sleep", "occurred_at": _day(1), "duration_hours": 8}
+            ),
+        ]
+        errors = []
+
+        report = WellnessImportService.import_logs(
+            db, test_user, lines, "ndjson", on_error=errors.append
+        )
+
+        assert (report.processed, report.imported, report.failed) == (5, 1, 4)
+        assert [error.line for error in errors] == [2, 3, 4, 6]
+        assert errors[0].errors[0].startswith("Invalid JSON")
+        assert errors[2].errors[0].startswith("mood_score")
+        assert errors[3].errors[0].startswith("quality_score")
+        assert report.errors == errors
+
+    def test_commits_in_chunks(self, db: Session, test_user: UserDB):
+        """Test each chunk is committed and reported on its own."""
+        lines = _csv(
+            *(
+                {
+                    "log_type": "sleep",
+                    "occurred_at": _day(i),
+                    "duration_hours": 7,
+                    "quality_score": 6,
+                }
+                for i in range(5)
+            )
+        )
+        progress = []
+
+        report = WellnessImportService.import_logs(
+            db,
+            test_user,
+            lines,
+            "csv",
+            chunk_size=2,
+            on_progress=lambda r: progress.append(r.imported),
+        )
+
+        assert report.imported == 5
+        assert progress == [2, 4, 5]
+        assert _count(db, SleepLogDB) == 5
+
+    def test_csv_requires_header(self, db: Session, test_user: UserDB):
+        """Test a CSV without the required columns is rejected."""
+        with pytest.raises(ValueError, match="header"):
+            WellnessImportService.import_logs(
+                db, test_user, ["mood_score\n", "5\n"], "csv"
+            )
@@ -0,0 +1,181 @@
+"""Unit tests for the daily_nutrition rollup."""
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import DailyNutritionDB, MealType, UserDB
+from src.eatsential.schemas.schemas import (
+    MealBatchItem,
+    MealCreate,
+    MealFoodItemCreate,
+    MealUpdate,
+)
+from src.eatsential.services.daily_nutrition_service import DailyNutritionService
+from src.eatsential.services.meal_service import MealService
+
+# Two days ago at 03:00 UTC is still the previous evening in New York
+DAY = date.today() - timedelta(days=2)
+EARLY_UTC = datetime.combine(DAY, time(3, 0))
+NOON_UTC = datetime.combine(DAY, time(12, 0))
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user in New York."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="rollup@example.com",
+        username="rollupuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="America/New_York",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _meal(meal_time: datetime, calories: float, protein_g: float = 0) -> MealCreate:
+    """Build a meal with one food item."""
+    return MealCreate(
+        meal_type=MealType.SNACK,
+        meal_time=meal_time,
+        food_items=[
+            MealFoodItemCreate(
+                food_name="Food",
+                portion_size=1.0,
+                portion_unit="serving",
+                calories=calories,
+                protein_g=protein_g,
+            )
+        ],
+    )
+
+
+def _rollup(db: Session, user_id: str) -> dict[date, tuple[int, float, float]]:
+    """Return {local_date: (meal_count, calories, protein)} for non-empty days."""
+    db.expire_all()
+    return {
+        day.local_date: (
+            day.meal_count,
+            float(day.total_calories),
+            float(day.total_protein_g),
+        )
+        for day in DailyNutritionService.get_daily_totals(
+            db, user_id, date.min, date.max
+        )
+    }
+
+
+class TestIncrementalRollup:
+    """Tests for rollup maintenance from meal writes."""
+
+    def test_create_meals_adds_to_local_day(self, db: Session, test_user: UserDB):
+        """Test meals are summed per local date in the user's timezone."""
+        MealService.create_meal(db, test_user.id, _meal(EARLY_UTC, 300, 10))
+        MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 500, 20))
+        MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 200, 5))
+
+        assert _rollup(db, test_user.id) == {
+            DAY - timedelta(days=1): (1, 300.0, 10.0),
+            DAY: (2, 700.0, 25.0),
+        }
+
+    def test_batch_create_adds_to_rollup(self, db: Session, test_user: UserDB):
+        """Test batch logging updates the rollup once for all meals."""
+        meals = [MealBatchItem(**_meal(NOON_UTC, 100).model_dump()) for _ in range(3)]
+
+        MealService.create_meals_batch(db, test_user.id, meals)
+
+        assert _rollup(db, test_user.id) == {DAY: (3, 300.0, 0.0)}
+
+    def test_update_meal_adjusts_and_moves_days(self, db: Session, test_user: UserDB):
+        """Test edits apply nutrient deltas and meal_time moves the meal."""
+        meal = MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 400))
+
+        MealService.update_meal(
+            db,
+            test_user.id,
+            meal.id,
+            MealUpdate(food_items=_meal(NOON_UTC, 650).food_items),
+        )
+        assert _rollup(db, test_user.id) == {DAY: (1, 650.0, 0.0)}
+
+        MealService.update_meal(
+            db, test_user.id, meal.id, MealUpdate(meal_time=EARLY_UTC)
+        )
+        assert _rollup(db, test_user.id) == {DAY - timedelta(days=1): (1, 650.0, 0.0)}
+
+    def test_delete_meal_removes_from_rollup(self, db: Session, test_user: UserDB):
+        """Test deleting a day's only meal leaves no summary for that day."""
+        MealService.create_meal(db, test_user.id, _meal(EARLY_UTC, 300))
+        deleted = MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 500))
+
+        MealService.delete_meal(db, test_user.id, deleted.id)
+
+        assert _rollup(db, test_user.id) == {DAY - timedelta(days=1): (1, 300.0, 0.0)}
+
+
+class TestRebuild:
+    """Tests for DailyNutritionService.rebuild."""
+
+    def test_rebuild_matches_incremental_rollup(self, db: Session, test_user: UserDB):
+        """Test a rebuild reproduces the incrementally maintained rows."""
+        for meal_time, calories in ((EARLY_UTC, 300), (NOON_UTC, 450), (NOON_UTC, 50)):
+            MealService.create_meal(db, test_user.id, _meal(meal_time, calories))
+        incremental = _rollup(db, test_user.id)
+
+        written = DailyNutritionService.rebuild(db, [test_user.id])
+
+        assert written == 2
+        assert _rollup(db, test_user.id) == incremental
+
+    def test_rebuild_matches_rollup_of_aware_meal_times(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test meal times with an offset are stored and rolled up as UTC."""
+        tokyo = timezone(timedelta(hours=9))
+        # 12:00 in Tokyo is 03:00 UTC, the previous evening in New York
+        created = MealService.create_meal(
+            db, test_user.id, _meal(EARLY_UTC.replace(tzinfo=timezone.utc), 300)
+        )
+        meal = MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 200))
+        MealService.update_meal(
+            db,
+            test_user.id,
+            meal.id,
+            MealUpdate(
+                meal_time=EARLY_UTC.replace(tzinfo=timezone.utc).astimezone(tokyo)
+            ),
+        )
+        incremental = _rollup(db, test_user.id)
+
+        DailyNutritionService.rebuild(db, [test_user.id])
+
+        assert created.meal_time == EARLY_UTC
+        assert incremental == {DAY - timedelta(days=1): (2, 500.0, 0.0)}
+        assert _rollup(db, test_user.id) == incremental
+
+    def test_rebuild_repairs_drift(self, db: Session, test_user: UserDB):
+        """Test a rebuild overwrites rows that no longer match the meals."""
+        MealService.create_meal(db, test_user.id, _meal(NOON_UTC, 500))
+        db.add(
+            DailyNutritionDB(
+                user_id=test_user.id,
+                local_date=DAY - timedelta(days=10),
+                meal_count=3,
+                total_calories=999,
+                total_protein_g=0,
+                total_carbs_g=0,
+                total_fat_g=0,
+            )
+        )
+        db.commit()
+
+        DailyNutritionService.rebuild(db, [test_user.id])
+
+        assert _rollup(db, test_user.id) == {DAY: (1, 500.0, 0.0)}
@@ -0,0 +1,161 @@
+"""Unit tests for the daily_wellness rollup."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import DailyWellnessDB, UserDB
+from src.eatsential.schemas.schemas import (
+    MoodLogCreate,
+    MoodLogUpdate,
+    SleepLogCreate,
+    SleepLogUpdate,
+    StressLogCreate,
+)
+from src.eatsential.services.daily_wellness_service import DailyWellnessService
+from src.eatsential.services.mental_wellness_service import MentalWellnessService
+from src.eatsential.utils.timezones import get_local_date
+
+# Logs can only be created for the user's local today
+NOW = datetime.now(timezone.utc)
+TODAY = get_local_date(NOW, "America/New_York")
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user in New York."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="wellnessrollup@example.com",
+        username="wellnessrollupuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="America/New_York",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _rollup(db: Session, user_id: str) -> dict[date, dict[str, tuple]]:
+    """Return {local_date: {metric: (sum, count)}} for the user's rows."""
+    db.expire_all()
+    return {
+        day.local_date: {
+            "mood": (float(day.mood_score_sum), day.mood_score_count),
+            "stress": (float(day.stress_level_sum), day.stress_level_count),
+            "sleep_hours": (float(day.sleep_hours_sum), day.sleep_hours_count),
+            "sleep_quality": (float(day.sleep_quality_sum), day.sleep_quality_count),
+        }
+        for day in db.scalars(
+            select(DailyWellnessDB).where(DailyWellnessDB.user_id == user_id)
+        )
+    }
+
+
+def _log_day(db: Session, user: UserDB) -> tuple:
+    """Log one mood, stress and sleep entry now.
+
+    Returns:
+        The (mood, stress, sleep) logs
+
+    """
+    return (
+        MentalWellnessService.log_mood(
+            db, user.id, MoodLogCreate(occurred_at=NOW, mood_score=8), user
+        ),
+        MentalWellnessService.log_stress(
+            db, user.id, StressLogCreate(occurred_at=NOW, stress_level=3), user
+        ),
+        MentalWellnessService.log_sleep(
+            db,
+            user.id,
+            SleepLogCreate(occurred_at=NOW, duration_hours=7.5, quality_score=6),
+            user,
+        ),
+    )
+
+
+class TestIncrementalRollup:
+    """Tests for rollup maintenance from wellness log writes."""
+
+    def test_create_logs_adds_to_local_day(self, db: Session, test_user: UserDB):
+        """Test logs are summed per local date in the user's timezone."""
+        _log_day(db, test_user)
+
+        assert _rollup(db, test_user.id) == {
+            TODAY: {
+                "mood": (8.0, 1),
+                "stress": (3.0, 1),
+                "sleep_hours": (7.5, 1),
+                "sleep_quality": (6.0, 1),
+            }
+        }
+
+    def test_update_logs_adjusts_sums(self, db: Session, test_user: UserDB):
+        """Test score edits replace the old value in the day's sum."""
+        mood, _, sleep = _log_day(db, test_user)
+
+        MentalWellnessService.update_mood_log(
+            db, test_user.id, mood.id, MoodLogUpdate(mood_score=5)
+        )
+        MentalWellnessService.update_sleep_log(
+            db,
+            test_user.id,
+            sleep.id,
+            SleepLogUpdate(duration_hours=6, quality_score=9),
+        )
+
+        day = _rollup(db, test_user.id)[TODAY]
+        assert day["mood"] == (5.0, 1)
+        assert day["sleep_hours"] == (6.0, 1)
+        assert day["sleep_quality"] == (9.0, 1)
+
+    def test_delete_logs_removes_from_rollup(self, db: Session, test_user: UserDB):
+        """Test deleted logs are subtracted from their day."""
+        mood, stress, sleep = _log_day(db, test_user)
+
+        MentalWellnessService.delete_mood_log(db, test_user.id, mood.id)
+        MentalWellnessService.delete_stress_log(db, test_user.id, stress.id)
+        MentalWellnessService.delete_sleep_log(db, test_user.id, sleep.id)
+
+        day = _rollup(db, test_user.id)[TODAY]
+        assert all(count == 0 for _, count in day.values())
+
+
+class TestRebuild:
+    """Tests for DailyWellnessService.rebuild."""
+
+    def test_rebuild_matches_incremental_rollup(self, db: Session, test_user: UserDB):
+        """Test a rebuild reproduces the incrementally maintained rows."""
+        _log_day(db, test_user)
+        incremental = _rollup(db, test_user.id)
+
+        written = DailyWellnessService.rebuild(db, [test_user.id])
+
+        assert written == 1
+        assert _rollup(db, test_user.id) == incremental
+
+    def test_rebuild_repairs_drift(self, db: Session, test_user: UserDB):
+        """Test a rebuild overwrites rows that no longer match the logs."""
+        _log_day(db, test_user)
+        db.add(
+            DailyWellnessDB(
+                user_id=test_user.id,
+                local_date=TODAY - timedelta(days=30),
+                mood_score_sum=9,
+                mood_score_count=1,
+            )
+        )
+        db.get(DailyWellnessDB, (test_user.id, TODAY)).stress_level_sum = 99
+        db.commit()
+
+        DailyWellnessService.rebuild(db, [test_user.id])
+
+        rollup = _rollup(db, test_user.id)
+        assert TODAY - timedelta(days=30) not in rollup
+        assert rollup[TODAY]["stress"] == (3.0, 1)
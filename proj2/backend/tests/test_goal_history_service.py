@@ -0,0 +1,279 @@
+"""Unit tests for GoalHistoryService."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import (
+    DailyNutritionDB,
+    GoalDB,
+    GoalProgressSnapshotDB,
+    GoalStatus,
+    GoalType,
+    UserDB,
+)
+from src.eatsential.services.goal_history_service import (
+    GoalHistoryService,
+    ProgressPoint,
+    downsample,
+)
+from src.eatsential.services.goal_service import GoalService
+
+# A Tuesday; with 90 days of daily retention the cutoff is Monday 2025-12-08
+TODAY = date(2026, 3, 10)
+
+# Noon UTC on TODAY: TODAY in New York, already the next day in Auckland
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="history@example.com",
+        username="historyuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _goal(
+    db: Session,
+    user: UserDB,
+    start_date: date,
+    end_date: date,
+    current_value: float = 42,
+    status: GoalStatus = GoalStatus.ACTIVE,
+    target_type: str = "weekly_meditation",
+) -> GoalDB:
+    """Create a goal with a target of 100."""
+    goal = GoalDB(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        goal_type=GoalType.WELLNESS.value,
+        target_type=target_type,
+        target_value=100,
+        current_value=current_value,
+        start_date=start_date,
+        end_date=end_date,
+        status=status.value,
+    )
+    db.add(goal)
+    db.commit()
+    return goal
+
+
+def _daily_snapshots(db: Session, goal: GoalDB, first_day: date, values) -> None:
+    """Add one daily snapshot per value, starting at first_day."""
+    db.add_all(
+        GoalProgressSnapshotDB(
+            goal_id=goal.id,
+            snapshot_date=first_day + timedelta(days=offset),
+            period_days=1,
+            value=value,
+            min_value=value,
+            max_value=value,
+            sample_count=1,
+        )
+        for offset, value in enumerate(values)
+    )
+    db.commit()
+
+
+def _snapshots(db: Session, goal: GoalDB) -> list[tuple]:
+    """Return (date, period_days, value, min, max, samples) rows of a goal."""
+    rows = (
+        db.query(GoalProgressSnapshotDB)
+        .filter(GoalProgressSnapshotDB.goal_id == goal.id)
+        .order_by(GoalProgressSnapshotDB.snapshot_date)
+        .all()
+    )
+    return [
+        (
+            row.snapshot_date,
+            row.period_days,
+            float(row.value),
+            float(row.min_value),
+            float(row.max_value),
+            row.sample_count,
+        )
+        for row in rows
+    ]
+
+
+class TestRecordSnapshots:
+    """Tests for GoalHistoryService.record_snapshots."""
+
+    def test_records_yesterday_once_per_goal(self, db: Session, test_user: UserDB):
+        """Test running goals get one row for yesterday, however often run."""
+        running = _goal(db, test_user, TODAY - timedelta(days=30), TODAY)
+        not_started = _goal(db, test_user, TODAY, TODAY + timedelta(days=30))
+        cancelled = _goal(
+            db,
+            test_user,
+            TODAY - timedelta(days=30),
+            TODAY,
+            status=GoalStatus.CANCELLED,
+        )
+
+        assert GoalHistoryService.record_snapshots(db, now=NOW) == 1
+        running.current_value = 50
+        db.commit()
+        assert GoalHistoryService.record_snapshots(db, now=NOW) == 0
+
+        yesterday = TODAY - timedelta(days=1)
+        assert _snapshots(db, running) == [(yesterday, 1, 42.0, 42.0, 42.0, 1)]
+        assert _snapshots(db, not_started) == []
+        assert _snapshots(db, cancelled) == []
+
+    def test_tracked_goal_records_its_closing_value(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test tracked goals get the value from the logs up to that day."""
+        goal = _goal(
+            db,
+            test_user,
+            TODAY - timedelta(days=5),
+            TODAY + timedelta(days=5),
+            current_value=2666.67,
+            target_type="daily_calories",
+        )
+        db.add_all(
+            DailyNutritionDB(
+                user_id=test_user.id,
+                local_date=TODAY - timedelta(days=days_ago),
+                meal_count=1,
+                total_calories=calories,
+                total_protein_g=0,
+                total_carbs_g=0,
+                total_fat_g=0,
+            )
+            for days_ago, calories in ((2, 1000), (1, 2000), (0, 5000))
+        )
+        db.commit()
+
+        assert GoalHistoryService.record_snapshots(db, now=NOW) == 1
+
+        # Today's meals are not part of yesterday's close
+        yesterday = TODAY - timedelta(days=1)
+        assert _snapshots(db, goal) == [(yesterday, 1, 1500.0, 1500.0, 1500.0, 1)]
+
+    def test_day_is_local_to_the_user(self, db: Session, test_user: UserDB):
+        """Test the recorded day is yesterday in the user's timezone."""
+        test_user.timezone = "Pacific/Auckland"
+        db.commit()
+        goal = _goal(db, test_user, TODAY - timedelta(days=30), TODAY)
+
+        assert GoalHistoryService.record_snapshots(db, now=NOW) == 1
+
+        assert _snapshots(db, goal) == [(TODAY, 1, 42.0, 42.0, 42.0, 1)]
+
+
+class TestCompactSnapshots:
+    """Tests for GoalHistoryService.compact_snapshots."""
+
+    def test_old_weeks_are_compacted(self, db: Session, test_user: UserDB):
+        """Test complete weeks past retention become one row per week."""
+        goal = _goal(db, test_user, date(2025, 11, 1), TODAY)
+        # Three weeks from Monday 2025-11-24; the third is still retained
+        _daily_snapshots(db, goal, date(2025, 11, 24), range(21))
+
+        compacted = GoalHistoryService.compact_snapshots(db, today=TODAY)
+
+        rows = _snapshots(db, goal)
+        assert compacted == 14
+        assert rows[:2] == [
+            (date(2025, 11, 24), 7, 3.0, 0.0, 6.0, 7),
+            (date(2025, 12, 1), 7, 10.0, 7.0, 13.0, 7),
+        ]
+        assert [row[1] for row in rows[2:]] == [1] * 7
+        assert GoalHistoryService.compact_snapshots(db, today=TODAY) == 0
+
+    def test_week_written_by_another_run_is_kept(self, db: Session, test_user: UserDB):
+        """Test compaction skips weeks a concurrent run already inserted."""
+        goal = _goal(db, test_user, date(2025, 11, 1), TODAY)
+        _daily_snapshots(db, goal, date(2025, 11, 24), range(7))
+        db.add(
+            GoalProgressSnapshotDB(
+                goal_id=goal.id,
+                snapshot_date=date(2025, 11, 24),
+                period_days=7,
+                value=3,
+                min_value=0,
+                max_value=6,
+                sample_count=7,
+            )
+        )
+        db.commit()
+
+        assert GoalHistoryService.compact_snapshots(db, today=TODAY) == 7
+
+        assert _snapshots(db, goal) == [(date(2025, 11, 24), 7, 3.0, 0.0, 6.0, 7)]
+
+    def test_deleting_goal_deletes_history(self, db: Session, test_user: UserDB):
+        """Test a goal's snapshots are removed with it."""
+        goal = _goal(db, test_user, date(2025, 11, 1), TODAY)
+        _daily_snapshots(db, goal, date(2025, 11, 24), range(3))
+
+        assert GoalService.delete_goal(db, test_user.id, goal.id)
+
+        assert db.query(GoalProgressSnapshotDB).count() == 0
+
+
+class TestGetHistory:
+    """Tests for GoalHistoryService.get_history and downsample."""
+
+    def test_live_value_is_last_point(self, db: Session, test_user: UserDB):
+        """Test the current value is appended when the range includes today."""
+        goal = _goal(db, test_user, TODAY - timedelta(days=3), TODAY)
+        _daily_snapshots(db, goal, TODAY - timedelta(days=3), [10, 20, 30])
+
+        points = GoalHistoryService.get_history(db, goal, today=TODAY)
+
+        assert [(p.snapshot_date, p.value) for p in points] == [
+            (TODAY - timedelta(days=3), 10.0),
+            (TODAY - timedelta(days=2), 20.0),
+            (TODAY - timedelta(days=1), 30.0),
+            (TODAY, 42.0),
+        ]
+
+    def test_range_starting_mid_week_includes_that_week(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test a compacted week overlapping the range start is returned."""
+        goal = _goal(db, test_user, date(2025, 11, 1), TODAY)
+        _daily_snapshots(db, goal, date(2025, 11, 24), range(14))
+        GoalHistoryService.compact_snapshots(db, today=TODAY)
+
+        points = GoalHistoryService.get_history(
+            db, goal, date(2025, 11, 26), date(2025, 12, 7), today=TODAY
+        )
+
+        assert [p.snapshot_date for p in points] == [
+            date(2025, 11, 24),
+            date(2025, 12, 1),
+        ]
+
+    def test_downsample_buckets_keep_last_value_and_envelope(self):
+        """Test long ranges are reduced to at most max_points buckets."""
+        start = date(2026, 1, 1)
+        points = [
+            ProgressPoint(start + timedelta(days=day), 1, day, day, day)
+            for day in range(10)
+        ]
+
+        sampled = downsample(points, start, max_points=4)
+
+        assert sampled == [
+            ProgressPoint(start, 3, 2, 0, 2),
+            ProgressPoint(start + timedelta(days=3), 3, 5, 3, 5),
+            ProgressPoint(start + timedelta(days=6), 3, 8, 6, 8),
+            ProgressPoint(start + timedelta(days=9), 3, 9, 9, 9),
+        ]
+        assert downsample(points, start, max_points=10) == points
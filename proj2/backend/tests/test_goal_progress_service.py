@@ -0,0 +1,278 @@
+"""Unit tests for log-driven goal progress."""
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.db.query_stats import track_queries
+from src.eatsential.models.models import (
+    GoalDB,
+    GoalStatus,
+    GoalType,
+    MealDB,
+    MealType,
+    UserDB,
+)
+from src.eatsential.schemas.schemas import (
+    GoalCreate,
+    GoalUpdate,
+    MealBatchItem,
+    MealCreate,
+    MealFoodItemCreate,
+    MealUpdate,
+    MoodLogCreate,
+    MoodLogUpdate,
+)
+from src.eatsential.services.daily_nutrition_service import DailyNutritionService
+from src.eatsential.services.events import NutritionChanged, publish
+from src.eatsential.services.goal_progress_service import (
+    GoalProgressService,
+    goal_metric,
+)
+from src.eatsential.services.goal_service import GoalService
+from src.eatsential.services.meal_service import MealService
+from src.eatsential.services.mental_wellness_service import MentalWellnessService
+
+TODAY = datetime.now(timezone.utc).date()
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user in UTC."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="progress@example.com",
+        username="progressuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="UTC",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _goal(
+    db: Session,
+    user: UserDB,
+    target_type: str,
+    start_date: date = TODAY - timedelta(days=7),
+    goal_type: GoalType = GoalType.NUTRITION,
+) -> GoalDB:
+    """Create an active goal covering the last week and the next month."""
+    return GoalService.create_goal(
+        db,
+        user.id,
+        GoalCreate(
+            goal_type=goal_type,
+            target_type=target_type,
+            target_value=100.0,
+            start_date=start_date,
+            end_date=TODAY + timedelta(days=30),
+        ),
+    )
+
+
+def _meal(days_ago: int, protein_g: float) -> MealCreate:
+    """Build a meal logged at noon UTC the given number of days ago."""
+    return MealCreate(
+        meal_type=MealType.SNACK,
+        meal_time=datetime.combine(TODAY - timedelta(days=days_ago), time(12, 0)),
+        food_items=[
+            MealFoodItemCreate(
+                food_name="Food",
+                portion_size=1.0,
+                portion_unit="serving",
+                calories=protein_g * 4,
+                protein_g=protein_g,
+            )
+        ],
+    )
+
+
+def _progress(db: Session, goal: GoalDB) -> tuple[float, int, float]:
+    """Return (progress_sum, progress_days, current_value) from the database."""
+    db.refresh(goal)
+    return (
+        float(goal.progress_sum),
+        goal.progress_days,
+        float(goal.current_value),
+    )
+
+
+class TestGoalMetric:
+    """Tests for goal_metric."""
+
+    @pytest.mark.parametrize(
+        ("target_type", "metric"),
+        [
+            ("protein", "protein"),
+            ("daily_calories", "calories"),
+            ("Sleep_Hours", "sleep_hours"),
+            ("steps", None),
+            ("weekly_protein", None),
+        ],
+    )
+    def test_target_types(self, target_type: str, metric):
+        """Test target types map to tracked metrics case-insensitively."""
+        assert goal_metric(target_type) == metric
+
+
+class TestNutritionEvents:
+    """Tests for nutrition goals following meal writes."""
+
+    def test_meals_update_average_per_logged_day(self, db: Session, test_user: UserDB):
+        """Test progress is the average over days with meals."""
+        goal = _goal(db, test_user, "daily_protein")
+
+        MealService.create_meal(db, test_user.id, _meal(1, 30), "UTC")
+        MealService.create_meal(db, test_user.id, _meal(1, 50), "UTC")
+        MealService.create_meal(db, test_user.id, _meal(2, 40), "UTC")
+
+        assert _progress(db, goal) == (120.0, 2, 60.0)
+
+    def test_delete_last_meal_of_day_removes_day(self, db: Session, test_user: UserDB):
+        """Test a day stops counting once its last meal is deleted."""
+        goal = _goal(db, test_user, "protein")
+        MealService.create_meal(db, test_user.id, _meal(1, 30), "UTC")
+        meal = MealService.create_meal(db, test_user.id, _meal(2, 90), "UTC")
+
+        MealService.delete_meal(db, test_user.id, meal.id, "UTC")
+
+        assert _progress(db, goal) == (30.0, 1, 30.0)
+
+    def test_meal_edits_update_progress(self, db: Session, test_user: UserDB):
+        """Test edits to nutrients and meal time follow into progress."""
+        goal = _goal(db, test_user, "daily_calories")
+        meal = MealService.create_meal(db, test_user.id, _meal(1, 125), "UTC")
+        assert _progress(db, goal) == (500.0, 1, 500.0)
+
+        MealService.update_meal(
+            db,
+            test_user.id,
+            meal.id,
+            MealUpdate(food_items=_meal(1, 225).food_items),
+            "UTC",
+        )
+        assert _progress(db, goal) == (900.0, 1, 900.0)
+
+        MealService.update_meal(
+            db,
+            test_user.id,
+            meal.id,
+            MealUpdate(meal_time=_meal(2, 0).meal_time),
+            "UTC",
+        )
+        assert _progress(db, goal) == (900.0, 1, 900.0)
+
+        MealService.delete_meal(db, test_user.id, meal.id, "UTC")
+        assert _progress(db, goal) == (0.0, 0, 0.0)
+
+    def test_meals_outside_window_or_inactive_goals_are_ignored(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test only active goals covering the meal's date change."""
+        later_goal = _goal(db, test_user, "protein", start_date=TODAY)
+        cancelled = _goal(db, test_user, "protein")
+        GoalService.update_goal(
+            db,
+            test_user.id,
+            cancelled.id,
+            GoalUpdate(status=GoalStatus.CANCELLED),
+        )
+
+        MealService.create_meal(db, test_user.id, _meal(3, 50), "UTC")
+
+        assert _progress(db, later_goal) == (0.0, 0, 0.0)
+        assert _progress(db, cancelled) == (0.0, 0, 0.0)
+
+    def test_batch_is_coalesced_into_one_update(self, db: Session, test_user: UserDB):
+        """Test all meals of one transaction update a goal with one UPDATE."""
+        goal = _goal(db, test_user, "protein")
+        meals = [
+            MealBatchItem(**_meal(days_ago, 20).model_dump())
+            for days_ago in (1, 1, 2, 3)
+        ]
+
+        with track_queries() as stats:
+            MealService.create_meals_batch(db, test_user.id, meals, "UTC")
+
+        goal_updates = sum(
+            count
+            for shape, count in stats.shapes.items()
+            if shape.startswith("UPDATE goals")
+        )
+        assert goal_updates == 1
+        assert _progress(db, goal) == (80.0, 3, 26.67)
+
+    def test_rollback_discards_events(self, db: Session, test_user: UserDB):
+        """Test rolled back writes do not reach goals."""
+        goal = _goal(db, test_user, "protein")
+        meal = MealDB(
+            meal_time=datetime.combine(TODAY, time(12, 0)),
+            total_calories=40,
+            total_protein_g=10,
+            total_carbs_g=0,
+            total_fat_g=0,
+        )
+        changes = DailyNutritionService.add_meal_changes({}, [meal], "UTC")
+
+        db.connection()  # open the transaction to roll back
+        publish(db, NutritionChanged(test_user.id, changes))
+
+        db.rollback()
+        db.commit()
+
+        assert _progress(db, goal) == (0.0, 0, 0.0)
+
+
+class TestWellnessEvents:
+    """Tests for wellness goals following mood, stress and sleep logs."""
+
+    def test_mood_log_create_update_delete(self, db: Session, test_user: UserDB):
+        """Test mood logs add, adjust and remove a logged day."""
+        goal = _goal(db, test_user, "mood_score", goal_type=GoalType.WELLNESS)
+
+        log = MentalWellnessService.log_mood(
+            db,
+            test_user.id,
+            MoodLogCreate(occurred_at=datetime.now(timezone.utc), mood_score=6),
+            test_user,
+        )
+        assert _progress(db, goal) == (6.0, 1, 6.0)
+
+        MentalWellnessService.update_mood_log(
+            db, test_user.id, log.id, MoodLogUpdate(mood_score=8)
+        )
+        assert _progress(db, goal) == (8.0, 1, 8.0)
+
+        MentalWellnessService.delete_mood_log(db, test_user.id, log.id)
+        assert _progress(db, goal) == (0.0, 0, 0.0)
+
+
+class TestRefreshAndReconcile:
+    """Tests for seeding and reconciling progress from raw data."""
+
+    def test_new_goal_starts_with_logged_history(self, db: Session, test_user: UserDB):
+        """Test a goal created after meals were logged includes them."""
+        MealService.create_meal(db, test_user.id, _meal(1, 30), "UTC")
+        MealService.create_meal(db, test_user.id, _meal(2, 60), "UTC")
+
+        goal = _goal(db, test_user, "protein")
+
+        assert _progress(db, goal) == (90.0, 2, 45.0)
+
+    def test_reconcile_repairs_drift(self, db: Session, test_user: UserDB):
+        """Test reconcile overwrites totals that no longer match the logs."""
+        goal = _goal(db, test_user, "protein")
+        MealService.create_meal(db, test_user.id, _meal(1, 30), "UTC")
+        goal.progress_sum, goal.progress_days, goal.current_value = 999, 9, 111
+        db.commit()
+
+        reconciled = GoalProgressService.reconcile(db, batch_size=1)
+
+        assert reconciled == 1
+        assert _progress(db, goal) == (30.0, 1, 30.0)
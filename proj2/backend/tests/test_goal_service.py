@@ -6,9 +6,11 @@ from datetime import date, timedelta
 import pytest
 from sqlalchemy.orm import Session
 
+from src.eatsential.db.query_stats import track_queries
 from src.eatsential.models.models import GoalStatus, GoalType, UserDB
 from src.eatsential.schemas.schemas import GoalCreate, GoalUpdate
 from src.eatsential.services.goal_service import GoalService
+from src.eatsential.utils.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -185,6 +187,31 @@ class TestGetUserGoals:
         assert total == 5
         assert len(goals) == 2
 
+    def test_get_user_goals_cursor_pagination(self, db: Session, test_user: UserDB):
+        """Test walking goals with cursors returns every goal exactly once."""
+        today = date.today()
+        for i in range(5):
+            goal_data = GoalCreate(
+                goal_type=GoalType.NUTRITION,
+                target_type=f"goal_{i}",
+                target_value=float(2000 + i * 100),
+                start_date=today,
+                end_date=today + timedelta(days=30),
+            )
+            GoalService.create_goal(db, test_user.id, goal_data)
+
+        first_page, total = GoalService.get_user_goals(db, test_user.id, limit=3)
+        cursor = encode_cursor(first_page[-1].created_at, first_page[-1].id)
+        second_page, _ = GoalService.get_user_goals(
+            db, test_user.id, limit=3, cursor=cursor
+        )
+
+        assert total == 5
+        assert len(first_page) == 3
+        assert len(second_page) == 2
+        ids = [goal.id for goal in first_page + second_page]
+        assert len(set(ids)) == 5
+
     def test_filter_by_goal_type(self, db: Session, test_user: UserDB):
         """Test filtering goals by type."""
         today = date.today()
@@ -311,7 +338,7 @@ class TestUpdateGoal:
         today = date.today()
         goal_data = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=30),
@@ -351,7 +378,7 @@ class TestUpdateGoal:
         today = date.today()
         goal_data = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=30),
@@ -494,7 +521,7 @@ class TestCalculateGoalProgress:
         today = date.today()
         goal_data = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=30),
@@ -515,7 +542,7 @@ class TestCalculateGoalProgress:
         today = date.today()
         goal_data = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=30),
@@ -536,7 +563,7 @@ class TestCalculateGoalProgress:
         today = date.today()
         goal_data = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=30),
@@ -564,7 +591,7 @@ class TestGetGoalsProgress:
         # Create goals with different progress
         goal_data_1 = GoalCreate(
             goal_type=GoalType.NUTRITION,
-            target_type="daily_calories",
+            target_type="weekly_calories",
             target_value=2000.0,
             start_date=today,
             end_date=today + timedelta(days=7),
@@ -590,9 +617,9 @@ class TestGetGoalsProgress:
         progress_list = GoalService.get_goals_progress(db, test_user.id)
 
         assert len(progress_list) == 2
-        assert progress_list[0]["completion_percentage"] == 50.0
+        assert progress_list[0].completion_percentage == 50.0
         # Use float comparison with approx
-        assert float(progress_list[1]["completion_percentage"]) == pytest.approx(
+        assert float(progress_list[1].completion_percentage) == pytest.approx(
             71.43, rel=0.01
         )
 
@@ -626,7 +653,7 @@ class TestGetGoalsProgress:
         )
 
         assert len(progress_list) == 1
-        assert progress_list[0]["goal_type"] == GoalType.NUTRITION.value
+        assert progress_list[0].goal_type == GoalType.NUTRITION.value
 
     def test_get_progress_with_days_remaining(self, db: Session, test_user: UserDB):
         """Test that days_remaining is calculated correctly."""
@@ -644,4 +671,58 @@ class TestGetGoalsProgress:
         progress_list = GoalService.get_goals_progress(db, test_user.id)
 
         assert len(progress_list) == 1
-        assert progress_list[0]["days_remaining"] == 10
+        assert progress_list[0].days_remaining == 10
+
+    def test_progress_is_computed_in_sql(self, db: Session, test_user: UserDB):
+        """Test percentages are capped at 100 and past goals count down."""
+        today = date.today()
+        for current_value in (25.0, 4.0):
+            goal = GoalService.create_goal(
+                db,
+                test_user.id,
+                GoalCreate(
+                    goal_type=GoalType.WELLNESS,
+                    target_type="weekly_meditation",
+                    target_value=10.0,
+                    start_date=today - timedelta(days=9),
+                    end_date=today - timedelta(days=2),
+                ),
+            )
+            GoalService.update_goal(
+                db, test_user.id, goal.id, GoalUpdate(current_value=current_value)
+            )
+
+        progress_list = GoalService.get_goals_progress(db, test_user.id)
+
+        assert [p.completion_percentage for p in progress_list] == [100.0, 40.0]
+        assert [p.days_remaining for p in progress_list] == [-2, -2]
+
+    def test_progress_is_cached_until_goal_write(self, db: Session, test_user: UserDB):
+        """Test repeated reads are served from the snapshot cache."""
+        today = date.today()
+        goal = GoalService.create_goal(
+            db,
+            test_user.id,
+            GoalCreate(
+                goal_type=GoalType.WELLNESS,
+                target_type="weekly_meditation",
+                target_value=10.0,
+                start_date=today,
+                end_date=today + timedelta(days=7),
+            ),
+        )
+        GoalService.get_goals_progress(db, test_user.id)
+
+        with track_queries() as stats:
+            cached = GoalService.get_goals_progress(db, test_user.id)
+        assert stats.count == 0
+        assert cached[0].completion_percentage == 0.0
+
+        GoalService.update_goal(
+            db, test_user.id, goal.id, GoalUpdate(current_value=5.0)
+        )
+
+        assert (
+            GoalService.get_goals_progress(db, test_user.id)[0].completion_percentage
+            == 50.0
+        )
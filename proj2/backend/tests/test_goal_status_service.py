@@ -0,0 +1,116 @@
+"""Unit tests for GoalStatusService."""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.db.query_stats import track_queries
+from src.eatsential.models.models import GoalDB, GoalStatus, GoalType, UserDB
+from src.eatsential.services.goal_status_service import GoalStatusService
+
+TODAY = date(2026, 3, 10)
+
+
+def _user(db: Session, name: str) -> UserDB:
+    """Create a user."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email=f"{name}@example.com",
+        username=name,
+        password_hash="hashedpassword123",
+        email_verified=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _goal(
+    db: Session,
+    user: UserDB,
+    ended_days_ago: int,
+    current_value: float,
+    status: GoalStatus = GoalStatus.ACTIVE,
+) -> GoalDB:
+    """Create a goal with a target of 100 that ended some days before TODAY."""
+    end_date = TODAY - timedelta(days=ended_days_ago)
+    goal = GoalDB(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        goal_type=GoalType.WELLNESS.value,
+        target_type="weekly_meditation",
+        target_value=100,
+        current_value=current_value,
+        start_date=end_date - timedelta(days=30),
+        end_date=end_date,
+        status=status.value,
+    )
+    db.add(goal)
+    db.commit()
+    return goal
+
+
+@pytest.fixture
+def users(db: Session) -> tuple[UserDB, UserDB]:
+    """Create two users."""
+    return _user(db, "statususer1"), _user(db, "statususer2")
+
+
+class TestEvaluateEndedGoals:
+    """Tests for GoalStatusService.evaluate_ended_goals."""
+
+    def test_ended_goals_are_completed_or_expired(self, db: Session, users):
+        """Test goals past the grace day move out of active across users."""
+        first, second = users
+        reached = _goal(db, first, ended_days_ago=5, current_value=100)
+        missed = _goal(db, second, ended_days_ago=2, current_value=99.5)
+        in_grace = _goal(db, first, ended_days_ago=1, current_value=0)
+        running = _goal(db, second, ended_days_ago=-3, current_value=0)
+        cancelled = _goal(
+            db, first, ended_days_ago=9, current_value=0, status=GoalStatus.CANCELLED
+        )
+
+        stats = GoalStatusService.evaluate_ended_goals(db, today=TODAY)
+
+        assert (stats.completed, stats.expired, stats.batches) == (1, 1, 1)
+        for goal, expected in (
+            (reached, GoalStatus.COMPLETED),
+            (missed, GoalStatus.EXPIRED),
+            (in_grace, GoalStatus.ACTIVE),
+            (running, GoalStatus.ACTIVE),
+            (cancelled, GoalStatus.CANCELLED),
+        ):
+            db.refresh(goal)
+            assert goal.status == expected.value
+
+    def test_batches_use_set_based_updates(self, db: Session, users):
+        """Test each batch issues two UPDATEs, whatever its size."""
+        first, second = users
+        for days_ago in range(2, 12):
+            _goal(db, first, ended_days_ago=days_ago, current_value=days_ago * 10)
+            _goal(db, second, ended_days_ago=days_ago, current_value=0)
+
+        with track_queries() as stats:
+            run = GoalStatusService.evaluate_ended_goals(db, today=TODAY, batch_size=8)
+
+        updates = sum(
+            count
+            for shape, count in stats.shapes.items()
+            if shape.startswith("UPDATE goals")
+        )
+        assert run.batches == 3
+        assert updates == 2 * run.batches
+        assert (run.completed, run.expired) == (2, 18)
+        assert run.evaluated == 20
+        assert run.goals_per_second > 0
+
+    def test_second_run_finds_nothing(self, db: Session, users):
+        """Test runs are idempotent."""
+        _goal(db, users[0], ended_days_ago=3, current_value=0)
+        GoalStatusService.evaluate_ended_goals(db, today=TODAY)
+
+        stats = GoalStatusService.evaluate_ended_goals(db, today=TODAY)
+
+        assert (stats.evaluated, stats.batches) == (0, 0)
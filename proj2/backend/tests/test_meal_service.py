@@ -10,9 +10,11 @@ from src.eatsential.models.models import MealFoodItemDB, MealType, UserDB
 from src.eatsential.schemas.schemas import (
     MealCreate,
     MealFoodItemCreate,
+    MealFoodItemUpdate,
     MealUpdate,
 )
 from src.eatsential.services.meal_service import MealService
+from src.eatsential.utils.pagination import InvalidCursorError, encode_cursor
 
 
 @pytest.fixture
@@ -260,6 +262,47 @@ class TestGetUserMeals:
         assert total == 5
         assert len(meals) == 2
 
+    def test_get_user_meals_cursor_pagination(self, db: Session, test_user: UserDB):
+        """Test cursor pages match offset pages, including meal_time ties."""
+        meal_time = datetime.now() - timedelta(hours=1)
+        for i in range(7):
+            meal_data = MealCreate(
+                meal_type=MealType.SNACK,
+                # Pairs of meals share a meal_time to exercise the id tie-breaker
+                meal_time=meal_time - timedelta(minutes=i // 2),
+                food_items=[
+                    MealFoodItemCreate(
+                        food_name=f"Food {i}",
+                        portion_size=1.0,
+                        portion_unit="serving",
+                    )
+                ],
+            )
+            MealService.create_meal(db, test_user.id, meal_data)
+
+        offset_ids = [
+            meal.id for meal in MealService.get_user_meals(db, test_user.id)[0]
+        ]
+
+        cursor_ids = []
+        cursor = None
+        while True:
+            meals, total = MealService.get_user_meals(
+                db, test_user.id, limit=3, cursor=cursor
+            )
+            cursor_ids.extend(meal.id for meal in meals)
+            if len(meals) < 3:
+                break
+            cursor = encode_cursor(meals[-1].meal_time, meals[-1].id)
+
+        assert total == 7
+        assert cursor_ids == offset_ids
+
+    def test_get_user_meals_invalid_cursor(self, db: Session, test_user: UserDB):
+        """Test a malformed cursor raises InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            MealService.get_user_meals(db, test_user.id, cursor="garbage")
+
     def test_get_user_meals_filter_by_meal_type(self, db: Session, test_user: UserDB):
         """Test filtering meals by meal type."""
         # Create meals of different types
@@ -458,6 +501,92 @@ class TestUpdateMeal:
         assert updated_meal.total_carbs_g == 15.0 + 0.0
         assert updated_meal.total_fat_g == 9.0 + 4.0
 
+    def test_update_meal_diffs_food_items_by_id(self, db: Session, test_user: UserDB):
+        """Test items are updated in place, added and removed by id."""
+        meal_data = MealCreate(
+            meal_type=MealType.DINNER,
+            meal_time=datetime.now() - timedelta(hours=1),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name=name,
+                    portion_size=1.0,
+                    portion_unit="serving",
+                    calories=calories,
+                    protein_g=10.0,
+                )
+                for name, calories in (("Rice", 200), ("Beans", 150), ("Salsa", 20))
+            ],
+        )
+        created_meal = MealService.create_meal(db, test_user.id, meal_data)
+        rice, beans, salsa = created_meal.food_items
+        rice_id, beans_id, salsa_id = rice.id, beans.id, salsa.id
+
+        update_data = MealUpdate(
+            food_items=[
+                # Unchanged
+                MealFoodItemUpdate.model_validate(rice),
+                # Edited in place
+                MealFoodItemUpdate(
+                    id=beans_id,
+                    food_name="Black beans",
+                    portion_size=2.0,
+                    portion_unit="serving",
+                    calories=300,
+                    protein_g=20.0,
+                ),
+                # Added (salsa is omitted and therefore removed)
+                MealFoodItemUpdate(
+                    food_name="Avocado",
+                    portion_size=0.5,
+                    portion_unit="whole",
+                    calories=120,
+                ),
+            ]
+        )
+
+        updated_meal = MealService.update_meal(
+            db, test_user.id, created_meal.id, update_data
+        )
+
+        items = {item.food_name: item for item in updated_meal.food_items}
+        assert set(items) == {"Rice", "Black beans", "Avocado"}
+        assert items["Rice"].id == rice_id
+        assert items["Black beans"].id == beans_id
+        assert items["Avocado"].id not in (rice_id, beans_id, salsa_id)
+        assert db.get(MealFoodItemDB, salsa_id) is None
+        assert float(updated_meal.total_calories) == 200 + 300 + 120
+        assert float(updated_meal.total_protein_g) == 10.0 + 20.0
+
+    def test_update_meal_rejects_foreign_food_item_id(
+        self, db: Session, test_user: UserDB
+    ):
+        """Test ids of items from another meal are rejected."""
+        meal_data = MealCreate(
+            meal_type=MealType.SNACK,
+            meal_time=datetime.now() - timedelta(hours=1),
+            food_items=[
+                MealFoodItemCreate(
+                    food_name="Apple", portion_size=1.0, portion_unit="whole"
+                )
+            ],
+        )
+        meal = MealService.create_meal(db, test_user.id, meal_data)
+        other_meal = MealService.create_meal(db, test_user.id, meal_data)
+
+        update_data = MealUpdate(
+            food_items=[
+                MealFoodItemUpdate(
+                    id=other_meal.food_items[0].id,
+                    food_name="Apple",
+                    portion_size=1.0,
+                    portion_unit="whole",
+                )
+            ]
+        )
+
+        with pytest.raises(ValueError, match="does not belong"):
+            MealService.update_meal(db, test_user.id, meal.id, update_data)
+
     def test_update_nonexistent_meal(self, db: Session, test_user: UserDB):
         """Test updating a non-existent meal returns None."""
         fake_meal_id = str(uuid.uuid4())
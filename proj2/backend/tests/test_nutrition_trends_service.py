@@ -0,0 +1,181 @@
+"""Unit tests for NutritionTrendsService."""
+
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import DailyNutritionDB, MealType, UserDB
+from src.eatsential.schemas.schemas import MealCreate, MealFoodItemCreate
+from src.eatsential.services.meal_service import MealService
+from src.eatsential.services.nutrition_trends_service import NutritionTrendsService
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="trends@example.com",
+        username="trendsuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="UTC",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _add_days(db: Session, user_id: str, days: dict[date, float]) -> None:
+    """Insert rollup rows of one meal with the given calories per day."""
+    db.add_all(
+        DailyNutritionDB(
+            user_id=user_id,
+            local_date=local_date,
+            meal_count=1,
+            total_calories=calories,
+            total_protein_g=25,
+            total_carbs_g=50,
+            total_fat_g=10,
+        )
+        for local_date, calories in days.items()
+    )
+    db.commit()
+
+
+def _trends(db: Session, user: UserDB, period: str, window: int = 4) -> dict:
+    """Get trends for 2023-2024."""
+    return NutritionTrendsService.get_trends(
+        db,
+        user.id,
+        user.timezone,
+        date(2023, 1, 1),
+        date(2024, 12, 31),
+        period,
+        window,
+    )
+
+
+class TestPeriodBuckets:
+    """Tests for weekly and monthly buckets."""
+
+    def test_weeks_start_on_monday(self, db: Session, test_user: UserDB):
+        """Test days are grouped into Monday-based weeks."""
+        _add_days(
+            db,
+            test_user.id,
+            {
+                date(2024, 1, 1): 2000,  # Monday
+                date(2024, 1, 7): 1000,  # Sunday, same week
+                date(2024, 1, 8): 1800,  # Next Monday
+            },
+        )
+
+        buckets = _trends(db, test_user, "week")["buckets"]
+
+        assert [b["period_start"] for b in buckets] == [
+            date(2024, 1, 1),
+            date(2024, 1, 8),
+        ]
+        assert [b["days_logged"] for b in buckets] == [2, 1]
+        assert [b["total_calories"] for b in buckets] == [3000, 1800]
+        assert [b["average_daily_calories"] for b in buckets] == [1500, 1800]
+
+    def test_months_and_moving_average(self, db: Session, test_user: UserDB):
+        """Test monthly buckets and the moving average over the window."""
+        _add_days(
+            db,
+            test_user.id,
+            {
+                date(2024, 1, 15): 1000,
+                date(2024, 2, 10): 2000,
+                date(2024, 2, 29): 2000,
+                date(2024, 3, 31): 3000,
+            },
+        )
+
+        buckets = _trends(db, test_user, "month", window=2)["buckets"]
+
+        assert [b["period_start"] for b in buckets] == [
+            date(2024, 1, 1),
+            date(2024, 2, 1),
+            date(2024, 3, 1),
+        ]
+        assert [b["meal_count"] for b in buckets] == [1, 2, 1]
+        assert [b["moving_average_calories"] for b in buckets] == [1000, 1500, 2500]
+
+    def test_macro_distribution(self, db: Session, test_user: UserDB):
+        """Test macro shares of calories use 4/4/9 kcal per gram."""
+        _add_days(db, test_user.id, {date(2024, 5, 1): 390})
+
+        (bucket,) = _trends(db, test_user, "month")["buckets"]
+
+        # 25g protein = 100 kcal, 50g carbs = 200 kcal, 10g fat = 90 kcal
+        assert bucket["protein_pct"] == 25.6
+        assert bucket["carbs_pct"] == 51.3
+        assert bucket["fat_pct"] == 23.1
+
+    @pytest.mark.parametrize("period", ["week", "month"])
+    def test_numpy_path_matches_sql(self, db: Session, test_user: UserDB, period: str):
+        """Test the NumPy fallback produces the same buckets as SQL."""
+        pytest.importorskip("numpy")
+        start = date(2023, 1, 1)
+        _add_days(
+            db,
+            test_user.id,
+            {start + timedelta(days=i): 1500 + i % 11 * 37 for i in range(0, 700, 3)},
+        )
+        args = (db, test_user.id, start, date(2024, 12, 31), period, 3)
+
+        sql = NutritionTrendsService.sql_buckets(*args)
+        vectorized = NutritionTrendsService.numpy_buckets(*args)
+
+        assert len(sql) == len(vectorized)
+        for expected, actual in zip(sql, vectorized):
+            assert actual["period_start"] == expected["period_start"]
+            for field in ("days_logged", "meal_count", "total_calories"):
+                assert float(actual[field]) == pytest.approx(float(expected[field]))
+            assert actual["moving_average_calories"] == pytest.approx(
+                expected["moving_average_calories"]
+            )
+
+
+class TestMealTypeBreakdown:
+    """Tests for the meal type breakdown."""
+
+    def test_breakdown_by_meal_type(self, db: Session, test_user: UserDB):
+        """Test meals are summed per type with calorie shares."""
+        for meal_type, calories in (
+            (MealType.BREAKFAST, 300),
+            (MealType.DINNER, 600),
+            (MealType.DINNER, 300),
+        ):
+            MealService.create_meal(
+                db,
+                test_user.id,
+                MealCreate(
+                    meal_type=meal_type,
+                    meal_time=datetime.now() - timedelta(hours=1),
+                    food_items=[
+                        MealFoodItemCreate(
+                            food_name="Food",
+                            portion_size=1.0,
+                            portion_unit="serving",
+                            calories=calories,
+                        )
+                    ],
+                ),
+            )
+        today = datetime.now().date()
+
+        breakdown = NutritionTrendsService.meal_type_breakdown(
+            db, test_user.id, "UTC", today - timedelta(days=1), today
+        )
+
+        assert [
+            (row["meal_type"], row["meal_count"], row["calorie_share"])
+            for row in breakdown
+        ] == [("breakfast", 1, 25.0), ("dinner", 2, 75.0)]
@@ -0,0 +1,215 @@
+"""Unit tests for WellnessInsightsService."""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.eatsential.models.models import DailyNutritionDB, DailyWellnessDB, UserDB
+from src.eatsential.services.wellness_insights_service import (
+    WellnessInsightsService,
+)
+
+# Four weeks starting on a Monday
+START = date(2024, 1, 1)
+END = date(2024, 1, 28)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def get_insights(request):
+    """Compute insights with the NumPy or the plain Python implementation."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    compute = getattr(WellnessInsightsService, f"{request.param}_insights")
+
+    def get(db: Session, user_id: str, start_date: date, end_date: date, window=7):
+        values = WellnessInsightsService.load_daily_values(
+            db, user_id, start_date, end_date
+        )
+        return compute(values, start_date, window)
+
+    return get
+
+
+@pytest.fixture
+def test_user(db: Session) -> UserDB:
+    """Create a test user."""
+    user = UserDB(
+        id=str(uuid.uuid4()),
+        email="insights@example.com",
+        username="insightsuser",
+        password_hash="hashedpassword123",
+        email_verified=True,
+        timezone="UTC",
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _add_wellness_days(
+    db: Session, user_id: str, days: dict[date, dict[str, float]]
+) -> None:
+    """Insert rollup rows with one logged value per given metric and day."""
+    for local_date, values in days.items():
+        row = DailyWellnessDB(user_id=user_id, local_date=local_date)
+        for metric, value in values.items():
+            setattr(row, f"{metric}_sum", value)
+            setattr(row, f"{metric}_count", 1)
+        db.add(row)
+    db.commit()
+
+
+def _metric(insights: dict, metric: str) -> dict:
+    """Return the insight entry of one metric."""
+    return next(entry for entry in insights["metrics"] if entry["metric"] == metric)
+
+
+def _correlation(insights: dict, metric_x: str, metric_y: str) -> dict:
+    """Return the correlation entry of one metric pair."""
+    return next(
+        entry
+        for entry in insights["correlations"]
+        if (entry["metric_x"], entry["metric_y"]) == (metric_x, metric_y)
+    )
+
+
+class TestGetInsights:
+    """Tests for WellnessInsightsService.get_insights."""
+
+    def test_averages_and_streaks(self, db: Session, test_user: UserDB, get_insights):
+        """Test averages, the rolling window and current/longest streaks."""
+        # Mood on days 0-9 and 14-27; sleep on days 0-26 (ends yesterday)
+        days = {}
+        for i in range(28):
+            values = {}
+            if i < 10 or i >= 14:
+                values["mood_score"] = 4 if i < 21 else 8
+            if i < 27:
+                values["sleep_hours"] = 7
+            days[START + timedelta(days=i)] = values
+        _add_wellness_days(db, test_user.id, days)
+
+        insights = get_insights(db, test_user.id, START, END, window=7)
+
+        mood = _metric(insights, "mood_score")
+        assert mood["days_logged"] == 24
+        assert mood["average"] == pytest.approx((17 * 4 + 7 * 8) / 24, abs=0.01)
+        assert mood["rolling_average"] == 8.0
+        assert (mood["current_streak"], mood["longest_streak"]) == (14, 14)
+
+        sleep = _metric(insights, "sleep_hours")
+        assert (sleep["current_streak"], sleep["longest_streak"]) == (27, 27)
+
+        stress = _metric(insights, "stress_level")
+        assert stress == {
+            "metric": "stress_level",
+            "days_logged": 0,
+            "average": None,
+            "rolling_average": None,
+            "current_streak": 0,
+            "longest_streak": 0,
+        }
+
+    def test_weekly_buckets(self, db: Session, test_user: UserDB, get_insights):
+        """Test days are averaged per ISO week and empty weeks are left out."""
+        _add_wellness_days(
+            db,
+            test_user.id,
+            {
+                START: {"mood_score": 4},
+                START + timedelta(days=6): {"mood_score": 6},
+                START + timedelta(days=7): {"mood_score": 9},
+            },
+        )
+
+        weeks = get_insights(db, test_user.id, START, END)["weeks"]
+
+        assert [week["week_start"] for week in weeks] == [
+            START,
+            START + timedelta(days=7),
+        ]
+        assert weeks[0]["mood_score"] == 5.0
+        assert weeks[1]["mood_score"] == 9.0
+        assert weeks[0]["sleep_hours"] is None
+
+    def test_correlations(self, db: Session, test_user: UserDB, get_insights):
+        """Test Pearson coefficients over days with both metrics logged."""
+        _add_wellness_days(
+            db,
+            test_user.id,
+            {
+                START + timedelta(days=i): {
+                    "mood_score": i % 5 + 3,
+                    "sleep_hours": i % 5 + 5,
+                    "stress_level": 8 - i % 5,
+                    "sleep_quality": 5,
+                }
+                for i in range(10)
+            },
+        )
+        db.add_all(
+            DailyNutritionDB(
+                user_id=test_user.id,
+                local_date=START + timedelta(days=i),
+                meal_count=1,
+                total_calories=2000 + 100 * (i % 5),
+                total_protein_g=0,
+                total_carbs_g=0,
+                total_fat_g=0,
+            )
+            for i in range(5)
+        )
+        db.commit()
+
+        insights = get_insights(db, test_user.id, START, END)
+
+        assert _correlation(insights, "sleep_hours", "mood_score") == {
+            "metric_x": "sleep_hours",
+            "metric_y": "mood_score",
+            "coefficient": 1.0,
+            "days": 10,
+        }
+        assert _correlation(insights, "stress_level", "mood_score")[
+            "coefficient"
+        ] == pytest.approx(-1.0)
+        # Constant sleep quality has no correlation
+        assert (
+            _correlation(insights, "sleep_quality", "mood_score")["coefficient"] is None
+        )
+        # Too few days with calories
+        calories = _correlation(insights, "stress_level", "calories")
+        assert (calories["coefficient"], calories["days"]) == (None, 5)
+        assert _metric(insights, "calories")["average"] == 2200.0
+
+    def test_numpy_and_python_paths_agree(self, db: Session, test_user: UserDB):
+        """Test both implementations give the same insights on irregular data."""
+        pytest.importorskip("numpy")
+        end = START + timedelta(days=100)
+        _add_wellness_days(
+            db,
+            test_user.id,
+            {
+                START + timedelta(days=i): {
+                    "mood_score": i * 7 % 10,
+                    "stress_level": i * 3 % 8 + 1,
+                    "sleep_hours": 5 + i % 4 * 0.75,
+                }
+                for i in range(100)
+                if i % 6 and i % 13
+            },
+        )
+        values = WellnessInsightsService.load_daily_values(db, test_user.id, START, end)
+
+        vectorized = WellnessInsightsService.numpy_insights(values, START, 10)
+        plain = WellnessInsightsService.python_insights(values, START, 10)
+
+        assert plain["metrics"] == vectorized["metrics"]
+        assert plain["weeks"] == vectorized["weeks"]
+        for expected, actual in zip(vectorized["correlations"], plain["correlations"]):
+            assert actual["days"] == expected["days"]
+            assert actual["coefficient"] == pytest.approx(
+                expected["coefficient"], abs=0.001
+            )
@@ -0,0 +1,64 @@
+"""Tests for keyset pagination cursor helpers."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.eatsential.utils.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+class TestCursorEncoding:
+    """Tests for encode_cursor/decode_cursor."""
+
+    def test_datetime_round_trip(self):
+        """Datetime sort keys decode back to datetimes."""
+        meal_time = datetime(2025, 3, 9, 7, 30, 15, 123456)
+        cursor = encode_cursor(meal_time, "meal-1")
+
+        assert decode_cursor(cursor) == (meal_time, "meal-1")
+
+    def test_string_round_trip(self):
+        """String sort keys decode back to strings."""
+        cursor = encode_cursor("peanut", "allergen-1")
+
+        assert decode_cursor(cursor) == ("peanut", "allergen-1")
+
+    def test_cursor_is_url_safe(self):
+        """Cursors can be passed as query parameters without escaping."""
+        cursor = encode_cursor("a/b+c?d", "id")
+
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!", ""])
+    def test_invalid_cursor_raises(self, cursor: str):
+        """Malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestNextCursor:
+    """Tests for next_cursor."""
+
+    def test_has_more_returns_cursor_of_last_item(self):
+        """A page with more rows after it yields a cursor to its last row."""
+        items = [
+            SimpleNamespace(id="b", name="milk"),
+            SimpleNamespace(id="a", name="peanut"),
+        ]
+
+        cursor = next_cursor(items, True, "name")
+
+        assert decode_cursor(cursor) == ("peanut", "a")
+
+    def test_last_page_returns_none(self):
+        """The last page has no next cursor."""
+        items = [SimpleNamespace(id="a", name="milk")]
+
+        assert next_cursor(items, False, "name") is None
+        assert next_cursor([], True, "name") is None
@@ -5,7 +5,9 @@ import pytest
 from src.eatsential.utils.security import (
     DecryptionError,
     EncryptionError,
+    decrypt_many,
     decrypt_sensitive_data,
+    encrypt_many,
     encrypt_sensitive_data,
     generate_encryption_key,
 )
@@ -189,3 +191,66 @@ class TestEncryptionUtilities:
         decrypted = decrypt_sensitive_data(encrypted)
 
         assert decrypted == plaintext
+
+
+class TestBatchDecryption:
+    """Test suite for encrypt_many and decrypt_many"""
+
+    @pytest.fixture(autouse=True)
+    def encryption_key(self, monkeypatch):
+        """Set a test encryption key"""
+        monkeypatch.setenv("ENCRYPTION_KEY", "test_encryption_key_for_batches")
+
+    def test_batch_keeps_order_and_empty_values(self):
+        """Test that values come back in order with None for empty input"""
+        encrypted = [
+            encrypt_sensitive_data("first"),
+            None,
+            "",
+            encrypt_sensitive_data("fourth"),
+        ]
+
+        assert decrypt_many(encrypted) == ["first", None, None, "fourth"]
+        assert decrypt_many([]) == []
+
+    def test_parallel_batch_matches_serial_decryption(self):
+        """Test that the thread pool path returns the same values"""
+        plaintexts = [f"note {i}" if i % 3 else None for i in range(50)]
+        encrypted = [encrypt_sensitive_data(text) for text in plaintexts]
+
+        assert decrypt_many(encrypted, parallel_threshold=1) == plaintexts
+        assert decrypt_many(encrypted, parallel_threshold=1000) == plaintexts
+
+    def test_invalid_token_in_batch_raises_error(self):
+        """Test that one corrupted value fails the whole batch"""
+        encrypted = [encrypt_sensitive_data(f"note {i}") for i in range(10)]
+        encrypted[7] = "invalid_encrypted_data"
+
+        with pytest.raises(DecryptionError, match="Invalid encryption token"):
+            decrypt_many(encrypted, parallel_threshold=1)
+
+    def test_batch_without_key_raises_error(self, monkeypatch):
+        """Test that decrypt_many fails without ENCRYPTION_KEY"""
+        encrypted = [encrypt_sensitive_data("note")]
+        monkeypatch.delenv("ENCRYPTION_KEY")
+
+        with pytest.raises(
+            DecryptionError, match="ENCRYPTION_KEY environment variable"
+        ):
+            decrypt_many(encrypted)
+
+    def test_encrypt_many_round_trips(self):
+        """Test that encrypt_many output decrypts to the input, in order"""
+        plaintexts = [f"note {i}" if i % 3 else None for i in range(50)]
+
+        for threshold in (1, 1000):
+            encrypted = encrypt_many(plaintexts, parallel_threshold=threshold)
+            assert encrypted[0] is None
+            assert decrypt_many(encrypted) == plaintexts
+
+    def test_encrypt_many_without_key_raises_error(self, monkeypatch):
+        """Test that encrypt_many fails without ENCRYPTION_KEY"""
+        monkeypatch.delenv("ENCRYPTION_KEY")
+
+        with pytest.raises(EncryptionError):
+            encrypt_many(["note"])
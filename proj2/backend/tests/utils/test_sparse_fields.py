@@ -0,0 +1,48 @@
+"""Tests for sparse fieldset helpers."""
+
+import pytest
+
+from src.eatsential.utils.sparse_fields import (
+    InvalidFieldsError,
+    parse_fields,
+    required_columns,
+)
+
+ALLOWED = ["id", "meal_type", "meal_time", "total_calories", "food_items"]
+
+
+class TestParseFields:
+    """Tests for parse_fields."""
+
+    def test_none_means_full_response(self):
+        """No fields parameter selects the full response."""
+        assert parse_fields(None, ALLOWED) is None
+
+    def test_fields_follow_response_order(self):
+        """Selected fields keep response order and include the always set."""
+        fields = parse_fields(" total_calories , meal_type,", ALLOWED)
+
+        assert fields == ["id", "meal_type", "total_calories"]
+
+    def test_always_fields_are_added(self):
+        """Cursor keys are returned even when not requested."""
+        fields = parse_fields("total_calories", ALLOWED, ("id", "meal_time"))
+
+        assert fields == ["id", "meal_time", "total_calories"]
+
+    def test_unknown_field_raises(self):
+        """Unknown fields are rejected with their names."""
+        with pytest.raises(InvalidFieldsError, match="password"):
+            parse_fields("id,password", ALLOWED)
+
+
+class TestRequiredColumns:
+    """Tests for required_columns."""
+
+    def test_derived_fields_expand_to_source_columns(self):
+        """Computed fields map to the columns they are built from."""
+        derived = {"completion_percentage": ("current_value", "target_value")}
+
+        columns = required_columns(["id", "completion_percentage"], derived)
+
+        assert columns == {"id", "current_value", "target_value"}
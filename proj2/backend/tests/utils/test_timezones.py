@@ -0,0 +1,92 @@
+"""Unit tests for timezone utilities."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from src.eatsential.utils import timezones
+from src.eatsential.utils.timezones import get_local_date, get_zoneinfo, local_dates
+
+# Zones with DST, half-hour DST, odd offsets and a skipped day (Apia, 2011)
+ZONES = (
+    "America/New_York",
+    "Europe/London",
+    "Australia/Lord_Howe",
+    "Asia/Kathmandu",
+    "Pacific/Apia",
+    "America/Sao_Paulo",
+    "UTC",
+)
+
+
+def _around_transitions(name: str, years: range) -> list[datetime]:
+    """UTC datetimes one second around every offset change in the years."""
+    values = []
+    for year in years:
+        starts, _ = timezones._year_transitions(name, year)
+        for start in starts:
+            for delta in (-1, 0, 1):
+                values.append(
+                    datetime.fromtimestamp(start + delta, timezone.utc).replace(
+                        tzinfo=None
+                    )
+                )
+    return values
+
+
+class TestGetLocalDate:
+    """Test suite for get_local_date"""
+
+    def test_converts_naive_and_aware_utc(self):
+        """Test naive values are treated as UTC and aware ones converted"""
+        naive = datetime(2024, 1, 15, 3, 0)
+        aware = datetime(2024, 1, 14, 23, 0, tzinfo=timezone(timedelta(hours=-4)))
+
+        assert get_local_date(naive, "America/New_York") == date(2024, 1, 14)
+        assert get_local_date(aware, "UTC") == date(2024, 1, 15)
+
+    def test_zoneinfo_is_cached(self):
+        """Test a zone is looked up once"""
+        assert get_zoneinfo("Europe/Paris") is get_zoneinfo("Europe/Paris")
+
+
+class TestLocalDates:
+    """Test suite for local_dates"""
+
+    @pytest.mark.parametrize("name", ZONES)
+    def test_vectorized_matches_astimezone_across_transitions(self, name: str):
+        """Test the transition tables give the same dates as astimezone"""
+        pytest.importorskip("numpy")
+        values = _around_transitions(name, range(2008, 2026))
+        # Plus every 7 hours and 13 minutes over the same years
+        step = timedelta(hours=7, minutes=13)
+        current = datetime(2008, 1, 1)
+        while current < datetime(2026, 1, 1):
+            values.append(current)
+            current += step
+
+        assert local_dates(values, name) == [get_local_date(v, name) for v in values]
+
+    def test_per_value_timezones_keep_input_order(self):
+        """Test one timezone per value is honoured, in input order"""
+        instant = datetime(2024, 3, 10, 4, 30)
+        values = [instant] * (2 * timezones.VECTORIZE_THRESHOLD)
+        names = ["America/Los_Angeles", "Asia/Tokyo"] * timezones.VECTORIZE_THRESHOLD
+
+        dates = local_dates(values, names)
+
+        assert dates[:2] == [date(2024, 3, 9), date(2024, 3, 10)]
+        assert dates == [get_local_date(instant, name) for name in names]
+
+    def test_small_batches_and_aware_values(self):
+        """Test small batches and aware datetimes use the same conversion"""
+        values = [
+            datetime(2024, 11, 3, 5, 59, tzinfo=timezone.utc),
+            datetime(2024, 11, 3, 1, 30, tzinfo=timezone(timedelta(hours=-5))),
+        ]
+
+        assert local_dates(values, "America/New_York") == [
+            date(2024, 11, 3),
+            date(2024, 11, 3),
+        ]
+        assert local_dates([], "UTC") == []
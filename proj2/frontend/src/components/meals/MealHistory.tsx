@@ -92,6 +92,7 @@ export function MealHistory() {
     return {
       page,
       page_size: PAGE_SIZE,
+      include_total: true,
       meal_type: filters.meal_type || undefined,
       start_date: toISOStringOrUndefined(filters.start_date),
       end_date: toISOStringOrUndefined(filters.end_date, true),
@@ -144,7 +145,7 @@ export function MealHistory() {
     toast.success('Meal history refreshed');
   };
 
-  const totalPages = data ? Math.max(1, Math.ceil(data.total / data.page_size)) : 1;
+  const totalPages = data ? Math.max(1, Math.ceil((data.total ?? 0) / data.page_size)) : 1;
   const meals: MealLogResponse[] = data?.meals ?? [];
   const showEmptyState = !isLoading && meals.length === 0;
 
@@ -32,6 +32,9 @@ export const isAdmin = (): boolean => {
 // Create axios instance
 const apiClient = axios.create({
   baseURL: '/api', // Use relative path, Vite will proxy automatically
+  // Send cookies cross-origin too: the backend pins reads after a write to
+  // the primary database with the read_primary_since cookie
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -579,9 +582,11 @@ export interface GoalResponse {
 
 export interface GoalListResponse {
   goals: GoalResponse[];
-  total: number;
+  total: number | null; // only set when include_total=true
   page: number;
   page_size: number;
+  has_more?: boolean;
+  next_cursor?: string | null;
 }
 
 // Mental Wellness API
@@ -716,14 +721,17 @@ export interface MealLogResponse {
 
 export interface MealListResponse {
   meals: MealLogResponse[];
-  total: number;
+  total: number | null; // only set when include_total=true
   page: number;
   page_size: number;
+  has_more?: boolean;
+  next_cursor?: string | null;
 }
 
 export interface MealListFilters {
   page?: number;
   page_size?: number;
+  include_total?: boolean;
   meal_type?: MealTypeOption | '';
   start_date?: string;
   end_date?: string;